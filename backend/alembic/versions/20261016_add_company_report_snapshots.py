@@ -0,0 +1,49 @@
+"""add company_report_snapshots table
+
+Revision ID: 20261016_report_snapshots
+Revises: 20260204_egm
+Create Date: 2026-10-16
+
+회사 종합보고서(CompanyFullReport) 사전 계산 스냅샷 테이블입니다.
+- 파싱/파이프라인/리스크 점수 스크립트가 데이터를 변경하면 is_stale 표시 + data_version 증가
+- 보고서 API는 최신 스냅샷이 있으면 그대로 반환, 없거나 stale이면 재계산 후 저장
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_report_snapshots'
+down_revision: Union[str, None] = '20260204_egm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'company_report_snapshots',
+        sa.Column('company_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('schema_version', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('is_stale', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('payload', postgresql.JSONB(), nullable=True),
+        sa.Column('built_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('invalidated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('company_id'),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+    )
+
+    # 재빌드 대상 (stale + 기존 조회 이력 있는 스냅샷) 조회용
+    op.create_index(
+        'ix_company_report_snapshots_stale',
+        'company_report_snapshots',
+        ['is_stale'],
+        postgresql_where=sa.text('is_stale'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_company_report_snapshots_stale', table_name='company_report_snapshots')
+    op.drop_table('company_report_snapshots')
@@ -0,0 +1,65 @@
+"""add investment_cycles / investment_cycle_members / investment_cycle_index_state tables
+
+Revision ID: 20261016_investment_cycles
+Revises: 20261016_risk_analysis_runs
+Create Date: 2026-10-16
+
+순환 투자 사전 계산 인덱스 (app/services/investment_cycles.py)입니다.
+- investment_cycles: 회사 → 회사 CB 투자 간선(cb_subscribers.subscriber_company_id)의 짧은 순환
+- investment_cycle_members: 순환별 소속 회사 (회사 → 순환 조회)
+- investment_cycle_index_state: 인덱스 빌드 정보 + 증분 갱신 워터마크 (단일 행)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_investment_cycles'
+down_revision: Union[str, None] = '20261016_risk_analysis_runs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'investment_cycles',
+        # 최소 회사 ID에서 시작하도록 회전한 회사 ID 목록 ('->' 연결)
+        sa.Column('cycle_key', sa.Text(), nullable=False),
+        sa.Column('company_ids', postgresql.ARRAY(postgresql.UUID(as_uuid=True)), nullable=False),
+        sa.Column('cycle_length', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('min_investment_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('cycle_key'),
+    )
+
+    op.create_table(
+        'investment_cycle_members',
+        sa.Column('company_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('cycle_key', sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint('company_id', 'cycle_key'),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['cycle_key'], ['investment_cycles.cycle_key'], ondelete='CASCADE'),
+    )
+    op.create_index('ix_investment_cycle_members_cycle_key', 'investment_cycle_members', ['cycle_key'])
+
+    op.create_table(
+        'investment_cycle_index_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('max_length', sa.Integer(), nullable=False),
+        sa.Column('cycle_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('edges_watermark', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('built_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.CheckConstraint('id = 1', name='ck_investment_cycle_index_state_single_row'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('investment_cycle_index_state')
+    op.drop_index('ix_investment_cycle_members_cycle_key', table_name='investment_cycle_members')
+    op.drop_table('investment_cycle_members')
+    op.drop_table('investment_cycles')
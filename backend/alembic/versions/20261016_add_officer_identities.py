@@ -0,0 +1,49 @@
+"""add officer_identities table and officers.person_id
+
+Revision ID: 20261016_officer_identities
+Revises: 20261016_report_snapshots
+Create Date: 2026-10-16
+
+임원 동일인 식별 테이블입니다.
+- 정규화된 이름 + 출생년월(YYYYMM) 쌍마다 정규 person id 1개
+- officers.person_id로 연결 → 경력 조회가 문자열 가공 없는 인덱스 동등 조인으로 변경
+- 기존 데이터 채우기: python -m scripts.maintenance.backfill_officer_identities
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_officer_identities'
+down_revision: Union[str, None] = '20261016_report_snapshots'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'officer_identities',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('name_normalized', sa.String(100), nullable=False),
+        # 출생년월 미상은 '' (NULL이면 UNIQUE 제약으로 동일인 묶기 불가)
+        sa.Column('birth_ym', sa.String(6), nullable=False, server_default=''),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name_normalized', 'birth_ym', name='uq_officer_identity_key'),
+    )
+
+    op.add_column('officers', sa.Column('person_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        'fk_officers_person_id', 'officers', 'officer_identities',
+        ['person_id'], ['id'], ondelete='SET NULL',
+    )
+    op.create_index('ix_officers_person_id', 'officers', ['person_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_officers_person_id', table_name='officers')
+    op.drop_constraint('fk_officers_person_id', 'officers', type_='foreignkey')
+    op.drop_column('officers', 'person_id')
+    op.drop_table('officer_identities')
@@ -0,0 +1,39 @@
+"""add raymonds_index_calc_state table / financial_details.updated_at index
+
+Revision ID: 20261016_ri_calc_state
+Revises: 20261016_investment_cycles
+Create Date: 2026-10-16
+
+RaymondsIndex 증분 재계산 (scripts/pipeline/calculate_index.py --incremental / --since)입니다.
+- raymonds_index_calc_state: 알고리즘 버전 × 대상 연도별 마지막 재계산 워터마크
+- idx_fd_updated_at: 워터마크 이후 변경된 financial_details 행 조회
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_ri_calc_state'
+down_revision: Union[str, None] = '20261016_investment_cycles'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_fd_updated_at', 'financial_details', ['updated_at'])
+
+    op.create_table(
+        'raymonds_index_calc_state',
+        sa.Column('algorithm_version', sa.String(10), nullable=False),
+        sa.Column('target_year', sa.Integer(), nullable=False),
+        sa.Column('financial_watermark', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('companies_calculated', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('calculated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('algorithm_version', 'target_year'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('raymonds_index_calc_state')
+    op.drop_index('idx_fd_updated_at', table_name='financial_details')
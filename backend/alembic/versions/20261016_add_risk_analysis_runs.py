@@ -0,0 +1,66 @@
+"""add risk_analysis_runs / risk_analysis_results tables
+
+Revision ID: 20261016_risk_analysis_runs
+Revises: 20261016_officer_identities
+Create Date: 2026-10-16
+
+일일 위험도 분석(app/scheduler.py daily_risk_analysis) 결과 저장 테이블입니다.
+- risk_analysis_runs: 실행 단위 진행 체크포인트 + 소요 시간/처리량
+- risk_analysis_results: 실행별 회사 분석 결과 (배치 단위 일괄 저장)
+- 중단된 실행은 다음 실행 시 이미 저장된 회사를 건너뛰고 이어서 처리
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_risk_analysis_runs'
+down_revision: Union[str, None] = '20261016_officer_identities'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'risk_analysis_runs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('status', sa.String(20), nullable=False, server_default='running'),  # running, completed, failed
+        sa.Column('total_companies', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('processed_companies', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed_companies', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('resume_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('wall_clock_seconds', sa.Float(), nullable=True),
+        sa.Column('companies_per_second', sa.Float(), nullable=True),
+        sa.Column('metrics', postgresql.JSONB(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('checkpoint_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_risk_analysis_runs_started_at', 'risk_analysis_runs', ['started_at'])
+
+    op.create_table(
+        'risk_analysis_results',
+        sa.Column('run_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('company_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('risk_score', sa.Float(), nullable=True),
+        sa.Column('risk_level', sa.String(20), nullable=False),
+        sa.Column('patterns', postgresql.JSONB(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('analyzed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('run_id', 'company_id'),
+        sa.ForeignKeyConstraint(['run_id'], ['risk_analysis_runs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+    )
+    # 회사별 최신 결과 조회용
+    op.create_index('ix_risk_analysis_results_company', 'risk_analysis_results', ['company_id', 'analyzed_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_risk_analysis_results_company', table_name='risk_analysis_results')
+    op.drop_table('risk_analysis_results')
+    op.drop_index('ix_risk_analysis_runs_started_at', table_name='risk_analysis_runs')
+    op.drop_table('risk_analysis_runs')
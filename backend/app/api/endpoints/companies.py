@@ -14,6 +14,7 @@ from sqlalchemy import select, or_, func, and_
 from app.database import AsyncSessionLocal
 from app.models import Company, ConvertibleBond, Officer, OfficerPosition, FinancialStatement
 from app.services.cache_service import cache
+from app.utils.cache import company_tag
 import logging
 from sqlalchemy import text
 
@@ -110,12 +111,7 @@ async def get_platform_stats(
     - 주주변동 데이터 수
     - 재무제표 건수
     """
-    # 캐시 조회
-    cached = cache.get("platform_stats")
-    if cached:
-        return PlatformStatsResponse(**cached)
-
-    try:
+    async def compute_stats() -> dict:
         # 각 테이블의 COUNT 조회
         companies_count = await db.execute(select(func.count(Company.id)))
         cb_count = await db.execute(select(func.count(ConvertibleBond.id)))
@@ -127,18 +123,20 @@ async def get_platform_stats(
             text("SELECT COUNT(*) FROM major_shareholders")
         )
 
-        result = PlatformStatsResponse(
+        return PlatformStatsResponse(
             companies=companies_count.scalar() or 0,
             convertible_bonds=cb_count.scalar() or 0,
             officers=officers_count.scalar() or 0,
             major_shareholders=major_shareholders_result.scalar() or 0,
             financial_statements=financial_count.scalar() or 0
-        )
-
-        # 캐시 저장 (5분)
-        cache.set("platform_stats", result.model_dump(), ttl=300)
+        ).model_dump()
 
-        return result
+    try:
+        # 캐시 조회 (5분) - 만료 시 동시 요청은 1회 계산으로 병합
+        stats = await cache.get_or_compute(
+            "platform_stats", compute_stats, ttl=300, distributed_lock=True
+        )
+        return PlatformStatsResponse(**stats)
     except Exception as e:
         logger.error(f"Error getting platform stats: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -486,13 +484,9 @@ async def get_company_detail(
     - 임원 수
     - company_id: UUID 또는 corp_code로 검색
     """
-    # 캐시 조회
     cache_key = f"company_detail:{company_id}"
-    cached = cache.get(cache_key)
-    if cached:
-        return CompanyDetailResponse(**cached)
 
-    try:
+    async def compute_detail() -> dict:
         import uuid
 
         company = None
@@ -542,7 +536,7 @@ async def get_company_detail(
         officer_count_result = await db.execute(officer_count_query)
         officer_count = officer_count_result.scalar() or 0
 
-        result = CompanyDetailResponse(
+        detail = CompanyDetailResponse(
             id=str(company.id),
             name=company.name,
             ticker=company.ticker,
@@ -556,15 +550,22 @@ async def get_company_detail(
             officer_count=officer_count,
             created_at=company.created_at.isoformat() if company.created_at else datetime.utcnow().isoformat(),
             updated_at=company.updated_at.isoformat() if company.updated_at else datetime.utcnow().isoformat()
-        )
+        ).model_dump()
 
-        # 캐시 저장 (5분) - 실제 company_id로 저장
-        cache.set(f"company_detail:{actual_company_id}", result.model_dump(), ttl=300)
-        # 원래 요청 키로도 저장 (corp_code나 ticker로 요청 시)
+        # 기업 단위 무효화 태그 등록 (요청 키가 corp_code/ticker여도 실제 ID로 무효화)
+        tags = [company_tag(actual_company_id)]
+        await cache.add_tags(cache_key, tags, ttl=300)
+
+        # 실제 company_id 키로도 저장 (corp_code나 ticker로 요청 시)
         if company_id != actual_company_id:
-            cache.set(cache_key, result.model_dump(), ttl=300)
+            await cache.set(f"company_detail:{actual_company_id}", detail, ttl=300, tags=tags)
+
+        return detail
 
-        return result
+    try:
+        # 캐시 조회 (5분) - 동시 미스는 1회 조회로 병합
+        detail = await cache.get_or_compute(cache_key, compute_detail, ttl=300)
+        return CompanyDetailResponse(**detail)
 
     except HTTPException:
         raise
@@ -690,23 +691,17 @@ async def list_sectors(
     - 중복 제거
     - 알파벳 순 정렬
     """
-    # 캐시 조회 (업종 목록은 자주 바뀌지 않음)
-    cached = cache.get("sectors_list")
-    if cached:
-        return cached
-
-    try:
+    async def compute_sectors() -> List[str]:
         query = select(Company.sector).where(
             Company.sector.isnot(None)
         ).distinct().order_by(Company.sector)
 
         result = await db.execute(query)
-        sectors = [row[0] for row in result.all()]
-
-        # 캐시 저장 (1시간)
-        cache.set("sectors_list", sectors, ttl=3600)
+        return [row[0] for row in result.all()]
 
-        return sectors
+    try:
+        # 캐시 조회 (1시간, 업종 목록은 자주 바뀌지 않음)
+        return await cache.get_or_compute("sectors_list", compute_sectors, ttl=3600)
 
     except Exception as e:
         logger.error(f"Error listing sectors: {e}", exc_info=True)
@@ -4,21 +4,25 @@
 회사명으로 검색하여 전체 데이터를 조회
 """
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 from datetime import date
-import asyncpg
+import asyncio
 import logging
+import time
 
-from app.config import settings
+from app.database import acquire_pg
+from app.middleware.performance import QueryPerformanceTracker
+from app.services.company_report_snapshot import (
+    get_snapshot,
+    is_snapshot_fresh,
+    save_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/report", tags=["company-report"])
 
-# asyncpg는 순수 postgresql:// 형식 필요 (SQLAlchemy의 +asyncpg 제거)
-DB_URL = settings.database_url.replace('postgresql+asyncpg://', 'postgresql://').replace('+asyncpg', '')
-
 
 # Response Models
 class CompanyBasicInfo(BaseModel):
@@ -134,9 +138,7 @@ async def search_companies_by_name(
     - CB 발행 건수 및 리스크 등급 포함
     """
     try:
-        conn = await asyncpg.connect(DB_URL)
-
-        try:
+        async with acquire_pg() as conn:
             companies = await conn.fetch("""
                 SELECT c.id, c.corp_code, c.name,
                        COALESCE(cb.cb_count, 0) as cb_count,
@@ -164,17 +166,340 @@ async def search_companies_by_name(
                 )
                 for row in companies
             ]
-        finally:
-            await conn.close()
-
     except Exception as e:
         logger.error(f"Search error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# 섹션별 쿼리 (회사 ID/corp_code 확정 후 서로 독립적 → 동시 실행)
+# (섹션명, 조회 메서드, SQL, 파라미터 키)
+_SECTION_QUERIES = [
+    ("disclosure_count", "fetchval", """
+        SELECT COUNT(*) FROM disclosures WHERE corp_code = $1
+    """, "corp_code"),
+    ("risk_score", "fetchrow", """
+        SELECT analysis_year, analysis_quarter, total_score, risk_level,
+               investment_grade, raymondsrisk_score, human_risk_score,
+               cb_risk_score, financial_health_score
+        FROM risk_scores
+        WHERE company_id = $1
+        ORDER BY analysis_year DESC, analysis_quarter DESC NULLS LAST
+        LIMIT 1
+    """, "company_id"),
+    ("risk_signals", "fetch", """
+        SELECT pattern_type, severity, risk_score, title, description
+        FROM risk_signals
+        WHERE target_company_id = $1
+        ORDER BY risk_score DESC
+    """, "company_id"),
+    ("convertible_bonds", "fetch", """
+        SELECT issue_date, issue_amount / 100000000.0 as issue_amount_billion,
+               conversion_price, maturity_date, bond_name
+        FROM convertible_bonds
+        WHERE company_id = $1
+        ORDER BY issue_date DESC NULLS LAST
+    """, "company_id"),
+    ("cb_subscribers", "fetch", """
+        SELECT cs.subscriber_name,
+               cs.subscription_amount / 100000000.0 as subscription_amount_billion,
+               cb.issue_date,
+               cb.bond_name
+        FROM cb_subscribers cs
+        JOIN convertible_bonds cb ON cs.cb_id = cb.id
+        WHERE cb.company_id = $1
+        ORDER BY cb.issue_date DESC NULLS LAST
+    """, "company_id"),
+    # 임원 - 최신 보고서 기준 재직 여부 포함 (최신 보고서 날짜는 CTE로 함께 조회)
+    ("officers", "fetch", """
+        WITH latest_report AS (
+            SELECT MAX(source_report_date) as latest_date
+            FROM officer_positions
+            WHERE company_id = $1
+        ),
+        latest_officers AS (
+            -- 최신 보고서의 임원 목록
+            SELECT DISTINCT o.name, op.position
+            FROM officers o
+            JOIN officer_positions op ON o.id = op.officer_id
+            WHERE op.company_id = $1
+            AND op.source_report_date = (SELECT latest_date FROM latest_report)
+        )
+        SELECT DISTINCT ON (o.name, op.position)
+            o.name,
+            op.position,
+            op.term_start_date,
+            op.term_end_date,
+            CASE WHEN lo.name IS NOT NULL THEN true ELSE false END as is_current
+        FROM officers o
+        JOIN officer_positions op ON o.id = op.officer_id
+        LEFT JOIN latest_officers lo ON o.name = lo.name AND op.position = lo.position
+        WHERE op.company_id = $1
+        ORDER BY o.name, op.position, op.source_report_date DESC NULLS LAST
+    """, "company_id"),
+    ("financials", "fetch", """
+        SELECT fiscal_year, quarter,
+               total_assets / 100000000.0 as total_assets_billion,
+               total_liabilities / 100000000.0 as total_liabilities_billion,
+               total_equity / 100000000.0 as total_equity_billion,
+               revenue / 100000000.0 as revenue_billion,
+               operating_profit / 100000000.0 as operating_profit_billion,
+               net_income / 100000000.0 as net_income_billion
+        FROM financial_statements
+        WHERE company_id = $1
+        ORDER BY fiscal_year DESC, quarter DESC NULLS LAST
+    """, "company_id"),
+    # 주주 (중복 제거 + 숫자로만 된 이름 필터링 - 파싱 오류 데이터)
+    # 동일 주주는 가장 최신 보고서 기준으로 1건만 표시
+    ("shareholders", "fetch", """
+        SELECT DISTINCT ON (shareholder_name_normalized)
+            shareholder_name,
+            share_ratio,
+            is_largest_shareholder,
+            report_year,
+            source_rcept_no
+        FROM major_shareholders
+        WHERE company_id = $1
+          AND shareholder_name !~ '^[0-9,\\.\\s]+$'
+        ORDER BY shareholder_name_normalized, source_rcept_no DESC NULLS LAST
+    """, "company_id"),
+    ("affiliates", "fetch", """
+        SELECT c2.name as affiliate_name, a.relationship_type
+        FROM affiliates a
+        JOIN companies c2 ON a.affiliate_company_id = c2.id
+        WHERE a.parent_company_id = $1
+    """, "company_id"),
+]
+
+
+# 보고서 1건당 섹션 쿼리에 사용하는 최대 풀 커넥션 수
+# (asyncpg 커넥션은 동시 쿼리 불가 → 커넥션별 순차 실행, 풀 최대 크기보다 충분히 작게 유지)
+REPORT_SECTION_CONNECTIONS = 2
+
+
+async def _fetch_section(
+    conn,
+    name: str,
+    method: str,
+    query: str,
+    param: Any,
+    timings: Dict[str, float],
+) -> Any:
+    """섹션 쿼리 실행 및 소요 시간(ms) 기록"""
+    start = time.perf_counter()
+    async with QueryPerformanceTracker(f"company_report.{name}"):
+        result = await getattr(conn, method)(query, param)
+    timings[name] = round((time.perf_counter() - start) * 1000, 2)
+    return result
+
+
+async def _fetch_sections(params: Dict[str, Any], timings: Dict[str, float]) -> Dict[str, Any]:
+    """
+    섹션 쿼리를 REPORT_SECTION_CONNECTIONS개 커넥션에 나눠 실행
+
+    각 커넥션은 남은 섹션을 하나씩 가져가 순차 실행한다 (먼저 끝난 커넥션이 다음 섹션 처리).
+    """
+    pending = list(_SECTION_QUERIES)
+    rows: Dict[str, Any] = {}
+
+    async def worker():
+        async with acquire_pg() as conn:
+            while pending:
+                name, method, query, param_key = pending.pop(0)
+                rows[name] = await _fetch_section(conn, name, method, query, params[param_key], timings)
+
+    await asyncio.gather(*[worker() for _ in range(min(REPORT_SECTION_CONNECTIONS, len(pending)))])
+    return rows
+
+
+def _format_server_timing(timings: Dict[str, float]) -> str:
+    """Server-Timing 헤더 값 생성 (브라우저 개발자도구에서 섹션별 확인 가능)"""
+    return ", ".join(f"{name};dur={ms}" for name, ms in timings.items())
+
+
+async def _find_company(conn, company_name: str, exact_match: bool):
+    """회사명으로 회사 조회 (부분 일치 시 가장 유사한 회사)"""
+    if exact_match:
+        return await conn.fetchrow("""
+            SELECT id, corp_code, name, ticker, market, company_type, trading_status
+            FROM companies WHERE name = $1
+        """, company_name)
+    return await conn.fetchrow("""
+        SELECT id, corp_code, name, ticker, market, company_type, trading_status
+        FROM companies
+        WHERE name ILIKE $1
+        ORDER BY
+            CASE WHEN name = $2 THEN 0 ELSE 1 END,
+            LENGTH(name)
+        LIMIT 1
+    """, f"%{company_name}%", company_name)
+
+
+async def build_company_report(
+    company,
+    timings: Optional[Dict[str, float]] = None,
+) -> CompanyFullReport:
+    """
+    회사 레코드로부터 종합 보고서 조립
+
+    섹션 쿼리들은 서로 독립적이므로 REPORT_SECTION_CONNECTIONS개 커넥션에서 나눠 실행한다.
+    (요청 1건이 풀 커넥션을 과점하지 않도록 커넥션 수 제한)
+
+    Args:
+        company: companies 레코드 (id, corp_code, name, ticker, market, company_type, trading_status)
+        timings: 섹션별 소요 시간(ms)을 채워 넣을 딕셔너리 (선택사항)
+    """
+    if timings is None:
+        timings = {}
+
+    company_id = company['id']
+    corp_code = company['corp_code']
+    params = {"company_id": company_id, "corp_code": corp_code}
+
+    rows = await _fetch_sections(params, timings)
+
+    disclosure_count = rows["disclosure_count"] or 0
+
+    risk_score = None
+    risk_score_row = rows["risk_score"]
+    if risk_score_row:
+        risk_score = RiskScoreInfo(
+            analysis_year=risk_score_row['analysis_year'],
+            analysis_quarter=risk_score_row['analysis_quarter'],
+            total_score=float(risk_score_row['total_score']),
+            risk_level=risk_score_row['risk_level'],
+            investment_grade=risk_score_row['investment_grade'],
+            raymondsrisk_score=float(risk_score_row['raymondsrisk_score']),
+            human_risk_score=float(risk_score_row['human_risk_score']),
+            cb_risk_score=float(risk_score_row['cb_risk_score']),
+            financial_health_score=float(risk_score_row['financial_health_score'])
+        )
+
+    risk_signals = [
+        RiskSignalInfo(
+            pattern_type=row['pattern_type'],
+            severity=row['severity'],
+            risk_score=float(row['risk_score']),
+            title=row['title'],
+            description=row['description']
+        )
+        for row in rows["risk_signals"]
+    ]
+
+    convertible_bonds = [
+        CBInfo(
+            issue_date=str(row['issue_date']) if row['issue_date'] else None,
+            issue_amount_billion=float(row['issue_amount_billion']) if row['issue_amount_billion'] else 0,
+            conversion_price=row['conversion_price'],
+            maturity_date=str(row['maturity_date']) if row['maturity_date'] else None,
+            bond_name=row['bond_name']
+        )
+        for row in rows["convertible_bonds"]
+    ]
+
+    cb_subscribers = [
+        CBSubscriberInfo(
+            subscriber_name=row['subscriber_name'],
+            subscription_amount_billion=float(row['subscription_amount_billion']) if row['subscription_amount_billion'] else 0,
+            issue_date=str(row['issue_date']) if row['issue_date'] else None,
+            bond_name=row['bond_name']
+        )
+        for row in rows["cb_subscribers"]
+    ]
+
+    officers = [
+        OfficerInfo(
+            name=row['name'],
+            position=row['position'] or '',
+            term_start=str(row['term_start_date']) if row['term_start_date'] else None,
+            term_end=str(row['term_end_date']) if row['term_end_date'] else None,
+            is_current=row['is_current']
+        )
+        for row in rows["officers"]
+    ]
+
+    financials = [
+        FinancialInfo(
+            fiscal_year=row['fiscal_year'],
+            quarter=row['quarter'],
+            total_assets_billion=float(row['total_assets_billion']) if row['total_assets_billion'] else None,
+            total_liabilities_billion=float(row['total_liabilities_billion']) if row['total_liabilities_billion'] else None,
+            total_equity_billion=float(row['total_equity_billion']) if row['total_equity_billion'] else None,
+            revenue_billion=float(row['revenue_billion']) if row['revenue_billion'] else None,
+            operating_profit_billion=float(row['operating_profit_billion']) if row['operating_profit_billion'] else None,
+            net_income_billion=float(row['net_income_billion']) if row['net_income_billion'] else None
+        )
+        for row in rows["financials"]
+    ]
+
+    shareholders = [
+        ShareholderInfo(
+            shareholder_name=row['shareholder_name'],
+            share_ratio=float(row['share_ratio']) if row['share_ratio'] else None,
+            is_largest=row['is_largest_shareholder'] or False,
+            report_year=row['report_year']
+        )
+        for row in rows["shareholders"]
+    ]
+
+    # 지분율 높은 순으로 재정렬
+    shareholders.sort(key=lambda x: x.share_ratio or 0, reverse=True)
+
+    affiliates = [
+        AffiliateInfo(
+            affiliate_name=row['affiliate_name'],
+            relationship_type=row['relationship_type'] or 'AFFILIATE'
+        )
+        for row in rows["affiliates"]
+    ]
+
+    # Summary 생성
+    total_cb_amount = sum(cb.issue_amount_billion for cb in convertible_bonds)
+
+    # 인수인별 합계
+    subscriber_totals = {}
+    for sub in cb_subscribers:
+        name = sub.subscriber_name
+        subscriber_totals[name] = subscriber_totals.get(name, 0) + sub.subscription_amount_billion
+
+    top_subscribers = sorted(subscriber_totals.items(), key=lambda x: x[1], reverse=True)[:5]
+
+    summary = {
+        "cb_total_count": len(convertible_bonds),
+        "cb_total_amount_billion": round(total_cb_amount, 1),
+        "risk_signal_count": len(risk_signals),
+        "high_risk_signals": len([s for s in risk_signals if s.severity == 'HIGH']),
+        "officer_count": len(officers),
+        "top_cb_subscribers": [{"name": name, "amount_billion": round(amt, 1)} for name, amt in top_subscribers],
+        "has_financial_loss": any(f.net_income_billion and f.net_income_billion < 0 for f in financials)
+    }
+
+    return CompanyFullReport(
+        basic_info=CompanyBasicInfo(
+            id=str(company_id),
+            corp_code=corp_code or '',
+            name=company['name'],
+            ticker=company.get('ticker'),
+            market=company.get('market'),
+            company_type=company.get('company_type'),
+            trading_status=company.get('trading_status')
+        ),
+        disclosure_count=disclosure_count,
+        risk_score=risk_score,
+        risk_signals=risk_signals,
+        convertible_bonds=convertible_bonds,
+        cb_subscribers=cb_subscribers,
+        officers=officers,
+        financials=financials,
+        shareholders=shareholders,
+        affiliates=affiliates,
+        summary=summary
+    )
+
+
 @router.get("/name/{company_name}", response_model=CompanyFullReport)
 async def get_company_full_report(
     company_name: str,
+    response: Response,
     exact_match: bool = Query(False, description="정확히 일치하는 회사명만 조회")
 ):
     """
@@ -188,284 +513,54 @@ async def get_company_full_report(
 
     **exact_match=false (기본)**: 부분 일치 시 가장 유사한 회사 선택
     **exact_match=true**: 정확히 일치하는 회사만 조회
+
+    사전 계산된 스냅샷이 있으면 그대로 반환 (`X-Report-Snapshot: HIT`),
+    없거나 데이터 변경으로 무효화된 경우 재계산 후 저장 (`X-Report-Snapshot: MISS`).
+    재계산 시 섹션별 조회 시간은 `Server-Timing` 응답 헤더로 확인 가능
     """
     try:
-        conn = await asyncpg.connect(DB_URL)
-
-        try:
-            # 1. 회사 찾기
-            if exact_match:
-                company = await conn.fetchrow("""
-                    SELECT id, corp_code, name, ticker, market, company_type, trading_status
-                    FROM companies WHERE name = $1
-                """, company_name)
-            else:
-                company = await conn.fetchrow("""
-                    SELECT id, corp_code, name, ticker, market, company_type, trading_status
-                    FROM companies
-                    WHERE name ILIKE $1
-                    ORDER BY
-                        CASE WHEN name = $2 THEN 0 ELSE 1 END,
-                        LENGTH(name)
-                    LIMIT 1
-                """, f"%{company_name}%", company_name)
+        timings: Dict[str, float] = {}
 
+        # 1. 회사 찾기 + 스냅샷 조회
+        start = time.perf_counter()
+        async with acquire_pg() as conn:
+            company = await _find_company(conn, company_name, exact_match)
             if not company:
                 raise HTTPException(status_code=404, detail=f"회사를 찾을 수 없습니다: {company_name}")
 
-            company_id = company['id']
-            corp_code = company['corp_code']
-
-            # 2. 공시 건수
-            disclosure_count = await conn.fetchval("""
-                SELECT COUNT(*) FROM disclosures WHERE corp_code = $1
-            """, corp_code) or 0
-
-            # 3. 리스크 점수
-            risk_score_row = await conn.fetchrow("""
-                SELECT analysis_year, analysis_quarter, total_score, risk_level,
-                       investment_grade, raymondsrisk_score, human_risk_score,
-                       cb_risk_score, financial_health_score
-                FROM risk_scores
-                WHERE company_id = $1
-                ORDER BY analysis_year DESC, analysis_quarter DESC NULLS LAST
-                LIMIT 1
-            """, company_id)
-
-            risk_score = None
-            if risk_score_row:
-                risk_score = RiskScoreInfo(
-                    analysis_year=risk_score_row['analysis_year'],
-                    analysis_quarter=risk_score_row['analysis_quarter'],
-                    total_score=float(risk_score_row['total_score']),
-                    risk_level=risk_score_row['risk_level'],
-                    investment_grade=risk_score_row['investment_grade'],
-                    raymondsrisk_score=float(risk_score_row['raymondsrisk_score']),
-                    human_risk_score=float(risk_score_row['human_risk_score']),
-                    cb_risk_score=float(risk_score_row['cb_risk_score']),
-                    financial_health_score=float(risk_score_row['financial_health_score'])
-                )
-
-            # 4. 리스크 신호
-            risk_signals_rows = await conn.fetch("""
-                SELECT pattern_type, severity, risk_score, title, description
-                FROM risk_signals
-                WHERE target_company_id = $1
-                ORDER BY risk_score DESC
-            """, company_id)
-
-            risk_signals = [
-                RiskSignalInfo(
-                    pattern_type=row['pattern_type'],
-                    severity=row['severity'],
-                    risk_score=float(row['risk_score']),
-                    title=row['title'],
-                    description=row['description']
-                )
-                for row in risk_signals_rows
-            ]
-
-            # 5. CB 발행
-            cb_rows = await conn.fetch("""
-                SELECT issue_date, issue_amount / 100000000.0 as issue_amount_billion,
-                       conversion_price, maturity_date, bond_name
-                FROM convertible_bonds
-                WHERE company_id = $1
-                ORDER BY issue_date DESC NULLS LAST
-            """, company_id)
-
-            convertible_bonds = [
-                CBInfo(
-                    issue_date=str(row['issue_date']) if row['issue_date'] else None,
-                    issue_amount_billion=float(row['issue_amount_billion']) if row['issue_amount_billion'] else 0,
-                    conversion_price=row['conversion_price'],
-                    maturity_date=str(row['maturity_date']) if row['maturity_date'] else None,
-                    bond_name=row['bond_name']
-                )
-                for row in cb_rows
-            ]
-
-            # 6. CB 인수인
-            sub_rows = await conn.fetch("""
-                SELECT cs.subscriber_name,
-                       cs.subscription_amount / 100000000.0 as subscription_amount_billion,
-                       cb.issue_date,
-                       cb.bond_name
-                FROM cb_subscribers cs
-                JOIN convertible_bonds cb ON cs.cb_id = cb.id
-                WHERE cb.company_id = $1
-                ORDER BY cb.issue_date DESC NULLS LAST
-            """, company_id)
-
-            cb_subscribers = [
-                CBSubscriberInfo(
-                    subscriber_name=row['subscriber_name'],
-                    subscription_amount_billion=float(row['subscription_amount_billion']) if row['subscription_amount_billion'] else 0,
-                    issue_date=str(row['issue_date']) if row['issue_date'] else None,
-                    bond_name=row['bond_name']
-                )
-                for row in sub_rows
-            ]
-
-            # 7. 임원 - 최신 보고서 기준 재직 여부 포함
-            # 먼저 해당 회사의 가장 최신 보고서 날짜 조회
-            latest_report = await conn.fetchrow("""
-                SELECT MAX(source_report_date) as latest_date
-                FROM officer_positions
-                WHERE company_id = $1
-            """, company_id)
-            latest_report_date = latest_report['latest_date'] if latest_report else None
-
-            officer_rows = await conn.fetch("""
-                WITH latest_officers AS (
-                    -- 최신 보고서의 임원 목록
-                    SELECT DISTINCT o.name, op.position
-                    FROM officers o
-                    JOIN officer_positions op ON o.id = op.officer_id
-                    WHERE op.company_id = $1
-                    AND op.source_report_date = $2
-                )
-                SELECT DISTINCT ON (o.name, op.position)
-                    o.name,
-                    op.position,
-                    op.term_start_date,
-                    op.term_end_date,
-                    CASE WHEN lo.name IS NOT NULL THEN true ELSE false END as is_current
-                FROM officers o
-                JOIN officer_positions op ON o.id = op.officer_id
-                LEFT JOIN latest_officers lo ON o.name = lo.name AND op.position = lo.position
-                WHERE op.company_id = $1
-                ORDER BY o.name, op.position, op.source_report_date DESC NULLS LAST
-            """, company_id, latest_report_date)
-
-            officers = [
-                OfficerInfo(
-                    name=row['name'],
-                    position=row['position'] or '',
-                    term_start=str(row['term_start_date']) if row['term_start_date'] else None,
-                    term_end=str(row['term_end_date']) if row['term_end_date'] else None,
-                    is_current=row['is_current']
-                )
-                for row in officer_rows
-            ]
-
-            # 8. 재무제표
-            fin_rows = await conn.fetch("""
-                SELECT fiscal_year, quarter,
-                       total_assets / 100000000.0 as total_assets_billion,
-                       total_liabilities / 100000000.0 as total_liabilities_billion,
-                       total_equity / 100000000.0 as total_equity_billion,
-                       revenue / 100000000.0 as revenue_billion,
-                       operating_profit / 100000000.0 as operating_profit_billion,
-                       net_income / 100000000.0 as net_income_billion
-                FROM financial_statements
-                WHERE company_id = $1
-                ORDER BY fiscal_year DESC, quarter DESC NULLS LAST
-            """, company_id)
-
-            financials = [
-                FinancialInfo(
-                    fiscal_year=row['fiscal_year'],
-                    quarter=row['quarter'],
-                    total_assets_billion=float(row['total_assets_billion']) if row['total_assets_billion'] else None,
-                    total_liabilities_billion=float(row['total_liabilities_billion']) if row['total_liabilities_billion'] else None,
-                    total_equity_billion=float(row['total_equity_billion']) if row['total_equity_billion'] else None,
-                    revenue_billion=float(row['revenue_billion']) if row['revenue_billion'] else None,
-                    operating_profit_billion=float(row['operating_profit_billion']) if row['operating_profit_billion'] else None,
-                    net_income_billion=float(row['net_income_billion']) if row['net_income_billion'] else None
-                )
-                for row in fin_rows
-            ]
+            snapshot = None
+            try:
+                snapshot = await get_snapshot(conn, company['id'])
+            except Exception as e:
+                logger.warning(f"Report snapshot lookup failed: {e}")
+        timings["company"] = round((time.perf_counter() - start) * 1000, 2)
+
+        if is_snapshot_fresh(snapshot):
+            return Response(
+                content=snapshot['payload'],
+                media_type="application/json",
+                headers={
+                    "X-Report-Snapshot": "HIT",
+                    "Server-Timing": _format_server_timing(timings),
+                },
+            )
 
-            # 9. 주주 (중복 제거 + 숫자로만 된 이름 필터링 - 파싱 오류 데이터)
-            # 동일 주주는 가장 최신 보고서 기준으로 1건만 표시
-            sh_rows = await conn.fetch("""
-                SELECT DISTINCT ON (shareholder_name_normalized)
-                    shareholder_name,
-                    share_ratio,
-                    is_largest_shareholder,
-                    report_year,
-                    source_rcept_no
-                FROM major_shareholders
-                WHERE company_id = $1
-                  AND shareholder_name !~ '^[0-9,\\.\\s]+$'
-                ORDER BY shareholder_name_normalized, source_rcept_no DESC NULLS LAST
-            """, company_id)
-
-            shareholders = [
-                ShareholderInfo(
-                    shareholder_name=row['shareholder_name'],
-                    share_ratio=float(row['share_ratio']) if row['share_ratio'] else None,
-                    is_largest=row['is_largest_shareholder'] or False,
-                    report_year=row['report_year']
-                )
-                for row in sh_rows
-            ]
+        # 2. 섹션 동시 조회 및 보고서 조립
+        expected_version = snapshot['data_version'] if snapshot else 0
+        report = await build_company_report(company, timings)
 
-            # 지분율 높은 순으로 재정렬
-            shareholders.sort(key=lambda x: x.share_ratio or 0, reverse=True)
-
-            # 10. 계열회사
-            aff_rows = await conn.fetch("""
-                SELECT c2.name as affiliate_name, a.relationship_type
-                FROM affiliates a
-                JOIN companies c2 ON a.affiliate_company_id = c2.id
-                WHERE a.parent_company_id = $1
-            """, company_id)
-
-            affiliates = [
-                AffiliateInfo(
-                    affiliate_name=row['affiliate_name'],
-                    relationship_type=row['relationship_type'] or 'AFFILIATE'
-                )
-                for row in aff_rows
-            ]
+        # 3. 스냅샷 저장 (실패해도 응답은 정상 반환)
+        try:
+            async with acquire_pg() as conn:
+                await save_snapshot(conn, company['id'], report.model_dump_json(), expected_version)
+        except Exception as e:
+            logger.warning(f"Report snapshot save failed for {company['name']}: {e}")
 
-            # Summary 생성
-            total_cb_amount = sum(cb.issue_amount_billion for cb in convertible_bonds)
-
-            # 인수인별 합계
-            subscriber_totals = {}
-            for sub in cb_subscribers:
-                name = sub.subscriber_name
-                subscriber_totals[name] = subscriber_totals.get(name, 0) + sub.subscription_amount_billion
-
-            top_subscribers = sorted(subscriber_totals.items(), key=lambda x: x[1], reverse=True)[:5]
-
-            summary = {
-                "cb_total_count": len(convertible_bonds),
-                "cb_total_amount_billion": round(total_cb_amount, 1),
-                "risk_signal_count": len(risk_signals),
-                "high_risk_signals": len([s for s in risk_signals if s.severity == 'HIGH']),
-                "officer_count": len(officers),
-                "top_cb_subscribers": [{"name": name, "amount_billion": round(amt, 1)} for name, amt in top_subscribers],
-                "has_financial_loss": any(f.net_income_billion and f.net_income_billion < 0 for f in financials)
-            }
-
-            return CompanyFullReport(
-                basic_info=CompanyBasicInfo(
-                    id=str(company_id),
-                    corp_code=corp_code or '',
-                    name=company['name'],
-                    ticker=company.get('ticker'),
-                    market=company.get('market'),
-                    company_type=company.get('company_type'),
-                    trading_status=company.get('trading_status')
-                ),
-                disclosure_count=disclosure_count,
-                risk_score=risk_score,
-                risk_signals=risk_signals,
-                convertible_bonds=convertible_bonds,
-                cb_subscribers=cb_subscribers,
-                officers=officers,
-                financials=financials,
-                shareholders=shareholders,
-                affiliates=affiliates,
-                summary=summary
-            )
+        response.headers["X-Report-Snapshot"] = "MISS"
+        response.headers["Server-Timing"] = _format_server_timing(timings)
+        logger.debug(f"Report sections for {company['name']}: {timings}")
 
-        finally:
-            await conn.close()
+        return report
 
     except HTTPException:
         raise
@@ -486,9 +581,7 @@ async def get_high_risk_companies(
     - 투자등급 포함
     """
     try:
-        conn = await asyncpg.connect(DB_URL)
-
-        try:
+        async with acquire_pg() as conn:
             companies = await conn.fetch("""
                 SELECT c.id, c.corp_code, c.name,
                        COALESCE(cb.cb_count, 0) as cb_count,
@@ -516,9 +609,6 @@ async def get_high_risk_companies(
                 )
                 for row in companies
             ]
-        finally:
-            await conn.close()
-
     except Exception as e:
         logger.error(f"High risk query error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
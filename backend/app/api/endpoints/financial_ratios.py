@@ -17,6 +17,7 @@ from decimal import Decimal
 import logging
 
 from app.database import get_db
+from app.services.cache_service import cache
 from app.models.financial_ratios import FinancialRatios
 from app.models.financial_details import FinancialDetails
 from app.models.companies import Company
@@ -26,6 +27,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/financial-ratios", tags=["FinancialRatios"])
 
+# 통계 캐시 (재무비율은 배치 계산 후에만 바뀜 → 만료 후에도 stale 값 즉시 반환)
+STATISTICS_CACHE_TTL = 600
+STATISTICS_STALE_TTL = 6 * 3600
+
 
 # ============================================================================
 # Response Formatters
@@ -273,6 +278,10 @@ async def get_financial_ratios_ranking(
 
 
 @router.get("/statistics")
+@cache.cached(
+    ttl=STATISTICS_CACHE_TTL, key_prefix="fr_statistics",
+    stale_ttl=STATISTICS_STALE_TTL, session_arg="db",
+)
 async def get_financial_ratios_statistics(
     year: Optional[int] = Query(None, description="연도 (기본: 최신)"),
     db: AsyncSession = Depends(get_db)
@@ -7,8 +7,12 @@
 - CB 인수자 투자 이력
 - 노드 중심 전환
 """
-from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple
+import base64
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
 from uuid import UUID
 
@@ -19,6 +23,9 @@ from datetime import datetime, date, time, timedelta
 from app.config import settings
 from app.database import AsyncSessionLocal
 import app.database as db_module  # 동적으로 neo4j_driver 접근
+from app.services.graph_cache import CACHE_HEADER, company_network_key, get_or_build_graph, officer_network_key
+from app.utils.cache import company_tag
+from app.utils.streaming import NDJSON_MEDIA_TYPE, stream_ndjson
 import logging
 
 logger = logging.getLogger(__name__)
@@ -125,6 +132,32 @@ class RecenterRequest(BaseModel):
     limit: int = Field(100, ge=10, le=500)
 
 
+class ExpandRequest(BaseModel):
+    """노드 확장 요청 (증분)"""
+    node_type: str = Field(..., description="Company|Officer|ConvertibleBond|Subscriber|Shareholder")
+    node_id: str
+    known_node_ids: List[str] = Field(
+        default_factory=list, max_length=5000,
+        description="클라이언트가 이미 가진 노드 ID (응답에서 제외)"
+    )
+    known_relationship_ids: List[str] = Field(
+        default_factory=list, max_length=10000,
+        description="클라이언트가 이미 가진 관계 ID (응답에서 제외)"
+    )
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (다음 페이지)")
+    limit: int = Field(100, ge=10, le=500, description="페이지당 관계 수")
+
+
+class ExpandResponse(BaseModel):
+    """노드 확장 응답 (신규 노드/관계만)"""
+    nodes: List[GraphNode]
+    relationships: List[GraphRelationship]
+    center: Dict[str, str]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total_relationships: Optional[int] = None  # 첫 페이지에서만 계산 (전체 연결 수)
+
+
 # Dependencies
 def is_neo4j_available() -> bool:
     """Neo4j 드라이버 사용 가능 여부 확인"""
@@ -161,7 +194,8 @@ async def _get_officer_career_from_postgres(officer_id: str, db: AsyncSession):
 
     # 임원 정보 조회 (career_raw_text 포함)
     officer_query = text("""
-        SELECT id::text, name, birth_date, position, career_history, career_raw_text
+        SELECT id::text, name, birth_date, position, career_history, career_raw_text,
+               person_id::text
         FROM officers WHERE id::text = :officer_id
     """)
     result = await db.execute(officer_query, {"officer_id": officer_id})
@@ -170,16 +204,18 @@ async def _get_officer_career_from_postgres(officer_id: str, db: AsyncSession):
     if not officer:
         raise HTTPException(status_code=404, detail="Officer not found")
 
-    # 경력 조회 (officer_positions 테이블)
+    # 경력 조회 (officer_positions 테이블, 동일인 person_id의 모든 임원 레코드)
     career_query = text("""
         SELECT c.id::text as company_id, c.name as company_name,
                op.position, op.term_start_date::text, op.term_end_date::text, op.is_current
         FROM officer_positions op
+        JOIN officers o ON op.officer_id = o.id
         JOIN companies c ON op.company_id = c.id
-        WHERE op.officer_id::text = :officer_id
+        WHERE o.id = CAST(:officer_id AS uuid)
+           OR o.person_id = CAST(:person_id AS uuid)
         ORDER BY op.is_current DESC, op.term_start_date DESC
     """)
-    result = await db.execute(career_query, {"officer_id": officer_id})
+    result = await db.execute(career_query, {"officer_id": officer.id, "person_id": officer.person_id})
     careers = result.fetchall()
 
     career_history = []
@@ -242,27 +278,31 @@ def serialize_neo4j_node(record: Dict) -> GraphNode:
 
 def serialize_neo4j_relationship(rel: Any) -> GraphRelationship:
     """Neo4j 관계를 GraphRelationship으로 변환"""
+    return GraphRelationship(**_relationship_dict(rel))
+
+
+def _relationship_dict(rel: Any) -> Dict[str, Any]:
+    """Neo4j 관계 → GraphRelationship 필드 dict (스트리밍 응답은 모델 생성 생략)"""
     # start_node와 end_node에서 'id' 속성 추출 (UUID)
     # element_id가 아닌 실제 데이터 id 사용
-    source_id = rel.start_node.get("id", str(rel.start_node.element_id))
-    target_id = rel.end_node.get("id", str(rel.end_node.element_id))
-
-    return GraphRelationship(
-        id=str(rel.element_id),
-        type=rel.type,
-        source=source_id,
-        target=target_id,
-        properties=serialize_node_properties(rel)
-    )
+    return {
+        "id": str(rel.element_id),
+        "type": rel.type,
+        "source": rel.start_node.get("id", str(rel.start_node.element_id)),
+        "target": rel.end_node.get("id", str(rel.end_node.element_id)),
+        "properties": serialize_node_properties(rel),
+    }
 
 
 # Endpoints
 @router.get("/company/{company_id}", response_model=GraphResponse)
 async def get_company_network(
+    response: Response,
     company_id: str,
     depth: int = Query(1, ge=1, le=3, description="탐색 깊이: 1=임원+CB회차, 2=+인수자, 3=+타사경력/투자"),
     limit: int = Query(100, ge=10, le=500, description="노드 제한"),
     report_years: Optional[str] = Query(None, description="사업보고서 연도 필터 (쉼표 구분, 예: 2023,2024,2025)"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="응답 형식: json | ndjson (스트리밍)"),
     driver=Depends(get_neo4j_driver),
     db: AsyncSession = Depends(get_db)
 ):
@@ -278,6 +318,280 @@ async def get_company_network(
     - 사업보고서 공시 연도 필터링 (source_report_date 기준)
     - 예: "2025" → 2025년 사업보고서에 나온 임원만
     - 예: "2023,2024,2025" → 최근 3년 사업보고서에 나온 임원
+
+    format=ndjson:
+    - Neo4j 결과 커서에서 바로 한 줄씩 전송 (전체 응답을 메모리에 만들지 않음)
+    - {"kind": "node", ...} 줄 → {"kind": "relationship", ...} 줄 → {"kind": "end", ...} 한 줄
+    - 전송 도중 오류는 {"kind": "error", "detail": ...} 줄로 알림 (상태 코드는 이미 200)
+    - 캐시 미사용 (X-Cache: BYPASS)
+
+    캐시:
+    - (노드, depth, limit, report_years) 단위, Neo4j 동기화 스크립트 실행 시 무효화
+    - 응답 헤더 X-Cache: HIT | MISS | COALESCED | BYPASS
+    """
+    if format == "ndjson":
+        return await _stream_company_network(company_id, depth, limit, report_years, driver, db)
+
+    return await get_or_build_graph(
+        response,
+        company_network_key(company_id, depth, limit, report_years),
+        lambda: _build_company_network(company_id, depth, limit, report_years, driver, db),
+        # corp_code로 조회해도 기업 단위 무효화(company_tag)에 포함되도록 중심 노드 UUID로 태깅
+        tags_fn=lambda payload: [company_tag(payload["nodes"][0]["id"])] if payload["nodes"] else [],
+    )
+
+
+# 회사 네트워크 쿼리 결과 그룹: (그룹명, 노드 타입, relation_type 표시)
+# 노드 그룹 → 관계 그룹 순서로 처리 (임원 관계 필터/중복 제거가 앞선 노드에 의존)
+_COMPANY_NETWORK_NODE_GROUPS = [
+    ("c", "Company", None),
+    ("officers", "Officer", None),
+    ("affiliates", "Company", None),
+    ("cbs", "ConvertibleBond", None),
+    ("shareholders", "Shareholder", None),
+    ("subscribers", "Subscriber", None),
+    ("officer_career_companies", "Company", "officer_career"),  # 임원 경력 회사 표시
+    ("subscriber_investment_cbs", "ConvertibleBond", "subscriber_investment"),  # 인수자 투자 CB 표시
+    ("subscriber_investment_companies", "Company", "subscriber_investment"),  # 인수자 투자 회사 표시
+]
+_COMPANY_NETWORK_REL_GROUPS = [
+    "officer_rels",
+    "affiliate_rels",
+    "cb_rels",
+    "shareholder_rels",
+    "subscriber_rels",
+    "officer_career_rels",
+    "subscriber_investment_rels",
+    "subscriber_investment_issued_rels",
+]
+
+# 단건 응답: 그룹별 리스트를 한 레코드로
+_COMPANY_NETWORK_RETURN = (
+    "RETURN "
+    + ", ".join([g for g, _, _ in _COMPANY_NETWORK_NODE_GROUPS] + _COMPANY_NETWORK_REL_GROUPS)
+    + "\n    LIMIT $limit"
+)
+
+# 스트리밍 응답: (그룹명, 노드/관계) 한 행씩 → 드라이버가 fetch_size 단위로 받아옴
+_COMPANY_NETWORK_STREAM_RETURN = (
+    "UNWIND [['c', c]]\n"
+    + "".join(
+        f"         + [x IN {g} | ['{g}', x]]\n"
+        for g in [g for g, _, _ in _COMPANY_NETWORK_NODE_GROUPS[1:]] + _COMPANY_NETWORK_REL_GROUPS
+    )
+    + "         AS item\n"
+    + "    RETURN item[0] AS grp, item[1] AS value"
+)
+
+# 임원 상장사 경력 수 조회용 보조 쿼리
+_OFFICER_CAREER_COUNT_CYPHER = """
+    MATCH (o:Officer {id: $officer_id})
+    MATCH (same_person:Officer)-[:WORKS_AT|WORKED_AT]->(company:Company)
+    WHERE same_person.person_id = o.person_id OR same_person.id = o.id
+    RETURN count(DISTINCT company) as career_count
+    """
+
+
+async def _officer_career_count(session, officer_id: str) -> int:
+    """임원(동일인 포함)의 상장사 경력 수"""
+    try:
+        career_result = await session.run(_OFFICER_CAREER_COUNT_CYPHER, officer_id=officer_id)
+        career_record = await career_result.single()
+        if career_record:
+            return career_record["career_count"]
+    except Exception as e:
+        logger.warning(f"Failed to get officer career count: {e}")
+    return 0
+
+
+async def _iter_company_network(
+    rows: AsyncIterator[Tuple[str, Any]],
+    career_count_fn: Callable[[str], Awaitable[int]],
+    filtered_officer_ids: Optional[set],
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    (그룹명, Neo4j 노드/관계) 행 → ("node" | "relationship", 필드 dict)
+
+    단건 응답과 NDJSON 스트리밍이 같은 필터/중복 제거 규칙을 쓰도록 공용으로 사용
+    """
+    node_groups = {g: (node_type, relation_type) for g, node_type, relation_type in _COMPANY_NETWORK_NODE_GROUPS}
+    seen_node_ids = set()
+    seen_rel_ids = set()
+    seen_sub_rel_pairs = set()
+    filtered_officer_node_ids = set()  # 필터링된 임원 노드 ID 저장
+
+    async for group, value in rows:
+        # Neo4j 노드/관계는 속성이 없으면 falsy이므로 None만 제외
+        if value is None:
+            continue
+
+        if group in node_groups:
+            node_type, relation_type = node_groups[group]
+            node_id = value["id"]
+            if node_id in seen_node_ids:
+                continue
+
+            properties = serialize_node_properties(value)
+            if group == "officers":
+                # report_years 필터가 있으면 해당 연도 임원만 포함
+                if filtered_officer_ids is not None and node_id not in filtered_officer_ids:
+                    continue  # 이 임원은 해당 연도에 공시되지 않았음
+                filtered_officer_node_ids.add(node_id)
+                properties["listed_career_count"] = await career_count_fn(node_id)
+            if relation_type:
+                properties["relation_type"] = relation_type
+
+            seen_node_ids.add(node_id)
+            yield "node", {"id": node_id, "type": node_type, "properties": properties}
+            continue
+
+        rel = _relationship_dict(value)
+        if rel["id"] in seen_rel_ids:
+            continue
+        # 임원 관계는 필터링된 임원(source)만 포함
+        if group == "officer_rels" and filtered_officer_ids is not None \
+                and rel["source"] not in filtered_officer_node_ids:
+            continue
+        if group == "subscriber_rels":
+            # 인수자-CB 관계 중복 방지 (같은 인수자가 같은 CB에 여러 관계를 가진 경우)
+            rel_pair = (rel["source"], rel["target"])
+            if rel_pair in seen_sub_rel_pairs:
+                continue
+            seen_sub_rel_pairs.add(rel_pair)
+
+        seen_rel_ids.add(rel["id"])
+        yield "relationship", rel
+
+
+async def _record_rows(record) -> AsyncIterator[Tuple[str, Any]]:
+    """단건 레코드(그룹별 리스트) → (그룹명, 노드/관계) 행"""
+    yield "c", record["c"]
+    for group, _, _ in _COMPANY_NETWORK_NODE_GROUPS[1:]:
+        for value in record[group]:
+            yield group, value
+    for group in _COMPANY_NETWORK_REL_GROUPS:
+        for value in record[group]:
+            yield group, value
+
+
+async def _build_company_network(
+    company_id: str,
+    depth: int,
+    limit: int,
+    report_years: Optional[str],
+    driver,
+    db: AsyncSession,
+) -> GraphResponse:
+    """회사 중심 네트워크 생성 (캐시 미스 시)"""
+    cypher, filtered_officer_ids = await _company_network_query(company_id, depth, report_years, db)
+
+    try:
+        async with driver.session() as session:
+            result = await session.run(cypher + _COMPANY_NETWORK_RETURN, company_id=company_id, limit=limit)
+            record = await result.single()
+
+            if not record:
+                raise HTTPException(status_code=404, detail="Company not found")
+
+            nodes = []
+            relationships = []
+            async for kind, item in _iter_company_network(
+                _record_rows(record),
+                lambda officer_id: _officer_career_count(session, officer_id),
+                filtered_officer_ids,
+            ):
+                if kind == "node":
+                    nodes.append(GraphNode(**item))
+                else:
+                    relationships.append(GraphRelationship(**item))
+
+            return GraphResponse(
+                nodes=nodes,
+                relationships=relationships,
+                center={"type": "Company", "id": company_id}
+            )
+
+    except Exception as e:
+        logger.error(f"Error fetching company network: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _stream_company_network(
+    company_id: str,
+    depth: int,
+    limit: int,
+    report_years: Optional[str],
+    driver,
+    db: AsyncSession,
+) -> StreamingResponse:
+    """회사 중심 네트워크 NDJSON 스트리밍 (캐시 미사용)"""
+    cypher, filtered_officer_ids = await _company_network_query(company_id, depth, report_years, db)
+
+    # 결과 커서를 여는 동안 같은 세션에서 다른 쿼리를 실행하면 남은 결과가 전부 버퍼링되므로
+    # 임원 경력 수 조회는 별도 세션 사용
+    session = driver.session()
+    career_session = driver.session()
+
+    async def close_sessions():
+        await session.close()
+        await career_session.close()
+
+    try:
+        result = await session.run(cypher + _COMPANY_NETWORK_STREAM_RETURN, company_id=company_id, limit=limit)
+        first = await result.peek()
+    except Exception as e:
+        await close_sessions()
+        logger.error(f"Error fetching company network: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if first is None:
+        await close_sessions()
+        raise HTTPException(status_code=404, detail="Company not found")
+
+    async def rows():
+        async for row in result:
+            yield row["grp"], row["value"]
+
+    async def lines():
+        counts = {"node": 0, "relationship": 0}
+        try:
+            async for kind, item in _iter_company_network(
+                rows(),
+                lambda officer_id: _officer_career_count(career_session, officer_id),
+                filtered_officer_ids,
+            ):
+                counts[kind] += 1
+                yield {"kind": kind, **item}
+            yield {
+                "kind": "end",
+                "center": {"type": "Company", "id": company_id},
+                "nodes": counts["node"],
+                "relationships": counts["relationship"],
+            }
+        except Exception as e:
+            logger.error(f"Error streaming company network: {e}", exc_info=True)
+            yield {"kind": "error", "detail": str(e)}
+
+    # 세션 종료는 응답 background로 (본문 전송 전 클라이언트가 끊어 lines()가 실행되지 않아도 실행됨)
+    return StreamingResponse(
+        stream_ndjson(lines()),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={CACHE_HEADER: "BYPASS"},
+        background=BackgroundTask(close_sessions),
+    )
+
+
+async def _company_network_query(
+    company_id: str,
+    depth: int,
+    report_years: Optional[str],
+    db: AsyncSession,
+) -> Tuple[str, Optional[set]]:
+    """
+    depth별 회사 네트워크 Cypher(RETURN 절 제외)와 report_years 임원 ID 필터
+
+    Cypher는 _COMPANY_NETWORK_NODE_GROUPS/_COMPANY_NETWORK_REL_GROUPS의 모든 그룹을 바인딩한
+    WITH 절로 끝나며, 호출 측에서 단건/스트리밍 RETURN 절을 붙인다.
     """
     # company_id가 corp_code 형식(8자리 숫자)인지 UUID 형식인지 확인
     is_corp_code = len(company_id) == 8 and company_id.isdigit()
@@ -336,14 +650,11 @@ async def get_company_network(
          collect(DISTINCT cb)[..20] as cbs,
          collect(DISTINCT r3)[..20] as cb_rels,
          collect(DISTINCT sh)[..20] as shareholders,
-         collect(DISTINCT r_sh)[..20] as shareholder_rels
-
-    RETURN c, officers, officer_rels, affiliates, affiliate_rels,
-           cbs, cb_rels, shareholders, shareholder_rels,
-           [] as subscribers, [] as subscriber_rels,
-           [] as officer_career_companies, [] as officer_career_rels,
-           [] as subscriber_investment_companies, [] as subscriber_investment_rels
-    LIMIT $limit
+         collect(DISTINCT r_sh)[..20] as shareholder_rels,
+         [] as subscribers, [] as subscriber_rels,
+         [] as officer_career_companies, [] as officer_career_rels,
+         [] as subscriber_investment_companies, [] as subscriber_investment_cbs,
+         [] as subscriber_investment_rels, [] as subscriber_investment_issued_rels
     """
 
     # 2단계: 1단계 + 인수자
@@ -375,13 +686,10 @@ async def get_company_network(
          collect(DISTINCT sh)[..20] as shareholders,
          collect(DISTINCT r_sh)[..20] as shareholder_rels,
          collect(DISTINCT s)[..50] as subscribers,
-         collect(DISTINCT r4)[..50] as subscriber_rels
-
-    RETURN c, officers, officer_rels, affiliates, affiliate_rels,
-           cbs, cb_rels, shareholders, shareholder_rels, subscribers, subscriber_rels,
-           [] as officer_career_companies, [] as officer_career_rels,
-           [] as subscriber_investment_companies, [] as subscriber_investment_rels
-    LIMIT $limit
+         collect(DISTINCT r4)[..50] as subscriber_rels,
+         [] as officer_career_companies, [] as officer_career_rels,
+         [] as subscriber_investment_companies, [] as subscriber_investment_cbs,
+         [] as subscriber_investment_rels, [] as subscriber_investment_issued_rels
     """
 
     # 3단계: 2단계 + 임원 타사 경력 + 인수자 타사 투자
@@ -406,17 +714,12 @@ async def get_company_network(
     WITH c, o, r1, aff, r2, cb, r3, sh, r_sh, s, r4
 
     // 3단계: 임원의 타 상장사 경력 (현재 회사 제외)
-    // 동일인 식별: 이름 + 생년월일
+    // 동일인 식별: person_id (이름 + 출생년월, officer_identities)
+    // person_id 미지정(동기화 전) 임원은 자기 자신의 경력만 (_OFFICER_CAREER_COUNT_CYPHER와 동일)
     OPTIONAL MATCH (same_officer:Officer)-[r_career:WORKS_AT|WORKED_AT]->(career_company:Company)
     WHERE o IS NOT NULL
-      AND same_officer.name = o.name
+      AND (same_officer.person_id = o.person_id OR same_officer.id = o.id)
       AND career_company.id <> c.id
-      AND (
-        (same_officer.birth_date IS NOT NULL AND o.birth_date IS NOT NULL
-         AND substring(replace(replace(replace(same_officer.birth_date, '년', ''), '월', ''), '.', ''), 0, 6)
-            = substring(replace(replace(replace(o.birth_date, '년', ''), '월', ''), '.', ''), 0, 6))
-        OR (same_officer.birth_date IS NULL AND o.birth_date IS NULL)
-      )
 
     // 3단계: 인수자의 타 상장사 CB 투자 (현재 회사 제외)
     // CB 노드와 발행 회사 모두 수집
@@ -440,222 +743,9 @@ async def get_company_network(
          collect(DISTINCT other_cb)[..50] as subscriber_investment_cbs,
          collect(DISTINCT r_invest)[..50] as subscriber_investment_rels,
          collect(DISTINCT r_other_issued)[..50] as subscriber_investment_issued_rels
-
-    RETURN c, officers, officer_rels, affiliates, affiliate_rels,
-           cbs, cb_rels, shareholders, shareholder_rels, subscribers, subscriber_rels,
-           officer_career_companies, officer_career_rels,
-           subscriber_investment_companies, subscriber_investment_cbs,
-           subscriber_investment_rels, subscriber_investment_issued_rels
-    LIMIT $limit
-    """
-
-    # 임원 상장사 경력 수 조회용 보조 쿼리
-    officer_career_count_cypher = """
-    MATCH (o:Officer {id: $officer_id})
-    MATCH (same_person:Officer)-[:WORKS_AT|WORKED_AT]->(company:Company)
-    WHERE same_person.name = o.name
-      AND (
-        (same_person.birth_date IS NOT NULL AND o.birth_date IS NOT NULL
-         AND substring(replace(replace(replace(same_person.birth_date, '년', ''), '월', ''), '.', ''), 0, 6)
-            = substring(replace(replace(replace(o.birth_date, '년', ''), '월', ''), '.', ''), 0, 6))
-        OR (same_person.birth_date IS NULL AND o.birth_date IS NULL)
-      )
-    RETURN count(DISTINCT company) as career_count
     """
 
-    try:
-        async with driver.session() as session:
-            result = await session.run(cypher, company_id=company_id, limit=limit)
-            record = await result.single()
-
-            if not record:
-                raise HTTPException(status_code=404, detail="Company not found")
-
-            nodes = []
-            relationships = []
-
-            # Center company
-            company_node = record["c"]
-            nodes.append(GraphNode(
-                id=company_node["id"],
-                type="Company",
-                properties=serialize_node_properties(company_node)
-            ))
-
-            # Officers - 상장사 경력 수 포함 (report_years 필터 적용)
-            filtered_officer_node_ids = set()  # 필터링된 임원 노드 ID 저장
-            for officer in record["officers"]:
-                if officer:
-                    officer_id = officer["id"]
-
-                    # report_years 필터가 있으면 해당 연도 임원만 포함
-                    if filtered_officer_ids is not None and officer_id not in filtered_officer_ids:
-                        continue  # 이 임원은 해당 연도에 공시되지 않았음
-
-                    filtered_officer_node_ids.add(officer_id)
-
-                    # 상장사 경력 수 조회
-                    career_count = 0
-                    try:
-                        career_result = await session.run(
-                            officer_career_count_cypher,
-                            officer_id=officer_id
-                        )
-                        career_record = await career_result.single()
-                        if career_record:
-                            career_count = career_record["career_count"]
-                    except Exception as e:
-                        logger.warning(f"Failed to get officer career count: {e}")
-
-                    officer_props = serialize_node_properties(officer)
-                    officer_props["listed_career_count"] = career_count
-
-                    nodes.append(GraphNode(
-                        id=officer_id,
-                        type="Officer",
-                        properties=officer_props
-                    ))
-
-            # Officer relationships (필터링된 임원만)
-            for rel in record["officer_rels"]:
-                if rel:
-                    rel_data = serialize_neo4j_relationship(rel)
-                    # source 또는 target이 필터링된 임원인 경우만 포함
-                    if filtered_officer_ids is None or rel_data.source in filtered_officer_node_ids:
-                        relationships.append(rel_data)
-
-            # Affiliates
-            for affiliate in record["affiliates"]:
-                if affiliate:
-                    nodes.append(GraphNode(
-                        id=affiliate["id"],
-                        type="Company",
-                        properties=serialize_node_properties(affiliate)
-                    ))
-
-            for rel in record["affiliate_rels"]:
-                if rel:
-                    relationships.append(serialize_neo4j_relationship(rel))
-
-            # CBs
-            for cb in record["cbs"]:
-                if cb:
-                    nodes.append(GraphNode(
-                        id=cb["id"],
-                        type="ConvertibleBond",
-                        properties=serialize_node_properties(cb)
-                    ))
-
-            for rel in record["cb_rels"]:
-                if rel:
-                    relationships.append(serialize_neo4j_relationship(rel))
-
-            # Shareholders
-            for shareholder in record.get("shareholders", []):
-                if shareholder:
-                    nodes.append(GraphNode(
-                        id=shareholder["id"],
-                        type="Shareholder",
-                        properties=serialize_node_properties(shareholder)
-                    ))
-
-            for rel in record.get("shareholder_rels", []):
-                if rel:
-                    relationships.append(serialize_neo4j_relationship(rel))
-
-            # Subscribers (depth >= 2)
-            # 중복 인수자 노드 방지
-            seen_subscriber_ids = set()
-            for subscriber in record["subscribers"]:
-                if subscriber and subscriber["id"] not in seen_subscriber_ids:
-                    nodes.append(GraphNode(
-                        id=subscriber["id"],
-                        type="Subscriber",
-                        properties=serialize_node_properties(subscriber)
-                    ))
-                    seen_subscriber_ids.add(subscriber["id"])
-
-            # 인수자-CB 관계 중복 방지 (같은 인수자가 같은 CB에 여러 관계를 가진 경우)
-            seen_sub_rel_pairs = set()
-            for rel in record["subscriber_rels"]:
-                if rel:
-                    serialized = serialize_neo4j_relationship(rel)
-                    # source(subscriber) + target(CB) 쌍으로 중복 체크
-                    rel_pair = (serialized.source, serialized.target)
-                    if rel_pair not in seen_sub_rel_pairs:
-                        relationships.append(serialized)
-                        seen_sub_rel_pairs.add(rel_pair)
-
-            # 3단계: 임원 타 상장사 경력 회사 (depth == 3)
-            seen_node_ids = {n.id for n in nodes}  # 중복 방지
-            for career_company in record.get("officer_career_companies", []):
-                if career_company and career_company["id"] not in seen_node_ids:
-                    nodes.append(GraphNode(
-                        id=career_company["id"],
-                        type="Company",
-                        properties={
-                            **serialize_node_properties(career_company),
-                            "relation_type": "officer_career"  # 임원 경력 회사 표시
-                        }
-                    ))
-                    seen_node_ids.add(career_company["id"])
-
-            for rel in record.get("officer_career_rels", []):
-                if rel:
-                    relationships.append(serialize_neo4j_relationship(rel))
-
-            # 3단계: 인수자 타 상장사 CB 투자 - CB 노드 추가 (depth == 3)
-            seen_rel_ids = {r.id for r in relationships}  # 관계 중복 방지
-            for invest_cb in record.get("subscriber_investment_cbs", []):
-                if invest_cb and invest_cb["id"] not in seen_node_ids:
-                    nodes.append(GraphNode(
-                        id=invest_cb["id"],
-                        type="ConvertibleBond",
-                        properties={
-                            **serialize_node_properties(invest_cb),
-                            "relation_type": "subscriber_investment"  # 인수자 투자 CB 표시
-                        }
-                    ))
-                    seen_node_ids.add(invest_cb["id"])
-
-            # 3단계: 인수자 타 상장사 CB 투자 - 회사 노드 추가 (depth == 3)
-            for invest_company in record.get("subscriber_investment_companies", []):
-                if invest_company and invest_company["id"] not in seen_node_ids:
-                    nodes.append(GraphNode(
-                        id=invest_company["id"],
-                        type="Company",
-                        properties={
-                            **serialize_node_properties(invest_company),
-                            "relation_type": "subscriber_investment"  # 인수자 투자 회사 표시
-                        }
-                    ))
-                    seen_node_ids.add(invest_company["id"])
-
-            # 3단계: SUBSCRIBED 관계 (Subscriber -> CB)
-            for rel in record.get("subscriber_investment_rels", []):
-                if rel:
-                    serialized = serialize_neo4j_relationship(rel)
-                    if serialized.id not in seen_rel_ids:
-                        relationships.append(serialized)
-                        seen_rel_ids.add(serialized.id)
-
-            # 3단계: ISSUED 관계 (Company -> CB)
-            for rel in record.get("subscriber_investment_issued_rels", []):
-                if rel:
-                    serialized = serialize_neo4j_relationship(rel)
-                    if serialized.id not in seen_rel_ids:
-                        relationships.append(serialized)
-                        seen_rel_ids.add(serialized.id)
-
-            return GraphResponse(
-                nodes=nodes,
-                relationships=relationships,
-                center={"type": "Company", "id": company_id}
-            )
-
-    except Exception as e:
-        logger.error(f"Error fetching company network: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return cypher, filtered_officer_ids
 
 
 @router.get("/officer/{officer_id}/career", response_model=OfficerCareerResponse)
@@ -669,7 +759,7 @@ async def get_officer_career(
 
     - 현재 및 과거 경력
     - 시간순 정렬
-    - 동일인 식별: 이름 + 생년월일 (YYYYMM) 기준
+    - 동일인 식별: person_id (이름 + 출생년월 YYYYMM, officer_identities)
     - 두 가지 소스:
       1. "db": 상장사 임원 DB (Neo4j WORKS_AT/WORKED_AT)
       2. "disclosure": 공시 파싱 경력 (PostgreSQL career_history JSONB)
@@ -683,18 +773,10 @@ async def get_officer_career(
     // 먼저 해당 임원의 이름과 생년월일을 가져옴
     MATCH (target:Officer {id: $officer_id})
 
-    // 같은 이름 + 같은 생년월일을 가진 모든 임원의 근무이력을 조회 (동일인물)
-    // 생년월일 비교: 숫자만 추출하여 앞 6자리 비교 (YYYYMM)
+    // 같은 person_id(이름 + 출생년월)를 가진 모든 임원의 근무이력을 조회 (동일인물)
+    // person_id 미지정(동기화 전) 임원은 자기 자신의 이력만
     MATCH (o:Officer)-[r:WORKS_AT|WORKED_AT]->(c:Company)
-    WHERE o.name = target.name
-      AND (
-        // 생년월일이 둘 다 있는 경우: 앞 6자리(YYYYMM) 비교
-        (o.birth_date IS NOT NULL AND target.birth_date IS NOT NULL
-         AND substring(replace(replace(replace(o.birth_date, '년', ''), '월', ''), '.', ''), 0, 6)
-            = substring(replace(replace(replace(target.birth_date, '년', ''), '월', ''), '.', ''), 0, 6))
-        // 생년월일이 둘 다 없는 경우도 동일인으로 간주 (fallback)
-        OR (o.birth_date IS NULL AND target.birth_date IS NULL)
-      )
+    WHERE o.person_id = target.person_id OR o.id = target.id
 
     // v2.5: 회사별로 그룹화하여 최신 레코드만 선택
     WITH target, c, r
@@ -759,49 +841,33 @@ async def get_officer_career(
                     ))
 
             # 2. PostgreSQL에서 파싱된 경력 조회 (source="disclosure")
-            # Neo4j ID와 PostgreSQL ID가 다를 수 있으므로 이름+생년월일로 조회
+            # Neo4j ID와 PostgreSQL ID가 다를 수 있으므로 동일인 키(이름 + 출생년월)로 조회
             career_raw_text = None  # 사업보고서 주요경력 원문 초기화 (v2.5)
             try:
                 from sqlalchemy import text
-                import re
+                from app.services.officer_identity import identity_key
 
                 officer_name = officer_node.get("name")
                 officer_birth = officer_node.get("birth_date")
 
                 # 생년월일 정규화 (Neo4j: "1978년 11월" or "1973.11" -> "197811" or "197311")
-                normalized_birth = None
-                if officer_birth:
-                    # 숫자만 추출
-                    digits = re.sub(r'[^\d]', '', officer_birth)
-                    if len(digits) >= 6:
-                        normalized_birth = digits[:6]
-
-                logger.info(f"PostgreSQL career_history 조회: name={officer_name}, birth={officer_birth}, normalized={normalized_birth}")
-
-                # 이름 + 생년월일로 조회 (동일인 식별)
-                # career_history가 있는 row만
-                if normalized_birth:
-                    # 생년월일이 있는 경우: 이름 + 생년월일 앞 6자리 비교
-                    pg_result = await db.execute(
-                        text("""
-                            SELECT career_history, career_raw_text FROM officers
-                            WHERE name = :name
-                            AND birth_date IS NOT NULL
-                            AND REPLACE(REPLACE(REPLACE(birth_date, '년', ''), '월', ''), '.', '') LIKE :birth_prefix || '%'
-                            LIMIT 1
-                        """),
-                        {"name": officer_name, "birth_prefix": normalized_birth}
-                    )
-                else:
-                    # 생년월일이 없는 경우: 이름만으로 조회 (fallback)
-                    pg_result = await db.execute(
-                        text("""
-                            SELECT career_history, career_raw_text FROM officers
-                            WHERE name = :name
-                            LIMIT 1
-                        """),
-                        {"name": officer_name}
-                    )
+                name_normalized, birth_ym = identity_key(officer_name, officer_birth)
+
+                logger.info(f"PostgreSQL career_history 조회: name={officer_name}, birth={officer_birth}, normalized={birth_ym}")
+
+                # officer_identities 동등 조인 (동일인 식별), career_history가 있는 row 우선
+                pg_result = await db.execute(
+                    text("""
+                        SELECT o.career_history, o.career_raw_text
+                        FROM officer_identities oi
+                        JOIN officers o ON o.person_id = oi.id
+                        WHERE oi.name_normalized = :name
+                          AND oi.birth_ym = :birth_ym
+                        ORDER BY (o.career_history IS NOT NULL AND o.career_history <> '[]'::jsonb) DESC
+                        LIMIT 1
+                    """),
+                    {"name": name_normalized, "birth_ym": birth_ym}
+                )
                 row = pg_result.fetchone()
                 logger.info(f"PostgreSQL career_history 결과: row={row is not None}, data={row[0] if row else None}")
 
@@ -874,6 +940,7 @@ async def get_officer_career(
 
 @router.get("/officer/{officer_id}/career-network", response_model=GraphResponse)
 async def get_officer_career_network(
+    response: Response,
     officer_id: str,
     limit: int = Query(100, ge=10, le=200),
     driver=Depends(get_neo4j_driver)
@@ -882,21 +949,25 @@ async def get_officer_career_network(
     임원 경력 네트워크 확장
 
     - 경력 회사들과 그 회사의 임원/계열사/CB 표시
-    - 동일인 식별: 이름 + 생년월일 (YYYYMM) 기준
+    - 동일인 식별: person_id (이름 + 출생년월 YYYYMM, officer_identities)
+    - (임원, limit) 단위로 캐시 (Neo4j 동기화 시 무효화, X-Cache 헤더)
     """
+    return await get_or_build_graph(
+        response,
+        officer_network_key(officer_id, limit),
+        lambda: _build_officer_career_network(officer_id, limit, driver),
+    )
+
+
+async def _build_officer_career_network(officer_id: str, limit: int, driver) -> GraphResponse:
+    """임원 경력 네트워크 생성 (캐시 미스 시)"""
     cypher = """
     // 대상 임원 조회
     MATCH (target:Officer {id: $officer_id})
 
-    // 같은 이름 + 생년월일을 가진 동일인의 경력 회사들
+    // 같은 person_id(이름 + 출생년월)를 가진 동일인의 경력 회사들
     MATCH (o:Officer)-[r:WORKED_AT|WORKS_AT]->(c:Company)
-    WHERE o.name = target.name
-      AND (
-        (o.birth_date IS NOT NULL AND target.birth_date IS NOT NULL
-         AND substring(replace(replace(replace(o.birth_date, '년', ''), '월', ''), '.', ''), 0, 6)
-            = substring(replace(replace(replace(target.birth_date, '년', ''), '월', ''), '.', ''), 0, 6))
-        OR (o.birth_date IS NULL AND target.birth_date IS NULL)
-      )
+    WHERE o.person_id = target.person_id OR o.id = target.id
 
     // 각 회사의 다른 임원들
     OPTIONAL MATCH (c)<-[:WORKS_AT {is_current: true}]-(other_officer:Officer)
@@ -1619,3 +1690,141 @@ async def recenter_graph(
     except Exception as e:
         logger.error(f"Error recentering graph: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# 증분 확장 대상 노드 타입 (recenter + 대주주)
+EXPANDABLE_NODE_TYPES = ("Company", "Officer", "ConvertibleBond", "Subscriber", "Shareholder")
+
+
+def encode_expand_cursor(node_id: str, rel_id: str) -> str:
+    """페이지 커서 (마지막 이웃 노드 ID + 관계 ID, 정렬 키와 동일)"""
+    raw = json.dumps([node_id, rel_id], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_expand_cursor(cursor: str) -> tuple:
+    try:
+        node_id, rel_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(node_id), str(rel_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.post("/expand", response_model=ExpandResponse)
+async def expand_graph(
+    request: ExpandRequest,
+    driver=Depends(get_neo4j_driver)
+):
+    """
+    노드 증분 확장
+
+    - 클라이언트가 이미 가진 노드/관계는 제외하고 신규 노드/관계만 반환
+      (recenter처럼 전체 이웃을 다시 보내지 않음)
+    - 연결이 많은 노드(대형 인수자 등)는 커서로 페이지 단위 조회
+      (이웃 노드 ID, 관계 ID 순 정렬 → 동기화 전까지 페이지 경계 안정)
+    - 이미 가진 노드로 향하는 관계는 노드 없이 관계만 포함
+    """
+    if request.node_type not in EXPANDABLE_NODE_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid node_type. Must be one of: {list(EXPANDABLE_NODE_TYPES)}"
+        )
+
+    after_node_id, after_rel_id = (
+        decode_expand_cursor(request.cursor) if request.cursor else (None, None)
+    )
+    known_nodes = set(request.known_node_ids)
+    known_rels = set(request.known_relationship_ids)
+
+    cypher = f"""
+    MATCH (center:{request.node_type} {{id: $node_id}})
+    OPTIONAL MATCH (center)-[r]-(connected)
+    WHERE connected.id IS NOT NULL
+      AND ($after_node_id IS NULL
+           OR connected.id > $after_node_id
+           OR (connected.id = $after_node_id AND elementId(r) > $after_rel_id))
+    WITH center, r, connected
+    ORDER BY connected.id, elementId(r)
+    LIMIT $fetch_limit
+    RETURN center, r, connected,
+           NOT connected.id IN $known_node_ids AS is_new_node
+    """
+
+    count_cypher = f"""
+    MATCH (center:{request.node_type} {{id: $node_id}})-[r]-(connected)
+    WHERE connected.id IS NOT NULL
+    RETURN count(r) AS total
+    """
+
+    try:
+        async with driver.session() as session:
+            result = await session.run(
+                cypher,
+                node_id=request.node_id,
+                after_node_id=after_node_id,
+                after_rel_id=after_rel_id,
+                known_node_ids=list(known_nodes),
+                # 다음 페이지 존재 여부 확인용 +1
+                fetch_limit=request.limit + 1,
+            )
+            records = [record async for record in result]
+
+            if not records:
+                raise HTTPException(status_code=404, detail=f"{request.node_type} not found")
+
+            total_relationships = None
+            if request.cursor is None:
+                count_result = await session.run(count_cypher, node_id=request.node_id)
+                count_record = await count_result.single()
+                total_relationships = count_record["total"] if count_record else 0
+
+        nodes = []
+        relationships = []
+        seen_nodes = set(known_nodes)
+
+        center = records[0]["center"]
+        if center["id"] not in seen_nodes:
+            nodes.append(GraphNode(
+                id=center["id"],
+                type=request.node_type,
+                properties=serialize_node_properties(center)
+            ))
+            seen_nodes.add(center["id"])
+
+        page = [record for record in records if record["r"] is not None]
+        has_more = len(page) > request.limit
+        page = page[:request.limit]
+
+        for record in page:
+            connected = record["connected"]
+            if record["is_new_node"] and connected["id"] not in seen_nodes:
+                nodes.append(GraphNode(
+                    id=connected["id"],
+                    type=list(connected.labels)[0] if connected.labels else "Unknown",
+                    properties=serialize_node_properties(connected)
+                ))
+                seen_nodes.add(connected["id"])
+
+            rel_id = str(record["r"].element_id)
+            if rel_id not in known_rels:
+                relationships.append(serialize_neo4j_relationship(record["r"]))
+
+        next_cursor = None
+        if has_more:
+            last = page[-1]
+            next_cursor = encode_expand_cursor(last["connected"]["id"], str(last["r"].element_id))
+
+        return ExpandResponse(
+            nodes=nodes,
+            relationships=relationships,
+            center={"type": request.node_type, "id": request.node_id},
+            next_cursor=next_cursor,
+            has_more=has_more,
+            total_relationships=total_relationships,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error expanding graph: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -14,6 +14,8 @@ from app.database import AsyncSessionLocal
 from app.core.security import get_current_user_optional
 from app.models.users import User
 from app.routes.view_history import save_view_history
+from app.services.graph_store import graph_store
+from app.services.officer_identity import identity_key
 from app.services.usage_service import check_query_limit, increment_usage, is_requery_allowed
 
 logger = logging.getLogger(__name__)
@@ -47,6 +49,38 @@ async def get_db():
         yield session
 
 
+async def _record_company_view(
+    db: AsyncSession,
+    current_user: User,
+    is_requery: bool,
+    company_id: str,
+    company_name: str,
+    ticker: Optional[str],
+    market: Optional[str]
+):
+    """조회 횟수 증가 + 조회 기록 저장 (실패해도 응답은 반환)"""
+    try:
+        # 1. 조회 횟수 증가 (재조회가 아닌 경우에만)
+        if not is_requery:
+            await increment_usage(db, current_user.id, "query")
+            logger.info(f"Usage incremented for user {current_user.id}")
+        else:
+            logger.info(f"Requery - skipping usage increment for user {current_user.id}")
+
+        # 2. 조회 기록 저장 (재조회 시에도 viewed_at 업데이트)
+        await save_view_history(
+            db=db,
+            user_id=current_user.id,
+            company_id=company_id,
+            company_name=company_name,
+            ticker=ticker,
+            market=market
+        )
+        logger.info(f"View history saved for user {current_user.id}, company {company_id}")
+    except Exception as e:
+        logger.warning(f"Failed to save view history or increment usage: {e}")
+
+
 @router.get("/company/{company_id}", response_model=GraphResponse)
 async def get_company_network_fallback(
     company_id: str,
@@ -64,6 +98,7 @@ async def get_company_network_fallback(
     - depth 3: 2단계 + 임원 타사 경력
 
     로그인한 사용자의 경우 조회 기록이 저장되고 조회 횟수가 차감됩니다.
+    인메모리 그래프(graph_store) 로드 후에는 SQL 없이 메모리에서 구성합니다.
     """
     # 로그인 사용자 조회 제한 체크
     is_requery = False  # 재조회 여부 (재조회면 사용량 차감 안 함)
@@ -87,6 +122,25 @@ async def get_company_network_fallback(
                     }
                 )
 
+    # 인메모리 그래프 (로드 완료 시 관계 SQL 왕복 없음)
+    if graph_store.ready:
+        network = graph_store.company_network(company_id, depth=depth)
+        if network is None:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+        company = network["center"]
+        if current_user:
+            await _record_company_view(
+                db, current_user, is_requery, company["id"],
+                company["name"], company["ticker"], company["market"]
+            )
+
+        return GraphResponse(
+            nodes=[GraphNode(**node) for node in network["nodes"]],
+            relationships=[GraphRelationship(**rel) for rel in network["relationships"]],
+            center={"type": "Company", "id": company_id}
+        )
+
     nodes = []
     relationships = []
     seen_node_ids = set()
@@ -138,7 +192,7 @@ async def get_company_network_fallback(
         
         # 2. 현재 임원 조회 (적자기업 경력 수 포함)
         officers_query = text("""
-            SELECT DISTINCT o.id::text, o.name, o.birth_date, op.position, op.is_current
+            SELECT DISTINCT o.id::text, o.name, o.birth_date, o.person_id::text, op.position, op.is_current
             FROM officers o
             JOIN officer_positions op ON o.id = op.officer_id
             WHERE op.company_id::text = :company_id AND op.is_current = true
@@ -160,42 +214,53 @@ async def get_company_network_fallback(
         # ======================================================================
         # N+1 쿼리 최적화: 배치 쿼리로 모든 임원의 경력 수를 한 번에 조회
         # ======================================================================
-        officer_identities = [(o.name, o.birth_date) for o in officers]
+        # 동일인 키: person_id (officer_identities), 미지정 임원은 자기 ID
+        officer_person_ids = [o.person_id for o in officers if o.person_id]
+        officer_ids = [o.id for o in officers]
         officer_names = [o.name for o in officers]
 
-        # 배치 쿼리: 모든 임원의 상장사 경력 수를 한 번에 조회
-        if officer_names:
+        # 배치 쿼리: 모든 임원의 상장사 경력 수를 한 번에 조회 (person_id 동등 조인)
+        if officer_ids:
             batch_career_query = text("""
-                SELECT o.name, o.birth_date, COUNT(DISTINCT op.company_id) as career_count
-                FROM officer_positions op
-                JOIN officers o ON op.officer_id = o.id
-                WHERE o.name = ANY(:names)
-                GROUP BY o.name, o.birth_date
+                SELECT COALESCE(o.person_id, o.id)::text as identity_key,
+                       COUNT(DISTINCT op.company_id) as career_count
+                FROM officers o
+                JOIN officer_positions op ON op.officer_id = o.id
+                WHERE o.person_id = ANY(CAST(:person_ids AS uuid[]))
+                   OR o.id = ANY(CAST(:officer_ids AS uuid[]))
+                GROUP BY 1
             """)
-            career_result = await db.execute(batch_career_query, {"names": officer_names})
-            career_counts = {(row.name, row.birth_date): row.career_count for row in career_result.fetchall()}
+            career_result = await db.execute(batch_career_query, {
+                "person_ids": officer_person_ids,
+                "officer_ids": officer_ids
+            })
+            career_counts = {row.identity_key: row.career_count for row in career_result.fetchall()}
 
             # 배치 쿼리: 모든 임원의 적자기업 경력 수를 한 번에 조회
             if deficit_company_ids:
                 batch_deficit_query = text("""
-                    SELECT o.name, o.birth_date, COUNT(DISTINCT op.company_id) as deficit_count
-                    FROM officer_positions op
-                    JOIN officers o ON op.officer_id = o.id
-                    WHERE o.name = ANY(:names)
+                    SELECT COALESCE(o.person_id, o.id)::text as identity_key,
+                           COUNT(DISTINCT op.company_id) as deficit_count
+                    FROM officers o
+                    JOIN officer_positions op ON op.officer_id = o.id
+                    WHERE (o.person_id = ANY(CAST(:person_ids AS uuid[]))
+                           OR o.id = ANY(CAST(:officer_ids AS uuid[])))
                       AND op.company_id::text = ANY(:deficit_ids)
                       AND op.company_id::text != :current_company_id
-                    GROUP BY o.name, o.birth_date
+                    GROUP BY 1
                 """)
                 deficit_result = await db.execute(batch_deficit_query, {
-                    "names": officer_names,
+                    "person_ids": officer_person_ids,
+                    "officer_ids": officer_ids,
                     "deficit_ids": list(deficit_company_ids),
                     "current_company_id": center_id
                 })
-                deficit_counts = {(row.name, row.birth_date): row.deficit_count for row in deficit_result.fetchall()}
+                deficit_counts = {row.identity_key: row.deficit_count for row in deficit_result.fetchall()}
             else:
                 deficit_counts = {}
 
             # 배치 쿼리: 모든 임원의 경영분쟁 참여 횟수를 한 번에 조회
+            # dispute_officers는 공시 원문 이름/생년월일만 있으므로 정규화 키로 매칭
             batch_dispute_query = text("""
                 SELECT d.officer_name, d.birth_date, COUNT(DISTINCT d.egm_disclosure_id) as dispute_count
                 FROM dispute_officers d
@@ -203,7 +268,10 @@ async def get_company_network_fallback(
                 GROUP BY d.officer_name, d.birth_date
             """)
             dispute_result = await db.execute(batch_dispute_query, {"names": officer_names})
-            dispute_counts = {(row.officer_name, row.birth_date): row.dispute_count for row in dispute_result.fetchall()}
+            dispute_counts = {}
+            for row in dispute_result.fetchall():
+                key = identity_key(row.officer_name, row.birth_date)
+                dispute_counts[key] = dispute_counts.get(key, 0) + row.dispute_count
         else:
             career_counts = {}
             deficit_counts = {}
@@ -212,10 +280,10 @@ async def get_company_network_fallback(
         # 배치 조회 결과를 사용하여 노드 생성 (N+1 쿼리 제거됨)
         for officer in officers:
             if officer.id not in seen_node_ids:
-                identity_key = (officer.name, officer.birth_date)
-                listed_career_count = career_counts.get(identity_key, 0)
-                deficit_career_count = deficit_counts.get(identity_key, 0)
-                dispute_career_count = dispute_counts.get(identity_key, 0)
+                person_key = officer.person_id or officer.id
+                listed_career_count = career_counts.get(person_key, 0)
+                deficit_career_count = deficit_counts.get(person_key, 0)
+                dispute_career_count = dispute_counts.get(identity_key(officer.name, officer.birth_date), 0)
 
                 nodes.append(GraphNode(
                     id=officer.id,
@@ -316,34 +384,37 @@ async def get_company_network_fallback(
                     properties={"amount": sub.subscription_amount}
                 ))
         
-        # 5. depth >= 3: 임원 타사 경력 (동명이인 방지: 이름 + 출생년월 비교)
+        # 5. depth >= 3: 임원 타사 경력 (동명이인 방지: person_id 동등 조인)
         if depth >= 3:
-            # 현재 임원들의 (이름, 출생년월) 쌍으로 동일인 식별
-            officer_identities = {(o.name, o.birth_date) for o in officers}
-            officer_names = [o.name for o in officers]
-            if officer_names:
+            # 동일인 키 → 현재 회사 임원 노드 ID (경력 관계의 source)
+            officer_by_person = {}
+            for o in officers:
+                officer_by_person.setdefault(o.person_id or o.id, o.id)
+            if officer_by_person:
                 careers_query = text("""
                     SELECT DISTINCT c.id::text as company_id, c.name as company_name,
                            c.trading_status,
-                           o.id::text as officer_id, o.name as officer_name,
-                           o.birth_date, op.position
-                    FROM officer_positions op
-                    JOIN officers o ON op.officer_id = o.id
+                           COALESCE(o.person_id, o.id)::text as identity_key,
+                           op.position
+                    FROM officers o
+                    JOIN officer_positions op ON op.officer_id = o.id
                     JOIN companies c ON op.company_id = c.id
-                    WHERE o.name = ANY(:names)
+                    WHERE (o.person_id = ANY(CAST(:person_ids AS uuid[]))
+                           OR o.id = ANY(CAST(:officer_ids AS uuid[])))
                       AND c.id::text != :center_id
                     LIMIT 50
                 """)
                 result = await db.execute(careers_query, {
-                    "names": officer_names,
+                    "person_ids": [o.person_id for o in officers if o.person_id],
+                    "officer_ids": [o.id for o in officers],
                     "center_id": center_id
                 })
                 careers = result.fetchall()
 
                 for career in careers:
-                    # 동명이인 필터링: (이름, 출생년월) 쌍이 일치하는 경우만 포함
-                    if (career.officer_name, career.birth_date) not in officer_identities:
-                        continue  # 동명이인이면 스킵
+                    source_officer_id = officer_by_person.get(career.identity_key)
+                    if source_officer_id is None:
+                        continue
 
                     if career.company_id not in seen_node_ids:
                         nodes.append(GraphNode(
@@ -361,7 +432,7 @@ async def get_company_network_fallback(
                     relationships.append(GraphRelationship(
                         id=f"rel_{rel_counter}",
                         type="WORKED_AT",
-                        source=career.officer_id,
+                        source=source_officer_id,
                         target=career.company_id,
                         properties={"position": career.position}
                     ))
@@ -409,26 +480,10 @@ async def get_company_network_fallback(
         
         # 조회 기록 저장 및 사용량 증가 (로그인 사용자만)
         if current_user:
-            try:
-                # 1. 조회 횟수 증가 (재조회가 아닌 경우에만)
-                if not is_requery:
-                    await increment_usage(db, current_user.id, "query")
-                    logger.info(f"Usage incremented for user {current_user.id}")
-                else:
-                    logger.info(f"Requery - skipping usage increment for user {current_user.id}")
-
-                # 2. 조회 기록 저장 (재조회 시에도 viewed_at 업데이트)
-                await save_view_history(
-                    db=db,
-                    user_id=current_user.id,
-                    company_id=center_id,
-                    company_name=company.name,
-                    ticker=company.ticker,
-                    market=company.market
-                )
-                logger.info(f"View history saved for user {current_user.id}, company {center_id}")
-            except Exception as e:
-                logger.warning(f"Failed to save view history or increment usage: {e}")
+            await _record_company_view(
+                db, current_user, is_requery, center_id,
+                company.name, company.ticker, company.market
+            )
 
         return GraphResponse(
             nodes=nodes,
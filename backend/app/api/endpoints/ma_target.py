@@ -12,6 +12,7 @@ from sqlalchemy import select, desc, func, and_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.services.cache_service import cache
 from app.models.financial_snapshot import FinancialSnapshot
 from app.models.companies import Company
 
@@ -19,6 +20,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ma-target", tags=["M&A Target"])
 
+# 랭킹 캐시 (스냅샷은 일 단위 배치로만 바뀜 → 만료 후에도 stale 값 즉시 반환)
+RANKING_CACHE_TTL = 600
+RANKING_STALE_TTL = 6 * 3600
+
 
 def format_snapshot_response(snapshot: FinancialSnapshot, company: Company) -> dict:
     """스냅샷 데이터를 API 응답 형식으로 변환"""
@@ -61,6 +66,10 @@ def format_snapshot_response(snapshot: FinancialSnapshot, company: Company) -> d
 
 
 @router.get("/ranking")
+@cache.cached(
+    ttl=RANKING_CACHE_TTL, key_prefix="ma_target_ranking",
+    stale_ttl=RANKING_STALE_TTL, session_arg="db",
+)
 async def get_ma_target_ranking(
     # 정렬
     sort: str = Query(
@@ -13,6 +13,8 @@ from decimal import Decimal
 import logging
 
 from app.database import get_db
+from app.services.cache_service import cache
+from app.utils.cache import company_tag
 from app.models.raymonds_index import RaymondsIndex
 from app.models.companies import Company
 from app.models.major_shareholders import MajorShareholder
@@ -21,6 +23,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/raymonds-index", tags=["RaymondsIndex"])
 
+# 랭킹/통계 캐시 (지수는 배치 계산 후에만 바뀜 → 만료 후에도 stale 값 즉시 반환)
+RANKING_CACHE_TTL = 600
+RANKING_STALE_TTL = 6 * 3600
+# 회사별 지수 캐시
+COMPANY_INDEX_CACHE_TTL = 3600
+
 
 # ============================================================================
 # Response Schemas
@@ -213,6 +221,10 @@ async def get_sector_statistics(
 
 
 @router.get("/{company_id}")
+@cache.cached(
+    ttl=COMPANY_INDEX_CACHE_TTL, key_prefix="ri_company", session_arg="db",
+    tags=lambda company_id, **_: [company_tag(company_id)],
+)
 async def get_raymonds_index(
     company_id: UUID,
     year: Optional[int] = None,
@@ -293,6 +305,10 @@ async def get_raymonds_index_history(
 
 
 @router.get("/ranking/list")
+@cache.cached(
+    ttl=RANKING_CACHE_TTL, key_prefix="ri_ranking_list",
+    stale_ttl=RANKING_STALE_TTL, session_arg="db",
+)
 async def get_raymonds_index_ranking(
     sort: str = Query("score_desc", regex="^(score_desc|score_asc|gap_asc|gap_desc|name_asc|name_desc|cei_desc|cei_asc|rii_desc|rii_asc|cgi_desc|cgi_asc|mai_desc|mai_asc)$"),
     grade: Optional[str] = None,
@@ -633,6 +649,10 @@ async def search_raymonds_index(
 
 
 @router.get("/statistics/summary")
+@cache.cached(
+    ttl=RANKING_CACHE_TTL, key_prefix="ri_statistics_summary",
+    stale_ttl=RANKING_STALE_TTL, session_arg="db",
+)
 async def get_raymonds_index_statistics(
     year: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
@@ -12,7 +12,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import AsyncSessionLocal
 from app.models import Company
+from app.services.graph_store import graph_store
 from app.services.risk_detection import RiskDetectionEngine
+from app.services.cache_service import cache
+from app.utils.cache import company_tag
 from app.config import settings
 from neo4j import AsyncGraphDatabase
 from sqlalchemy import select
@@ -22,6 +25,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/risks", tags=["risks"])
 
+# 위험도 분석 캐시 (8개 패턴 × Neo4j 쿼리 → 회사별 1시간 캐시)
+RISK_ANALYSIS_TTL = 3600
+
 
 # Response Models
 class RiskSignal(BaseModel):
@@ -85,6 +91,16 @@ async def get_neo4j_driver():
 
 
 # Helper Functions
+async def get_risk_analysis(db: AsyncSession, neo4j_driver, company_id: str) -> Dict[str, Any]:
+    """회사 종합 위험도 분석 결과 (캐시, 동시 미스 병합)"""
+    return await cache.get_or_compute(
+        f"risk_analysis:{company_id}",
+        lambda: RiskDetectionEngine(neo4j_driver, graph_store=graph_store).analyze_company_risk(db, company_id),
+        ttl=RISK_ANALYSIS_TTL,
+        tags=[company_tag(company_id)],
+    )
+
+
 def format_risk_signal(pattern_type: str, pattern_data: Dict[str, Any]) -> RiskSignal:
     """위험 패턴 데이터를 RiskSignal 형식으로 변환"""
 
@@ -177,8 +193,7 @@ async def get_company_risks(
             raise HTTPException(status_code=404, detail="Company not found")
 
         # 위험도 분석
-        engine = RiskDetectionEngine(neo4j_driver)
-        analysis = await engine.analyze_company_risk(db, company_id)
+        analysis = await get_risk_analysis(db, neo4j_driver, company_id)
 
         # 패턴 필터링
         patterns = analysis["patterns"]
@@ -260,7 +275,7 @@ async def get_risk_pattern_detail(
             raise HTTPException(status_code=404, detail="Company not found")
 
         # 위험 탐지 엔진
-        engine = RiskDetectionEngine(neo4j_driver)
+        engine = RiskDetectionEngine(neo4j_driver, graph_store=graph_store)
 
         # 패턴별 상세 조회
         pattern_methods = {
@@ -408,36 +423,44 @@ async def compare_company_risks(
                 detail="일부 회사를 찾을 수 없습니다"
             )
 
-        # 각 회사별 위험도 분석
-        engine = RiskDetectionEngine(neo4j_driver)
+        # 전체 회사 일괄 분석 (패턴별 배치 Cypher 1회)
+        engine = RiskDetectionEngine(neo4j_driver, graph_store=graph_store)
         comparison_data = []
 
+        try:
+            analyses = await engine.analyze_companies_risk(db, [str(company.id) for company in companies])
+            batch_error = None
+        except Exception as e:
+            logger.warning(f"일괄 분석 실패: {e}")
+            analyses = {}
+            batch_error = e
+
         for company in companies:
-            try:
-                analysis = await engine.analyze_company_risk(db, str(company.id))
-                comparison_data.append({
-                    "company_id": str(company.id),
-                    "company_name": company.name,
-                    "risk_score": analysis["risk_score"],
-                    "risk_level": analysis["overall_risk_level"],
-                    "pattern_count": len([
-                        p for p in analysis["patterns"].values()
-                        if p and (
-                            (isinstance(p, list) and len(p) > 0) or
-                            (isinstance(p, dict) and len(p) > 0)
-                        )
-                    ])
-                })
-            except Exception as e:
-                logger.warning(f"분석 실패 - {company.name}: {e}")
+            analysis = analyses.get(str(company.id))
+            if analysis is None:
                 comparison_data.append({
                     "company_id": str(company.id),
                     "company_name": company.name,
                     "risk_score": 0,
                     "risk_level": "unknown",
                     "pattern_count": 0,
-                    "error": str(e)
+                    "error": str(batch_error)
                 })
+                continue
+
+            comparison_data.append({
+                "company_id": str(company.id),
+                "company_name": company.name,
+                "risk_score": analysis["risk_score"],
+                "risk_level": analysis["overall_risk_level"],
+                "pattern_count": len([
+                    p for p in analysis["patterns"].values()
+                    if p and (
+                        (isinstance(p, list) and len(p) > 0) or
+                        (isinstance(p, dict) and len(p) > 0)
+                    )
+                ])
+            })
 
         # 위험도 순으로 정렬
         comparison_data.sort(key=lambda x: x["risk_score"], reverse=True)
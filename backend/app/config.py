@@ -38,6 +38,37 @@ class Settings(BaseSettings):
     redis_url: Optional[str] = None
     port: int = 8000
 
+    # asyncpg 커넥션 풀 (raw SQL 엔드포인트용, SQLAlchemy 풀과 별도)
+    # Railway Postgres 연결 한도를 고려해 작게 유지
+    pg_pool_min_size: int = 2
+    pg_pool_max_size: int = 10
+    pg_pool_acquire_timeout: float = 10.0
+
+    # 프로세스 내 L1 캐시 (Redis L2 앞단, 워커별 메모리 사용)
+    cache_l1_max_entries: int = 2000
+    cache_l1_max_bytes: int = 32 * 1024 * 1024  # 32MB (Railway Hobby 512MB 고려)
+    cache_l1_max_entry_bytes: int = 1024 * 1024  # 1MB 초과 값은 L1에 저장 안 함
+    cache_l1_max_ttl: int = 60  # 워커 간 불일치 상한 (pub/sub 무효화 유실 대비)
+
+    # 캐시 값 직렬화 (orjson/msgpack/json, 임계값 이상 zlib 압축)
+    cache_codec: str = "orjson"
+    cache_compress_threshold: int = 4096  # 바이트, 0이면 압축 안 함
+    cache_compress_level: int = 1
+
+    # 캐시 워밍 (조회 이력 상위 기업, 앱 시작 후/배치 작업 후)
+    cache_warm_on_startup: bool = True
+    cache_warm_limit: int = 100
+    cache_warm_concurrency: int = 4  # asyncpg/SQLAlchemy 풀을 실시간 요청과 공유
+
+    # 인메모리 관계 그래프 (graph-fallback/위험 패턴 검사, 워커별 메모리 사용)
+    graph_store_enabled: bool = True
+    graph_store_refresh_interval: int = 300  # 초, updated_at 워터마크 증분 갱신
+    graph_store_full_reload_interval: int = 6 * 60 * 60  # 초, 삭제 행 반영용 전체 재로드
+
+    # 일일 위험도 분석 파이프라인 (app/services/risk_analysis_pipeline.py)
+    risk_analysis_workers: int = 4  # 동시 분석 배치 수 (실행 전용 풀: 배치당 DB 세션 1개 + asyncpg 커넥션 1개)
+    risk_analysis_batch_size: int = 25
+
     # Neo4j (optional - only needed for graph visualization)
     neo4j_uri: Optional[str] = None
     neo4j_user: str = "neo4j"
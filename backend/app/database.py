@@ -7,8 +7,12 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import declarative_base
 from redis.asyncio import Redis
 from neo4j import AsyncGraphDatabase
+import asyncpg
+import asyncio
 import logging
-from typing import AsyncGenerator
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
 
 from app.config import settings
 
@@ -58,6 +62,14 @@ engine = create_async_engine(
     },
 )
 
+def get_asyncpg_dsn(url: str) -> str:
+    """Convert database URL to plain postgresql:// DSN for raw asyncpg"""
+    # asyncpg는 순수 postgresql:// 형식 필요 (SQLAlchemy의 +asyncpg 제거)
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace("+asyncpg", "")
+
+
 # Session Factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -67,6 +79,137 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# ============================================================================
+# PostgreSQL - asyncpg Pool (raw SQL 엔드포인트용)
+# ============================================================================
+
+pg_pool: Optional[asyncpg.Pool] = None
+_pg_pool_lock = asyncio.Lock()
+
+
+class PgPoolMetrics:
+    """
+    asyncpg 풀 대기 시간 메트릭
+
+    acquire_pg()를 통한 커넥션 획득 대기 시간을 기록 (최근 1000건)
+    """
+
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        self.acquire_count = 0
+        self.timeout_count = 0
+        self.wait_times_ms = []
+
+    def record_acquire(self, wait_ms: float):
+        self.acquire_count += 1
+        self.wait_times_ms.append(wait_ms)
+        if len(self.wait_times_ms) > self.MAX_SAMPLES:
+            self.wait_times_ms = self.wait_times_ms[-self.MAX_SAMPLES:]
+
+    def record_timeout(self):
+        self.timeout_count += 1
+
+    def get_stats(self) -> dict:
+        """풀 크기 및 대기 시간 통계"""
+        waits = sorted(self.wait_times_ms)
+        if waits:
+            avg_wait = sum(waits) / len(waits)
+            p95_wait = waits[min(int(len(waits) * 0.95), len(waits) - 1)]
+            max_wait = waits[-1]
+        else:
+            avg_wait = p95_wait = max_wait = 0
+
+        stats = {
+            "initialized": pg_pool is not None,
+            "acquire_count": self.acquire_count,
+            "timeout_count": self.timeout_count,
+            "avg_wait_ms": round(avg_wait, 2),
+            "p95_wait_ms": round(p95_wait, 2),
+            "max_wait_ms": round(max_wait, 2),
+        }
+        if pg_pool is not None:
+            stats.update({
+                "size": pg_pool.get_size(),
+                "idle": pg_pool.get_idle_size(),
+                "in_use": pg_pool.get_size() - pg_pool.get_idle_size(),
+                "min_size": pg_pool.get_min_size(),
+                "max_size": pg_pool.get_max_size(),
+            })
+        return stats
+
+    def reset(self):
+        self.acquire_count = 0
+        self.timeout_count = 0
+        self.wait_times_ms.clear()
+
+
+pg_pool_metrics = PgPoolMetrics()
+
+
+async def init_pg_pool() -> asyncpg.Pool:
+    """asyncpg 커넥션 풀 생성 (이미 있으면 재사용)"""
+    global pg_pool
+
+    async with _pg_pool_lock:
+        if pg_pool is None:
+            pg_pool = await asyncpg.create_pool(
+                get_asyncpg_dsn(settings.database_url),
+                min_size=settings.pg_pool_min_size,
+                max_size=settings.pg_pool_max_size,
+                max_inactive_connection_lifetime=300,
+                command_timeout=60,
+                timeout=10,
+                server_settings={
+                    "application_name": "raymontology-raw",
+                    "jit": "off",
+                },
+            )
+            logger.info(
+                f"asyncpg pool created "
+                f"(min={settings.pg_pool_min_size}, max={settings.pg_pool_max_size})"
+            )
+    return pg_pool
+
+
+async def close_pg_pool():
+    """asyncpg 커넥션 풀 종료"""
+    global pg_pool
+
+    if pg_pool is not None:
+        await pg_pool.close()
+        pg_pool = None
+        logger.info("asyncpg pool closed")
+
+
+@asynccontextmanager
+async def acquire_pg() -> AsyncGenerator[asyncpg.Connection, None]:
+    """
+    asyncpg 풀에서 커넥션 획득 (대기 시간 메트릭 기록)
+
+    Usage:
+        async with acquire_pg() as conn:
+            rows = await conn.fetch("SELECT ...")
+    """
+    pool = pg_pool or await init_pg_pool()
+
+    start = time.perf_counter()
+    try:
+        conn = await pool.acquire(timeout=settings.pg_pool_acquire_timeout)
+    except asyncio.TimeoutError:
+        pg_pool_metrics.record_timeout()
+        logger.warning(
+            f"asyncpg pool acquire timeout ({settings.pg_pool_acquire_timeout}s)"
+        )
+        raise
+    pg_pool_metrics.record_acquire((time.perf_counter() - start) * 1000)
+
+    try:
+        yield conn
+    finally:
+        await pool.release(conn)
+
+
 # ============================================================================
 # Redis
 # ============================================================================
@@ -140,6 +283,13 @@ async def init_db():
         else:
             logger.info("PostgreSQL connected (use Alembic for migrations)")
 
+    # PostgreSQL - asyncpg 풀 (raw SQL 엔드포인트용)
+    try:
+        await init_pg_pool()
+    except Exception as e:
+        # 첫 acquire_pg() 호출 시 재시도
+        logger.warning(f"asyncpg pool creation failed: {e}. Will retry lazily.")
+
     # Redis (간소화된 연결) - Optional
     if settings.redis_url:
         logger.info(f"Initializing Redis...")
@@ -153,6 +303,10 @@ async def init_db():
             )
             await redis_client.ping()
             logger.info("Redis connected successfully")
+
+            # 워커 간 L1 캐시 무효화 구독
+            from app.utils.cache import start_invalidation_listener
+            start_invalidation_listener(redis_client)
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Caching disabled.")
             redis_client = None
@@ -195,6 +349,8 @@ async def close_db():
 
     # Redis
     if redis_client:
+        from app.utils.cache import stop_invalidation_listener
+        await stop_invalidation_listener()
         await redis_client.close()
         logger.info("Redis connection closed")
 
@@ -204,6 +360,7 @@ async def close_db():
         logger.info("Neo4j connection closed")
 
     # PostgreSQL
+    await close_pg_pool()
     await engine.dispose()
     logger.info("PostgreSQL connection closed")
 
@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
+import asyncio
 import os
 import logging
 import traceback
@@ -35,6 +36,7 @@ from app.routes import auth, oauth, admin, subscription, content, service_applic
 from app.routes import toss_auth, credits
 from app.routes import view_history  # 조회 기록 API
 from app.routes import ml_admin  # ML 관리 API
+from app.routes import monitoring  # 모니터링 메트릭 API
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -54,6 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
+    expose_headers=["X-Cache"],  # 그래프 API 캐시 적중 여부 (프론트엔드에서 읽기)
 )
 
 
@@ -86,6 +89,7 @@ app.include_router(credits.router)
 app.include_router(service_application.router)
 app.include_router(view_history.router)  # 조회 기록 API
 app.include_router(ml_admin.router)  # ML 관리 API
+app.include_router(monitoring.router)  # 모니터링 메트릭 API (DB 풀, 캐시, 관리자 전용)
 
 # Static files (이미지 업로드)
 os.makedirs("uploads/content", exist_ok=True)
@@ -160,6 +164,16 @@ async def startup_event():
         logger.error(traceback.format_exc())
         # DB 없이도 앱은 시작 (health check 응답 가능)
 
+    # 인기 기업 캐시 워밍 (백그라운드 - 시작 지연 없음)
+    if settings.cache_warm_on_startup:
+        from app.services.cache_warmer import warm_popular_companies
+        app.state.cache_warm_task = asyncio.create_task(warm_popular_companies())
+
+    # 인메모리 관계 그래프 로드/갱신 (백그라운드 - 로드 전에는 SQL 폴백 사용)
+    if settings.graph_store_enabled:
+        from app.services.graph_store import graph_store
+        app.state.graph_store_task = asyncio.create_task(graph_store.run())
+
     # 배치 스케줄러 시작 (선택사항 - 실패해도 앱 계속 실행)
     # 현재 Railway 배포에서는 비활성화
     # if settings.environment == "production":
@@ -178,6 +192,15 @@ async def shutdown_event():
     """애플리케이션 종료"""
     logger.info("Raymontology API shutting down...")
 
+    # 진행 중인 캐시 워밍 중단
+    warm_task = getattr(app.state, "cache_warm_task", None)
+    if warm_task and not warm_task.done():
+        warm_task.cancel()
+
+    graph_store_task = getattr(app.state, "graph_store_task", None)
+    if graph_store_task and not graph_store_task.done():
+        graph_store_task.cancel()
+
     try:
         # 데이터베이스 연결 종료
         await close_db()
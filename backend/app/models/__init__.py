@@ -20,7 +20,7 @@ from app.models.cb_subscribers import CBSubscriber
 from app.models.financial_statements import FinancialStatement
 from app.models.financial_details import FinancialDetails
 from app.models.financial_ratios import FinancialRatios
-from app.models.raymonds_index import RaymondsIndex
+from app.models.raymonds_index import RaymondsIndex, RaymondsIndexCalcState
 from app.models.users import User
 from app.models.major_shareholders import MajorShareholder
 from app.models.risk_scores import RiskScore
@@ -45,6 +45,10 @@ from app.models.ml_features import MLFeature
 from app.models.risk_predictions import RiskPrediction
 from app.models.ml_models import MLModel
 from app.models.suspension_classifications import SuspensionClassification
+from app.models.company_report_snapshot import CompanyReportSnapshot
+from app.models.officer_identity import OfficerIdentity
+from app.models.risk_analysis import RiskAnalysisRun, RiskAnalysisResult
+from app.models.investment_cycles import InvestmentCycle, InvestmentCycleMember, InvestmentCycleIndexState
 
 __all__ = [
     "Base",
@@ -66,6 +70,7 @@ __all__ = [
     "FinancialDetails",
     "FinancialRatios",
     "RaymondsIndex",
+    "RaymondsIndexCalcState",
     "User",
     "MajorShareholder",
     "RiskScore",
@@ -105,4 +110,14 @@ __all__ = [
     "RiskPrediction",
     "MLModel",
     "SuspensionClassification",
+    # 보고서 스냅샷
+    "CompanyReportSnapshot",
+    "OfficerIdentity",
+    # 일일 위험도 분석
+    "RiskAnalysisRun",
+    "RiskAnalysisResult",
+    # 순환 투자 인덱스
+    "InvestmentCycle",
+    "InvestmentCycleMember",
+    "InvestmentCycleIndexState",
 ]
@@ -0,0 +1,33 @@
+"""
+회사 종합보고서 스냅샷 모델
+
+/api/report/name/{company_name} 응답(CompanyFullReport)을 회사별로 사전 계산해 저장합니다.
+"""
+
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
+
+from app.database import Base
+
+
+class CompanyReportSnapshot(Base):
+    """회사 종합보고서 스냅샷"""
+
+    __tablename__ = "company_report_snapshots"
+
+    company_id = Column(
+        PGUUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # 응답 모델 구조 버전 (CompanyFullReport 변경 시 증가 → 기존 스냅샷 자동 무효)
+    schema_version = Column(Integer, nullable=False, default=0)
+    # 데이터 변경 시마다 증가 (재빌드 중 변경된 경우 덮어쓰기 방지)
+    data_version = Column(Integer, nullable=False, default=0)
+    is_stale = Column(Boolean, nullable=False, default=True)
+
+    payload = Column(JSONB, nullable=True)
+
+    built_at = Column(DateTime(timezone=True), nullable=True)
+    invalidated_at = Column(DateTime(timezone=True), nullable=True)
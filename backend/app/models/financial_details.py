@@ -141,6 +141,7 @@ class FinancialDetails(Base):
         Index('idx_fd_year', 'fiscal_year'),
         Index('idx_fd_quarter', 'fiscal_quarter'),
         Index('idx_fd_fs_type', 'fs_type'),
+        Index('idx_fd_updated_at', 'updated_at'),  # RaymondsIndex 증분 재계산 변경 감지
     )
 
     def __repr__(self):
@@ -0,0 +1,63 @@
+"""
+순환 투자 인덱스 모델
+
+회사 → 회사 CB 투자 간선의 짧은 순환을 오프라인으로 미리 계산해 둔 결과입니다.
+(app/services/investment_cycles.py에서 생성/증분 갱신, 위험 패턴 탐지에서 조회)
+"""
+
+from sqlalchemy import Column, Text, Integer, Float, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, ARRAY
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class InvestmentCycle(Base):
+    """순환 투자 경로 (A → B → C → A)"""
+
+    __tablename__ = "investment_cycles"
+
+    # 최소 회사 ID에서 시작하도록 회전한 회사 ID 목록 ('->' 연결)
+    cycle_key = Column(Text, primary_key=True)
+    company_ids = Column(ARRAY(PGUUID(as_uuid=True)), nullable=False)
+    cycle_length = Column(Integer, nullable=False)
+    total_amount = Column(Float, nullable=False, default=0)
+    min_investment_count = Column(Integer, nullable=False, default=0)
+
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class InvestmentCycleMember(Base):
+    """순환 투자 소속 회사"""
+
+    __tablename__ = "investment_cycle_members"
+
+    company_id = Column(
+        PGUUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    cycle_key = Column(
+        Text,
+        ForeignKey("investment_cycles.cycle_key", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+
+class InvestmentCycleIndexState(Base):
+    """순환 투자 인덱스 빌드 정보 (단일 행)"""
+
+    __tablename__ = "investment_cycle_index_state"
+
+    id = Column(Integer, primary_key=True)
+    max_length = Column(Integer, nullable=False)
+    cycle_count = Column(Integer, nullable=False, default=0)
+    # 이 시각 이후 변경된 CB/인수자 행만 증분 갱신 대상
+    edges_watermark = Column(DateTime(timezone=True), nullable=False)
+    built_at = Column(DateTime(timezone=True), nullable=False)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("id = 1", name="ck_investment_cycle_index_state_single_row"),
+    )
@@ -0,0 +1,35 @@
+"""
+임원 동일인 식별 모델
+
+정규화된 이름 + 출생년월(YYYYMM)마다 정규 person id를 부여합니다.
+officers.person_id가 이 테이블을 참조합니다.
+"""
+
+from sqlalchemy import Column, String, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+
+from app.database import Base
+
+
+class OfficerIdentity(Base):
+    """임원 동일인 식별 테이블"""
+
+    __tablename__ = "officer_identities"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # 공백 제거한 이름
+    name_normalized = Column(String(100), nullable=False)
+    # 출생년월 (YYYYMM), 미상은 ''
+    birth_ym = Column(String(6), nullable=False, default="")
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('name_normalized', 'birth_ym', name='uq_officer_identity_key'),
+    )
+
+    def __repr__(self):
+        return f"<OfficerIdentity(id={self.id}, name='{self.name_normalized}', birth_ym='{self.birth_ym}')>"
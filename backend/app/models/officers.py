@@ -1,7 +1,7 @@
 """
 Officer 모델
 """
-from sqlalchemy import Column, String, Float, Integer, DateTime, Boolean, Index
+from sqlalchemy import Column, String, Float, Integer, DateTime, Boolean, Index, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.sql import func
 import uuid
@@ -27,6 +27,14 @@ class Officer(Base):
     gender = Column(String(10), nullable=True)  # 성별 (남/여)
     resident_number_hash = Column(String(64), unique=True, nullable=True)  # SHA256 해시
 
+    # 동일인 식별 (이름 + 출생년월 → officer_identities.id)
+    person_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("officer_identities.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
     # 직위
     position = Column(String(100), nullable=True, index=True)  # 대표이사, 사내이사, 사외이사, 감사 등
     current_company_id = Column(UUID(as_uuid=True), nullable=True, index=True)
@@ -195,3 +195,16 @@ class RaymondsIndex(Base):
             "watch_trigger": self.watch_trigger,
             "data_quality_score": float(self.data_quality_score) if self.data_quality_score else None,
         }
+
+
+class RaymondsIndexCalcState(Base):
+    """RaymondsIndex 증분 재계산 워터마크 (알고리즘 버전 × 대상 연도별 1행)"""
+
+    __tablename__ = "raymonds_index_calc_state"
+
+    algorithm_version = Column(String(10), primary_key=True)  # 2.1 → raymonds_index, 3.0 → raymonds_index_v3
+    target_year = Column(Integer, primary_key=True)  # --year (0: 미지정 = 회사별 최신 연도)
+    # 이 시각 이후 변경된 financial_details 행의 회사만 재계산 대상
+    financial_watermark = Column(DateTime(timezone=True), nullable=False)
+    companies_calculated = Column(Integer, nullable=False, default=0)
+    calculated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
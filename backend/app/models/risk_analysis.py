@@ -0,0 +1,63 @@
+"""
+일일 위험도 분석 결과 모델
+
+app/scheduler.py의 daily_risk_analysis가 실행 단위(RiskAnalysisRun)로 진행 상황과
+처리량을 기록하고, 회사별 분석 결과(RiskAnalysisResult)를 배치 단위로 저장합니다.
+"""
+
+from sqlalchemy import Column, String, Integer, Float, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.database import Base
+
+
+class RiskAnalysisRun(Base):
+    """일일 위험도 분석 실행 (체크포인트 + 실행 지표)"""
+
+    __tablename__ = "risk_analysis_runs"
+
+    id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    status = Column(String(20), nullable=False, default="running")  # running, completed, failed
+
+    total_companies = Column(Integer, nullable=False, default=0)
+    processed_companies = Column(Integer, nullable=False, default=0)
+    failed_companies = Column(Integer, nullable=False, default=0)
+    # 중단 후 이어서 실행한 횟수
+    resume_count = Column(Integer, nullable=False, default=0)
+
+    # 실행 지표 (이어서 실행한 경우 마지막 구간 기준)
+    wall_clock_seconds = Column(Float, nullable=True)
+    companies_per_second = Column(Float, nullable=True)
+    metrics = Column(JSONB, nullable=True)
+
+    error_message = Column(Text, nullable=True)
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    checkpoint_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class RiskAnalysisResult(Base):
+    """회사별 위험도 분석 결과"""
+
+    __tablename__ = "risk_analysis_results"
+
+    run_id = Column(
+        PGUUID(as_uuid=True),
+        ForeignKey("risk_analysis_runs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    company_id = Column(
+        PGUUID(as_uuid=True),
+        ForeignKey("companies.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    risk_score = Column(Float, nullable=True)
+    risk_level = Column(String(20), nullable=False)  # high, medium, low, unknown(분석 실패)
+    patterns = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+
+    analyzed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
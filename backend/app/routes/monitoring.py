@@ -1,8 +1,10 @@
 """
 Monitoring API Routes
 
-성능 모니터링 및 시스템 상태 조회
+성능 모니터링 및 시스템 상태 조회 (관리자 전용)
 """
+import asyncio
+
 from fastapi import APIRouter, Depends
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,8 +12,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db, get_redis, check_db_health
 from app.middleware.performance import performance_metrics, get_memory_usage
 from app.utils.cache import get_cache_stats
+from app.routes.admin import require_admin
 
-router = APIRouter(prefix="/api/monitoring", tags=["Monitoring"])
+# 메트릭 초기화/시스템 정보 포함 → 라우터 전체 관리자 권한 필요
+router = APIRouter(
+    prefix="/api/monitoring",
+    tags=["Monitoring"],
+    dependencies=[Depends(require_admin)],
+)
 
 
 # ============================================================================
@@ -54,8 +62,8 @@ async def system_status():
     try:
         process = psutil.Process()
 
-        # CPU 사용률 (1초 간격)
-        cpu_percent = process.cpu_percent(interval=1)
+        # CPU 사용률 (1초 간격, 이벤트 루프 블로킹 방지를 위해 스레드에서 측정)
+        cpu_percent = await asyncio.to_thread(process.cpu_percent, 1)
 
         # 메모리 사용량
         memory = get_memory_usage()
@@ -133,11 +141,16 @@ async def get_cache_metrics(redis: Redis = Depends(get_redis)):
     - 메모리 사용량
     - 히트율
     - 연결된 클라이언트 수
+    - single-flight 병합 통계 (동시 미스 병합 횟수)
+    - stale-while-revalidate 통계 (stale 응답, 백그라운드 갱신 횟수)
     """
-    if not redis:
-        return {"error": "Redis not available"}
+    from app.services.cache_service import cache
 
     stats = await get_cache_stats(redis)
+    stats["stale_while_revalidate"] = dict(cache.swr_stats)
+    if not redis:
+        return {"error": "Redis not available", **stats}
+
     return stats
 
 
@@ -152,8 +165,9 @@ async def get_database_metrics(db: AsyncSession = Depends(get_db)):
 
     - 연결 풀 상태
     - 활성 연결 수
+    - asyncpg 풀 크기 및 획득 대기 시간
     """
-    from app.database import engine
+    from app.database import engine, pg_pool_metrics
 
     pool = engine.pool
 
@@ -165,6 +179,7 @@ async def get_database_metrics(db: AsyncSession = Depends(get_db)):
             "max_overflow": pool._max_overflow,
             "total_connections": pool.size() + pool.overflow(),
         },
+        "asyncpg_pool": pg_pool_metrics.get_stats(),
     }
 
 
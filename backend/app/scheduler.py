@@ -6,16 +6,15 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from functools import wraps
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy import select, func, text
 
 from app.database import AsyncSessionLocal
 from app.models import Company
-from app.services.risk_detection import RiskDetectionEngine
+from app.services.risk_analysis_pipeline import run_risk_analysis
 from app.services.financial_metrics import FinancialMetricsCalculator
-from app.config import settings
-from neo4j import AsyncGraphDatabase
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +27,8 @@ async def daily_risk_analysis():
     일일 위험도 재계산 작업
 
     - 매일 00:00 실행
-    - CB 발행 회사 대상으로 위험도 분석
-    - 결과를 로그에 기록 (향후 DB 저장 가능)
+    - CB 발행 회사 대상으로 위험도 분석 (배치 단위 동시 처리)
+    - 결과를 risk_analysis_results에 저장, 중단 시 다음 실행에서 이어서 처리
     """
     logger.info("=" * 70)
     logger.info("일일 위험도 분석 시작")
@@ -37,77 +36,33 @@ async def daily_risk_analysis():
     logger.info("=" * 70)
 
     try:
-        # Neo4j driver
-        driver = AsyncGraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_user, settings.neo4j_password)
-        )
-
-        async with AsyncSessionLocal() as db:
-            # CB 발행 회사 조회
-            result = await db.execute(text("""
-                SELECT DISTINCT c.id, c.name
-                FROM companies c
-                JOIN convertible_bonds cb ON c.id = cb.company_id
-                ORDER BY c.name
-            """))
-            companies = result.all()
-
-            logger.info(f"분석 대상: {len(companies)}개 회사")
-
-            # 위험도 분석
-            engine = RiskDetectionEngine(driver)
-            high_risk_companies = []
-            analysis_results = []
-
-            for i, company in enumerate(companies, 1):
-                company_id = str(company.id)
-                company_name = company.name
-
-                try:
-                    analysis = await engine.analyze_company_risk(db, company_id)
-
-                    result_data = {
-                        "company_id": company_id,
-                        "company_name": company_name,
-                        "risk_score": analysis["risk_score"],
-                        "risk_level": analysis["overall_risk_level"]
-                    }
-                    analysis_results.append(result_data)
-
-                    # 고위험 회사 별도 기록
-                    if analysis["overall_risk_level"] in ["high", "critical"]:
-                        high_risk_companies.append(result_data)
-
-                    if i % 100 == 0:
-                        logger.info(f"진행률: {i}/{len(companies)} ({i/len(companies)*100:.1f}%)")
-
-                except Exception as e:
-                    logger.error(f"분석 실패 - {company_name}: {e}")
-
-        await driver.close()
+        summary = await run_risk_analysis()
+        if summary.get("skipped"):
+            return
 
         # 결과 요약
         logger.info("")
         logger.info("=" * 70)
-        logger.info("분석 완료")
+        logger.info("분석 완료" if summary["status"] == "completed" else "분석 중단 (다음 실행에서 재개)")
         logger.info("=" * 70)
-        logger.info(f"전체 분석: {len(analysis_results)}개 회사")
-        logger.info(f"고위험 회사: {len(high_risk_companies)}개")
+        logger.info(f"실행 ID: {summary['run_id']}{' (재개)' if summary['resumed'] else ''}")
+        logger.info(f"전체 분석: {summary['processed']}/{summary['total']}개 회사 (실패 {summary['failed']}개)")
+        logger.info(
+            f"소요 시간: {summary['wall_clock_seconds']:.1f}초 "
+            f"({summary['companies_per_second']:.1f}개/초)"
+        )
 
         # 고위험 회사 상위 10개 출력
-        if high_risk_companies:
-            high_risk_companies.sort(key=lambda x: x["risk_score"], reverse=True)
+        if summary["high_risk_top"]:
             logger.info("")
             logger.info("고위험 회사 TOP 10:")
-            for i, company in enumerate(high_risk_companies[:10], 1):
-                logger.info(f"  {i}. {company['company_name']}: {company['risk_score']:.1f}점 ({company['risk_level']})")
+            for i, company in enumerate(summary["high_risk_top"], 1):
+                logger.info(f"  {i}. {company['name']}: {company['risk_score']:.1f}점 ({company['risk_level']})")
 
         logger.info("=" * 70)
 
-        # 향후: 결과를 DB에 저장하거나 알림 발송
-        # await save_risk_analysis_results(analysis_results)
-        # await send_high_risk_alerts(high_risk_companies)
+        # 향후: 고위험 회사 알림 발송
+        # await send_high_risk_alerts(summary["high_risk_top"])
 
     except Exception as e:
         logger.error(f"일일 위험도 분석 실패: {e}", exc_info=True)
@@ -400,13 +355,29 @@ async def quarterly_pipeline():
         # await send_pipeline_failed_notification(quarter, year, str(e))
 
 
+def with_cache_warming(job):
+    """
+    작업 완료 후 인기 기업 캐시 재워밍
+
+    데이터가 바뀐 직후 첫 조회가 전체 쿼리 지연을 겪지 않도록 기존 캐시를 교체한다.
+    """
+    @wraps(job)
+    async def wrapper():
+        await job()
+
+        from app.services.cache_warmer import warm_popular_companies
+        await warm_popular_companies(refresh=True)
+
+    return wrapper
+
+
 def setup_scheduler():
     """
     스케줄러 설정 및 작업 등록
     """
     # 일일 위험도 분석 - 매일 00:00
     scheduler.add_job(
-        daily_risk_analysis,
+        with_cache_warming(daily_risk_analysis),
         CronTrigger(hour=0, minute=0),
         id='daily_risk_analysis',
         name='일일 위험도 분석',
@@ -416,7 +387,7 @@ def setup_scheduler():
 
     # 일일 재무지표 업데이트 - 매일 01:00
     scheduler.add_job(
-        daily_financial_update,
+        with_cache_warming(daily_financial_update),
         CronTrigger(hour=1, minute=0),
         id='daily_financial_update',
         name='일일 재무지표 업데이트',
@@ -426,7 +397,7 @@ def setup_scheduler():
 
     # 일일 M&A 타겟 업데이트 - 매일 10:00 KST
     scheduler.add_job(
-        daily_ma_target_update,
+        with_cache_warming(daily_ma_target_update),
         CronTrigger(hour=10, minute=0),
         id='daily_ma_target_update',
         name='일일 M&A 타겟 업데이트',
@@ -436,7 +407,7 @@ def setup_scheduler():
 
     # 주간 데이터 수집 - 매주 월요일 02:00
     scheduler.add_job(
-        weekly_data_collection,
+        with_cache_warming(weekly_data_collection),
         CronTrigger(day_of_week='mon', hour=2, minute=0),
         id='weekly_data_collection',
         name='주간 데이터 수집',
@@ -446,7 +417,7 @@ def setup_scheduler():
 
     # 월간 정리 작업 - 매월 1일 03:00
     scheduler.add_job(
-        monthly_cleanup,
+        with_cache_warming(monthly_cleanup),
         CronTrigger(day=1, hour=3, minute=0),
         id='monthly_cleanup',
         name='월간 정리 작업',
@@ -1,57 +1,29 @@
 """
-Redis 캐시 서비스
+Redis 캐시 서비스 (비동기)
+- app.database의 redis.asyncio 클라이언트 공유 (이벤트 루프 블로킹 없음)
+- 프로세스 내 L1 캐시 → Redis(L2) 순서로 조회 (app.utils.cache.l1_cache)
 - Redis 연결 실패 시 자동 fallback (캐시 없이 동작)
+- stale-while-revalidate: TTL 만료 후에도 이전 값을 즉시 반환하고 백그라운드 갱신
 - 프로덕션 안정성을 위한 graceful degradation
 """
-import json
+import asyncio
 import logging
-from typing import Any, Optional, Callable, TypeVar
+import time
+from typing import Any, Optional, Callable, Iterable, TypeVar, Awaitable
 from functools import wraps
 import hashlib
 
+from app import database
+from app.utils.cache import (
+    add_tags, get_raw, invalidate_tags, l1_cache, l2_stats,
+    publish_invalidation, single_flight,
+)
+from app.utils.cache_serializer import cache_serializer
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
-# Redis 클라이언트 (lazy initialization)
-_redis_client = None
-_redis_available = None
-
-
-def get_redis_client():
-    """Redis 클라이언트 반환 (연결 실패 시 None)"""
-    global _redis_client, _redis_available
-
-    if _redis_available is False:
-        return None
-
-    if _redis_client is None:
-        try:
-            from app.config import settings
-            if not settings.redis_url:
-                logger.info("Redis URL not configured, cache disabled")
-                _redis_available = False
-                return None
-
-            import redis
-            logger.info(f"Connecting to Redis: {settings.redis_url[:30]}...")
-            _redis_client = redis.from_url(
-                settings.redis_url,
-                decode_responses=True,
-                socket_timeout=5,
-                socket_connect_timeout=5,
-            )
-            # 연결 테스트
-            _redis_client.ping()
-            _redis_available = True
-            logger.info("Redis cache connected successfully")
-        except Exception as e:
-            logger.warning(f"Redis connection failed, cache disabled: {e}")
-            _redis_available = False
-            _redis_client = None
-
-    return _redis_client
-
 
 class CacheService:
     """
@@ -61,148 +33,397 @@ class CacheService:
         cache = CacheService()
 
         # 직접 사용
-        cache.set("key", {"data": "value"}, ttl=300)
-        data = cache.get("key")
+        await cache.set("key", {"data": "value"}, ttl=300)
+        data = await cache.get("key")
+
+        # 동시 미스 병합 (single-flight)
+        data = await cache.get_or_compute("key", compute_fn, ttl=300)
+
+        # TTL 만료 후 stale_ttl 동안은 이전 값 반환 + 백그라운드 갱신
+        data = await cache.get_or_compute("key", compute_fn, ttl=300, stale_ttl=3600)
+
+        # 태그 단위 무효화 (SCAN 없이 태그에 속한 키만 삭제)
+        await cache.set("key", value, ttl=300, tags=[company_tag(company_id)])
+        await cache.invalidate_tags(company_tag(company_id))
 
         # 데코레이터 사용
         @cache.cached(ttl=300)
-        def get_company(company_id: str):
-            return db.query(Company).filter(Company.id == company_id).first()
+        async def get_company(company_id: str):
+            ...
     """
 
     DEFAULT_TTL = 300  # 5분
 
+    # Redis 응답 대기 상한 (초) - 느린 Redis가 API 응답을 붙잡지 않도록
+    OPERATION_TIMEOUT = 0.5
+    # 오류 발생 시 Redis 우회 기간 (초) - 장애 중 매 요청마다 타임아웃 대기 방지
+    ERROR_COOLDOWN = 30.0
+
+    # stale-while-revalidate 봉투 필드 (값이 신선한 기한, epoch 초)
+    SWR_FRESH_UNTIL = "__fresh_until__"
+    # 백그라운드 갱신 락 (워커 간 중복 갱신 방지, 갱신이 죽어도 자동 해제)
+    SWR_REFRESH_LOCK_TTL = 60
+
+    def __init__(self):
+        self._disabled_until = 0.0
+        self._refresh_tasks: set = set()
+        self._refreshing: set = set()
+        self.swr_stats = {
+            "stale_served": 0,     # 만료 값 반환 횟수
+            "refreshes": 0,        # 백그라운드 갱신 완료
+            "refresh_errors": 0,   # 백그라운드 갱신 실패 (이전 값 유지)
+        }
+
     @property
     def client(self):
-        return get_redis_client()
+        """공유 Redis 클라이언트 (init_db에서 생성, 미설정/연결 실패 시 None)"""
+        return database.redis_client
 
     @property
     def available(self) -> bool:
-        return self.client is not None
+        return self.client is not None and time.monotonic() >= self._disabled_until
 
     def _make_key(self, key: str, prefix: str = "raymontology") -> str:
         """캐시 키 생성"""
         return f"{prefix}:{key}"
 
-    def get(self, key: str, default: Any = None) -> Any:
-        """캐시에서 값 조회"""
+    async def _call(self, operation: Awaitable[T]) -> T:
+        """Redis 명령 실행 (타임아웃 적용)"""
+        return await asyncio.wait_for(operation, timeout=self.OPERATION_TIMEOUT)
+
+    def _on_error(self, action: str, key: str, error: Exception):
+        """오류 기록 후 일정 시간 Redis 우회"""
+        self._disabled_until = time.monotonic() + self.ERROR_COOLDOWN
+        logger.warning(
+            f"Cache {action} failed for {key}: {error!r} "
+            f"(bypassing cache for {self.ERROR_COOLDOWN:.0f}s)"
+        )
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        """캐시에서 값 조회 (L1 → Redis)"""
         if not self.available:
             return default
 
+        cache_key = self._make_key(key)
+        value = l1_cache.get(cache_key)
+        if value is not None:
+            return value
+
         try:
-            cache_key = self._make_key(key)
-            value = self.client.get(cache_key)
-            if value is None:
+            raw = await self._call(get_raw(self.client, cache_key))
+            l2_stats.record(raw is not None)
+            if raw is None:
                 return default
-            return json.loads(value)
+            value = cache_serializer.loads(raw)
+            l1_cache.set(cache_key, value, l1_cache.max_ttl, len(raw))
+            return value
         except Exception as e:
-            logger.warning(f"Cache get failed for {key}: {e}")
+            self._on_error("get", key, e)
             return default
 
-    def set(self, key: str, value: Any, ttl: int = None) -> bool:
-        """캐시에 값 저장"""
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = None,
+        tags: Iterable[str] = (),
+    ) -> bool:
+        """캐시에 값 저장 (tags: invalidate_tags()로 함께 삭제할 태그)"""
         if not self.available:
             return False
 
         try:
             cache_key = self._make_key(key)
             ttl = ttl or self.DEFAULT_TTL
-            self.client.setex(cache_key, ttl, json.dumps(value, default=str))
+            serialized = cache_serializer.dumps(value)
+            await self._call(self.client.setex(cache_key, ttl, serialized))
+            if tags:
+                await self._call(add_tags(self.client, tags, cache_key, ttl=ttl))
+            l1_cache.set(cache_key, value, ttl, len(serialized))
             return True
         except Exception as e:
-            logger.warning(f"Cache set failed for {key}: {e}")
+            self._on_error("set", key, e)
             return False
 
-    def delete(self, key: str) -> bool:
+    async def delete(self, key: str) -> bool:
         """캐시에서 값 삭제"""
         if not self.available:
             return False
 
+        cache_key = self._make_key(key)
         try:
-            cache_key = self._make_key(key)
-            self.client.delete(cache_key)
+            await self._call(self.client.delete(cache_key))
             return True
         except Exception as e:
-            logger.warning(f"Cache delete failed for {key}: {e}")
+            self._on_error("delete", key, e)
             return False
+        finally:
+            await publish_invalidation(self.client, keys=[cache_key])
 
-    def delete_pattern(self, pattern: str) -> int:
-        """패턴에 매칭되는 모든 키 삭제"""
+    async def delete_pattern(self, pattern: str) -> int:
+        """
+        패턴에 매칭되는 모든 키 삭제 (SCAN 사용 - KEYS로 Redis 블로킹 방지)
+
+        전체 키스페이스를 훑으므로 운영/디버깅용. 기업 단위 무효화는 invalidate_tags 사용.
+        """
         if not self.available:
             return 0
 
+        cache_pattern = self._make_key(pattern)
         try:
-            cache_pattern = self._make_key(pattern)
-            keys = self.client.keys(cache_pattern)
+            keys = [key async for key in self.client.scan_iter(match=cache_pattern, count=100)]
             if keys:
-                return self.client.delete(*keys)
+                return await self._call(self.client.delete(*keys))
             return 0
         except Exception as e:
-            logger.warning(f"Cache delete_pattern failed for {pattern}: {e}")
+            self._on_error("delete_pattern", pattern, e)
+            return 0
+        finally:
+            await publish_invalidation(self.client, patterns=[cache_pattern])
+
+    async def add_tags(self, key: str, tags: Iterable[str], ttl: int = None) -> bool:
+        """기존 키를 태그에 추가 등록 (저장 시점에 태그를 모르는 경우)"""
+        if not self.available:
+            return False
+
+        try:
+            await self._call(add_tags(
+                self.client, tags, self._make_key(key), ttl=ttl or self.DEFAULT_TTL
+            ))
+            return True
+        except Exception as e:
+            self._on_error("add_tags", key, e)
+            return False
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """태그에 속한 모든 키 삭제 (Redis + 모든 워커의 L1)"""
+        if not self.available:
             return 0
+        return await invalidate_tags(self.client, *tags)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute_fn: Callable,
+        ttl: int = None,
+        distributed_lock: bool = False,
+        stale_ttl: int = None,
+        refresh_fn: Callable = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        캐시 조회, 미스 시 계산 후 저장 (single-flight)
+
+        동일 키의 동시 미스는 한 번만 계산하고 나머지 요청은 결과를 재사용한다.
+
+        Args:
+            key: 캐시 키
+            compute_fn: 값 계산 코루틴 함수 (인자 없음)
+            ttl: 캐시 유효 시간 (초)
+            distributed_lock: Redis 락으로 워커 간에도 계산 병합
+            stale_ttl: 지정 시 stale-while-revalidate 모드.
+                TTL 만료 후 stale_ttl 동안은 이전 값을 반환하고 백그라운드에서 갱신
+            refresh_fn: 백그라운드 갱신용 함수 (기본: compute_fn).
+                요청 범위 리소스(DB 세션 등)를 쓰지 않아야 한다
+            tags: 무효화 태그 (예: [company_tag(company_id)])
+        """
+        tags = list(tags)
+        if stale_ttl:
+            return await self._get_or_compute_swr(
+                key, compute_fn, ttl or self.DEFAULT_TTL, stale_ttl,
+                refresh_fn or compute_fn, tags,
+            )
+
+        cached_value = await self.get(key)
+        if cached_value is not None:
+            return cached_value
+
+        async def compute_and_set():
+            result = await compute_fn()
+            if result is not None:
+                await self.set(key, result, ttl, tags=tags)
+            return result
+
+        if not self.available:
+            return await compute_and_set()
+
+        cache_key = self._make_key(key)
+
+        if distributed_lock:
+            return await single_flight.do(
+                cache_key,
+                lambda: single_flight.do_with_lock(
+                    self.client, cache_key, compute_and_set, lambda: self.get(key)
+                ),
+            )
+
+        return await single_flight.do(cache_key, compute_and_set)
+
+    # ------------------------------------------------------------------
+    # stale-while-revalidate
+    # ------------------------------------------------------------------
+
+    async def _set_swr(
+        self, key: str, value: Any, ttl: int, stale_ttl: int, tags: Iterable[str] = ()
+    ) -> bool:
+        """신선 기한을 담은 봉투로 저장 (Redis TTL = ttl + stale_ttl)"""
+        envelope = {self.SWR_FRESH_UNTIL: time.time() + ttl, "value": value}
+        return await self.set(key, envelope, ttl + stale_ttl, tags=tags)
+
+    async def _get_or_compute_swr(
+        self,
+        key: str,
+        compute_fn: Callable,
+        ttl: int,
+        stale_ttl: int,
+        refresh_fn: Callable,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        envelope = await self.get(key)
+        if isinstance(envelope, dict) and self.SWR_FRESH_UNTIL in envelope:
+            if time.time() >= envelope[self.SWR_FRESH_UNTIL]:
+                self.swr_stats["stale_served"] += 1
+                self._schedule_refresh(key, refresh_fn, ttl, stale_ttl, tags)
+            return envelope["value"]
+
+        async def compute_and_set():
+            result = await compute_fn()
+            if result is not None:
+                await self._set_swr(key, result, ttl, stale_ttl, tags)
+            return result
+
+        if not self.available:
+            return await compute_and_set()
+
+        return await single_flight.do(self._make_key(key), compute_and_set)
+
+    def _schedule_refresh(
+        self, key: str, refresh_fn: Callable, ttl: int, stale_ttl: int, tags: Iterable[str] = ()
+    ):
+        """백그라운드 갱신 예약 (프로세스 내 키당 1개)"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, refresh_fn, ttl, stale_ttl, tags))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(
+        self, key: str, refresh_fn: Callable, ttl: int, stale_ttl: int, tags: Iterable[str] = ()
+    ):
+        cache_key = self._make_key(key)
+        lock_key = f"{single_flight.LOCK_PREFIX}refresh:{cache_key}"
+        acquired = False
+        try:
+            if not self.available:
+                return
+
+            # 다른 워커가 이미 갱신 중이면 생략
+            acquired = await self._call(self.client.set(
+                lock_key, "1", nx=True, ex=self.SWR_REFRESH_LOCK_TTL,
+            ))
+            if not acquired:
+                return
+
+            result = await refresh_fn()
+            if result is not None:
+                await self._set_swr(key, result, ttl, stale_ttl, tags)
+                # 다른 워커 L1의 만료 값 제거
+                await publish_invalidation(self.client, keys=[cache_key])
+            self.swr_stats["refreshes"] += 1
+        except Exception as e:
+            # 갱신 실패 시 stale 값을 계속 제공 (stale_ttl 경과 후 만료)
+            self.swr_stats["refresh_errors"] += 1
+            logger.warning(f"Cache background refresh failed for {key}: {e!r}")
+        finally:
+            self._refreshing.discard(key)
+            # 갱신 종료 즉시 락 해제 (락 TTL은 워커 비정상 종료 대비 안전망)
+            if acquired:
+                try:
+                    await self._call(self.client.delete(lock_key))
+                except Exception as e:
+                    logger.debug(f"Cache refresh lock release failed for {key}: {e!r}")
 
     def cached(
         self,
         ttl: int = None,
         key_prefix: str = None,
         key_builder: Callable = None,
+        stale_ttl: int = None,
+        session_arg: str = None,
+        tags: Callable[..., Iterable[str]] = None,
     ):
         """
-        캐시 데코레이터
+        캐시 데코레이터 (async 함수 전용)
 
         Args:
             ttl: 캐시 유효 시간 (초)
             key_prefix: 캐시 키 접두사
             key_builder: 커스텀 키 생성 함수
+            stale_ttl: 지정 시 stale-while-revalidate 모드 (get_or_compute 참고)
+            session_arg: DB 세션 인자 이름 (예: "db"). 캐시 키에서 제외하고,
+                백그라운드 갱신 시 요청 세션 대신 새 세션을 열어 전달
+            tags: 인자로 무효화 태그 목록을 만드는 함수
+                (예: lambda company_id, **_: [company_tag(company_id)])
 
         Example:
             @cache.cached(ttl=600, key_prefix="company")
-            def get_company(company_id: str):
-                return db.query(Company).filter_by(id=company_id).first()
+            async def get_company(company_id: str):
+                ...
+
+            @router.get("/ranking")
+            @cache.cached(ttl=600, key_prefix="ranking", stale_ttl=3600, session_arg="db")
+            async def get_ranking(limit: int = 50, db: AsyncSession = Depends(get_db)):
+                ...
         """
-        def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+            def build_key(*args, **kwargs) -> str:
+                if session_arg:
+                    kwargs.pop(session_arg, None)
+                if key_builder:
+                    return key_builder(*args, **kwargs)
+
+                prefix = key_prefix or func.__name__
+                key_parts = [prefix]
+                key_parts.extend(str(a) for a in args)
+                key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
+                raw_key = ":".join(key_parts)
+                # 긴 키는 해시
+                if len(raw_key) > 200:
+                    return f"{prefix}:{hashlib.md5(raw_key.encode()).hexdigest()}"
+                return raw_key
+
             @wraps(func)
-            def wrapper(*args, **kwargs) -> T:
+            async def wrapper(*args, **kwargs) -> T:
                 # 캐시 비활성화 시 원본 함수 실행
                 if not self.available:
-                    return func(*args, **kwargs)
+                    return await func(*args, **kwargs)
 
-                # 캐시 키 생성
-                if key_builder:
-                    cache_key = key_builder(*args, **kwargs)
-                else:
-                    prefix = key_prefix or func.__name__
-                    key_parts = [prefix]
-                    key_parts.extend(str(a) for a in args)
-                    key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-                    raw_key = ":".join(key_parts)
-                    # 긴 키는 해시
-                    if len(raw_key) > 200:
-                        cache_key = f"{prefix}:{hashlib.md5(raw_key.encode()).hexdigest()}"
-                    else:
-                        cache_key = raw_key
-
-                # 캐시 조회
-                cached_value = self.get(cache_key)
-                if cached_value is not None:
-                    logger.debug(f"Cache hit: {cache_key}")
-                    return cached_value
-
-                # 캐시 미스 - 원본 함수 실행
-                logger.debug(f"Cache miss: {cache_key}")
-                result = func(*args, **kwargs)
-
-                # 결과 캐싱 (None이 아닌 경우만)
-                if result is not None:
-                    self.set(cache_key, result, ttl)
-
-                return result
+                async def refresh_with_new_session():
+                    async with database.AsyncSessionLocal() as session:
+                        return await func(*args, **{**kwargs, session_arg: session})
+
+                refresh_fn = refresh_with_new_session if session_arg else None
+
+                key_tags = ()
+                if tags:
+                    tag_kwargs = {k: v for k, v in kwargs.items() if k != session_arg}
+                    key_tags = tags(*args, **tag_kwargs)
+
+                return await self.get_or_compute(
+                    build_key(*args, **kwargs),
+                    lambda: func(*args, **kwargs),
+                    ttl,
+                    stale_ttl=stale_ttl,
+                    refresh_fn=refresh_fn,
+                    tags=key_tags,
+                )
 
             # 캐시 무효화 헬퍼 메서드 추가
-            wrapper.invalidate = lambda *args, **kwargs: self.delete(
-                key_builder(*args, **kwargs) if key_builder
-                else f"{key_prefix or func.__name__}:{':'.join(str(a) for a in args)}"
-            )
+            async def invalidate(*args, **kwargs) -> bool:
+                return await self.delete(build_key(*args, **kwargs))
+
+            wrapper.invalidate = invalidate
 
             return wrapper
         return decorator
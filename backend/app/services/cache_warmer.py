@@ -0,0 +1,204 @@
+"""
+인기 기업 캐시 워밍
+
+조회 이력(company_view_history, report_views) 기준 상위 기업의 API 응답을
+미리 캐시에 채워, 앱 시작 직후/배치 작업 직후 첫 사용자가 전체 쿼리 지연을 겪지 않도록 한다.
+
+워밍 대상 (회사별):
+    - 회사 상세 (GET /api/companies/{id})
+    - RaymondsIndex (GET /api/raymonds-index/{id})
+    - 위험도 분석 (GET /api/risks/companies/{id}, Neo4j 연결 시)
+    - 관계도 (GET /api/graph/company/{id}, 프론트엔드 기본 depth/limit, Neo4j 연결 시)
+
+동시성은 세마포어로 제한한다 (워밍이 DB 풀을 점유해 실시간 요청이 밀리지 않도록).
+
+Usage:
+    from app.services.cache_warmer import warm_popular_companies
+
+    await warm_popular_companies()              # 앱 시작 후
+    await warm_popular_companies(refresh=True)  # 배치 작업 후 (기존 캐시 교체)
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app import database
+from app.config import settings
+from app.services.cache_service import cache
+from app.utils.cache import company_tag
+
+logger = logging.getLogger(__name__)
+
+# 조회 이력 집계 기간
+POPULAR_WINDOW_DAYS = 30
+
+# 관계도 워밍 파라미터 (frontend/src/api/graph.ts: DEFAULT_DEPTH=2, NODE_LIMIT 200 + 여유분 50)
+GRAPH_WARM_DEPTH = 2
+GRAPH_WARM_LIMIT = 250
+
+_POPULAR_COMPANIES_SQL = text("""
+    WITH views AS (
+        SELECT company_id, COUNT(*) AS views
+        FROM company_view_history
+        WHERE viewed_at >= NOW() - make_interval(days => :days)
+        GROUP BY company_id
+
+        UNION ALL
+
+        SELECT c.id AS company_id, SUM(rv.view_count) AS views
+        FROM report_views rv
+        JOIN companies c ON c.corp_code = rv.company_id
+        WHERE rv.last_viewed_at >= NOW() - make_interval(days => :days)
+        GROUP BY c.id
+    )
+    SELECT company_id
+    FROM views
+    GROUP BY company_id
+    ORDER BY SUM(views) DESC
+    LIMIT :limit
+""")
+
+
+async def get_popular_company_ids(
+    limit: int = None,
+    days: int = POPULAR_WINDOW_DAYS,
+) -> List[str]:
+    """
+    최근 조회수 상위 기업 ID
+
+    Args:
+        limit: 최대 기업 수 (기본: settings.cache_warm_limit)
+        days: 집계 기간 (일)
+    """
+    limit = limit or settings.cache_warm_limit
+    async with database.AsyncSessionLocal() as db:
+        result = await db.execute(_POPULAR_COMPANIES_SQL, {"days": days, "limit": limit})
+        return [str(row.company_id) for row in result.all()]
+
+
+async def warm_company(company_id: str, refresh: bool = False) -> Dict[str, bool]:
+    """
+    단일 기업 캐시 워밍
+
+    엔드포인트 함수를 직접 호출하여 요청 경로와 같은 캐시 키/값으로 채운다.
+
+    Returns:
+        dict: 대상별 성공 여부
+    """
+    from fastapi import HTTPException, Response
+    from app.api.endpoints.companies import get_company_detail
+    from app.api.endpoints.graph import get_company_network
+    from app.api.endpoints.raymonds_index import get_raymonds_index
+    from app.api.endpoints.risks import get_risk_analysis
+
+    if refresh:
+        # 워밍 전 기존 캐시 삭제 (기업 태그 단위)
+        await cache.invalidate_tags(company_tag(company_id))
+
+    targets = {
+        "company_detail": lambda db: get_company_detail(company_id=company_id, db=db),
+        "raymonds_index": lambda db: get_raymonds_index(
+            company_id=UUID(company_id), year=None, db=db
+        ),
+    }
+    if database.neo4j_driver is not None:
+        targets["risk"] = lambda db: get_risk_analysis(db, database.neo4j_driver, company_id)
+        # 핸들러 직접 호출 → Query(...) 기본값이 적용되지 않으므로 모든 쿼리 파라미터를 명시
+        targets["graph"] = lambda db: get_company_network(
+            response=Response(),
+            company_id=company_id,
+            depth=GRAPH_WARM_DEPTH,
+            limit=GRAPH_WARM_LIMIT,
+            report_years=None,
+            format="json",
+            driver=database.neo4j_driver,
+            db=db,
+        )
+
+    results = {}
+    for name, warm in targets.items():
+        try:
+            async with database.AsyncSessionLocal() as db:
+                await warm(db)
+            results[name] = True
+        except HTTPException as e:
+            # 지수 미계산 등 데이터 없음 (404) → 캐시할 응답 없음
+            results[name] = e.status_code == 404
+        except Exception as e:
+            logger.warning(f"Cache warming failed for {name}:{company_id}: {e!r}")
+            results[name] = False
+    return results
+
+
+async def warm_company_caches(
+    company_ids: List[str],
+    concurrency: int = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    기업 목록 캐시 워밍 (동시성 제한)
+
+    Args:
+        company_ids: 기업 UUID 목록
+        concurrency: 동시 워밍 기업 수 (기본: settings.cache_warm_concurrency)
+        refresh: 기존 캐시를 지우고 다시 채움 (데이터 변경 후)
+
+    Returns:
+        dict: {"companies": N, "warmed": N, "failed": N, "elapsed_seconds": N}
+    """
+    stats = {"companies": len(company_ids), "warmed": 0, "failed": 0, "elapsed_seconds": 0.0}
+    if not company_ids:
+        return stats
+
+    if not cache.available:
+        logger.info("Cache unavailable, skipping cache warming")
+        return stats
+
+    start = time.monotonic()
+    semaphore = asyncio.Semaphore(concurrency or settings.cache_warm_concurrency)
+
+    async def _warm(company_id: str):
+        async with semaphore:
+            return await warm_company(company_id, refresh=refresh)
+
+    results = await asyncio.gather(*[_warm(cid) for cid in company_ids], return_exceptions=True)
+    for company_id, result in zip(company_ids, results):
+        if isinstance(result, Exception) or not all(result.values()):
+            stats["failed"] += 1
+        else:
+            stats["warmed"] += 1
+
+    stats["elapsed_seconds"] = round(time.monotonic() - start, 2)
+    return stats
+
+
+async def warm_popular_companies(
+    limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    인기 기업 캐시 워밍 (실패해도 예외를 올리지 않음)
+
+    Args:
+        limit: 워밍할 기업 수 (기본: settings.cache_warm_limit)
+        concurrency: 동시 워밍 기업 수 (기본: settings.cache_warm_concurrency)
+        refresh: 기존 캐시를 지우고 다시 채움 (배치 작업 후)
+    """
+    try:
+        company_ids = await get_popular_company_ids(limit)
+        logger.info(f"Warming cache for {len(company_ids)} popular companies (refresh={refresh})")
+
+        stats = await warm_company_caches(company_ids, concurrency=concurrency, refresh=refresh)
+        logger.info(
+            f"Cache warming completed: {stats['warmed']}/{stats['companies']} companies "
+            f"(failed: {stats['failed']}, {stats['elapsed_seconds']}s)"
+        )
+        return stats
+    except Exception as e:
+        logger.error(f"Cache warming failed: {e}", exc_info=True)
+        return {"companies": 0, "warmed": 0, "failed": 0, "error": str(e)}
@@ -0,0 +1,227 @@
+"""
+회사 종합보고서 스냅샷 서비스
+
+CompanyFullReport는 10여 개 테이블을 조합하지만, 원천 데이터는 파싱/파이프라인/
+리스크 점수 스크립트 실행 후에만 바뀐다. 회사별 보고서를 company_report_snapshots
+테이블에 저장해두고 API는 스냅샷을 그대로 반환한다.
+
+무효화 흐름:
+    1. 스크립트가 데이터 변경 후 invalidate_company_reports() 또는
+       invalidate_company_reports_since() 호출 → is_stale=TRUE, data_version+1
+    2. rebuild_stale_company_reports()로 조회 이력 있는 스냅샷을 즉시 재빌드
+       (또는 다음 API 조회 시 재빌드)
+    3. 재빌드 중 데이터가 다시 바뀌면 data_version 불일치로 저장 생략 → 다음 조회 시 재빌드
+
+Usage (스크립트):
+    from app.services.company_report_snapshot import (
+        invalidate_company_reports_since, rebuild_stale_company_reports,
+    )
+
+    watermark = await conn.fetchval("SELECT NOW()")
+    ... 데이터 적재 ...
+    await invalidate_company_reports_since(conn, watermark)
+    await rebuild_stale_company_reports()
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# CompanyFullReport 구조 변경 시 증가 → 기존 스냅샷은 다음 조회 시 재빌드
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# 보고서 섹션의 원천 테이블 (company_id 컬럼, updated_at 컬럼)
+# disclosures(공시 건수)는 corp_code로 연결, 시각은 UTC naive(crawled_at: 신규, updated_at: 갱신)
+_CHANGED_COMPANIES_SQL = """
+    SELECT company_id FROM financial_statements WHERE updated_at >= $1
+    UNION SELECT company_id FROM officer_positions WHERE updated_at >= $1
+    UNION SELECT company_id FROM major_shareholders WHERE updated_at >= $1
+    UNION SELECT company_id FROM convertible_bonds WHERE updated_at >= $1
+    UNION SELECT cb.company_id
+          FROM cb_subscribers cs
+          JOIN convertible_bonds cb ON cs.cb_id = cb.id
+          WHERE cs.updated_at >= $1
+    UNION SELECT company_id FROM risk_scores WHERE updated_at >= $1
+    UNION SELECT target_company_id FROM risk_signals WHERE updated_at >= $1
+    UNION SELECT parent_company_id FROM affiliates WHERE updated_at >= $1
+    UNION SELECT c.id
+          FROM disclosures d
+          JOIN companies c ON c.corp_code = d.corp_code
+          WHERE d.crawled_at >= ($1::timestamptz AT TIME ZONE 'UTC')
+             OR d.updated_at >= ($1::timestamptz AT TIME ZONE 'UTC')
+    UNION SELECT id FROM companies WHERE updated_at >= $1
+"""
+
+_INVALIDATE_UPSERT = """
+    ON CONFLICT (company_id) DO UPDATE SET
+        data_version = company_report_snapshots.data_version + 1,
+        is_stale = TRUE,
+        invalidated_at = NOW()
+"""
+
+
+def is_snapshot_fresh(row) -> bool:
+    """스냅샷이 그대로 반환 가능한 상태인지 확인"""
+    return (
+        row is not None
+        and row['payload'] is not None
+        and not row['is_stale']
+        and row['schema_version'] == SNAPSHOT_SCHEMA_VERSION
+    )
+
+
+async def get_snapshot(conn, company_id):
+    """
+    스냅샷 조회
+
+    Returns:
+        Record(payload: JSON 문자열, data_version, is_stale, schema_version) 또는 None
+    """
+    return await conn.fetchrow("""
+        SELECT payload::text AS payload, data_version, is_stale, schema_version
+        FROM company_report_snapshots
+        WHERE company_id = $1
+    """, company_id)
+
+
+async def save_snapshot(
+    conn,
+    company_id,
+    payload_json: str,
+    expected_version: int,
+) -> bool:
+    """
+    스냅샷 저장
+
+    빌드 시작 시점의 data_version과 현재 값이 같을 때만 덮어쓴다
+    (빌드 도중 무효화된 경우 오래된 데이터로 fresh 표시되는 것을 방지).
+
+    Returns:
+        bool: 저장 여부
+    """
+    result = await conn.execute("""
+        INSERT INTO company_report_snapshots (
+            company_id, schema_version, data_version, is_stale, payload, built_at
+        )
+        VALUES ($1, $2, $3, FALSE, $4::jsonb, NOW())
+        ON CONFLICT (company_id) DO UPDATE SET
+            schema_version = EXCLUDED.schema_version,
+            is_stale = FALSE,
+            payload = EXCLUDED.payload,
+            built_at = NOW()
+        WHERE company_report_snapshots.data_version = EXCLUDED.data_version
+    """, company_id, SNAPSHOT_SCHEMA_VERSION, expected_version, payload_json)
+    return result.endswith(" 1")
+
+
+async def invalidate_company_reports(conn, company_ids: Iterable) -> int:
+    """
+    지정 회사들의 스냅샷 무효화
+
+    Args:
+        conn: asyncpg 커넥션
+        company_ids: 회사 UUID 목록
+
+    Returns:
+        int: 무효화된 회사 수
+    """
+    ids = list({cid for cid in company_ids if cid is not None})
+    if not ids:
+        return 0
+
+    result = await conn.execute(f"""
+        INSERT INTO company_report_snapshots (company_id, data_version, is_stale, invalidated_at)
+        SELECT c.id, 1, TRUE, NOW()
+        FROM companies c
+        WHERE c.id = ANY($1::uuid[])
+        {_INVALIDATE_UPSERT}
+    """, ids)
+    count = int(result.split()[-1])
+    logger.info(f"Invalidated {count} company report snapshots")
+    return count
+
+
+async def invalidate_company_reports_since(conn, since: datetime) -> int:
+    """
+    워터마크 이후 원천 데이터가 변경된 회사들의 스냅샷 무효화
+
+    Args:
+        conn: asyncpg 커넥션
+        since: 워터마크 (DB 시각 기준 권장: SELECT NOW())
+
+    Returns:
+        int: 무효화된 회사 수
+    """
+    result = await conn.execute(f"""
+        WITH changed AS ({_CHANGED_COMPANIES_SQL})
+        INSERT INTO company_report_snapshots (company_id, data_version, is_stale, invalidated_at)
+        SELECT c.id, 1, TRUE, NOW()
+        FROM changed ch
+        JOIN companies c ON c.id = ch.company_id
+        {_INVALIDATE_UPSERT}
+    """, since)
+    count = int(result.split()[-1])
+    logger.info(f"Invalidated {count} company report snapshots changed since {since}")
+    return count
+
+
+async def rebuild_stale_company_reports(
+    limit: Optional[int] = None,
+    concurrency: int = 2,
+) -> Dict[str, Any]:
+    """
+    stale 스냅샷 재빌드
+
+    한 번이라도 조회되어 payload가 있는 스냅샷만 재빌드한다
+    (조회된 적 없는 회사는 첫 조회 시 빌드).
+
+    Args:
+        limit: 최대 재빌드 개수
+        concurrency: 동시 재빌드 수 (보고서 1건당 섹션 쿼리가 병렬 실행되므로 작게 유지)
+
+    Returns:
+        dict: {"total": N, "rebuilt": N, "skipped": N, "errors": N}
+    """
+    from app.api.endpoints.company_report import build_company_report
+    from app.database import acquire_pg
+
+    async with acquire_pg() as conn:
+        rows = await conn.fetch("""
+            SELECT s.data_version,
+                   c.id, c.corp_code, c.name, c.ticker, c.market,
+                   c.company_type, c.trading_status
+            FROM company_report_snapshots s
+            JOIN companies c ON c.id = s.company_id
+            WHERE s.is_stale AND s.payload IS NOT NULL
+            ORDER BY s.invalidated_at
+            LIMIT $1
+        """, limit)
+
+    stats = {"total": len(rows), "rebuilt": 0, "skipped": 0, "errors": 0}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _rebuild(row) -> bool:
+        async with semaphore:
+            report = await build_company_report(row)
+            async with acquire_pg() as conn:
+                return await save_snapshot(
+                    conn, row['id'], report.model_dump_json(), row['data_version']
+                )
+
+    results = await asyncio.gather(*[_rebuild(row) for row in rows], return_exceptions=True)
+    for row, result in zip(rows, results):
+        if isinstance(result, Exception):
+            stats["errors"] += 1
+            logger.error(f"Snapshot rebuild failed for {row['name']}: {result}")
+        elif result:
+            stats["rebuilt"] += 1
+        else:
+            stats["skipped"] += 1
+
+    logger.info(
+        f"Company report snapshots rebuilt: {stats['rebuilt']}/{stats['total']} "
+        f"(skipped: {stats['skipped']}, errors: {stats['errors']})"
+    )
+    return stats
@@ -0,0 +1,141 @@
+"""
+그래프 네트워크 응답 캐시
+
+/api/graph/company/{id} (특히 depth 3)와 /api/graph/officer/{id}/career-network는
+매 요청마다 다단계 Cypher를 실행하지만, 결과는 Neo4j 동기화 후에만 바뀐다.
+GraphResponse를 (노드, depth, limit, report_years) 단위로 캐시하고
+scripts/sync/의 동기화 스크립트가 끝날 때 GRAPH_TAG 태그로 일괄 무효화한다.
+
+응답 헤더:
+    X-Cache: HIT (캐시 조회) | MISS (이 요청이 생성) | COALESCED (다른 요청의 생성 결과 대기)
+             | BYPASS (Redis 미사용/장애)
+
+Usage (엔드포인트):
+    key = company_network_key(company_id, depth, limit, report_years)
+    return await get_or_build_graph(response, key, build, tags_fn=...)
+
+Usage (동기화 스크립트):
+    from app.services.graph_cache import invalidate_graph_cache, invalidate_graph_cache_sync
+
+    await invalidate_graph_cache()   # async 스크립트
+    invalidate_graph_cache_sync()    # 동기 스크립트
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from fastapi import Response
+
+from app.config import settings
+from app.services.cache_service import cache
+from app.utils.cache import invalidate_tags
+
+logger = logging.getLogger(__name__)
+
+# 모든 그래프 응답 키가 속하는 태그 (Neo4j 동기화 시 일괄 무효화)
+GRAPH_TAG = "graph"
+
+# 동기화 스크립트가 무효화하므로 TTL은 안전망 (동기화 누락 대비)
+GRAPH_CACHE_TTL = 24 * 60 * 60
+
+CACHE_HEADER = "X-Cache"
+
+
+def normalize_report_years(report_years: Optional[str]) -> str:
+    """report_years 쿼리 → 캐시 키 조각 (순서/중복/공백 무관, 파싱 실패 시 필터 없음과 동일)"""
+    if not report_years:
+        return "all"
+    try:
+        years = sorted({int(y.strip()) for y in report_years.split(',')})
+    except ValueError:
+        return "all"
+    return ",".join(str(y) for y in years) or "all"
+
+
+def company_network_key(company_id: str, depth: int, limit: int, report_years: Optional[str]) -> str:
+    return f"graph:company:{company_id}:d{depth}:l{limit}:y{normalize_report_years(report_years)}"
+
+
+def officer_network_key(officer_id: str, limit: int) -> str:
+    return f"graph:officer_network:{officer_id}:l{limit}"
+
+
+async def get_or_build_graph(
+    response: Response,
+    key: str,
+    build_fn: Callable[[], Awaitable[Any]],
+    tags_fn: Callable[[Dict[str, Any]], Iterable[str]] = None,
+) -> Any:
+    """
+    그래프 응답 캐시 조회, 미스 시 생성 후 저장 + X-Cache 헤더 설정
+
+    Args:
+        response: FastAPI Response (헤더 설정용)
+        key: 캐시 키 (company_network_key 등)
+        build_fn: GraphResponse 생성 코루틴 함수 (인자 없음)
+        tags_fn: 생성된 응답 → 추가 무효화 태그 (예: 중심 회사 company_tag)
+    """
+    if not cache.available:
+        response.headers[CACHE_HEADER] = "BYPASS"
+        return await build_fn()
+
+    cached = await cache.get(key)
+    if cached is not None:
+        response.headers[CACHE_HEADER] = "HIT"
+        return cached
+
+    built = False
+
+    async def compute():
+        nonlocal built
+        built = True
+        return (await build_fn()).model_dump()
+
+    payload = await cache.get_or_compute(key, compute, ttl=GRAPH_CACHE_TTL, tags=[GRAPH_TAG])
+
+    if built and tags_fn:
+        extra_tags = list(tags_fn(payload))
+        if extra_tags:
+            await cache.add_tags(key, extra_tags, ttl=GRAPH_CACHE_TTL)
+
+    # 생성하지 않았으면 같은 키의 single-flight 생성을 기다린 요청 (캐시 적중 아님)
+    response.headers[CACHE_HEADER] = "MISS" if built else "COALESCED"
+    return payload
+
+
+async def invalidate_graph_cache(redis_url: Optional[str] = None) -> int:
+    """
+    그래프 응답 캐시 전체 무효화 (Redis + 모든 워커의 L1)
+
+    앱 밖(동기화 스크립트)에서는 별도 Redis 연결을 만든다. 실패해도 예외를 올리지 않음
+    (캐시는 TTL로 만료).
+
+    Returns:
+        int: 삭제된 Redis 키 개수
+    """
+    if cache.available:
+        # 앱 프로세스 내부 (공유 Redis 클라이언트)
+        return await cache.invalidate_tags(GRAPH_TAG)
+
+    redis_url = redis_url or settings.redis_url
+    if not redis_url:
+        logger.info("REDIS_URL 미설정: 그래프 캐시 무효화 생략")
+        return 0
+
+    from redis.asyncio import Redis
+
+    client = Redis.from_url(redis_url, decode_responses=True, socket_timeout=5)
+    try:
+        deleted = await invalidate_tags(client, GRAPH_TAG)
+        logger.info(f"그래프 캐시 무효화: {deleted}개 키")
+        return deleted
+    except Exception as e:
+        logger.warning(f"그래프 캐시 무효화 실패: {e}")
+        return 0
+    finally:
+        await client.close()
+
+
+def invalidate_graph_cache_sync(redis_url: Optional[str] = None) -> int:
+    """invalidate_graph_cache 동기 래퍼 (이벤트 루프 밖의 동기 스크립트용)"""
+    return asyncio.run(invalidate_graph_cache(redis_url))
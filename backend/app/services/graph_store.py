@@ -0,0 +1,752 @@
+"""
+인메모리 관계 그래프 (CSR)
+
+Neo4j 미연결 시 /api/graph-fallback/company/{id}는 요청마다 임원, 적자기업, 경력 수, 분쟁 수,
+CB, 인수자, 대주주 SQL을 차례로 왕복한다. 관계 데이터는 수십만 행 규모라 PostgreSQL에서
+한 번 읽어 프로세스 메모리에 압축 인접 배열(CSR)로 보관하고, depth 1~3 이웃 조회와
+RiskDetectionEngine 패턴 검사를 메모리에서 처리한다.
+
+구조:
+    노드: 회사 / 임원 / CB / 인수자 / 대주주 → 정수 인덱스
+    간선: offsets[i]..offsets[i+1] 구간의 targets / edge_kinds / edge_dirs (양방향 저장)
+    파생 간선: 회사 → 회사 INVESTED_IN (cb_subscribers.subscriber_company_id, 건수/금액 합계)
+    임원 동일인: officers.person_id (미지정 임원은 자기 ID) 별 임원 노드 목록
+
+갱신:
+    - 앱 시작 시 전체 로드 (백그라운드, 로드 완료 전에는 기존 SQL/Neo4j 경로 사용)
+    - graph_store_refresh_interval마다 updated_at 워터마크 이후 변경 행만 읽어 반영 → CSR 재구성
+    - 삭제된 행은 graph_store_full_reload_interval마다 전체 재로드로 반영
+
+Usage:
+    from app.services.graph_store import graph_store
+
+    if graph_store.ready:
+        network = graph_store.company_network(company_id, depth=2)
+        cycles = graph_store.circular_investments(company_id)
+"""
+import asyncio
+import logging
+import time
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.services.officer_identity import identity_key
+
+logger = logging.getLogger(__name__)
+
+# 노드 유형
+COMPANY, OFFICER, CB, SUBSCRIBER, SHAREHOLDER = range(5)
+NODE_LABELS = ("Company", "Officer", "ConvertibleBond", "Subscriber", "Shareholder")
+
+# 간선 유형 (방향: 앞 노드 → 뒤 노드)
+WORKS_AT = 0        # 임원 → 회사
+ISSUED = 1          # 회사 → CB
+SUBSCRIBED = 2      # 인수자 → CB
+SHAREHOLDER_OF = 3  # 대주주 → 회사
+AFFILIATE_OF = 4    # 모회사 → 계열사
+INVESTED_IN = 5     # 인수자 법인 → CB 발행사
+EDGE_LABELS = ("WORKS_AT", "ISSUED", "SUBSCRIBED", "SHAREHOLDER_OF", "AFFILIATE_OF", "INVESTED_IN")
+
+OUT, IN = 1, -1
+
+# 폴백 응답 상한 (graph_fallback SQL 경로와 동일)
+MAX_OFFICERS = 50
+MAX_CBS = 20
+MAX_SUBSCRIBERS = 50
+MAX_CAREERS = 50
+MAX_SHAREHOLDERS = 10
+
+# 원천 테이블 조회 ({since}: 증분 갱신 시 워터마크 조건)
+_SOURCES: Dict[str, Tuple[str, str]] = {
+    "companies": ("""
+        SELECT c.id::text AS id, c.name, c.corp_code, c.ticker, c.market, c.sector,
+               c.trading_status, rs.investment_grade,
+               GREATEST(c.updated_at, rs.updated_at) AS updated_at
+        FROM companies c
+        LEFT JOIN LATERAL (
+            SELECT investment_grade, updated_at
+            FROM risk_scores
+            WHERE company_id = c.id
+            ORDER BY analysis_year DESC, analysis_quarter DESC NULLS FIRST
+            LIMIT 1
+        ) rs ON TRUE
+        WHERE TRUE {since}
+    """, "GREATEST(c.updated_at, rs.updated_at)"),
+    "officers": ("""
+        SELECT id::text AS id, name, birth_date, COALESCE(person_id, id)::text AS person_key,
+               influence_score, updated_at
+        FROM officers
+        WHERE TRUE {since}
+    """, "updated_at"),
+    "positions": ("""
+        SELECT id::text AS id, officer_id::text AS officer_id, company_id::text AS company_id,
+               position, is_current, updated_at
+        FROM officer_positions
+        WHERE TRUE {since}
+    """, "updated_at"),
+    "cbs": ("""
+        SELECT id::text AS id, company_id::text AS company_id, bond_name,
+               issue_date::text AS issue_date, issue_amount, bond_type, updated_at
+        FROM convertible_bonds
+        WHERE TRUE {since}
+    """, "updated_at"),
+    "subscribers": ("""
+        SELECT id::text AS id, cb_id::text AS cb_id, subscriber_name, subscriber_type,
+               is_related_party, subscription_amount,
+               subscriber_company_id::text AS subscriber_company_id, updated_at
+        FROM cb_subscribers
+        WHERE TRUE {since}
+    """, "updated_at"),
+    "shareholders": ("""
+        SELECT id::text AS id, company_id::text AS company_id, shareholder_name,
+               share_ratio, share_count, shareholder_type, updated_at
+        FROM major_shareholders
+        WHERE shareholder_name NOT IN (
+                  '주식수', '의결권 없는 주식', '의결권없는주식', '의결권없는 주식',
+                  '의결권이 없는 주식', '종류주식', '종류주', '자기주식', '우선주식',
+                  '보통주식', '기타주주', '성명순', '합계', '소계', '계', '주', '-'
+              )
+          AND shareholder_name !~ '^(주식수|보통주|우선주|의결권|종류주|자기주|합계|소계|계)\\s*$'
+          AND LENGTH(shareholder_name) > 1
+          {since}
+    """, "updated_at"),
+    "affiliates": ("""
+        SELECT id::text AS id, parent_company_id::text AS parent_company_id,
+               affiliate_company_id::text AS affiliate_company_id, updated_at
+        FROM affiliates
+        WHERE TRUE {since}
+    """, "updated_at"),
+}
+
+# 최근 2년 적자 회사 (임원 적자기업 경력 수)
+_DEFICIT_COMPANIES_SQL = """
+    SELECT DISTINCT company_id::text
+    FROM financial_statements
+    WHERE net_income < 0
+      AND fiscal_year >= EXTRACT(YEAR FROM CURRENT_DATE) - 2
+"""
+
+# 경영분쟁 참여 횟수 (공시 원문 이름/생년월일 → 동일인 키로 합산)
+_DISPUTE_COUNTS_SQL = """
+    SELECT officer_name, birth_date, COUNT(DISTINCT egm_disclosure_id) AS dispute_count
+    FROM dispute_officers
+    GROUP BY officer_name, birth_date
+"""
+
+
+def _amount(value) -> float:
+    return float(value) if value else 0
+
+
+class _GraphSnapshot:
+    """불변 CSR 스냅샷 (갱신 시 새로 만들어 통째로 교체)"""
+
+    def __init__(
+        self,
+        rows: Dict[str, Dict[str, Any]],
+        deficit_company_ids: Set[str],
+        dispute_counts: Dict[Tuple[str, str], int],
+    ):
+        self.node_ids: List[str] = []
+        self.node_kinds = array('B')
+        self.node_rows: List[Any] = []
+        self.index: Dict[str, int] = {}
+        self.corp_codes: Dict[str, int] = {}
+        self.persons: Dict[str, List[int]] = {}
+        self.deficit_company_ids = frozenset(deficit_company_ids)
+        self.dispute_counts = dict(dispute_counts)
+
+        for row in rows["companies"].values():
+            idx = self._add_node(row["id"], COMPANY, row)
+            if row["corp_code"]:
+                self.corp_codes[row["corp_code"]] = idx
+        for row in rows["officers"].values():
+            idx = self._add_node(row["id"], OFFICER, row)
+            self.persons.setdefault(row["person_key"], []).append(idx)
+        for row in rows["cbs"].values():
+            self._add_node(row["id"], CB, row)
+        for row in rows["subscribers"].values():
+            self._add_node(row["id"], SUBSCRIBER, row)
+        for row in rows["shareholders"].values():
+            self._add_node(row["id"], SHAREHOLDER, row)
+
+        src: List[int] = []
+        dst: List[int] = []
+        kinds: List[int] = []
+        payloads: List[Any] = []
+
+        def link(source_id, target_id, kind, payload):
+            s = self.index.get(source_id)
+            t = self.index.get(target_id)
+            if s is None or t is None or s == t:
+                return
+            src.append(s)
+            dst.append(t)
+            kinds.append(kind)
+            payloads.append(payload)
+
+        for row in rows["positions"].values():
+            link(row["officer_id"], row["company_id"], WORKS_AT, row)
+        for row in rows["cbs"].values():
+            link(row["company_id"], row["id"], ISSUED, row)
+
+        # 인수자 법인 → 발행사 투자 합계
+        investments: Dict[Tuple[str, str], List[float]] = {}
+        for row in rows["subscribers"].values():
+            link(row["id"], row["cb_id"], SUBSCRIBED, row)
+            cb = rows["cbs"].get(row["cb_id"])
+            if row["subscriber_company_id"] and cb:
+                stats = investments.setdefault((row["subscriber_company_id"], cb["company_id"]), [0, 0])
+                stats[0] += 1
+                stats[1] += _amount(row["subscription_amount"])
+        for (investor_id, issuer_id), (count, amount) in investments.items():
+            link(investor_id, issuer_id, INVESTED_IN, (count, amount))
+
+        for row in rows["shareholders"].values():
+            link(row["id"], row["company_id"], SHAREHOLDER_OF, row)
+        for row in rows["affiliates"].values():
+            link(row["parent_company_id"], row["affiliate_company_id"], AFFILIATE_OF, row)
+
+        self._build_csr(src, dst, kinds, payloads)
+
+    def _add_node(self, node_id: str, kind: int, row) -> int:
+        idx = self.index.get(node_id)
+        if idx is None:
+            idx = len(self.node_ids)
+            self.index[node_id] = idx
+            self.node_ids.append(node_id)
+            self.node_kinds.append(kind)
+            self.node_rows.append(row)
+        return idx
+
+    def _build_csr(self, src: List[int], dst: List[int], kinds: List[int], payloads: List[Any]):
+        node_count = len(self.node_ids)
+        degree = [0] * (node_count + 1)
+        for s, t in zip(src, dst):
+            degree[s + 1] += 1
+            degree[t + 1] += 1
+        self.offsets = array('i', accumulate(degree))
+
+        edge_count = 2 * len(src)
+        self.targets = array('i', [0]) * edge_count
+        self.edge_kinds = array('B', [0]) * edge_count
+        self.edge_dirs = array('b', [0]) * edge_count
+        self.payloads: List[Any] = [None] * edge_count
+
+        cursor = list(self.offsets[:-1])
+        for s, t, kind, payload in zip(src, dst, kinds, payloads):
+            for node, other, direction in ((s, t, OUT), (t, s, IN)):
+                pos = cursor[node]
+                cursor[node] += 1
+                self.targets[pos] = other
+                self.edge_kinds[pos] = kind
+                self.edge_dirs[pos] = direction
+                self.payloads[pos] = payload
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets) // 2
+
+    def edges(self, idx: int, kind: int = None, direction: int = None) -> Iterator[Tuple[int, Any]]:
+        """노드 idx의 간선 (상대 노드 인덱스, payload)"""
+        for pos in range(self.offsets[idx], self.offsets[idx + 1]):
+            if kind is not None and self.edge_kinds[pos] != kind:
+                continue
+            if direction is not None and self.edge_dirs[pos] != direction:
+                continue
+            yield self.targets[pos], self.payloads[pos]
+
+    def resolve_company(self, company_id: str) -> Optional[int]:
+        """회사 UUID 또는 corp_code(8자리) → 노드 인덱스"""
+        if len(company_id) == 8 and company_id.isdigit():
+            return self.corp_codes.get(company_id)
+        idx = self.index.get(company_id)
+        if idx is None or self.node_kinds[idx] != COMPANY:
+            return None
+        return idx
+
+    def person_positions(self, person_key: str) -> Iterator[Tuple[int, int, Any]]:
+        """동일인의 모든 임원 레코드 직책 (임원 인덱스, 회사 인덱스, 직책 행)"""
+        for officer_idx in self.persons.get(person_key, ()):
+            for company_idx, position in self.edges(officer_idx, WORKS_AT, OUT):
+                yield officer_idx, company_idx, position
+
+    def current_officers(self, company_idx: int) -> Iterator[Tuple[int, Any]]:
+        """회사의 현직 임원 (임원 인덱스, 직책 행), (임원, 직책) 중복 제거"""
+        seen = set()
+        for officer_idx, position in self.edges(company_idx, WORKS_AT, IN):
+            key = (officer_idx, position["position"])
+            if not position["is_current"] or key in seen:
+                continue
+            seen.add(key)
+            yield officer_idx, position
+
+
+class GraphStore:
+    """인메모리 관계 그래프 (원천 행 보관 + CSR 스냅샷)"""
+
+    def __init__(self):
+        self._rows: Dict[str, Dict[str, Any]] = {name: {} for name in _SOURCES}
+        self._watermarks: Dict[str, Any] = {}
+        self._deficit_company_ids: Set[str] = set()
+        self._dispute_counts: Dict[Tuple[str, str], int] = {}
+        self._snapshot: Optional[_GraphSnapshot] = None
+        self._loaded_at: Optional[float] = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    # ------------------------------------------------------------------
+    # 로드 / 갱신
+    # ------------------------------------------------------------------
+
+    async def _fetch_source(self, conn, name: str, incremental: bool) -> int:
+        sql, watermark_column = _SOURCES[name]
+        watermark = self._watermarks.get(name) if incremental else None
+        if watermark is not None:
+            rows = await conn.fetch(sql.format(since=f"AND {watermark_column} > $1"), watermark)
+        else:
+            rows = await conn.fetch(sql.format(since=""))
+            self._rows[name] = {}
+
+        table = self._rows[name]
+        for row in rows:
+            table[row["id"]] = row
+            updated_at = row["updated_at"]
+            if updated_at is not None and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+        self._watermarks[name] = watermark
+        return len(rows)
+
+    async def _fetch_derived(self, conn) -> bool:
+        """적자 회사 / 분쟁 횟수 (작은 집계라 매번 전체 조회), 변경 여부 반환"""
+        deficit = {r[0] for r in await conn.fetch(_DEFICIT_COMPANIES_SQL)}
+        disputes: Dict[Tuple[str, str], int] = {}
+        for r in await conn.fetch(_DISPUTE_COUNTS_SQL):
+            key = identity_key(r["officer_name"], r["birth_date"])
+            disputes[key] = disputes.get(key, 0) + r["dispute_count"]
+
+        changed = deficit != self._deficit_company_ids or disputes != self._dispute_counts
+        self._deficit_company_ids = deficit
+        self._dispute_counts = disputes
+        return changed
+
+    async def _rebuild(self) -> None:
+        start = time.perf_counter()
+        # CSR 구성은 CPU 작업 → 이벤트 루프 차단 방지
+        snapshot = await asyncio.to_thread(
+            _GraphSnapshot, self._rows, self._deficit_company_ids, self._dispute_counts
+        )
+        self._snapshot = snapshot
+        logger.info(
+            f"그래프 스토어 구성: 노드 {len(snapshot.node_ids):,}개, 간선 {snapshot.edge_count:,}개 "
+            f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+        )
+
+    async def load(self, conn) -> None:
+        """원천 테이블 전체 로드 후 스냅샷 교체"""
+        async with self._lock:
+            start = time.perf_counter()
+            for name in _SOURCES:
+                await self._fetch_source(conn, name, incremental=False)
+            await self._fetch_derived(conn)
+            await self._rebuild()
+            self._loaded_at = self._refreshed_at = time.time()
+            logger.info(f"그래프 스토어 전체 로드 완료 ({time.perf_counter() - start:.1f}s)")
+
+    async def refresh(self, conn) -> int:
+        """
+        워터마크 이후 변경 행만 반영 (삭제는 전체 재로드에서 반영)
+
+        Returns:
+            int: 반영된 변경 행 수
+        """
+        if not self.ready:
+            await self.load(conn)
+            return 0
+
+        async with self._lock:
+            changed = 0
+            for name in _SOURCES:
+                changed += await self._fetch_source(conn, name, incremental=True)
+            derived_changed = await self._fetch_derived(conn)
+            if changed or derived_changed:
+                await self._rebuild()
+                logger.info(f"그래프 스토어 증분 갱신: {changed:,}행")
+            self._refreshed_at = time.time()
+            return changed
+
+    async def run(self) -> None:
+        """앱 수명 동안 로드/갱신 반복 (main.py startup에서 백그라운드 태스크로 실행)"""
+        from app.database import acquire_pg
+
+        while True:
+            try:
+                async with acquire_pg() as conn:
+                    full_reload_due = (
+                        self._loaded_at is None
+                        or time.time() - self._loaded_at >= settings.graph_store_full_reload_interval
+                    )
+                    if full_reload_due:
+                        await self.load(conn)
+                    else:
+                        await self.refresh(conn)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 스냅샷은 유지 (다음 주기 재시도), 미로드 상태면 SQL 경로 계속 사용
+                logger.warning(f"그래프 스토어 갱신 실패: {e}")
+            await asyncio.sleep(settings.graph_store_refresh_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "ready": snapshot is not None,
+            "nodes": len(snapshot.node_ids) if snapshot else 0,
+            "edges": snapshot.edge_count if snapshot else 0,
+            "loaded_at": self._loaded_at,
+            "refreshed_at": self._refreshed_at,
+        }
+
+    # ------------------------------------------------------------------
+    # 이웃 조회
+    # ------------------------------------------------------------------
+
+    def neighbourhood(self, node_id: str, depth: int = 1) -> Dict[str, int]:
+        """
+        depth 단계 이내 노드 (노드 ID → 홉 수, 시작 노드 0)
+
+        스냅샷이 없거나 노드가 없으면 빈 dict
+        """
+        snapshot = self._snapshot
+        start = snapshot.index.get(node_id) if snapshot else None
+        if start is None:
+            return {}
+
+        hops = {start: 0}
+        frontier = [start]
+        for hop in range(1, depth + 1):
+            next_frontier = []
+            for idx in frontier:
+                for other, _ in snapshot.edges(idx):
+                    if other not in hops:
+                        hops[other] = hop
+                        next_frontier.append(other)
+            frontier = next_frontier
+        return {snapshot.node_ids[idx]: hop for idx, hop in hops.items()}
+
+    def company_network(self, company_id: str, depth: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        회사 관계 네트워크 (graph_fallback SQL 경로와 같은 노드/관계 구성)
+
+        - depth 1: 임원 + CB + 대주주
+        - depth 2: 1단계 + CB 인수자
+        - depth 3: 2단계 + 임원 타사 경력
+
+        Returns:
+            {"center": 회사 행, "nodes": [...], "relationships": [...]} 또는 None (회사 없음)
+        """
+        snapshot = self._snapshot
+        center = snapshot.resolve_company(company_id) if snapshot else None
+        if center is None:
+            return None
+
+        nodes: List[Dict[str, Any]] = []
+        relationships: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+
+        def add_node(node_id, node_type, properties) -> bool:
+            if node_id in seen:
+                return False
+            seen.add(node_id)
+            nodes.append({"id": node_id, "type": node_type, "properties": properties})
+            return True
+
+        def add_rel(rel_type, source, target, properties):
+            relationships.append({
+                "id": f"rel_{len(relationships) + 1}",
+                "type": rel_type,
+                "source": source,
+                "target": target,
+                "properties": properties,
+            })
+
+        company = snapshot.node_rows[center]
+        center_id = company["id"]
+        add_node(center_id, "Company", {
+            "name": company["name"],
+            "corp_code": company["corp_code"],
+            "ticker": company["ticker"],
+            "market": company["market"],
+            "sector": company["sector"],
+            "trading_status": company["trading_status"],
+            "investment_grade": company["investment_grade"],
+        })
+
+        # 1. 현재 임원 (동일인 기준 상장사/적자기업/분쟁 경력 수)
+        officers = []
+        for officer_idx, position in snapshot.current_officers(center):
+            officers.append((officer_idx, position))
+            if len(officers) >= MAX_OFFICERS:
+                break
+
+        for officer_idx, position in officers:
+            officer = snapshot.node_rows[officer_idx]
+            if officer["id"] in seen:
+                continue
+            career_companies = {c for _, c, _ in snapshot.person_positions(officer["person_key"])}
+            deficit_count = sum(
+                1 for c in career_companies
+                if c != center and snapshot.node_ids[c] in snapshot.deficit_company_ids
+            )
+            add_node(officer["id"], "Officer", {
+                "name": officer["name"],
+                "birth_date": officer["birth_date"],
+                "position": position["position"],
+                "listed_career_count": len(career_companies),
+                "deficit_career_count": deficit_count,
+                "dispute_career_count": snapshot.dispute_counts.get(
+                    identity_key(officer["name"], officer["birth_date"]), 0
+                ),
+            })
+            add_rel("WORKS_AT", officer["id"], center_id,
+                    {"position": position["position"], "is_current": True})
+
+        # 2. 전환사채 (최근 발행순, 발행일 미상 우선 - PostgreSQL DESC 정렬과 동일)
+        cbs = [row for _, row in snapshot.edges(center, ISSUED, OUT)]
+        cbs.sort(key=lambda cb: (cb["issue_date"] is None, cb["issue_date"] or ""), reverse=True)
+        for cb in cbs[:MAX_CBS]:
+            if add_node(cb["id"], "ConvertibleBond", {
+                "bond_name": cb["bond_name"],
+                "issue_date": cb["issue_date"],
+                "issue_amount": cb["issue_amount"],
+                "bond_type": cb["bond_type"],
+            }):
+                add_rel("ISSUED", center_id, cb["id"], {})
+
+        # 3. depth >= 2: CB 인수자
+        if depth >= 2:
+            subscriber_count = 0
+            for cb_idx, cb in snapshot.edges(center, ISSUED, OUT):
+                for _, sub in snapshot.edges(cb_idx, SUBSCRIBED, IN):
+                    if subscriber_count >= MAX_SUBSCRIBERS:
+                        break
+                    subscriber_count += 1
+                    add_node(sub["id"], "Subscriber", {
+                        "name": sub["subscriber_name"],
+                        "type": sub["subscriber_type"],
+                        "is_related_party": sub["is_related_party"],
+                        "current_investment": {
+                            "cb_id": sub["cb_id"],
+                            "bond_name": cb["bond_name"],
+                            "issue_date": cb["issue_date"],
+                            "amount": sub["subscription_amount"],
+                        },
+                    })
+                    add_rel("SUBSCRIBED", sub["id"], sub["cb_id"], {"amount": sub["subscription_amount"]})
+
+        # 4. depth >= 3: 임원 타사 경력 (동일인 기준, 관계 source는 현재 회사 임원 노드)
+        if depth >= 3:
+            officer_by_person: Dict[str, str] = {}
+            for officer_idx, _ in officers:
+                officer = snapshot.node_rows[officer_idx]
+                officer_by_person.setdefault(officer["person_key"], officer["id"])
+
+            career_count = 0
+            seen_careers = set()
+            for person_key, source_officer_id in officer_by_person.items():
+                for _, company_idx, position in snapshot.person_positions(person_key):
+                    if company_idx == center or career_count >= MAX_CAREERS:
+                        continue
+                    key = (company_idx, person_key, position["position"])
+                    if key in seen_careers:
+                        continue
+                    seen_careers.add(key)
+                    career_count += 1
+
+                    career = snapshot.node_rows[company_idx]
+                    add_node(career["id"], "Company", {
+                        "name": career["name"],
+                        "trading_status": career["trading_status"],
+                        "relation_type": "officer_career",
+                    })
+                    add_rel("WORKED_AT", source_officer_id, career["id"], {"position": position["position"]})
+
+        # 5. 대주주 (지분율 상위, 무효 이름은 로드 시 제외)
+        shareholders = [row for _, row in snapshot.edges(center, SHAREHOLDER_OF, IN)]
+        shareholders.sort(key=lambda sh: (sh["share_ratio"] is not None, sh["share_ratio"] or 0), reverse=True)
+        for sh in shareholders[:MAX_SHAREHOLDERS]:
+            share_ratio = float(sh["share_ratio"]) if sh["share_ratio"] else 0
+            if add_node(sh["id"], "Shareholder", {
+                "name": sh["shareholder_name"],
+                "share_ratio": share_ratio,
+                "share_count": sh["share_count"],
+                "type": sh["shareholder_type"],
+            }):
+                add_rel("SHAREHOLDER_OF", sh["id"], center_id, {"share_ratio": share_ratio})
+
+        return {"center": company, "nodes": nodes, "relationships": relationships}
+
+    # ------------------------------------------------------------------
+    # 위험 패턴 (RiskDetectionEngine Cypher 결과와 같은 레코드 형태)
+    # ------------------------------------------------------------------
+
+    def circular_investments(self, company_id: str, max_depth: int = 3, limit: int = 10) -> List[Dict[str, Any]]:
+        """INVESTED_IN 간선으로 시작 회사에 돌아오는 순환 경로 (총액 내림차순)"""
+        snapshot = self._snapshot
+        start = snapshot.resolve_company(company_id) if snapshot else None
+        if start is None:
+            return []
+
+        cycles = []
+
+        def walk(idx: int, path: List[int], total: float):
+            for other, (count, amount) in snapshot.edges(idx, INVESTED_IN, OUT):
+                if count <= 0:
+                    continue
+                if other == start:
+                    cycle = path + [start]
+                    cycles.append({
+                        "cycle": [snapshot.node_rows[i]["name"] for i in cycle],
+                        "company_ids": [snapshot.node_ids[i] for i in cycle],
+                        "total_amount": total + amount,
+                        "cycle_length": len(path),
+                    })
+                elif len(path) < max_depth and other not in path:
+                    walk(other, path + [other], total + amount)
+
+        walk(start, [start], 0)
+        cycles.sort(key=lambda c: c["total_amount"], reverse=True)
+        return cycles[:limit]
+
+    def cb_issuances(self, company_id: str, cutoff_date: str) -> Dict[str, Any]:
+        """cutoff_date(YYYY-MM-DD) 이후 발행 CB 건수/총액/목록"""
+        snapshot = self._snapshot
+        idx = snapshot.resolve_company(company_id) if snapshot else None
+        cbs = [] if idx is None else [
+            row for _, row in snapshot.edges(idx, ISSUED, OUT)
+            if row["issue_date"] and row["issue_date"] >= cutoff_date
+        ]
+        cbs.sort(key=lambda cb: cb["issue_date"])
+        return {
+            "cb_count": len(cbs),
+            "total_amount": sum(_amount(cb["issue_amount"]) for cb in cbs),
+            "details": [
+                {"bond_name": cb["bond_name"], "issue_date": cb["issue_date"], "amount": cb["issue_amount"]}
+                for cb in cbs
+            ],
+        }
+
+    def officer_concentration(self, company_id: str, min_positions: int = 3, limit: int = 10) -> List[Dict[str, Any]]:
+        """현직 임원 중 (동일인 기준) 현직 회사가 min_positions개 이상인 임원"""
+        snapshot = self._snapshot
+        idx = snapshot.resolve_company(company_id) if snapshot else None
+        if idx is None:
+            return []
+
+        records = []
+        seen_persons = set()
+        for officer_idx, _ in snapshot.current_officers(idx):
+            officer = snapshot.node_rows[officer_idx]
+            if officer["person_key"] in seen_persons:
+                continue
+            seen_persons.add(officer["person_key"])
+            companies = {
+                c for _, c, position in snapshot.person_positions(officer["person_key"])
+                if position["is_current"]
+            }
+            if len(companies) >= min_positions:
+                records.append({
+                    "officer_name": officer["name"],
+                    "influence_score": officer["influence_score"] or 0,
+                    "position_count": len(companies),
+                    "companies": [snapshot.node_rows[c]["name"] for c in companies],
+                })
+        records.sort(key=lambda r: (r["position_count"], r["influence_score"]), reverse=True)
+        return records[:limit]
+
+    def related_party_investments(self, company_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """계열사 / 현직 임원(동일인 기준) 겸직 회사가 이 회사 CB에 투자한 내역"""
+        snapshot = self._snapshot
+        idx = snapshot.resolve_company(company_id) if snapshot else None
+        if idx is None:
+            return {"affiliate_investments": [], "officer_linked_investments": []}
+
+        invested = {other: stats for other, stats in snapshot.edges(idx, INVESTED_IN, IN)}
+
+        affiliate_investments = []
+        for affiliate in {other for other, _ in snapshot.edges(idx, AFFILIATE_OF)}:
+            count, amount = invested.get(affiliate, (0, 0))
+            affiliate_investments.append({
+                "company": snapshot.node_rows[affiliate]["name"],
+                "company_id": snapshot.node_ids[affiliate],
+                "investment_count": count,
+                "total_amount": amount,
+            })
+
+        officer_linked = []
+        seen = set()
+        for officer_idx, _ in snapshot.current_officers(idx):
+            officer = snapshot.node_rows[officer_idx]
+            person_key = officer["person_key"]
+            for _, other, position in snapshot.person_positions(person_key):
+                if other == idx or not position["is_current"] or (other, person_key) in seen:
+                    continue
+                seen.add((other, person_key))
+                count, amount = invested.get(other, (0, 0))
+                officer_linked.append({
+                    "company": snapshot.node_rows[other]["name"],
+                    "company_id": snapshot.node_ids[other],
+                    "officer": officer["name"],
+                    "investment_count": count,
+                    "total_amount": amount,
+                })
+
+        return {"affiliate_investments": affiliate_investments, "officer_linked_investments": officer_linked}
+
+    def cb_investor_concentration(self, company_id: str, min_ratio: float = 0.2, limit: int = 10) -> List[Dict[str, Any]]:
+        """인수자(이름 기준)별 참여 CB 비율이 min_ratio 초과인 투자자"""
+        snapshot = self._snapshot
+        idx = snapshot.resolve_company(company_id) if snapshot else None
+        if idx is None:
+            return []
+
+        subscribed_cbs = set()
+        investors: Dict[str, List] = {}
+        for cb_idx, _ in snapshot.edges(idx, ISSUED, OUT):
+            for _, sub in snapshot.edges(cb_idx, SUBSCRIBED, IN):
+                subscribed_cbs.add(cb_idx)
+                stats = investors.setdefault(sub["subscriber_name"], [set(), 0])
+                stats[0].add(cb_idx)
+                stats[1] += _amount(sub["subscription_amount"])
+
+        total_cb_count = len(subscribed_cbs)
+        records = []
+        for name, (cbs, amount) in investors.items():
+            ratio = len(cbs) / total_cb_count if total_cb_count else 0
+            if ratio > min_ratio:
+                records.append({
+                    "investor": name,
+                    "investment_count": len(cbs),
+                    "total_amount": amount,
+                    "concentration_ratio": ratio,
+                })
+        records.sort(key=lambda r: r["concentration_ratio"], reverse=True)
+        return records[:limit]
+
+    def affiliate_ids(self, company_id: str) -> List[str]:
+        """계열사 ID (모회사/계열사 양방향)"""
+        snapshot = self._snapshot
+        idx = snapshot.resolve_company(company_id) if snapshot else None
+        if idx is None:
+            return []
+        return list(dict.fromkeys(snapshot.node_ids[other] for other, _ in snapshot.edges(idx, AFFILIATE_OF)))
+
+
+# 전역 그래프 스토어 인스턴스 (워커별 메모리)
+graph_store = GraphStore()
@@ -0,0 +1,371 @@
+"""
+순환 투자 사전 계산 인덱스
+
+회사 → 회사 CB 투자 간선(cb_subscribers.subscriber_company_id → 발행사, 인메모리 그래프의
+INVESTED_IN과 동일)에서 길이 MAX_CYCLE_LENGTH 이하의 순환을 한 번에 열거해
+investment_cycles / investment_cycle_members에 저장한다. 위험 패턴 탐지(순환 투자)는
+회사마다 가변 길이 경로 탐색을 하는 대신 이 인덱스를 조회한다.
+
+열거 방식 (Johnson 알고리즘의 길이 제한 변형):
+    1. 강연결요소(SCC)로 분할 → 순환은 한 SCC 안에만 존재, 나머지 간선은 제외
+    2. 각 SCC에서 회사 ID 순으로 시작점 s를 정하고 s보다 큰 회사만 지나는 경로로 s에 돌아오는
+       순환을 깊이 제한 DFS로 찾음 → 각 순환은 최소 ID 회사에서 한 번만 발견
+    (길이 제한이 있으면 Johnson의 blocking 규칙이 성립하지 않아 깊이 제한으로 대체)
+
+갱신:
+    - rebuild_investment_cycles: 전체 재계산 (삭제된 인수자 행 반영)
+    - refresh_investment_cycles: 워터마크 이후 변경된 CB/인수자 행의 회사가 포함된 순환만 재계산
+      (새 간선/금액 변경으로 생기거나 바뀌는 순환은 반드시 변경 간선의 양 끝 회사를 포함)
+
+Usage:
+    from app.services.investment_cycles import refresh_investment_cycles, fetch_company_cycles
+
+    async with acquire_pg() as conn:
+        await refresh_investment_cycles(conn)          # 동기화 후
+        cycles = await fetch_company_cycles(conn, [company_id], max_depth=3)
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 인덱스에 저장하는 최대 순환 길이 (위험 탐지 기본 max_depth와 동일)
+MAX_CYCLE_LENGTH = 3
+
+# {투자 회사: {발행 회사: (투자 건수, 투자 총액)}}
+InvestmentEdges = Dict[str, Dict[str, Tuple[int, float]]]
+
+_INVESTMENT_EDGES_SQL = """
+    SELECT s.subscriber_company_id::text AS investor_id,
+           cb.company_id::text AS issuer_id,
+           COUNT(*) AS investment_count,
+           SUM(COALESCE(s.subscription_amount, 0)) AS total_amount
+    FROM cb_subscribers s
+    JOIN convertible_bonds cb ON cb.id = s.cb_id
+    WHERE s.subscriber_company_id IS NOT NULL
+      AND cb.company_id IS NOT NULL
+    GROUP BY s.subscriber_company_id, cb.company_id
+"""
+
+# 워터마크 이후 변경된 CB/인수자 행의 양 끝 회사
+_CHANGED_COMPANIES_SQL = """
+    WITH changed AS (
+        SELECT s.subscriber_company_id, cb.company_id
+        FROM cb_subscribers s
+        JOIN convertible_bonds cb ON cb.id = s.cb_id
+        WHERE s.updated_at > $1 OR cb.updated_at > $1
+    )
+    SELECT subscriber_company_id::text AS company_id FROM changed WHERE subscriber_company_id IS NOT NULL
+    UNION
+    SELECT company_id::text FROM changed WHERE company_id IS NOT NULL
+"""
+
+_INSERT_CYCLES_SQL = """
+    INSERT INTO investment_cycles (cycle_key, company_ids, cycle_length, total_amount, min_investment_count, computed_at)
+    SELECT r.cycle_key, string_to_array(r.cycle_key, '->')::uuid[], r.cycle_length, r.total_amount, r.min_count, NOW()
+    FROM unnest($1::text[], $2::int[], $3::float8[], $4::int[])
+         AS r(cycle_key, cycle_length, total_amount, min_count)
+    ON CONFLICT (cycle_key) DO UPDATE SET
+        total_amount = EXCLUDED.total_amount,
+        min_investment_count = EXCLUDED.min_investment_count,
+        computed_at = EXCLUDED.computed_at
+"""
+
+_INSERT_MEMBERS_SQL = """
+    INSERT INTO investment_cycle_members (company_id, cycle_key)
+    SELECT company_id, cycle_key
+    FROM unnest($1::uuid[], $2::text[]) AS r(company_id, cycle_key)
+    ON CONFLICT DO NOTHING
+"""
+
+_UPSERT_STATE_SQL = """
+    INSERT INTO investment_cycle_index_state (id, max_length, cycle_count, edges_watermark, built_at, refreshed_at)
+    VALUES (1, $1, (SELECT COUNT(*) FROM investment_cycles), $2, NOW(), NOW())
+    ON CONFLICT (id) DO UPDATE SET
+        max_length = EXCLUDED.max_length,
+        cycle_count = EXCLUDED.cycle_count,
+        edges_watermark = EXCLUDED.edges_watermark,
+        built_at = CASE WHEN $3 THEN EXCLUDED.built_at ELSE investment_cycle_index_state.built_at END,
+        refreshed_at = EXCLUDED.refreshed_at
+"""
+
+# 회사별 순환 (총액 내림차순 상위 $3개), 회사명은 조회 시점 기준
+_COMPANY_CYCLES_SQL = """
+    SELECT company_id, company_ids, names, cycle_length, total_amount
+    FROM (
+        SELECT m.company_id::text AS company_id,
+               ic.company_ids::text[] AS company_ids,
+               ARRAY(
+                   SELECT c.name
+                   FROM unnest(ic.company_ids) WITH ORDINALITY AS u(id, ord)
+                   LEFT JOIN companies c ON c.id = u.id
+                   ORDER BY u.ord
+               ) AS names,
+               ic.cycle_length,
+               ic.total_amount,
+               ROW_NUMBER() OVER (PARTITION BY m.company_id ORDER BY ic.total_amount DESC) AS rank
+        FROM investment_cycle_members m
+        JOIN investment_cycles ic ON ic.cycle_key = m.cycle_key
+        WHERE m.company_id = ANY($1::uuid[])
+          AND ic.cycle_length <= $2
+    ) ranked
+    WHERE rank <= $3
+    ORDER BY company_id, total_amount DESC
+"""
+
+
+# ============================================================================
+# 순환 열거 (순수 함수)
+# ============================================================================
+
+def _strongly_connected(edges: InvestmentEdges) -> Dict[str, int]:
+    """Tarjan SCC (반복 구현) → {회사: SCC 번호}"""
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    component: Dict[str, int] = {}
+    counter = 0
+    scc_count = 0
+
+    for root in edges:
+        if root in index:
+            continue
+        work = [(root, iter(edges.get(root, ())))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(edges.get(succ, ()))))
+                    advanced = True
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component[member] = scc_count
+                    if member == node:
+                        break
+                scc_count += 1
+
+    return component
+
+
+def _canonical(nodes: List[str]) -> List[str]:
+    """순환 회사 목록을 최소 ID 회사에서 시작하도록 회전"""
+    start = nodes.index(min(nodes))
+    return nodes[start:] + nodes[:start]
+
+
+def _cycle_record(nodes: List[str], edges: InvestmentEdges) -> Dict[str, Any]:
+    hops = [edges[nodes[i]][nodes[(i + 1) % len(nodes)]] for i in range(len(nodes))]
+    return {
+        "cycle_key": "->".join(nodes),
+        "company_ids": list(nodes),
+        "cycle_length": len(nodes),
+        "total_amount": float(sum(amount for _, amount in hops)),
+        "min_investment_count": min(count for count, _ in hops),
+    }
+
+
+def find_cycles(
+    edges: InvestmentEdges,
+    max_length: int = MAX_CYCLE_LENGTH,
+    through: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    길이 max_length 이하의 투자 순환 열거
+
+    Args:
+        edges: {투자 회사: {발행 회사: (건수, 총액)}}
+        max_length: 최대 순환 길이 (간선 수, 자기 자신 투자는 1)
+        through: 지정 시 이 회사들 중 하나 이상을 포함하는 순환만 (증분 갱신용)
+
+    Returns:
+        [{cycle_key, company_ids (최소 ID부터, 닫힘 노드 제외), cycle_length, total_amount,
+          min_investment_count}]
+    """
+    component = _strongly_connected(edges)
+    cycles: Dict[str, Dict[str, Any]] = {}
+
+    def walk(start: str, node: str, path: List[str], allowed):
+        for succ in edges.get(node, ()):
+            if succ == start:
+                nodes = _canonical(path) if through is not None else path
+                key = "->".join(nodes)
+                if key not in cycles:
+                    cycles[key] = _cycle_record(nodes, edges)
+            elif len(path) < max_length and succ not in path and allowed(succ):
+                path.append(succ)
+                walk(start, succ, path, allowed)
+                path.pop()
+
+    if through is None:
+        # 최소 ID 시작점에서만 발견되도록 시작점보다 큰 회사만 경유
+        for start in sorted(edges):
+            scc = component[start]
+            walk(start, start, [start], lambda n, s=start, c=scc: n > s and component.get(n) == c)
+    else:
+        for start in sorted(set(through)):
+            if start not in edges:
+                continue
+            scc = component[start]
+            walk(start, start, [start], lambda n, c=scc: component.get(n) == c)
+
+    return list(cycles.values())
+
+
+# ============================================================================
+# 인덱스 저장/조회
+# ============================================================================
+
+async def _load_edges(conn) -> InvestmentEdges:
+    edges: InvestmentEdges = {}
+    for row in await conn.fetch(_INVESTMENT_EDGES_SQL):
+        edges.setdefault(row["investor_id"], {})[row["issuer_id"]] = (
+            row["investment_count"], float(row["total_amount"] or 0)
+        )
+    return edges
+
+
+async def _insert_cycles(conn, cycles: List[Dict[str, Any]]):
+    if not cycles:
+        return
+    await conn.execute(
+        _INSERT_CYCLES_SQL,
+        [c["cycle_key"] for c in cycles],
+        [c["cycle_length"] for c in cycles],
+        [c["total_amount"] for c in cycles],
+        [c["min_investment_count"] for c in cycles],
+    )
+    member_ids, member_keys = [], []
+    for c in cycles:
+        for company_id in set(c["company_ids"]):
+            member_ids.append(company_id)
+            member_keys.append(c["cycle_key"])
+    await conn.execute(_INSERT_MEMBERS_SQL, member_ids, member_keys)
+
+
+async def rebuild_investment_cycles(conn, max_length: int = MAX_CYCLE_LENGTH) -> Dict[str, Any]:
+    """순환 인덱스 전체 재계산 (한 트랜잭션으로 교체, 조회 중인 세션은 이전 인덱스를 봄)"""
+    start = time.perf_counter()
+    watermark = await conn.fetchval("SELECT NOW()")
+    edges = await _load_edges(conn)
+    cycles = await asyncio.to_thread(find_cycles, edges, max_length)
+
+    async with conn.transaction():
+        # TRUNCATE는 커밋까지 조회를 막으므로 DELETE 사용
+        await conn.execute("DELETE FROM investment_cycles")
+        await _insert_cycles(conn, cycles)
+        await conn.execute(_UPSERT_STATE_SQL, max_length, watermark, True)
+
+    stats = {
+        "mode": "full",
+        "edges": sum(len(targets) for targets in edges.values()),
+        "cycles": len(cycles),
+        "seconds": round(time.perf_counter() - start, 2),
+    }
+    logger.info(f"순환 투자 인덱스 전체 재계산: 간선 {stats['edges']:,}개 → 순환 {stats['cycles']:,}개 ({stats['seconds']}초)")
+    return stats
+
+
+async def refresh_investment_cycles(conn, max_length: Optional[int] = None) -> Dict[str, Any]:
+    """
+    워터마크 이후 변경된 CB/인수자 행 기준 증분 갱신
+
+    인덱스가 없거나 max_length가 바뀌면 전체 재계산. 삭제된 인수자 행은 감지하지 못하므로
+    주기적인 rebuild_investment_cycles가 필요하다.
+    """
+    state = await conn.fetchrow(
+        "SELECT max_length, edges_watermark FROM investment_cycle_index_state WHERE id = 1"
+    )
+    if state is None or (max_length is not None and max_length != state["max_length"]):
+        return await rebuild_investment_cycles(conn, max_length or MAX_CYCLE_LENGTH)
+
+    start = time.perf_counter()
+    max_length = state["max_length"]
+    watermark = await conn.fetchval("SELECT NOW()")
+    changed = [row["company_id"] for row in await conn.fetch(_CHANGED_COMPANIES_SQL, state["edges_watermark"])]
+
+    cycles: List[Dict[str, Any]] = []
+    if changed:
+        edges = await _load_edges(conn)
+        cycles = await asyncio.to_thread(find_cycles, edges, max_length, changed)
+
+    async with conn.transaction():
+        if changed:
+            await conn.execute("""
+                DELETE FROM investment_cycles
+                WHERE cycle_key IN (
+                    SELECT cycle_key FROM investment_cycle_members WHERE company_id = ANY($1::uuid[])
+                )
+            """, changed)
+            await _insert_cycles(conn, cycles)
+        await conn.execute(_UPSERT_STATE_SQL, max_length, watermark, False)
+
+    stats = {
+        "mode": "incremental",
+        "changed_companies": len(changed),
+        "cycles": len(cycles),
+        "seconds": round(time.perf_counter() - start, 2),
+    }
+    logger.info(
+        f"순환 투자 인덱스 증분 갱신: 변경 회사 {stats['changed_companies']:,}개 → "
+        f"순환 {stats['cycles']:,}개 재계산 ({stats['seconds']}초)"
+    )
+    return stats
+
+
+async def fetch_company_cycles(
+    conn,
+    company_ids: List[str],
+    max_depth: int = MAX_CYCLE_LENGTH,
+    limit: int = 10,
+) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """
+    회사별 순환 투자 (위험 탐지 _CIRCULAR_INVESTMENT_CYPHER 결과와 같은 형태)
+
+    Returns:
+        {company_id: [{cycle, company_ids, total_amount, cycle_length}]}
+        (cycle/company_ids는 해당 회사에서 시작해 해당 회사로 끝남)
+        인덱스가 없거나 max_depth가 인덱스 최대 길이보다 길면 None
+    """
+    indexed_length = await conn.fetchval("SELECT max_length FROM investment_cycle_index_state WHERE id = 1")
+    if indexed_length is None or max_depth > indexed_length:
+        return None
+
+    result: Dict[str, List[Dict[str, Any]]] = {cid: [] for cid in company_ids}
+    for row in await conn.fetch(_COMPANY_CYCLES_SQL, company_ids, max_depth, limit):
+        cid = row["company_id"]
+        ids, names = list(row["company_ids"]), list(row["names"])
+        offset = ids.index(cid)
+        ids = ids[offset:] + ids[:offset]
+        names = names[offset:] + names[:offset]
+        result.setdefault(cid, []).append({
+            "cycle": names + names[:1],
+            "company_ids": ids + ids[:1],
+            "total_amount": row["total_amount"],
+            "cycle_length": row["cycle_length"],
+        })
+    return result
@@ -0,0 +1,146 @@
+"""
+임원 동일인 식별 서비스
+
+임원 레코드는 보고서/파서마다 따로 생성되므로 같은 사람이 여러 officers 행으로
+존재한다. 이전에는 경력 조회 시마다 이름 + 생년월일 문자열을 가공해
+(replace/substring) 비교했으나, 이제 (정규화 이름, 출생년월)마다 정규 person id를
+officer_identities에 저장하고 officers.person_id로 연결한다.
+
+    officers.person_id = officer_identities.id
+    Neo4j (:Officer {person_id})  ← 동기화 스크립트가 같은 값 저장
+
+동일인 기준 (기존 Cypher 비교와 동일):
+    - 이름: 공백 제거 후 일치
+    - 출생년월: 숫자 기준 YYYYMM 일치, 둘 다 미상('')이면 동일인
+
+Usage (스크립트, asyncpg):
+    from app.services.officer_identity import resolve_officer_identities
+
+    await resolve_officer_identities(conn)                     # person_id 미지정 임원 전체
+    await resolve_officer_identities(conn, officer_ids=[...])  # 특정 임원만
+"""
+import logging
+import re
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# "1978년 11월", "1978.11", "1978-1", "197811" 등
+_BIRTH_YM_PATTERN = re.compile(r'(\d{4})\D*(\d{1,2})')
+_WHITESPACE = re.compile(r'\s+')
+
+# 한 번에 처리할 임원 수
+RESOLVE_BATCH_SIZE = 5000
+
+_UPSERT_IDENTITIES_SQL = """
+    INSERT INTO officer_identities (name_normalized, birth_ym)
+    SELECT DISTINCT k.name_normalized, k.birth_ym
+    FROM unnest($1::text[], $2::text[]) AS k(name_normalized, birth_ym)
+    ON CONFLICT (name_normalized, birth_ym) DO NOTHING
+"""
+
+# updated_at 갱신: 그래프 스토어 증분 갱신(워터마크)이 person_id 변경을 감지하도록
+_ASSIGN_PERSON_IDS_SQL = """
+    UPDATE officers o
+    SET person_id = oi.id, updated_at = NOW()
+    FROM unnest($1::uuid[], $2::text[], $3::text[]) AS k(officer_id, name_normalized, birth_ym)
+    JOIN officer_identities oi
+      ON oi.name_normalized = k.name_normalized AND oi.birth_ym = k.birth_ym
+    WHERE o.id = k.officer_id
+      AND o.person_id IS DISTINCT FROM oi.id
+"""
+
+
+def normalize_officer_name(name: Optional[str]) -> str:
+    """이름 정규화 (공백 제거)"""
+    if not name:
+        return ""
+    return _WHITESPACE.sub("", name)
+
+
+def normalize_birth_ym(birth_date: Optional[str]) -> str:
+    """
+    생년월일 → YYYYMM (미상이면 '')
+
+    - "1978년 11월" → "197811"
+    - "1973.1"     → "197301"
+    - "197811"     → "197811"
+    """
+    if not birth_date:
+        return ""
+    match = _BIRTH_YM_PATTERN.search(str(birth_date))
+    if not match:
+        return ""
+    year, month = match.groups()
+    if not 1 <= int(month) <= 12:
+        # 월 파싱 실패 → 연도만으로는 동일인 판단 불가
+        return ""
+    return f"{year}{int(month):02d}"
+
+
+def identity_key(name: Optional[str], birth_date: Optional[str]) -> Tuple[str, str]:
+    """동일인 식별 키 (정규화 이름, 출생년월)"""
+    return normalize_officer_name(name), normalize_birth_ym(birth_date)
+
+
+async def _assign_batch(conn, rows) -> int:
+    officer_ids: List = []
+    names: List[str] = []
+    birth_yms: List[str] = []
+    for row in rows:
+        name, birth_ym = identity_key(row['name'], row['birth_date'])
+        if not name:
+            continue
+        officer_ids.append(row['id'])
+        names.append(name)
+        birth_yms.append(birth_ym)
+
+    if not officer_ids:
+        return 0
+
+    async with conn.transaction():
+        await conn.execute(_UPSERT_IDENTITIES_SQL, names, birth_yms)
+        status = await conn.execute(_ASSIGN_PERSON_IDS_SQL, officer_ids, names, birth_yms)
+    return int(status.split()[-1])
+
+
+async def resolve_officer_identities(
+    conn,
+    officer_ids: Optional[Iterable] = None,
+    only_missing: bool = True,
+    batch_size: int = RESOLVE_BATCH_SIZE,
+) -> int:
+    """
+    임원에 person_id 부여 (필요 시 officer_identities 생성)
+
+    Args:
+        conn: asyncpg 연결
+        officer_ids: 대상 임원 ID (None이면 전체)
+        only_missing: person_id가 없는 임원만 처리 (False면 이름/생년월일 변경분도 재계산)
+        batch_size: 배치 크기
+
+    Returns:
+        person_id가 새로 지정/변경된 임원 수
+    """
+    conditions = []
+    params = []
+    if officer_ids is not None:
+        ids = [str(i) for i in officer_ids]
+        if not ids:
+            return 0
+        params.append(ids)
+        conditions.append(f"id = ANY(${len(params)}::uuid[])")
+    if only_missing:
+        conditions.append("person_id IS NULL")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    rows = await conn.fetch(f"SELECT id, name, birth_date FROM officers {where}", *params)
+
+    updated = 0
+    for i in range(0, len(rows), batch_size):
+        updated += await _assign_batch(conn, rows[i:i + batch_size])
+
+    if updated:
+        logger.info(f"임원 동일인 식별: {updated:,}명 person_id 지정 (대상 {len(rows):,}명)")
+    return updated
+
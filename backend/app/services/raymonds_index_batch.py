@@ -0,0 +1,793 @@
+"""
+RaymondsIndex™ v2.1 배치 계산 엔진 (NumPy 열 단위)
+
+RaymondsIndexCalculator.calculate()를 회사 단위로 반복하는 대신,
+대상 회사 전체의 재무 데이터를 (회사 × 연도) 배열로 모아 핵심 지표, Sub-Index,
+종합 점수, 등급, 특별 규칙을 한 번에 계산합니다.
+
+- 계산 규칙은 RaymondsIndexCalculator와 동일 (tests/test_raymonds_index_batch.py 패리티 테스트)
+- Red/Yellow Flags, 해석 문구는 문자열 생성이므로 회사별로 기존 메서드를 재사용
+- 결과는 RaymondsIndexCalculator.to_dict()와 같은 형식의 dict 리스트
+
+Usage:
+    panel = FinancialPanel.from_rows(rows)   # company_id, fiscal_year 포함 행
+    results = RaymondsIndexBatchCalculator().calculate(panel, target_year=2025)
+"""
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from app.services.raymonds_index_calculator import CoreMetrics, RaymondsIndexCalculator
+
+logger = logging.getLogger(__name__)
+
+# 계산에 사용하는 재무 항목 (없는 항목은 RaymondsIndexCalculator._safe_get과 같이 0으로 처리)
+FINANCIAL_FIELDS = [
+    # 재무상태표
+    'cash_and_equivalents', 'short_term_investments',
+    'other_financial_assets_current', 'other_assets_current',
+    'fvpl_financial_assets', 'other_financial_assets_non_current',
+    'tangible_assets', 'intangible_assets', 'right_of_use_assets', 'investments_in_associates',
+    'total_assets', 'total_liabilities', 'total_equity',
+    'short_term_borrowings', 'long_term_borrowings', 'bonds_payable', 'convertible_bonds',
+    # 손익계산서
+    'revenue', 'operating_income', 'net_income', 'depreciation_expense',
+    # 현금흐름표
+    'operating_cash_flow', 'capex', 'dividend_paid', 'treasury_stock_acquisition',
+    'stock_issuance', 'bond_issuance',
+]
+
+# 계산에 필요한 최소 연도 수 (RaymondsIndexCalculator.calculate와 동일)
+MIN_YEARS = 2
+
+# 데이터 품질 점수 대상 항목 (RaymondsIndexCalculator._calculate_data_quality와 동일)
+QUALITY_FIELDS = [
+    'total_assets', 'revenue', 'operating_cash_flow', 'capex',
+    'cash_and_equivalents', 'net_income', 'total_equity',
+    'operating_income', 'tangible_assets', 'short_term_investments',
+]
+
+# 추세 코드 → CoreMetrics.capex_trend 문자열
+_TREND_INCREASING = 1
+_TREND_STABLE = 0
+_TREND_DECREASING = -1
+_TREND_NAMES = {
+    _TREND_INCREASING: 'increasing',
+    _TREND_STABLE: 'stable',
+    _TREND_DECREASING: 'decreasing',
+}
+
+
+@dataclass
+class FinancialPanel:
+    """
+    회사 × 연도 재무 데이터 배열
+
+    회사별 연도 데이터를 오래된 순서로 왼쪽 정렬하고, 부족한 칸은 NaN으로 채운다.
+    lengths[i]는 회사 i의 연도 수 (current = lengths - 1, previous = lengths - 2).
+    """
+    company_ids: List[str]
+    fiscal_years: np.ndarray           # (n, T) 회계연도, 빈 칸 0
+    lengths: np.ndarray                # (n,) 연도 수
+    values: Dict[str, np.ndarray]      # 항목별 (n, T), None/빈 칸 NaN
+
+    @property
+    def size(self) -> int:
+        return len(self.company_ids)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> 'FinancialPanel':
+        """
+        (company_id, fiscal_year) 단위 행 → 패널
+
+        같은 (company_id, fiscal_year) 행이 여러 개면 먼저 나온 행을 사용한다
+        (조회 쿼리의 DISTINCT ON 규칙과 동일). 2개 연도 미만 회사는 제외 (계산 불가).
+        """
+        by_company: Dict[str, Dict[int, Mapping[str, Any]]] = {}
+        for row in rows:
+            years = by_company.setdefault(str(row['company_id']), {})
+            year = row.get('fiscal_year') or 0
+            if year not in years:
+                years[year] = row
+
+        company_ids = [cid for cid, years in by_company.items() if len(years) >= MIN_YEARS]
+        n = len(company_ids)
+        width = max((len(by_company[cid]) for cid in company_ids), default=MIN_YEARS)
+
+        fiscal_years = np.zeros((n, width), dtype=np.int64)
+        lengths = np.zeros(n, dtype=np.int64)
+        columns = {field: np.full((n, width), np.nan) for field in FINANCIAL_FIELDS}
+
+        for i, cid in enumerate(company_ids):
+            years = by_company[cid]
+            lengths[i] = len(years)
+            for j, year in enumerate(sorted(years)):
+                row = years[year]
+                fiscal_years[i, j] = year
+                for field in FINANCIAL_FIELDS:
+                    value = row.get(field)
+                    if value is not None:
+                        columns[field][i, j] = float(value)
+
+        return cls(company_ids=company_ids, fiscal_years=fiscal_years, lengths=lengths, values=columns)
+
+
+def _round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    파이썬 round()와 같은 반올림
+
+    np.round는 10^n 곱셈 오차로 .5 경계 값에서 round()와 다를 수 있어,
+    경계에 가까운 값만 round()로 다시 계산한다.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(v, ndigits) for v in values[near_tie].tolist()]
+    return rounded
+
+
+def _div(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """0으로 나누는 칸은 0 (해당 칸은 호출 측 np.where 조건에서 제외됨)"""
+    safe = np.where(denominator != 0, denominator, 1.0)
+    return np.where(denominator != 0, numerator / safe, 0.0)
+
+
+def _trend(values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    추세 코드 (RaymondsIndexCalculator._analyze_trend의 배열 버전)
+
+    0인 값을 제외하고 남은 값의 순서를 x로 선형 회귀, 상대 기울기 ±5% 기준
+    """
+    mask = valid & (values != 0)
+    count = mask.sum(axis=1)
+    x = np.cumsum(mask, axis=1) - 1
+    x_mean = (count - 1) / 2
+    y_mean = _div(np.where(mask, values, 0.0).sum(axis=1), count.astype(float))
+
+    dx = np.where(mask, x - x_mean[:, None], 0.0)
+    numerator = (dx * np.where(mask, values - y_mean[:, None], 0.0)).sum(axis=1)
+    denominator = (dx ** 2).sum(axis=1)
+
+    slope = _div(numerator, denominator)
+    relative_slope = _div(slope, np.abs(y_mean))
+
+    trend = np.select(
+        [relative_slope > 0.05, relative_slope < -0.05],
+        [_TREND_INCREASING, _TREND_DECREASING],
+        _TREND_STABLE,
+    )
+    return np.where((count < 2) | (denominator == 0), _TREND_STABLE, trend)
+
+
+def _linear_score(values: np.ndarray, breakpoints) -> np.ndarray:
+    """구간별 선형 보간 점수 (RaymondsIndexCalculator.linear_score의 배열 버전, 같은 보간식)"""
+    sorted_bp = sorted(breakpoints, key=lambda x: x[0])
+    conditions = [values <= sorted_bp[0][0], values >= sorted_bp[-1][0]]
+    choices = [sorted_bp[0][1], sorted_bp[-1][1]]
+    for (x1, y1), (x2, y2) in zip(sorted_bp, sorted_bp[1:]):
+        conditions.append((x1 <= values) & (values <= x2))
+        choices.append(y1 + (values - x1) / (x2 - x1) * (y2 - y1))
+    return np.select(conditions, choices, 50.0)
+
+
+class RaymondsIndexBatchCalculator:
+    """
+    RaymondsIndex v2.1 배치 계산기
+
+    가중치, 등급 기준, 특별 규칙 상한, 문구 생성은 RaymondsIndexCalculator 인스턴스를 공유한다.
+    """
+
+    def __init__(self, industry_sector: str = None):
+        self._calculator = RaymondsIndexCalculator(industry_sector)
+
+    def calculate(
+        self,
+        panel: FinancialPanel,
+        target_year: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        패널 전체 RaymondsIndex 계산
+
+        Args:
+            panel: 회사 × 연도 재무 데이터 (회사당 2개 연도 이상)
+            target_year: 계산 대상 연도 (기본: 회사별 가장 최근 연도)
+
+        Returns:
+            RaymondsIndexCalculator.to_dict() 형식 결과 리스트 (panel.company_ids 순서)
+        """
+        if panel.size == 0:
+            return []
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            metrics = self._calculate_core_metrics(panel)
+            scores = self._calculate_sub_indices(panel, metrics)
+            graded = self._calculate_grades(scores, metrics)
+
+        quality = self._calculate_data_quality(panel)
+        return self._to_dicts(panel, target_year, metrics, scores, graded, quality)
+
+    # ═══════════════════════════════════════════════════════════════
+    # 배열 접근
+    # ═══════════════════════════════════════════════════════════════
+
+    def _get(self, panel: FinancialPanel, field: str) -> np.ndarray:
+        """항목 (n, T) 배열, 결측 0"""
+        return np.nan_to_num(panel.values[field], nan=0.0)
+
+    @staticmethod
+    def _at(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+        """회사별 연도 위치의 값"""
+        return values[np.arange(values.shape[0]), index]
+
+    def _total_cash(self, panel: FinancialPanel) -> np.ndarray:
+        """총 현금성자산 (v2.2) = 현금 + 단기금융상품 + 기타금융자산(유동) + 기타자산(유동)"""
+        return (
+            self._get(panel, 'cash_and_equivalents') +
+            self._get(panel, 'short_term_investments') +
+            self._get(panel, 'other_financial_assets_current') +
+            self._get(panel, 'other_assets_current')
+        )
+
+    # ═══════════════════════════════════════════════════════════════
+    # 핵심 지표
+    # ═══════════════════════════════════════════════════════════════
+
+    def _calculate_core_metrics(self, panel: FinancialPanel) -> Dict[str, np.ndarray]:
+        """핵심 지표 (RaymondsIndexCalculator._calculate_core_metrics)"""
+        width = panel.values['revenue'].shape[1]
+        lengths = panel.lengths
+        valid = np.arange(width)[None, :] < lengths[:, None]
+        cur = lengths - 1
+        prev = lengths - 2
+        at = self._at
+
+        total_cash_all = self._total_cash(panel)
+        capex_all = np.abs(self._get(panel, 'capex'))
+        ocf_all = self._get(panel, 'operating_cash_flow')
+
+        cash = at(self._get(panel, 'cash_and_equivalents'), cur)
+        short_term = at(self._get(panel, 'short_term_investments'), cur)
+        total_cash = at(total_cash_all, cur)
+        total_assets = at(self._get(panel, 'total_assets'), cur)
+        total_equity = at(self._get(panel, 'total_equity'), cur)
+        total_liabilities = at(self._get(panel, 'total_liabilities'), cur)
+        revenue = at(self._get(panel, 'revenue'), cur)
+        tangible_all = self._get(panel, 'tangible_assets')
+        tangible = at(tangible_all, cur)
+        capex = at(capex_all, cur)
+        operating_cf = at(ocf_all, cur)
+        operating_income = at(self._get(panel, 'operating_income'), cur)
+        dividend = np.abs(at(self._get(panel, 'dividend_paid'), cur))
+        treasury = np.abs(at(self._get(panel, 'treasury_stock_acquisition'), cur))
+
+        prev_total_cash = at(total_cash_all, prev)
+        prev_tangible = at(tangible_all, prev)
+        prev_capex = at(capex_all, prev)
+        oldest_total_cash = total_cash_all[:, 0]
+
+        m: Dict[str, np.ndarray] = {}
+
+        # 1. 자산회전율 / 2. 유휴현금비율
+        m['asset_turnover'] = np.where(total_assets > 0, _round(_div(revenue, total_assets), 3), 0.0)
+        m['idle_cash_ratio'] = np.where(
+            total_assets > 0, _round(_div(total_cash, total_assets) * 100, 2), 0.0
+        )
+
+        # 3. 재투자율 (CAPEX / OCF)
+        m['reinvestment_rate'] = np.select(
+            [operating_cf > 0, capex > 0],
+            [_round(_div(capex, operating_cf) * 100, 2), 100.0],
+            0.0,
+        )
+
+        # 4. 주주환원율
+        m['shareholder_return'] = np.where(
+            operating_cf > 0, _round(_div(dividend + treasury, operating_cf) * 100, 2), 0.0
+        )
+
+        # 5. 현금 CAGR (참고용)
+        years = np.maximum(lengths - 1, 1)
+        m['cash_cagr'] = np.where(
+            (oldest_total_cash > 0) & (total_cash > 0),
+            _round((np.power(_div(total_cash, oldest_total_cash), 1 / years) - 1) * 100, 2),
+            0.0,
+        )
+
+        # 6. CAPEX 증가율 (참고용)
+        m['capex_growth'] = np.where(
+            prev_capex > 0, _round(_div(capex - prev_capex, prev_capex) * 100, 2), 0.0
+        )
+
+        # 7. 투자괴리율 (레거시) / 8. 투자괴리율 v2.0 / 9. 투자괴리율 v2.1
+        m['investment_gap'] = self._investment_gap_legacy(panel, cur)
+        m['investment_gap_v2'] = self._investment_gap_v2(capex_all, ocf_all, lengths, prev, cur)
+        m['investment_gap_v21'], m['investment_gap_v21_flag'] = self._investment_gap_v21(
+            total_cash_all, capex_all, valid, lengths, prev, cur
+        )
+
+        # 현금-유형자산 증가비율
+        cash_increase = total_cash - prev_total_cash
+        tangible_increase = tangible - prev_tangible
+        m['cash_tangible_ratio'] = np.select(
+            [(cash_increase > 0) & (tangible_increase > 0), cash_increase > 0],
+            [_round(_div(cash_increase, tangible_increase), 2), 999.0],
+            0.0,
+        )
+
+        # 단기금융상품 비율
+        m['short_term_ratio'] = np.where(
+            total_cash > 0, _round(_div(short_term, total_cash) * 100, 2), 0.0
+        )
+
+        # CAPEX 추세
+        m['capex_trend'] = _trend(capex_all, valid)
+
+        # 조달자금 투자전환율 (전체 기간 합계)
+        fundraising = np.abs(self._get(panel, 'stock_issuance')) + np.abs(self._get(panel, 'bond_issuance'))
+        total_fundraising = np.where(valid, fundraising, 0.0).sum(axis=1)
+        total_investment = np.where(valid, capex_all, 0.0).sum(axis=1)
+        m['fundraising_utilization'] = np.where(
+            total_fundraising > 0,
+            _round(_div(total_investment, total_fundraising) * 100, 2),
+            -1.0,  # 조달 없음 표시
+        )
+
+        # ROIC (법인세율 22% 가정)
+        invested_capital = total_equity + total_liabilities - cash
+        m['roic'] = np.where(
+            (invested_capital > 0) & (operating_income != 0),
+            _round(_div(operating_income * 0.78, invested_capital) * 100, 2),
+            0.0,
+        )
+
+        # CAPEX 변동계수 (모집단 표준편차 / 평균)
+        mean_capex = _div(np.where(valid, capex_all, 0.0).sum(axis=1), lengths.astype(float))
+        variance = _div(
+            np.where(valid, (capex_all - mean_capex[:, None]) ** 2, 0.0).sum(axis=1),
+            lengths.astype(float),
+        )
+        m['capex_cv'] = np.where(mean_capex > 0, _round(_div(np.sqrt(variance), mean_capex), 3), 0.0)
+
+        # 현금 활용도 = (CAPEX + 배당 + 자사주매입) / (기초 현금 + OCF)
+        total_usage = capex + dividend + treasury
+        total_available = prev_total_cash + np.maximum(operating_cf, 0)
+        m['cash_utilization'] = np.where(
+            total_available > 0, _round(_div(total_usage, total_available) * 100, 2), 0.0
+        )
+
+        # 유형자산 효율성 / 현금 수익률
+        m['tangible_efficiency'] = np.where(tangible > 0, _round(_div(revenue, tangible), 3), 0.0)
+        m['cash_yield'] = np.where(
+            total_cash > 0, _round(_div(operating_income, total_cash) * 100, 2), 0.0
+        )
+
+        # 부채/EBITDA (감가상각비 없으면 영업이익만)
+        ebitda = operating_income + at(self._get(panel, 'depreciation_expense'), cur)
+        total_debt = (
+            at(self._get(panel, 'short_term_borrowings'), cur) +
+            at(self._get(panel, 'long_term_borrowings'), cur) +
+            at(self._get(panel, 'bonds_payable'), cur) +
+            at(self._get(panel, 'convertible_bonds'), cur)
+        )
+        m['debt_to_ebitda'] = np.where(ebitda > 0, _round(_div(total_debt, ebitda), 2), 99.0)
+
+        # 성장 투자 비율 (유지 CAPEX = 유형자산 * 10% 가정)
+        maintenance_capex = np.where(tangible > 0, tangible * 0.10, 0.0)
+        growth_capex = np.maximum(0, capex - maintenance_capex)
+        m['growth_investment_ratio'] = np.where(
+            capex > 0, _round(_div(growth_capex, capex) * 100, 2), 0.0
+        )
+
+        return m
+
+    def _investment_gap_legacy(self, panel: FinancialPanel, cur: np.ndarray) -> np.ndarray:
+        """투자괴리율 레거시 (가장 오래된 연도 대비 현금성자산 증가비율 - CAPEX 증가비율)"""
+        cash_equivalent = (
+            self._get(panel, 'cash_and_equivalents') +
+            self._get(panel, 'short_term_investments') +
+            self._get(panel, 'other_financial_assets_current') +
+            self._get(panel, 'other_assets_current') +
+            self._get(panel, 'fvpl_financial_assets') +
+            self._get(panel, 'other_financial_assets_non_current')
+        )
+        capex_total = (
+            self._get(panel, 'tangible_assets') +
+            self._get(panel, 'intangible_assets') +
+            self._get(panel, 'right_of_use_assets') +
+            self._get(panel, 'investments_in_associates')
+        )
+
+        def growth(values: np.ndarray) -> np.ndarray:
+            oldest = values[:, 0]
+            current = self._at(values, cur)
+            return np.select(
+                [oldest > 0, (current > 0) & (oldest == 0)],
+                [_div(current - oldest, oldest) * 100, 100.0],
+                0.0,
+            )
+
+        gap = _round(growth(cash_equivalent) - growth(capex_total), 2)
+        return np.clip(gap, -999.0, 999.0)
+
+    def _investment_gap_v2(
+        self,
+        capex_all: np.ndarray,
+        ocf_all: np.ndarray,
+        lengths: np.ndarray,
+        prev: np.ndarray,
+        cur: np.ndarray,
+    ) -> np.ndarray:
+        """투자괴리율 v2.0 (초기 2년 평균 재투자율 - 최근 2년 평균 재투자율)"""
+        rates = np.select(
+            [capex_all == 0, ocf_all <= 0],
+            [0.0, 100.0],
+            np.minimum(_div(capex_all, ocf_all) * 100, 200.0),
+        )
+        two_years = lengths == 2
+        initial = np.where(two_years, rates[:, 0], (rates[:, 0] + rates[:, 1]) / 2)
+        recent = np.where(two_years, rates[:, 1], (self._at(rates, prev) + self._at(rates, cur)) / 2)
+        return _round(np.clip(initial - recent, -100.0, 100.0), 2)
+
+    def _investment_gap_v21(
+        self,
+        total_cash_all: np.ndarray,
+        capex_all: np.ndarray,
+        valid: np.ndarray,
+        lengths: np.ndarray,
+        prev: np.ndarray,
+        cur: np.ndarray,
+    ):
+        """투자괴리율 v2.1 ⭐핵심 (현금 CAGR - CAPEX 성장률) + 데이터 플래그"""
+        cash_start = total_cash_all[:, 0]
+        cash_end = self._at(total_cash_all, cur)
+        years = lengths - 1
+
+        cash_cagr = np.select(
+            [
+                (cash_start > 0) & (cash_end > 0) & (years > 0),
+                (cash_end > 0) & (cash_start == 0),
+                (cash_start > 0) & (cash_end == 0),
+            ],
+            [
+                (np.power(_div(cash_end, cash_start), 1 / np.maximum(years, 1)) - 1) * 100,
+                np.minimum(50.0, (cash_end / 1e8) * 10),  # 1000억당 10%p, 최대 50%
+                -50.0,
+            ],
+            0.0,
+        )
+
+        capex_early = (capex_all[:, 0] + capex_all[:, 1]) / 2
+        capex_late = (self._at(capex_all, prev) + self._at(capex_all, cur)) / 2
+        capex_growth = np.select(
+            [capex_early > 0, capex_late > 0],
+            [_div(capex_late - capex_early, capex_early) * 100, np.minimum(50.0, (capex_late / 1e8) * 10)],
+            0.0,
+        )
+
+        gap = _round(np.clip(cash_cagr - capex_growth, -50.0, 50.0), 2)
+
+        no_capex = ~np.any(valid & (capex_all != 0), axis=1)
+        no_cash = (cash_start == 0) & (cash_end == 0)
+        flag = np.select([no_capex, no_cash], ['no_capex', 'no_cash'], 'ok')
+        gap = np.where(no_capex | no_cash, 0.0, gap)
+        return gap, flag
+
+    # ═══════════════════════════════════════════════════════════════
+    # Sub-Index
+    # ═══════════════════════════════════════════════════════════════
+
+    def _calculate_sub_indices(
+        self,
+        panel: FinancialPanel,
+        m: Dict[str, np.ndarray],
+    ) -> Dict[str, np.ndarray]:
+        """Sub-Index 점수 (RaymondsIndexCalculator._calculate_sub_indices)"""
+        width = panel.values['revenue'].shape[1]
+        lengths = panel.lengths
+        valid = np.arange(width)[None, :] < lengths[:, None]
+        cur = lengths - 1
+        prev = lengths - 2
+        at = self._at
+
+        revenue_all = self._get(panel, 'revenue')
+        capex_all = np.abs(self._get(panel, 'capex'))
+        ocf_all = self._get(panel, 'operating_cash_flow')
+
+        revenue = at(revenue_all, cur)
+        capex = at(capex_all, cur)
+        operating_cf = at(ocf_all, cur)
+        net_income = at(self._get(panel, 'net_income'), cur)
+
+        # ── CEI: 자산회전율(25%) + 유형자산효율성(20%) + 현금수익률(20%) + ROIC(25%) + 추세(10%)
+        turnover_score = np.minimum(m['asset_turnover'] / 0.5, 1) * 100
+
+        te = m['tangible_efficiency']
+        te_score = np.select(
+            [te >= 3.0, te >= 2.0, te >= 1.0],
+            [90.0, 70 + (te - 2.0) * 20, 50 + (te - 1.0) * 20],
+            np.maximum(te * 50, 0),
+        )
+
+        cy = m['cash_yield']
+        cy_score = np.select(
+            [cy < 0, cy < 10, cy < 20],
+            [np.maximum(0, 30 + cy), 30 + cy * 2, 50 + (cy - 10) * 3],
+            np.minimum(100, 80 + (cy - 20) * 1),
+        )
+
+        roic = m['roic']
+        roic_score = np.select(
+            [roic >= 15, roic >= 8, roic >= 0],
+            [90.0, 50 + (roic - 8) * (40 / 7), 20 + roic * (30 / 8)],
+            np.maximum(20 + roic, 0),
+        )
+
+        assets_all = self._get(panel, 'total_assets')
+        turnover_all = revenue_all / np.where(assets_all != 0, assets_all, 1)
+        efficiency_trend = _trend(turnover_all, valid)
+        trend_score = np.select(
+            [efficiency_trend == _TREND_INCREASING, efficiency_trend == _TREND_STABLE], [80.0, 60.0], 30.0
+        )
+
+        cei = _round(
+            turnover_score * 0.25 + te_score * 0.20 + cy_score * 0.20 + roic_score * 0.25 + trend_score * 0.10,
+            2,
+        )
+
+        # ── RII: CAPEX강도(30%) + 투자괴리율(30%) + 재투자율(25%) + 투자지속성(15%)
+        capex_intensity = np.where(revenue > 0, _div(capex, revenue) * 100, 0.0)
+        intensity_score = np.select(
+            [(capex_intensity >= 5) & (capex_intensity <= 15), capex_intensity < 5],
+            [100.0, capex_intensity * 20],
+            np.maximum(100 - (capex_intensity - 15) * 5, 0),
+        )
+
+        gap_score = _linear_score(m['investment_gap_v21'], self._calculator.INVESTMENT_GAP_BREAKPOINTS)
+
+        reinvest = m['reinvestment_rate']
+        reinvest_score = np.select(
+            [reinvest >= 60, reinvest >= 40, reinvest >= 20, reinvest >= 10, reinvest > 0],
+            [90.0, 80.0, 60.0, 40.0, 20.0],
+            50.0,  # 영업손실 시 중립
+        )
+
+        cv = m['capex_cv']
+        cv_score = np.select([cv < 0.15, cv < 0.25, cv < 0.40, cv < 0.60], [90.0, 75.0, 55.0, 35.0], 15.0)
+
+        rii = _round(intensity_score * 0.30 + gap_score * 0.30 + reinvest_score * 0.25 + cv_score * 0.15, 2)
+
+        # ── CGI: 현금활용도(20%) + 자금조달효율성(25%) + 주주환원균형(20%) + 현금적정성(15%) + 부채건전성(20%)
+        cu = m['cash_utilization']
+        cash_util_score = np.select(
+            [
+                (cu >= 60) & (cu <= 90),
+                ((cu >= 40) & (cu < 60)) | ((cu > 90) & (cu <= 100)),
+                (cu >= 20) & (cu < 40),
+                cu < 20,
+            ],
+            [95.0, 80.0, 60.0, 30.0],
+            50.0,  # 과도한 지출
+        )
+
+        fu = m['fundraising_utilization']
+        util_score = np.select(
+            [fu < 0, fu >= 80, fu >= 60, fu >= 50, fu >= 30], [80.0, 95.0, 80.0, 65.0, 40.0], 15.0
+        )
+
+        sh = m['shareholder_return']
+        sh_score = np.select(
+            [
+                (sh >= 20) & (sh <= 50),
+                ((sh >= 10) & (sh < 20)) | ((sh > 50) & (sh <= 70)),
+                ((sh >= 5) & (sh < 10)) | ((sh > 70) & (sh <= 80)),
+            ],
+            [90.0, 70.0, 50.0],
+            30.0,
+        )
+
+        idle = m['idle_cash_ratio']
+        idle_score = np.select(
+            [(idle >= 10) & (idle <= 20), idle < 10, idle <= 30],
+            [90.0, idle * 9, 90 - (idle - 20) * 4],
+            np.maximum(50 - (idle - 30) * 2, 15),
+        )
+
+        debt = m['debt_to_ebitda']
+        dh_score = np.select(
+            [debt < 1, debt < 2, debt < 3, debt < 5],
+            [95.0, 80 + (2 - debt) * 15, 60 + (3 - debt) * 20, 40 + (5 - debt) * 10],
+            np.maximum(10, 40 - (debt - 5) * 5),
+        )
+
+        cgi = _round(
+            cash_util_score * 0.20 + util_score * 0.25 + sh_score * 0.20 + idle_score * 0.15 + dh_score * 0.20,
+            2,
+        )
+
+        # ── MAI: 매출-투자동조성(30%) + 이익품질(25%) + 투자지속성(20%) + 성장투자비율(15%) + FCF추세(10%)
+        prev_revenue = at(revenue_all, prev)
+        revenue_growth = np.where(prev_revenue > 0, _div(revenue - prev_revenue, prev_revenue) * 100, 0.0)
+        capex_change = m['capex_growth']
+        sync_score = np.select(
+            [
+                (revenue_growth > 10) & (capex_change > 5),
+                (revenue_growth > 10) & (capex_change > 0),
+                (revenue_growth > 10) & (capex_change >= -10),
+                revenue_growth > 10,
+                (revenue_growth > 0) & (capex_change >= -5),
+                (revenue_growth > 0) & (capex_change >= -15),
+                revenue_growth > 0,
+                capex_change < -5,
+                capex_change < 5,
+            ],
+            [90.0, 70.0, 50.0, 25.0, 75.0, 60.0, 45.0, 60.0, 70.0],
+            80.0,  # 역성장인데 투자 확대 → 턴어라운드 시도
+        )
+
+        quality_ratio = _div(operating_cf, net_income)
+        quality_score = np.select(
+            [
+                net_income == 0,
+                (quality_ratio >= 0.5) & (quality_ratio <= 1.5),
+                (quality_ratio >= 0.3) & (quality_ratio <= 2.0),
+                quality_ratio < 0,
+            ],
+            [50.0, 85 + (0.5 - np.abs(quality_ratio - 1.0)) * 30, 55.0, 30.0],
+            35.0,
+        )
+
+        capex_trend = m['capex_trend']
+        capex_trend_score = np.select(
+            [capex_trend == _TREND_INCREASING, capex_trend == _TREND_STABLE], [85.0, 70.0], 35.0
+        )
+
+        gr = m['growth_investment_ratio']
+        gr_score = np.select([gr > 60, gr > 40, gr > 20], [90.0, 70 + gr * 0.5, 50 + gr], 40.0)
+
+        fcf_trend = _trend(ocf_all - capex_all, valid)
+        fcf_score = np.select(
+            [fcf_trend == _TREND_INCREASING, fcf_trend == _TREND_STABLE], [90.0, 70.0], 40.0
+        )
+
+        mai = _round(
+            sync_score * 0.30 + quality_score * 0.25 + capex_trend_score * 0.20 + gr_score * 0.15 + fcf_score * 0.10,
+            2,
+        )
+
+        return {'cei': cei, 'rii': rii, 'cgi': cgi, 'mai': mai}
+
+    # ═══════════════════════════════════════════════════════════════
+    # 종합 점수 / 등급 / 특별 규칙
+    # ═══════════════════════════════════════════════════════════════
+
+    def _calculate_grades(
+        self,
+        scores: Dict[str, np.ndarray],
+        m: Dict[str, np.ndarray],
+    ) -> Dict[str, np.ndarray]:
+        """종합 점수, 등급, 특별 규칙 (RaymondsIndexCalculator._calculate_total_score 이후 단계)"""
+        calc = self._calculator
+        weights = calc.adjusted_weights
+        total = (
+            scores['cei'] * weights['CEI'] +
+            scores['rii'] * weights['RII'] +
+            scores['cgi'] * weights['CGI'] +
+            scores['mai'] * weights['MAI']
+        )
+        total = np.minimum(np.maximum(total, 0), 100)
+
+        # 등급: 기준 점수 이상인 첫 번째 등급 (점수는 0 이상이므로 항상 존재)
+        thresholds = np.array([threshold for threshold, _ in calc.GRADE_THRESHOLDS])
+        grade_names = np.array([grade for _, grade in calc.GRADE_THRESHOLDS])
+        grade_order = {grade: i for i, grade in enumerate(calc.GRADE_ORDER)}
+        grade_rank = np.array([grade_order[g] for g in grade_names])[
+            np.argmax(total[:, None] >= thresholds[None, :], axis=1)
+        ]
+
+        # 특별 규칙 위반 개수
+        violation_count = (
+            (m['cash_tangible_ratio'] > 30).astype(np.int64) +
+            ((m['fundraising_utilization'] >= 0) & (m['fundraising_utilization'] < 30)) +
+            ((m['short_term_ratio'] > 65) & (m['capex_trend'] == _TREND_DECREASING))
+        )
+
+        # 위반 시 최대 등급 및 점수 상한
+        max_rank = np.select(
+            [violation_count >= 2, violation_count == 1],
+            [grade_order['C+'], grade_order['B-']],
+            len(calc.GRADE_ORDER),
+        )
+        capped = (violation_count > 0) & (grade_rank < max_rank)
+        rank_to_max_score = np.array([
+            calc.GRADE_MAX_SCORES.get(grade, np.inf) for grade in calc.GRADE_ORDER
+        ] + [np.inf])
+        max_score = rank_to_max_score[max_rank]
+        adjusted = np.where(capped & (total > max_score), max_score, total)
+        grade_rank = np.where(capped, max_rank, grade_rank)
+
+        return {
+            'total_score': _round(adjusted, 2),
+            'grade_rank': grade_rank,
+            'violation_count': violation_count,
+        }
+
+    def _calculate_data_quality(self, panel: FinancialPanel) -> np.ndarray:
+        """데이터 품질 점수 (최근 연도 필수 항목 충족 비율)"""
+        cur = panel.lengths - 1
+        filled = sum(~np.isnan(self._at(panel.values[field], cur)) for field in QUALITY_FIELDS)
+        return _round(filled / len(QUALITY_FIELDS), 2)
+
+    # ═══════════════════════════════════════════════════════════════
+    # 결과 변환
+    # ═══════════════════════════════════════════════════════════════
+
+    def _to_dicts(
+        self,
+        panel: FinancialPanel,
+        target_year: Optional[int],
+        m: Dict[str, np.ndarray],
+        scores: Dict[str, np.ndarray],
+        graded: Dict[str, np.ndarray],
+        quality: np.ndarray,
+    ) -> List[Dict[str, Any]]:
+        """배열 → to_dict() 형식 dict (Flags/해석 문구는 회사별 생성)"""
+        calc = self._calculator
+        metric_fields = [f for f in CoreMetrics.__dataclass_fields__ if f in m]
+        metric_columns = {f: m[f].tolist() for f in metric_fields}
+        metric_columns['capex_trend'] = [_TREND_NAMES[code] for code in m['capex_trend'].tolist()]
+        score_columns = {k: v.tolist() for k, v in scores.items()}
+        total_scores = graded['total_score'].tolist()
+        grades = [calc.GRADE_ORDER[rank] for rank in graded['grade_rank'].tolist()]
+        violation_counts = graded['violation_count'].tolist()
+        qualities = quality.tolist()
+        last_years = self._at(panel.fiscal_years, panel.lengths - 1).tolist()
+        calculation_date = date.today().isoformat()
+        industry_sector = calc.industry_sector or ''
+
+        results = []
+        for i, company_id in enumerate(panel.company_ids):
+            core_metrics = CoreMetrics(
+                **{f: metric_columns[f][i] for f in metric_fields},
+                industry_sector=industry_sector,
+            )
+            red_flags, yellow_flags = calc._generate_flags(core_metrics, [])
+            verdict, key_risk, recommendation, watch_trigger = calc._generate_interpretation(
+                grades[i], core_metrics, red_flags, yellow_flags, violation_counts[i]
+            )
+
+            results.append({
+                'company_id': company_id,
+                'fiscal_year': target_year if target_year is not None else last_years[i],
+                'calculation_date': calculation_date,
+                'total_score': total_scores[i],
+                'grade': grades[i],
+                'cei_score': score_columns['cei'][i],
+                'rii_score': score_columns['rii'][i],
+                'cgi_score': score_columns['cgi'][i],
+                'mai_score': score_columns['mai'][i],
+                **{f: getattr(core_metrics, f) for f in (
+                    'investment_gap', 'cash_cagr', 'capex_growth', 'idle_cash_ratio',
+                    'asset_turnover', 'reinvestment_rate', 'shareholder_return',
+                    'cash_tangible_ratio', 'fundraising_utilization', 'short_term_ratio',
+                    'capex_trend', 'roic', 'capex_cv',
+                )},
+                'violation_count': violation_counts[i],
+                **{f: getattr(core_metrics, f) for f in (
+                    'investment_gap_v2', 'investment_gap_v21', 'investment_gap_v21_flag',
+                    'cash_utilization', 'industry_sector', 'weight_adjustment',
+                    'tangible_efficiency', 'cash_yield', 'debt_to_ebitda', 'growth_investment_ratio',
+                )},
+                'red_flags': red_flags,
+                'yellow_flags': yellow_flags,
+                'verdict': verdict,
+                'key_risk': key_risk,
+                'recommendation': recommendation,
+                'watch_trigger': watch_trigger,
+                'data_quality_score': qualities[i],
+            })
+
+        return results
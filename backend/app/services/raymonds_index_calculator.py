@@ -161,6 +161,28 @@ class RaymondsIndexCalculator:
     # 등급 순서 (강제 하향용)
     GRADE_ORDER = ['A++', 'A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C']
 
+    # 특별규칙 위반 시 등급별 점수 상한선 (해당 등급의 최대 점수)
+    GRADE_MAX_SCORES = {
+        'C+': 44.99,  # C+ 최대 점수
+        'B-': 54.99,  # B- 최대 점수
+        'B': 63.99,   # B 최대 점수
+    }
+
+    # 투자괴리율 v2.1 점수 구간 (선형 보간)
+    # 양수(+): 현금 축적 > 투자 (위험) → 낮은 점수
+    # 음수(-): 투자 > 현금 축적 (긍정) → 높은 점수
+    INVESTMENT_GAP_BREAKPOINTS = [
+        (-50, 100),  # 매우 적극적 투자 → 최고점
+        (-20, 95),   # 적극 투자 (우수)
+        (-10, 85),   # 투자 > 현금 축적 (양호)
+        (0, 75),     # 균형
+        (10, 60),    # 소폭 현금 축적
+        (20, 45),    # 현금 축적 경향
+        (30, 30),    # 현금 축적
+        (40, 15),    # 심한 현금 축적
+        (50, 0),     # 극심한 현금 축적 → 최저점
+    ]
+
     # v2.0 업종별 가중치 조정
     INDUSTRY_WEIGHT_ADJUSTMENTS = {
         'rd_intensive': {
@@ -917,18 +939,7 @@ class RaymondsIndexCalculator:
         # 음수(-): 투자 > 현금 축적 (긍정) → 높은 점수
         # v2.2: 연속 함수(선형 보간)로 변경 - 구간 경계값 점프 제거
         gap_v21 = core_metrics.investment_gap_v21
-        gap_breakpoints = [
-            (-50, 100),  # 매우 적극적 투자 → 최고점
-            (-20, 95),   # 적극 투자 (우수)
-            (-10, 85),   # 투자 > 현금 축적 (양호)
-            (0, 75),     # 균형
-            (10, 60),    # 소폭 현금 축적
-            (20, 45),    # 현금 축적 경향
-            (30, 30),    # 현금 축적
-            (40, 15),    # 심한 현금 축적
-            (50, 0),     # 극심한 현금 축적 → 최저점
-        ]
-        gap_score = self.linear_score(gap_v21, gap_breakpoints)
+        gap_score = self.linear_score(gap_v21, self.INVESTMENT_GAP_BREAKPOINTS)
         rii_components.append(gap_score * 0.30)
 
         # 3. 재투자율 점수 (25%)
@@ -1182,13 +1193,6 @@ class RaymondsIndexCalculator:
             violation_count += 1
 
         # 등급 및 점수 강제 조정
-        # 등급별 점수 상한선 (해당 등급의 최대 점수)
-        GRADE_MAX_SCORES = {
-            'C+': 44.99,  # C+ 최대 점수
-            'B-': 54.99,  # B- 최대 점수
-            'B': 63.99,   # B 최대 점수
-        }
-
         if violation_count >= 2:
             max_grade = 'C+'
         elif violation_count == 1:
@@ -1204,7 +1208,7 @@ class RaymondsIndexCalculator:
             if current_idx < max_idx:  # 현재 등급이 더 좋으면 하향
                 grade = max_grade
                 # 점수도 해당 등급의 상한선으로 조정
-                max_score = GRADE_MAX_SCORES.get(max_grade, total_score)
+                max_score = self.GRADE_MAX_SCORES.get(max_grade, total_score)
                 if total_score > max_score:
                     adjusted_score = max_score
 
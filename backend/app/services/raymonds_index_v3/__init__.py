@@ -35,6 +35,12 @@ from .normalizers import (
     clamp,
     winsorize,
     geometric_mean_weighted,
+    min_max_normalize_array,
+    v_score_normalize_array,
+    inverse_normalize_array,
+    clamp_array,
+    winsorize_array,
+    geometric_mean_weighted_array,
 )
 from .validators import DataValidator, ValidationResult
 
@@ -56,6 +62,12 @@ __all__ = [
     "clamp",
     "winsorize",
     "geometric_mean_weighted",
+    "min_max_normalize_array",
+    "v_score_normalize_array",
+    "inverse_normalize_array",
+    "clamp_array",
+    "winsorize_array",
+    "geometric_mean_weighted_array",
     # Validators
     "DataValidator",
     "ValidationResult",
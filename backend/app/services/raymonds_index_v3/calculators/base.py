@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
 
+import numpy as np
+
 from ..constants import GOALPOSTS, METRIC_WEIGHTS
 from ..normalizers import (
     min_max_normalize,
@@ -14,6 +16,10 @@ from ..normalizers import (
     clamp,
     geometric_mean_weighted,
     safe_divide,
+    min_max_normalize_array,
+    v_score_normalize_array,
+    inverse_normalize_array,
+    geometric_mean_weighted_array,
 )
 
 
@@ -131,11 +137,71 @@ class SubIndexCalculator(ABC):
         Returns:
             CalculationResult
         """
-        warnings = []
-
         # 1. 원본 지표 계산
         raw = self._calculate_raw_metrics(data)
 
+        # 2. 정규화 → 3. 집계
+        return self._result_from_raw(raw)
+
+    def _normalize_array(self, metric_name: str, values: np.ndarray) -> np.ndarray:
+        """_normalize_metrics의 지표 1개 배열 버전"""
+        if metric_name not in self.goalposts:
+            return np.clip(np.where(np.isnan(values), 0.0, values), 0, 100)
+
+        gp = self.goalposts[metric_name]
+        method = gp.get('method', 'min_max')
+
+        if method == 'min_max':
+            return min_max_normalize_array(values, gp['min'], gp['max'])
+        if method == 'v_score':
+            return v_score_normalize_array(
+                values,
+                optimal=gp.get('optimal', (gp['min'] + gp['max']) / 2),
+                min_val=gp['min'],
+                max_val=gp['max']
+            )
+        if method == 'inverse':
+            return inverse_normalize_array(values, gp['min'], gp['max'])
+        return np.clip(np.where(np.isnan(values), 0.0, values), 0, 100)
+
+    def calculate_batch(self, raws: List[Dict[str, float]]) -> List[CalculationResult]:
+        """
+        여러 회사 Sub-Index 일괄 계산 (정규화/집계를 지표별 배열로 처리)
+
+        Args:
+            raws: 회사별 원본 지표 (_calculate_raw_metrics 결과)
+
+        Returns:
+            회사별 CalculationResult (calculate와 같은 값)
+        """
+        if not raws:
+            return []
+
+        metric_names = list(raws[0])
+        if any(list(raw) != metric_names for raw in raws):
+            # 지표 구성이 회사마다 다르면 회사별 계산
+            return [self._result_from_raw(raw) for raw in raws]
+
+        normalized = {
+            name: self._normalize_array(name, np.array([raw[name] for raw in raws], dtype=float))
+            for name in metric_names
+        }
+        scores = geometric_mean_weighted_array(normalized, self.weights)
+
+        columns = {name: values.tolist() for name, values in normalized.items()}
+        return [
+            CalculationResult(
+                score=round(score, 2),
+                raw_metrics=raw,
+                normalized_metrics={name: columns[name][i] for name in metric_names},
+            )
+            for i, (raw, score) in enumerate(zip(raws, scores.tolist()))
+        ]
+
+    def _result_from_raw(self, raw: Dict[str, float]) -> CalculationResult:
+        """원본 지표 → CalculationResult (정규화 → 집계)"""
+        warnings = []
+
         # 2. 정규화
         normalized = self._normalize_metrics(raw)
 
@@ -12,7 +12,7 @@ HDI 정규화 방식 적용 (OECD Handbook 2008, UNDP HDI 2010)
 import logging
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 
 from .constants import (
     SUBINDEX_WEIGHTS,
@@ -21,7 +21,12 @@ from .constants import (
     SPECIAL_RULES,
     INDUSTRY_WEIGHT_ADJUSTMENTS,
 )
-from .normalizers import geometric_mean_weighted, arithmetic_mean_weighted
+from .normalizers import (
+    geometric_mean_weighted,
+    arithmetic_mean_weighted,
+    geometric_mean_weighted_array,
+    arithmetic_mean_weighted_array,
+)
 from .validators import DataValidator, ValidationResult
 from .calculators import (
     CEICalculator,
@@ -119,6 +124,7 @@ class RaymondsIndexCalculatorV3:
     사용법:
         calculator = RaymondsIndexCalculatorV3()
         result = calculator.calculate(company_id, financial_data)
+        results = calculator.calculate_batch({company_id: financial_data, ...})
     """
 
     def __init__(
@@ -181,23 +187,9 @@ class RaymondsIndexCalculatorV3:
         validation = self.validator.validate_for_calculation(financial_data)
 
         if not validation.can_calculate:
-            return RaymondsIndexResultV3(
-                company_id=company_id,
-                fiscal_year=target_year or 0,
-                status='DATA_INSUFFICIENT',
-                grade='N/A',
-                data_quality_score=validation.quality_score,
-                validation_warnings=validation.errors + validation.warnings,
-            )
-
-        # 연도순 정렬
-        sorted_data = sorted(financial_data, key=lambda x: x.get('fiscal_year', 0))
-
-        if target_year is None:
-            target_year = sorted_data[-1].get('fiscal_year', 0)
+            return self._insufficient_result(company_id, target_year, validation)
 
-        # 리스트 형태로 변환 (Calculator에서 사용)
-        data_dict = self._convert_to_dict_format(sorted_data)
+        target_year, data_dict = self._prepare(financial_data, target_year)
 
         # ═══════════════════════════════════════════════════════════════
         # Step 2: Sub-Index 계산
@@ -219,10 +211,126 @@ class RaymondsIndexCalculatorV3:
         # ═══════════════════════════════════════════════════════════════
         if self.use_geometric_mean:
             total_score = geometric_mean_weighted(sub_scores, self.weights)
-            aggregation_method = 'geometric_mean'
         else:
             total_score = arithmetic_mean_weighted(sub_scores, self.weights)
-            aggregation_method = 'arithmetic_mean'
+
+        return self._build_result(
+            company_id, target_year, validation, data_dict,
+            cei_result, rii_result, cgi_result, mai_result, total_score,
+        )
+
+    def calculate_batch(
+        self,
+        companies: Mapping[str, List[Dict]],
+        target_year: Optional[int] = None,
+    ) -> List[RaymondsIndexResultV3]:
+        """
+        RaymondsIndex v3.0 일괄 계산
+
+        원본 지표는 회사별로 계산하고, 정규화/Sub-Index 집계/종합 점수는
+        지표별 NumPy 배열로 한 번에 계산한다. 결과는 calculate와 같다.
+
+        Args:
+            companies: {company_id: 연도별 재무 데이터 리스트}
+            target_year: 계산 대상 연도 (기본: 회사별 가장 최근)
+
+        Returns:
+            입력 순서대로 RaymondsIndexResultV3 리스트
+        """
+        results: List[Optional[RaymondsIndexResultV3]] = []
+        prepared = []  # (결과 위치, company_id, 대상 연도, 검증 결과, 필드별 데이터)
+
+        # Step 1: 데이터 검증 + 원본 지표 준비
+        for company_id, financial_data in companies.items():
+            validation = self.validator.validate_for_calculation(financial_data)
+            if not validation.can_calculate:
+                results.append(self._insufficient_result(company_id, target_year, validation))
+                continue
+
+            year, data_dict = self._prepare(financial_data, target_year)
+            prepared.append((len(results), company_id, year, validation, data_dict))
+            results.append(None)
+
+        if not prepared:
+            return results
+
+        # Step 2: Sub-Index 일괄 계산
+        sub_results = {
+            name: calc.calculate_batch([calc._calculate_raw_metrics(p[4]) for p in prepared])
+            for name, calc in (
+                ('CEI', self.cei_calc),
+                ('RII', self.rii_calc),
+                ('CGI', self.cgi_calc),
+                ('MAI', self.mai_calc),
+            )
+        }
+
+        # Step 3: 종합 점수 일괄 계산
+        sub_scores = {
+            name: [r.score for r in sub_result]
+            for name, sub_result in sub_results.items()
+        }
+        if self.use_geometric_mean:
+            total_scores = geometric_mean_weighted_array(sub_scores, self.weights).tolist()
+        else:
+            total_scores = arithmetic_mean_weighted_array(sub_scores, self.weights).tolist()
+
+        # Step 4~8: 등급/특별 규칙/신호/해석 (회사별)
+        for i, (position, company_id, year, validation, data_dict) in enumerate(prepared):
+            results[position] = self._build_result(
+                company_id, year, validation, data_dict,
+                sub_results['CEI'][i], sub_results['RII'][i],
+                sub_results['CGI'][i], sub_results['MAI'][i],
+                total_scores[i],
+            )
+
+        return results
+
+    def _insufficient_result(
+        self,
+        company_id: str,
+        target_year: Optional[int],
+        validation: ValidationResult,
+    ) -> RaymondsIndexResultV3:
+        """데이터 부족 결과"""
+        return RaymondsIndexResultV3(
+            company_id=company_id,
+            fiscal_year=target_year or 0,
+            status='DATA_INSUFFICIENT',
+            grade='N/A',
+            data_quality_score=validation.quality_score,
+            validation_warnings=validation.errors + validation.warnings,
+        )
+
+    def _prepare(
+        self,
+        financial_data: List[Dict],
+        target_year: Optional[int],
+    ) -> Tuple[int, Dict[str, List]]:
+        """연도순 정렬 + 대상 연도 결정 + 필드별 리스트 변환"""
+        # 연도순 정렬
+        sorted_data = sorted(financial_data, key=lambda x: x.get('fiscal_year', 0))
+
+        if target_year is None:
+            target_year = sorted_data[-1].get('fiscal_year', 0)
+
+        # 리스트 형태로 변환 (Calculator에서 사용)
+        return target_year, self._convert_to_dict_format(sorted_data)
+
+    def _build_result(
+        self,
+        company_id: str,
+        target_year: int,
+        validation: ValidationResult,
+        data_dict: Dict[str, List],
+        cei_result: CalculationResult,
+        rii_result: CalculationResult,
+        cgi_result: CalculationResult,
+        mai_result: CalculationResult,
+        total_score: float,
+    ) -> RaymondsIndexResultV3:
+        """Sub-Index/종합 점수 → 등급, 특별 규칙, 위험 신호, 해석을 포함한 결과"""
+        aggregation_method = 'geometric_mean' if self.use_geometric_mean else 'arithmetic_mean'
 
         # ═══════════════════════════════════════════════════════════════
         # Step 4: 등급 결정
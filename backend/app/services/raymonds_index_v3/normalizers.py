@@ -12,11 +12,19 @@ RaymondsIndex v3.0 정규화 함수
 - clamp: 범위 제한 (-999% 버그 방지)
 - winsorize: 극단값 처리
 - geometric_mean_weighted: 가중 기하평균 (HDI 2010 방식)
+
+배열 버전 (*_array): 여러 회사 값을 NumPy 배열로 한 번에 처리 (None → NaN).
+결과는 스칼라 함수를 원소마다 호출한 것과 같다.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
 from .constants import CLAMP_LIMITS
 
+ArrayLike = Union[np.ndarray, Sequence[Optional[float]]]
+
 
 def min_max_normalize(value: float, min_val: float, max_val: float) -> float:
     """
@@ -375,3 +383,167 @@ def safe_growth_rate(
             return CLAMP_LIMITS.get('capex_growth', {}).get('max', 500.0)
 
     return ((late_avg - early_avg) / early_avg) * 100
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# 배열 버전 (회사 여러 개 일괄 처리)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _as_array(values: ArrayLike) -> np.ndarray:
+    """float 배열 변환 (None → NaN)"""
+    return np.array(values, dtype=float)
+
+
+def _round_array(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    파이썬 round()와 같은 반올림
+
+    np.round는 10^n 곱셈 오차로 .5 경계 값에서 round()와 다를 수 있어,
+    경계에 가까운 값만 round()로 다시 계산한다.
+    """
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(v, ndigits) for v in values[near_tie].tolist()]
+    return rounded
+
+
+def min_max_normalize_array(values: ArrayLike, min_val: float, max_val: float) -> np.ndarray:
+    """min_max_normalize 배열 버전 (NaN → 0점)"""
+    values = _as_array(values)
+    if max_val <= min_val:
+        return np.full(values.shape, 50.0)
+
+    result = ((values - min_val) / (max_val - min_val)) * 100
+    result = np.where(values <= min_val, 0.0, result)
+    result = np.where(values >= max_val, 100.0, result)
+    return np.where(np.isnan(values), 0.0, result)
+
+
+def v_score_normalize_array(
+    values: ArrayLike,
+    optimal: float,
+    min_val: float,
+    max_val: float
+) -> np.ndarray:
+    """v_score_normalize 배열 버전 (NaN → 50점)"""
+    values = _as_array(values)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if optimal == min_val:
+            lower = np.full(values.shape, 100.0)
+        else:
+            lower = ((values - min_val) / (optimal - min_val)) * 100
+        if max_val == optimal:
+            upper = np.full(values.shape, 100.0)
+        else:
+            upper = 100 - ((values - optimal) / (max_val - optimal)) * 100
+
+    result = np.where(values <= optimal, lower, upper)
+    result = np.where((values <= min_val) | (values >= max_val), 0.0, result)
+    return np.where(np.isnan(values), 50.0, result)
+
+
+def inverse_normalize_array(values: ArrayLike, min_val: float, max_val: float) -> np.ndarray:
+    """inverse_normalize 배열 버전 (NaN → 50점)"""
+    values = _as_array(values)
+    if max_val <= min_val:
+        return np.full(values.shape, 50.0)
+
+    result = 100 - ((values - min_val) / (max_val - min_val)) * 100
+    result = np.where(values <= min_val, 100.0, result)
+    result = np.where(values >= max_val, 0.0, result)
+    return np.where(np.isnan(values), 50.0, result)
+
+
+def clamp_array(values: ArrayLike, metric: str) -> np.ndarray:
+    """clamp 배열 버전 (NaN → 0)"""
+    values = _as_array(values)
+    values = np.where(np.isnan(values), 0.0, values)
+    if metric not in CLAMP_LIMITS:
+        return values
+
+    limits = CLAMP_LIMITS[metric]
+    return np.clip(values, limits['min'], limits['max'])
+
+
+def winsorize_array(values: ArrayLike, percentile: float = 2.5) -> np.ndarray:
+    """winsorize 배열 버전 (NaN은 그대로 유지, 유효 값 10개 미만이면 스킵)"""
+    values = _as_array(values)
+    valid = ~np.isnan(values)
+
+    n = int(valid.sum())
+    if n < 10:
+        return values
+
+    sorted_vals = np.sort(values[valid])
+    lower_idx = int(n * percentile / 100)
+    upper_idx = int(n * (100 - percentile) / 100) - 1
+
+    lower = sorted_vals[max(0, lower_idx)]
+    upper = sorted_vals[min(n - 1, upper_idx)]
+    return np.where(valid, np.clip(values, lower, upper), np.nan)
+
+
+def geometric_mean_weighted_array(
+    scores: Mapping[str, ArrayLike],
+    weights: Dict[str, float]
+) -> np.ndarray:
+    """
+    geometric_mean_weighted 배열 버전
+
+    scores는 지표별 회사 배열 ({'CEI': [75, 60, ...], ...}), NaN은 None과 같이 1점 처리.
+    거듭제곱은 SIMD 구현이라 스칼라와 마지막 비트가 다를 수 있어,
+    반올림 경계에 가까운 회사만 스칼라 함수로 다시 계산한다.
+    """
+    arrays = {key: _as_array(values) for key, values in scores.items()}
+    size = len(next(iter(arrays.values()))) if arrays else 0
+    result = np.ones(size)
+    total_weight = 0.0
+
+    for key, weight in weights.items():
+        if key not in arrays:
+            continue
+
+        # 0점 방지 (최소 1점) - log(0) 방지
+        values = arrays[key]
+        safe_score = np.fmax(values, 1.0)  # NaN → 1.0
+        result = result * safe_score ** weight
+        total_weight += weight
+
+    if total_weight > 0 and abs(total_weight - 1.0) > 0.01:
+        result = result ** (1.0 / total_weight)
+
+    rounded = np.round(result, 2)
+    scaled = result * 100
+    near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie).tolist():
+        row = {
+            key: (None if np.isnan(values[i]) else float(values[i]))
+            for key, values in arrays.items()
+        }
+        rounded[i] = geometric_mean_weighted(row, weights)
+    return rounded
+
+
+def arithmetic_mean_weighted_array(
+    scores: Mapping[str, ArrayLike],
+    weights: Dict[str, float]
+) -> np.ndarray:
+    """arithmetic_mean_weighted 배열 버전 (NaN → 0점)"""
+    arrays = {key: _as_array(values) for key, values in scores.items()}
+    size = len(next(iter(arrays.values()))) if arrays else 0
+    total = np.zeros(size)
+    total_weight = 0.0
+
+    for key, weight in weights.items():
+        if key not in arrays:
+            continue
+        total = total + np.nan_to_num(arrays[key], nan=0.0) * weight
+        total_weight += weight
+
+    if total_weight == 0:
+        return np.zeros(size)
+
+    return _round_array(total / total_weight * total_weight, 2)
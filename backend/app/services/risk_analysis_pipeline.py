@@ -0,0 +1,318 @@
+"""
+일일 위험도 분석 파이프라인
+
+CB 발행 회사 전체를 RiskDetectionEngine.analyze_companies_risk 배치 단위로 분석해
+risk_analysis_results에 저장한다 (app/scheduler.py daily_risk_analysis).
+
+구조:
+    - 대상 회사를 risk_analysis_batch_size개씩 나눠 risk_analysis_workers개까지 동시 분석
+    - 배치마다 AsyncSession 1개 + 앱의 공유 Neo4j 드라이버 또는 인메모리 그래프 사용
+    - PostgreSQL은 실행 전용 풀(asyncpg workers+1개, SQLAlchemy workers개)만 사용
+      → API 프로세스 안에서 돌아도 웹 요청용 공유 풀을 점유하지 않음
+    - 배치 결과는 unnest INSERT 1회로 저장하고 같은 트랜잭션에서 실행 체크포인트 갱신
+
+재시작:
+    완료되지 않은 최근 실행(RESUME_WINDOW_HOURS 이내)이 있으면 새 실행을 만들지 않고
+    이미 저장된 회사를 건너뛰어 이어서 처리한다. 여러 워커 프로세스에서 스케줄러가 돌아도
+    advisory lock으로 한 프로세스만 실행한다.
+
+Usage:
+    from app.services.risk_analysis_pipeline import run_risk_analysis
+
+    summary = await run_risk_analysis()
+"""
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+import asyncpg
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import database
+from app.config import settings
+from app.database import get_async_database_url, get_asyncpg_dsn
+from app.services.graph_store import graph_store
+from app.services.investment_cycles import refresh_investment_cycles
+from app.services.risk_detection import RiskDetectionEngine
+
+logger = logging.getLogger(__name__)
+
+# 이 시간 안에 시작된 미완료 실행은 이어서 처리 (그보다 오래되면 새 실행)
+RESUME_WINDOW_HOURS = 20
+
+_LOCK_KEY = "daily_risk_analysis"
+
+_TARGET_COMPANIES_SQL = """
+    SELECT DISTINCT c.id
+    FROM companies c
+    JOIN convertible_bonds cb ON c.id = cb.company_id
+    ORDER BY c.id
+"""
+
+_RESUMABLE_RUN_SQL = """
+    SELECT id
+    FROM risk_analysis_runs
+    WHERE status IN ('running', 'failed')
+      AND started_at >= NOW() - make_interval(hours => $1)
+    ORDER BY started_at DESC
+    LIMIT 1
+"""
+
+_INSERT_RESULTS_SQL = """
+    INSERT INTO risk_analysis_results (run_id, company_id, risk_score, risk_level, patterns, error, analyzed_at)
+    SELECT $1, r.company_id, r.risk_score, r.risk_level, r.patterns::jsonb, r.error, NOW()
+    FROM unnest($2::uuid[], $3::float8[], $4::text[], $5::text[], $6::text[])
+         AS r(company_id, risk_score, risk_level, patterns, error)
+    ON CONFLICT (run_id, company_id) DO UPDATE SET
+        risk_score = EXCLUDED.risk_score,
+        risk_level = EXCLUDED.risk_level,
+        patterns = EXCLUDED.patterns,
+        error = EXCLUDED.error,
+        analyzed_at = EXCLUDED.analyzed_at
+"""
+
+_CHECKPOINT_SQL = """
+    UPDATE risk_analysis_runs
+    SET processed_companies = processed_companies + $2,
+        failed_companies = failed_companies + $3,
+        checkpoint_at = NOW()
+    WHERE id = $1
+"""
+
+_HIGH_RISK_TOP_SQL = """
+    SELECT c.name, r.risk_score, r.risk_level
+    FROM risk_analysis_results r
+    JOIN companies c ON c.id = r.company_id
+    WHERE r.run_id = $1 AND r.risk_level IN ('high', 'critical')
+    ORDER BY r.risk_score DESC
+    LIMIT $2
+"""
+
+# (company_id, 분석 결과 또는 None, 오류 메시지)
+AnalysisRow = Tuple[str, Optional[Dict[str, Any]], Optional[str]]
+
+
+async def _start_or_resume_run(conn) -> Tuple[Any, bool]:
+    """미완료 실행이 있으면 재개, 없으면 새 실행 생성 → (run_id, resumed)"""
+    run_id = await conn.fetchval(_RESUMABLE_RUN_SQL, RESUME_WINDOW_HOURS)
+    if run_id is not None:
+        await conn.execute("""
+            UPDATE risk_analysis_runs
+            SET status = 'running', resume_count = resume_count + 1, error_message = NULL
+            WHERE id = $1
+        """, run_id)
+        return run_id, True
+
+    run_id = await conn.fetchval("INSERT INTO risk_analysis_runs (status) VALUES ('running') RETURNING id")
+    return run_id, False
+
+
+@asynccontextmanager
+async def _job_connections(workers: int) -> AsyncGenerator[Tuple[asyncpg.Pool, async_sessionmaker], None]:
+    """
+    실행 전용 DB 풀 (실행 종료 시 닫힘)
+
+    asyncpg: advisory lock 커넥션 1개 + 배치별 1개 (순환 인덱스 조회 → 결과 저장 순차 사용)
+    SQLAlchemy: 배치별 AsyncSession 1개
+    """
+    pool = await asyncpg.create_pool(
+        get_asyncpg_dsn(settings.database_url),
+        min_size=1,
+        max_size=workers + 1,
+        command_timeout=300,
+        server_settings={"application_name": "raymontology-risk-analysis", "jit": "off"},
+    )
+    session_engine = create_async_engine(
+        get_async_database_url(settings.database_url),
+        pool_size=workers,
+        max_overflow=0,
+        pool_pre_ping=True,
+        connect_args={"server_settings": {"application_name": "raymontology-risk-analysis"}},
+    )
+    try:
+        yield pool, async_sessionmaker(session_engine, expire_on_commit=False)
+    finally:
+        await pool.close()
+        await session_engine.dispose()
+
+
+async def _analyze_batch(
+    engine: RiskDetectionEngine,
+    session_factory: async_sessionmaker,
+    company_ids: List[str],
+) -> List[AnalysisRow]:
+    """배치 분석, 배치 전체가 실패하면 회사별로 재시도해 실패 회사만 분리"""
+    async with session_factory() as db:
+        try:
+            analyses = await engine.analyze_companies_risk(db, company_ids)
+            return [(cid, analyses[cid], None) for cid in company_ids]
+        except Exception as e:
+            logger.warning(f"배치 분석 실패 ({len(company_ids)}개 회사), 회사별 재시도: {e}")
+            await db.rollback()
+
+        rows: List[AnalysisRow] = []
+        for cid in company_ids:
+            try:
+                rows.append((cid, await engine.analyze_company_risk(db, cid), None))
+            except Exception as e:
+                logger.error(f"분석 실패 - {cid}: {e}")
+                await db.rollback()
+                rows.append((cid, None, str(e)))
+        return rows
+
+
+async def _write_results(pool: asyncpg.Pool, run_id, rows: List[AnalysisRow]) -> int:
+    """배치 결과 일괄 저장 + 체크포인트 갱신 (한 트랜잭션), 실패 회사 수 반환"""
+    company_ids, scores, levels, patterns, errors = [], [], [], [], []
+    for cid, analysis, error in rows:
+        company_ids.append(cid)
+        if analysis is None:
+            scores.append(None)
+            levels.append("unknown")
+            patterns.append(None)
+        else:
+            scores.append(analysis["risk_score"])
+            levels.append(analysis["overall_risk_level"])
+            # Neo4j 날짜 타입 등은 문자열로 저장
+            patterns.append(json.dumps(analysis["patterns"], ensure_ascii=False, default=str))
+        errors.append(error)
+
+    failed = sum(1 for e in errors if e is not None)
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(_INSERT_RESULTS_SQL, run_id, company_ids, scores, levels, patterns, errors)
+            await conn.execute(_CHECKPOINT_SQL, run_id, len(rows) - failed, failed)
+    return failed
+
+
+async def run_risk_analysis(
+    workers: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    top_n: int = 10,
+) -> Dict[str, Any]:
+    """
+    CB 발행 회사 위험도 일괄 분석 + 결과 저장
+
+    Args:
+        workers: 동시 분석 배치 수 (기본: settings.risk_analysis_workers)
+        batch_size: 배치당 회사 수 (기본: settings.risk_analysis_batch_size)
+        top_n: 요약에 포함할 고위험 회사 수
+
+    Returns:
+        dict: run_id, resumed, total/processed/failed, wall_clock_seconds, companies_per_second,
+              high_risk_top (skipped=True면 다른 프로세스가 실행 중)
+    """
+    workers = workers or settings.risk_analysis_workers
+    batch_size = batch_size or settings.risk_analysis_batch_size
+
+    driver = database.neo4j_driver
+    if driver is None and not graph_store.ready:
+        raise RuntimeError("Neo4j 드라이버와 인메모리 그래프 모두 사용할 수 없습니다")
+
+    async with _job_connections(workers) as (pool, session_factory), pool.acquire() as lock_conn:
+        engine = RiskDetectionEngine(driver, graph_store=graph_store, pg_pool=pool)
+        if not await lock_conn.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", _LOCK_KEY):
+            logger.info("다른 프로세스에서 일일 위험도 분석 실행 중: 건너뜀")
+            return {"skipped": True}
+
+        try:
+            # 순환 투자 인덱스를 최신 CB/인수자 데이터로 갱신 (실패 시 기존 인덱스 사용)
+            try:
+                await refresh_investment_cycles(lock_conn)
+            except Exception as e:
+                logger.warning(f"순환 투자 인덱스 갱신 실패: {e}")
+
+            run_id, resumed = await _start_or_resume_run(lock_conn)
+            company_ids = [str(r["id"]) for r in await lock_conn.fetch(_TARGET_COMPANIES_SQL)]
+            done = set()
+            if resumed:
+                # 분석 실패로 저장된 회사는 다시 처리
+                done = {
+                    str(r["company_id"]) for r in await lock_conn.fetch(
+                        "SELECT company_id FROM risk_analysis_results WHERE run_id = $1 AND error IS NULL",
+                        run_id,
+                    )
+                }
+            pending = [cid for cid in company_ids if cid not in done]
+            await lock_conn.execute("""
+                UPDATE risk_analysis_runs
+                SET total_companies = $2, processed_companies = $3, failed_companies = 0
+                WHERE id = $1
+            """, run_id, len(company_ids), len(done))
+            logger.info(
+                f"분석 대상: {len(company_ids)}개 회사 (이미 완료 {len(done)}개, 남은 {len(pending)}개, "
+                f"workers={workers}, batch={batch_size}, run={run_id}{', 재개' if resumed else ''})"
+            )
+
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            semaphore = asyncio.Semaphore(workers)
+            batch_seconds: List[float] = []
+            progress = {"processed": 0, "failed": 0}
+            start = time.perf_counter()
+
+            async def _run_batch(batch: List[str]):
+                async with semaphore:
+                    batch_start = time.perf_counter()
+                    rows = await _analyze_batch(engine, session_factory, batch)
+                    failed = await _write_results(pool, run_id, rows)
+                    batch_seconds.append(time.perf_counter() - batch_start)
+
+                    progress["processed"] += len(rows)
+                    progress["failed"] += failed
+                    done_count = len(done) + progress["processed"]
+                    if len(batch_seconds) % 10 == 0 or progress["processed"] == len(pending):
+                        elapsed = time.perf_counter() - start
+                        logger.info(
+                            f"진행률: {done_count}/{len(company_ids)} "
+                            f"({done_count / len(company_ids) * 100:.1f}%, "
+                            f"{progress['processed'] / elapsed:.1f}개/초)"
+                        )
+
+            results = await asyncio.gather(*[_run_batch(b) for b in batches], return_exceptions=True)
+            errors = [r for r in results if isinstance(r, Exception)]
+            wall_clock = time.perf_counter() - start
+            throughput = progress["processed"] / wall_clock if wall_clock > 0 else 0.0
+
+            metrics = {
+                "workers": workers,
+                "batch_size": batch_size,
+                "batches": len(batches),
+                "batch_errors": len(errors),
+                "avg_batch_seconds": round(sum(batch_seconds) / len(batch_seconds), 3) if batch_seconds else None,
+                "max_batch_seconds": round(max(batch_seconds), 3) if batch_seconds else None,
+                "skipped_done": len(done),
+                "graph_source": "memory" if engine.graph_store is not None else "neo4j",
+            }
+
+            # 저장 실패 배치가 있으면 failed로 남겨 다음 실행에서 이어서 처리
+            status = "failed" if errors else "completed"
+            await lock_conn.execute("""
+                UPDATE risk_analysis_runs
+                SET status = $2, wall_clock_seconds = $3, companies_per_second = $4,
+                    metrics = $5::jsonb, error_message = $6,
+                    completed_at = CASE WHEN $2 = 'completed' THEN NOW() END
+                WHERE id = $1
+            """, run_id, status, wall_clock, throughput, json.dumps(metrics),
+                str(errors[0]) if errors else None)
+
+            high_risk_top = [
+                dict(r) for r in await lock_conn.fetch(_HIGH_RISK_TOP_SQL, run_id, top_n)
+            ]
+        finally:
+            await lock_conn.execute("SELECT pg_advisory_unlock(hashtext($1))", _LOCK_KEY)
+
+    return {
+        "run_id": str(run_id),
+        "resumed": resumed,
+        "status": status,
+        "total": len(company_ids),
+        "processed": len(done) + progress["processed"],
+        "failed": progress["failed"],
+        "batch_errors": len(errors),
+        "wall_clock_seconds": round(wall_clock, 2),
+        "companies_per_second": round(throughput, 2),
+        "high_risk_top": high_risk_top,
+    }
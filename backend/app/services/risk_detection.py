@@ -10,28 +10,633 @@
 6. 임원 이동 패턴 (Officer Movement Pattern)
 7. CB 투자자 집중 (CB Investor Concentration)
 8. 계열사 연쇄 부실 (Affiliate Chain Risk)
+
+인메모리 그래프(graph_store)가 주어지면 그래프 패턴(1, 2, 3, 5, 7, 8)은 Neo4j 대신
+메모리에서 검사한다. 임원 이동 패턴(6)은 Neo4j의 career_history가 필요하다.
+순환 투자(1)는 사전 계산 인덱스(app/services/investment_cycles.py)가 있으면 인덱스를 조회한다.
+
+실행 방식:
+    - 그래프 조회는 패턴마다 UNWIND Cypher 1회로 회사 목록 전체를 처리 (회사 수와 무관)
+    - 서로 독립인 패턴 조회는 동시 실행, AsyncSession을 쓰는 재무 조회는 한 코루틴에서 순차 실행
+    - analyze_company_risk는 analyze_companies_risk([company_id])와 동일
 """
-from typing import Dict, List, Optional, Any
+import asyncio
+import asyncpg
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime, timedelta
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import AsyncDriver
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 import json
 import re
+import uuid
 
+from app.database import acquire_pg
 from app.services.financial_metrics import FinancialMetricsCalculator
+from app.services.graph_store import GraphStore
+from app.services.investment_cycles import fetch_company_cycles
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# 배치 Cypher (UNWIND $company_ids, 결과는 company_id별 1행)
+# ============================================================================
+
+_CIRCULAR_INVESTMENT_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH path = (start:Company {id: company_id})-[:INVESTED_IN*1..%d]->(start)
+WHERE ALL(r in relationships(path) WHERE r.investment_count > 0)
+WITH company_id,
+     [n in nodes(path) | n.name] as cycle,
+     [n in nodes(path) | n.id] as company_ids,
+     reduce(total = 0, r in relationships(path) | total + r.total_amount) as total_amount,
+     length(path) as cycle_length
+ORDER BY total_amount DESC
+WITH company_id, COLLECT({
+    cycle: cycle,
+    company_ids: company_ids,
+    total_amount: total_amount,
+    cycle_length: cycle_length
+})[..10] as records
+RETURN company_id, records
+"""
+
+_CB_ISSUANCE_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH (c:Company {id: company_id})-[:ISSUED]->(cb:ConvertibleBond)
+WHERE cb.issue_date >= date($cutoff_date)
+WITH company_id, cb
+ORDER BY cb.issue_date
+WITH company_id,
+     COUNT(cb) as cb_count,
+     SUM(COALESCE(cb.total_amount, 0)) as total_amount,
+     COLLECT({
+         bond_name: cb.bond_name,
+         issue_date: cb.issue_date,
+         amount: cb.total_amount
+     }) as details
+RETURN company_id, cb_count, total_amount, details
+"""
+
+_OFFICER_CONCENTRATION_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH (c:Company {id: company_id})<-[w:WORKS_AT]-(o:Officer)
+WHERE w.is_current = true
+MATCH (o)-[w2:WORKS_AT {is_current: true}]->(other:Company)
+WITH company_id, o, COUNT(DISTINCT other) as position_count, COLLECT(DISTINCT other.name) as companies
+WHERE position_count >= 3
+WITH company_id, o, position_count, companies
+ORDER BY position_count DESC, o.influence_score DESC
+WITH company_id, COLLECT({
+    officer_name: o.name,
+    influence_score: o.influence_score,
+    position_count: position_count,
+    companies: companies
+})[..10] as records
+RETURN company_id, records
+"""
+
+_RELATED_PARTY_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH (c:Company {id: company_id})
+
+// 1. 계열사 간 CB 투자
+OPTIONAL MATCH (c)-[:AFFILIATE_OF]-(affiliate:Company)
+OPTIONAL MATCH (affiliate)-[inv:INVESTED_IN]->(c)
+WITH company_id, c, COLLECT(DISTINCT {
+    company: affiliate.name,
+    company_id: affiliate.id,
+    investment_count: inv.investment_count,
+    total_amount: inv.total_amount
+}) as affiliate_investments
+
+// 2. 임원 겸직 회사 간 CB 투자
+OPTIONAL MATCH (c)<-[:WORKS_AT {is_current: true}]-(o:Officer)-[:WORKS_AT {is_current: true}]->(other:Company)
+OPTIONAL MATCH (other)-[inv2:INVESTED_IN]->(c)
+WHERE other.id <> c.id
+WITH company_id, affiliate_investments, COLLECT(DISTINCT {
+    company: other.name,
+    company_id: other.id,
+    officer: o.name,
+    investment_count: inv2.investment_count,
+    total_amount: inv2.total_amount
+}) as officer_linked_investments
+
+RETURN company_id,
+       affiliate_investments,
+       officer_linked_investments
+"""
+
+_OFFICER_MOVEMENT_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH (c:Company {id: company_id})<-[w:WORKS_AT {is_current: true}]-(o:Officer)
+
+// 임원의 이전 경력 조회 (career_history JSON), career_count가 높은 임원 필터링
+WHERE o.career_history IS NOT NULL AND o.career_count >= 4
+
+WITH company_id, o
+ORDER BY o.career_count DESC
+WITH company_id, COLLECT({
+    officer: o.name,
+    career_count: o.career_count,
+    influence_score: o.influence_score,
+    career_history: o.career_history
+})[..10] as records
+RETURN company_id, records
+"""
+
+_CB_INVESTOR_CONCENTRATION_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH (c:Company {id: company_id})<-[:ISSUED]-(cb:ConvertibleBond)<-[sub:SUBSCRIBED]-(s:Subscriber)
+WITH company_id, c,
+     COUNT(DISTINCT cb) as total_cb_count,
+     SUM(COALESCE(sub.subscription_amount, 0)) as total_cb_amount
+
+MATCH (c)<-[:ISSUED]-(cb:ConvertibleBond)<-[sub:SUBSCRIBED]-(s:Subscriber)
+WITH company_id, total_cb_count, s,
+     COUNT(DISTINCT cb) as investor_cb_count,
+     SUM(COALESCE(sub.subscription_amount, 0)) as investor_amount
+WITH company_id, s, investor_cb_count, investor_amount,
+     CASE
+         WHEN total_cb_count > 0 THEN toFloat(investor_cb_count) / total_cb_count
+         ELSE 0
+     END as concentration_ratio
+WHERE concentration_ratio > 0.2
+
+WITH company_id, s, investor_cb_count, investor_amount, concentration_ratio
+ORDER BY concentration_ratio DESC
+WITH company_id, COLLECT({
+    investor: s.name,
+    investment_count: investor_cb_count,
+    total_amount: investor_amount,
+    concentration_ratio: concentration_ratio
+})[..10] as records
+RETURN company_id, records
+"""
+
+_AFFILIATE_IDS_CYPHER = """
+UNWIND $company_ids AS company_id
+MATCH (c:Company {id: company_id})-[:AFFILIATE_OF]-(affiliate:Company)
+RETURN company_id, COLLECT(DISTINCT affiliate.id) as affiliate_ids
+"""
+
+
 class RiskDetectionEngine:
     """위험 패턴 탐지 엔진"""
 
-    def __init__(self, neo4j_driver: AsyncDriver):
+    def __init__(
+        self,
+        neo4j_driver: Optional[AsyncDriver],
+        graph_store: Optional[GraphStore] = None,
+        pg_pool: Optional[asyncpg.Pool] = None,
+    ):
         self.driver = neo4j_driver
+        # 순환 투자 인덱스 조회용 asyncpg 풀 (미지정 시 앱 공유 풀)
+        self.pg_pool = pg_pool
+        # 로드 완료된 인메모리 그래프만 사용 (미로드 시 Neo4j)
+        self.graph_store = graph_store if graph_store is not None and graph_store.ready else None
         self.metrics_calculator = FinancialMetricsCalculator()
 
+    # ========================================================================
+    # 그래프 조회 (회사 목록 단위)
+    # ========================================================================
+
+    async def _run_batch(self, cypher: str, company_ids: List[str], **params) -> Dict[str, Dict[str, Any]]:
+        """UNWIND Cypher 실행 → {company_id: 레코드} (결과 없는 회사는 누락)"""
+        async with self.driver.session() as session:
+            result = await session.run(cypher, company_ids=company_ids, **params)
+            records = await result.data()
+        return {record["company_id"]: record for record in records}
+
+    async def _fetch_circular_investments(self, company_ids: List[str], max_depth: int = 3) -> Dict[str, List]:
+        # 사전 계산 순환 인덱스 우선 (미구축/조회 실패 시 그래프 탐색)
+        try:
+            async with (self.pg_pool.acquire() if self.pg_pool is not None else acquire_pg()) as conn:
+                indexed = await fetch_company_cycles(conn, company_ids, max_depth)
+            if indexed is not None:
+                return indexed
+        except Exception as e:
+            logger.warning(f"순환 투자 인덱스 조회 실패, 그래프 탐색으로 대체: {e}")
+
+        if self.graph_store is not None:
+            return {cid: self.graph_store.circular_investments(cid, max_depth=max_depth) for cid in company_ids}
+        rows = await self._run_batch(_CIRCULAR_INVESTMENT_CYPHER % max_depth, company_ids)
+        return {cid: rows[cid]["records"] if cid in rows else [] for cid in company_ids}
+
+    async def _fetch_cb_issuances(self, company_ids: List[str], months: int) -> Dict[str, Optional[Dict]]:
+        cutoff_date = (datetime.now() - timedelta(days=months * 30)).strftime("%Y-%m-%d")
+        if self.graph_store is not None:
+            return {cid: self.graph_store.cb_issuances(cid, cutoff_date) for cid in company_ids}
+        rows = await self._run_batch(_CB_ISSUANCE_CYPHER, company_ids, cutoff_date=cutoff_date)
+        return {cid: rows.get(cid) for cid in company_ids}
+
+    async def _fetch_officer_concentration(self, company_ids: List[str]) -> Dict[str, List]:
+        if self.graph_store is not None:
+            return {cid: self.graph_store.officer_concentration(cid) for cid in company_ids}
+        rows = await self._run_batch(_OFFICER_CONCENTRATION_CYPHER, company_ids)
+        return {cid: rows[cid]["records"] if cid in rows else [] for cid in company_ids}
+
+    async def _fetch_related_party(self, company_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        if self.graph_store is not None:
+            return {cid: self.graph_store.related_party_investments(cid) for cid in company_ids}
+        rows = await self._run_batch(_RELATED_PARTY_CYPHER, company_ids)
+        return {cid: rows.get(cid) for cid in company_ids}
+
+    async def _fetch_officer_movement(self, company_ids: List[str]) -> Dict[str, Optional[List]]:
+        if self.driver is None:
+            # career_history/career_count는 Neo4j Officer 노드에만 있음
+            return {cid: None for cid in company_ids}
+        rows = await self._run_batch(_OFFICER_MOVEMENT_CYPHER, company_ids)
+        return {cid: rows[cid]["records"] if cid in rows else [] for cid in company_ids}
+
+    async def _fetch_cb_investor_concentration(self, company_ids: List[str]) -> Dict[str, List]:
+        if self.graph_store is not None:
+            return {cid: self.graph_store.cb_investor_concentration(cid) for cid in company_ids}
+        rows = await self._run_batch(_CB_INVESTOR_CONCENTRATION_CYPHER, company_ids)
+        return {cid: rows[cid]["records"] if cid in rows else [] for cid in company_ids}
+
+    async def _fetch_affiliate_ids(self, company_ids: List[str]) -> Dict[str, List[str]]:
+        if self.graph_store is not None:
+            return {cid: self.graph_store.affiliate_ids(cid) for cid in company_ids}
+        rows = await self._run_batch(_AFFILIATE_IDS_CYPHER, company_ids)
+        return {cid: rows[cid]["affiliate_ids"] if cid in rows else [] for cid in company_ids}
+
+    # ========================================================================
+    # PostgreSQL 조회 (AsyncSession은 동시 사용 불가 → 호출 측에서 순차 실행)
+    # ========================================================================
+
+    async def _fetch_high_risk_company_names(self, db: Optional[AsyncSession]) -> set:
+        """리스크 점수 60 이상 회사명 (임원 이동 패턴용)"""
+        if not db:
+            return set()
+        try:
+            from app.models.risk_scores import RiskScore
+            from app.models.companies import Company
+
+            stmt = (
+                select(Company.name)
+                .join(RiskScore, Company.id == RiskScore.company_id)
+                .where(RiskScore.total_score >= 60)
+            )
+            result_db = await db.execute(stmt)
+            names = {row[0] for row in result_db.fetchall()}
+            logger.debug(f"Found {len(names)} high-risk companies")
+            return names
+        except Exception as e:
+            logger.warning(f"Failed to fetch high-risk companies: {e}")
+            return set()
+
+    async def _fetch_affiliate_financials(self, db: AsyncSession, affiliate_ids: Iterable) -> Dict[str, Any]:
+        """계열사별 최신 재무제표 {affiliate_id: (id, name, equity, liabilities, operating_income, net_income)}"""
+        from app.models.financial_statements import FinancialStatement
+        from app.models.companies import Company
+
+        # UUID 변환
+        affiliate_uuids = []
+        for aid in affiliate_ids:
+            try:
+                affiliate_uuids.append(uuid.UUID(aid) if isinstance(aid, str) else aid)
+            except (ValueError, TypeError):
+                continue
+
+        if not affiliate_uuids:
+            return {}
+
+        stmt = (
+            select(
+                Company.id,
+                Company.name,
+                FinancialStatement.total_equity,
+                FinancialStatement.total_liabilities,
+                FinancialStatement.operating_income,
+                FinancialStatement.net_income
+            )
+            .join(FinancialStatement, Company.id == FinancialStatement.company_id)
+            .where(Company.id.in_(affiliate_uuids))
+            .order_by(Company.id, FinancialStatement.fiscal_year.desc())
+            .distinct(Company.id)
+        )
+        result_db = await db.execute(stmt)
+        return {str(row[0]): row for row in result_db.fetchall()}
+
+    # ========================================================================
+    # 패턴 평가 (조회 결과 → 위험도)
+    # ========================================================================
+
+    @staticmethod
+    def _assess_circular_investment(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        cycles = []
+        for record in records:
+            risk_level = "high" if record["total_amount"] > 1_000_000_000 else "medium"
+
+            cycles.append({
+                "cycle": record["cycle"],
+                "company_ids": record["company_ids"],
+                "total_amount": record["total_amount"],
+                "cycle_length": record["cycle_length"],
+                "risk_level": risk_level
+            })
+
+        return cycles
+
+    @staticmethod
+    def _assess_excessive_cb(record: Optional[Dict[str, Any]], months: int) -> Dict[str, Any]:
+        if not record or record["cb_count"] == 0:
+            return {
+                "cb_count": 0,
+                "total_amount": 0,
+                "avg_interval_days": None,
+                "risk_level": "low",
+                "details": []
+            }
+
+        cb_count = record["cb_count"]
+        total_amount = record["total_amount"]
+        details = record["details"]
+
+        # 평균 발행 간격 계산
+        avg_interval = months * 30 / cb_count if cb_count > 0 else None
+
+        # 위험도 평가
+        if cb_count >= 4 or total_amount > 5_000_000_000:
+            risk_level = "high"
+        elif cb_count >= 2 or total_amount > 1_000_000_000:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "cb_count": cb_count,
+            "total_amount": total_amount,
+            "avg_interval_days": avg_interval,
+            "risk_level": risk_level,
+            "details": details
+        }
+
+    @staticmethod
+    def _assess_officer_concentration(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        officers = []
+        for record in records:
+            officers.append({
+                "officer_name": record["officer_name"],
+                "position_count": record["position_count"],
+                "influence_score": record.get("influence_score", 0),
+                "companies": record["companies"]
+            })
+
+        # 위험도 평가
+        if officers and max(o["position_count"] for o in officers) >= 5:
+            risk_level = "high"
+        elif officers:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "high_concentration_officers": officers,
+            "risk_level": risk_level
+        }
+
+    @staticmethod
+    def _assess_financial_distress(health_analysis: Dict[str, Any], cb_data: Dict[str, Any]) -> Dict[str, Any]:
+        health_score = health_analysis["health_score"]
+        cb_count = cb_data["cb_count"]
+
+        if health_score < 50 and cb_count >= 2:
+            risk_level = "high"
+        elif health_score < 60 and cb_count >= 1:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "health_score": health_score,
+            "recent_cb_count": cb_count,
+            "cb_total_amount": cb_data["total_amount"],
+            "metrics": health_analysis["metrics"],
+            "warnings": health_analysis["warnings"],
+            "strengths": health_analysis["strengths"],
+            "risk_level": risk_level
+        }
+
+    @staticmethod
+    def _assess_related_party(record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if not record:
+            return {
+                "affiliate_investments": [],
+                "officer_linked_investments": [],
+                "risk_level": "low"
+            }
+
+        affiliate_investments = [inv for inv in record["affiliate_investments"] if inv.get("investment_count")]
+        officer_linked = [inv for inv in record["officer_linked_investments"] if inv.get("investment_count")]
+
+        # 위험도 평가
+        total_related_count = len(affiliate_investments) + len(officer_linked)
+        if total_related_count >= 3:
+            risk_level = "high"
+        elif total_related_count >= 1:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "affiliate_investments": affiliate_investments,
+            "officer_linked_investments": officer_linked,
+            "total_related_count": total_related_count,
+            "risk_level": risk_level
+        }
+
+    def _extract_company_name_from_career(self, career_text: str) -> Optional[str]:
+        """
+        career_history text에서 회사명 추출
+
+        예: "(주)이아이디 재무이사" -> "이아이디"
+        """
+        if not career_text:
+            return None
+
+        # (주), (유), 주식회사 등 제거하고 회사명 추출
+        patterns = [
+            r'\(주\)([^\s]+)',      # (주)회사명
+            r'\(유\)([^\s]+)',      # (유)회사명
+            r'주식회사\s*([^\s]+)', # 주식회사 회사명
+            r'^([^\s]+)\s+',        # 첫 단어 (회사명으로 추정)
+        ]
+
+        for pattern in patterns:
+            match = re.search(pattern, career_text)
+            if match:
+                return match.group(1).strip()
+
+        return None
+
+    def _assess_officer_movement(
+        self,
+        records: Optional[List[Dict[str, Any]]],
+        high_risk_company_names: set
+    ) -> Dict[str, Any]:
+        if records is None:
+            return {
+                "high_risk_officers": [],
+                "total_high_risk_careers": 0,
+                "risk_level": "unknown"
+            }
+
+        high_risk_officers = []
+        total_high_risk_careers = 0
+
+        for record in records:
+            career_history = record.get("career_history")
+            previous_companies = []
+            high_risk_companies = []
+
+            # career_history JSON 파싱
+            if career_history:
+                try:
+                    careers = career_history if isinstance(career_history, list) else json.loads(career_history)
+                    for career in careers:
+                        if isinstance(career, dict) and career.get("text"):
+                            company_name = self._extract_company_name_from_career(career["text"])
+                            if company_name:
+                                previous_companies.append(company_name)
+                                # 고위험 회사 경력 확인
+                                if company_name in high_risk_company_names:
+                                    high_risk_companies.append(company_name)
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"Failed to parse career_history: {e}")
+
+            if high_risk_companies:
+                total_high_risk_careers += len(high_risk_companies)
+
+            high_risk_officers.append({
+                "officer": record["officer"],
+                "career_count": record["career_count"],
+                "influence_score": record.get("influence_score", 0),
+                "previous_companies": previous_companies[:5],  # 최대 5개
+                "high_risk_companies": high_risk_companies
+            })
+
+        # 위험도 평가 (고위험 회사 경력 기반)
+        if total_high_risk_careers >= 3:
+            risk_level = "high"
+        elif total_high_risk_careers >= 1 or (high_risk_officers and max(o["career_count"] for o in high_risk_officers) >= 6):
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "high_risk_officers": high_risk_officers,
+            "total_high_risk_careers": total_high_risk_careers,
+            "risk_level": risk_level
+        }
+
+    @staticmethod
+    def _assess_cb_investor_concentration(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        top_investors = []
+        for record in records:
+            top_investors.append({
+                "investor": record["investor"],
+                "investment_count": record["investment_count"],
+                "total_amount": record["total_amount"],
+                "concentration_ratio": round(record["concentration_ratio"], 3)
+            })
+
+        # 위험도 평가
+        if top_investors and max(inv["concentration_ratio"] for inv in top_investors) > 0.4:
+            risk_level = "high"
+        elif top_investors:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "top_investors": top_investors,
+            "total_investors": len(top_investors),
+            "risk_level": risk_level
+        }
+
+    @staticmethod
+    def _assess_affiliate_chain(affiliate_ids: List[str], financials: Dict[str, Any]) -> Dict[str, Any]:
+        if not affiliate_ids:
+            return {
+                "total_affiliates": 0,
+                "distressed_affiliates": 0,
+                "distress_ratio": 0.0,
+                "risk_level": "low"
+            }
+
+        total_affiliates = len(affiliate_ids)
+        distressed_count = 0
+        distressed_companies = []
+
+        for aid in affiliate_ids:
+            row = financials.get(str(aid))
+            if row is None:
+                continue
+
+            company_name = row[1]
+            total_equity = float(row[2]) if row[2] else 0
+            total_liabilities = float(row[3]) if row[3] else 0
+            operating_income = float(row[4]) if row[4] else 0
+            net_income = float(row[5]) if row[5] else 0
+
+            # 재무 건전성 평가 기준
+            # 1. 부채비율 200% 초과
+            # 2. 영업이익 적자
+            # 3. 당기순이익 적자
+            is_distressed = False
+
+            if total_equity > 0:
+                debt_ratio = total_liabilities / total_equity
+                if debt_ratio > 2.0:
+                    is_distressed = True
+
+            if operating_income < 0 or net_income < 0:
+                is_distressed = True
+
+            if is_distressed:
+                distressed_count += 1
+                distressed_companies.append(company_name)
+
+        # 부실 비율 계산
+        distress_ratio = distressed_count / total_affiliates if total_affiliates > 0 else 0.0
+
+        # 위험도 평가
+        if distress_ratio >= 0.5:
+            risk_level = "critical"
+        elif distress_ratio >= 0.3:
+            risk_level = "high"
+        elif distress_ratio >= 0.1:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+
+        return {
+            "total_affiliates": total_affiliates,
+            "distressed_affiliates": distressed_count,
+            "distressed_companies": distressed_companies[:5],  # 최대 5개
+            "distress_ratio": round(distress_ratio, 3),
+            "risk_level": risk_level
+        }
+
+    @staticmethod
+    def _affiliate_chain_error(affiliate_ids: List[str], error: Exception) -> Dict[str, Any]:
+        return {
+            "total_affiliates": len(affiliate_ids),
+            "affiliate_ids": affiliate_ids,
+            "distressed_affiliates": None,
+            "distress_ratio": None,
+            "risk_level": "unknown",
+            "note": f"Error: {str(error)}"
+        }
+
+    # ========================================================================
+    # 단일 패턴 탐지 (패턴 상세 API)
+    # ========================================================================
+
     async def detect_circular_investment(
         self,
         company_id: str,
@@ -50,38 +655,8 @@ class RiskDetectionEngine:
                 "risk_level": "high"
             }]
         """
-        cypher = """
-        MATCH path = (start:Company {id: $company_id})-[:INVESTED_IN*1..%d]->(start)
-        WHERE ALL(r in relationships(path) WHERE r.investment_count > 0)
-        WITH path,
-             [n in nodes(path) | n.name] as company_names,
-             [n in nodes(path) | n.id] as company_ids,
-             reduce(total = 0, r in relationships(path) | total + r.total_amount) as total_amount
-        RETURN company_names as cycle,
-               company_ids,
-               total_amount,
-               length(path) as cycle_length
-        ORDER BY total_amount DESC
-        LIMIT 10
-        """ % max_depth
-
-        async with self.driver.session() as session:
-            result = await session.run(cypher, company_id=company_id)
-            records = await result.data()
-
-            cycles = []
-            for record in records:
-                risk_level = "high" if record["total_amount"] > 1_000_000_000 else "medium"
-
-                cycles.append({
-                    "cycle": record["cycle"],
-                    "company_ids": record["company_ids"],
-                    "total_amount": record["total_amount"],
-                    "cycle_length": record["cycle_length"],
-                    "risk_level": risk_level
-                })
-
-            return cycles
+        records = await self._fetch_circular_investments([company_id], max_depth)
+        return self._assess_circular_investment(records[company_id])
 
     async def detect_excessive_cb_issuance(
         self,
@@ -102,65 +677,8 @@ class RiskDetectionEngine:
                 "details": [...]
             }
         """
-        cutoff_date = (datetime.now() - timedelta(days=months * 30)).strftime("%Y-%m-%d")
-
-        cypher = """
-        MATCH (c:Company {id: $company_id})-[:ISSUED]->(cb:ConvertibleBond)
-        WHERE cb.issue_date >= date($cutoff_date)
-        WITH c, cb
-        ORDER BY cb.issue_date
-        WITH c,
-             COUNT(cb) as cb_count,
-             SUM(COALESCE(cb.total_amount, 0)) as total_amount,
-             COLLECT({
-                 bond_name: cb.bond_name,
-                 issue_date: cb.issue_date,
-                 amount: cb.total_amount
-             }) as details
-        RETURN cb_count,
-               total_amount,
-               details
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(
-                cypher,
-                company_id=company_id,
-                cutoff_date=cutoff_date
-            )
-            record = await result.single()
-
-            if not record or record["cb_count"] == 0:
-                return {
-                    "cb_count": 0,
-                    "total_amount": 0,
-                    "avg_interval_days": None,
-                    "risk_level": "low",
-                    "details": []
-                }
-
-            cb_count = record["cb_count"]
-            total_amount = record["total_amount"]
-            details = record["details"]
-
-            # 평균 발행 간격 계산
-            avg_interval = months * 30 / cb_count if cb_count > 0 else None
-
-            # 위험도 평가
-            if cb_count >= 4 or total_amount > 5_000_000_000:
-                risk_level = "high"
-            elif cb_count >= 2 or total_amount > 1_000_000_000:
-                risk_level = "medium"
-            else:
-                risk_level = "low"
-
-            return {
-                "cb_count": cb_count,
-                "total_amount": total_amount,
-                "avg_interval_days": avg_interval,
-                "risk_level": risk_level,
-                "details": details
-            }
+        records = await self._fetch_cb_issuances([company_id], months)
+        return self._assess_excessive_cb(records[company_id], months)
 
     async def detect_officer_concentration(
         self,
@@ -184,45 +702,8 @@ class RiskDetectionEngine:
                 "risk_level": "medium"
             }
         """
-        cypher = """
-        MATCH (c:Company {id: $company_id})<-[w:WORKS_AT]-(o:Officer)
-        WHERE w.is_current = true
-        MATCH (o)-[w2:WORKS_AT {is_current: true}]->(other:Company)
-        WITH o, c, COUNT(DISTINCT other) as position_count, COLLECT(DISTINCT other.name) as companies
-        WHERE position_count >= 3
-        RETURN o.name as officer_name,
-               o.influence_score as influence_score,
-               position_count,
-               companies
-        ORDER BY position_count DESC, influence_score DESC
-        LIMIT 10
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(cypher, company_id=company_id)
-            records = await result.data()
-
-            officers = []
-            for record in records:
-                officers.append({
-                    "officer_name": record["officer_name"],
-                    "position_count": record["position_count"],
-                    "influence_score": record.get("influence_score", 0),
-                    "companies": record["companies"]
-                })
-
-            # 위험도 평가
-            if officers and max(o["position_count"] for o in officers) >= 5:
-                risk_level = "high"
-            elif officers:
-                risk_level = "medium"
-            else:
-                risk_level = "low"
-
-            return {
-                "high_concentration_officers": officers,
-                "risk_level": risk_level
-            }
+        records = await self._fetch_officer_concentration([company_id])
+        return self._assess_officer_concentration(records[company_id])
 
     async def detect_financial_distress_with_cb(
         self,
@@ -243,32 +724,13 @@ class RiskDetectionEngine:
                 "risk_level": "high"
             }
         """
-        # 재무 건전성 분석
-        health_analysis = await self.metrics_calculator.analyze_company_health(db, company_id)
-
-        # 최근 CB 발행 조회
-        cb_data = await self.detect_excessive_cb_issuance(company_id, months=6)
-
-        # 위험도 평가
-        health_score = health_analysis["health_score"]
-        cb_count = cb_data["cb_count"]
-
-        if health_score < 50 and cb_count >= 2:
-            risk_level = "high"
-        elif health_score < 60 and cb_count >= 1:
-            risk_level = "medium"
-        else:
-            risk_level = "low"
-
-        return {
-            "health_score": health_score,
-            "recent_cb_count": cb_count,
-            "cb_total_amount": cb_data["total_amount"],
-            "metrics": health_analysis["metrics"],
-            "warnings": health_analysis["warnings"],
-            "strengths": health_analysis["strengths"],
-            "risk_level": risk_level
-        }
+        # 재무 건전성 분석 + 최근 6개월 CB 발행 (서로 독립)
+        health_analysis, cb_records = await asyncio.gather(
+            self.metrics_calculator.analyze_company_health(db, company_id),
+            self._fetch_cb_issuances([company_id], 6),
+        )
+        cb_data = self._assess_excessive_cb(cb_records[company_id], 6)
+        return self._assess_financial_distress(health_analysis, cb_data)
 
     async def detect_related_party_transactions(
         self,
@@ -286,88 +748,8 @@ class RiskDetectionEngine:
                 "risk_level": "medium"
             }
         """
-        cypher = """
-        MATCH (c:Company {id: $company_id})
-
-        // 1. 계열사 간 CB 투자
-        OPTIONAL MATCH (c)-[:AFFILIATE_OF]-(affiliate:Company)
-        OPTIONAL MATCH (affiliate)-[inv:INVESTED_IN]->(c)
-        WITH c, COLLECT(DISTINCT {
-            company: affiliate.name,
-            company_id: affiliate.id,
-            investment_count: inv.investment_count,
-            total_amount: inv.total_amount
-        }) as affiliate_investments
-
-        // 2. 임원 겸직 회사 간 CB 투자
-        OPTIONAL MATCH (c)<-[:WORKS_AT {is_current: true}]-(o:Officer)-[:WORKS_AT {is_current: true}]->(other:Company)
-        OPTIONAL MATCH (other)-[inv2:INVESTED_IN]->(c)
-        WHERE other.id <> c.id
-        WITH c, affiliate_investments, COLLECT(DISTINCT {
-            company: other.name,
-            company_id: other.id,
-            officer: o.name,
-            investment_count: inv2.investment_count,
-            total_amount: inv2.total_amount
-        }) as officer_linked_investments
-
-        RETURN affiliate_investments,
-               officer_linked_investments
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(cypher, company_id=company_id)
-            record = await result.single()
-
-            if not record:
-                return {
-                    "affiliate_investments": [],
-                    "officer_linked_investments": [],
-                    "risk_level": "low"
-                }
-
-            affiliate_investments = [inv for inv in record["affiliate_investments"] if inv.get("investment_count")]
-            officer_linked = [inv for inv in record["officer_linked_investments"] if inv.get("investment_count")]
-
-            # 위험도 평가
-            total_related_count = len(affiliate_investments) + len(officer_linked)
-            if total_related_count >= 3:
-                risk_level = "high"
-            elif total_related_count >= 1:
-                risk_level = "medium"
-            else:
-                risk_level = "low"
-
-            return {
-                "affiliate_investments": affiliate_investments,
-                "officer_linked_investments": officer_linked,
-                "total_related_count": total_related_count,
-                "risk_level": risk_level
-            }
-
-    def _extract_company_name_from_career(self, career_text: str) -> Optional[str]:
-        """
-        career_history text에서 회사명 추출
-
-        예: "(주)이아이디 재무이사" -> "이아이디"
-        """
-        if not career_text:
-            return None
-
-        # (주), (유), 주식회사 등 제거하고 회사명 추출
-        patterns = [
-            r'\(주\)([^\s]+)',      # (주)회사명
-            r'\(유\)([^\s]+)',      # (유)회사명
-            r'주식회사\s*([^\s]+)', # 주식회사 회사명
-            r'^([^\s]+)\s+',        # 첫 단어 (회사명으로 추정)
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, career_text)
-            if match:
-                return match.group(1).strip()
-
-        return None
+        records = await self._fetch_related_party([company_id])
+        return self._assess_related_party(records[company_id])
 
     async def detect_officer_movement_pattern(
         self,
@@ -398,97 +780,11 @@ class RiskDetectionEngine:
                 "risk_level": "medium"
             }
         """
-        cutoff_date = (datetime.now() - timedelta(days=months * 30)).strftime("%Y-%m-%d")
-
-        cypher = """
-        MATCH (c:Company {id: $company_id})<-[w:WORKS_AT {is_current: true}]-(o:Officer)
-
-        // 임원의 이전 경력 조회 (career_history JSON)
-        WITH c, o, o.career_history as career_history
-        WHERE career_history IS NOT NULL
-
-        // career_count가 높은 임원 필터링
-        WITH c, o, career_history, o.career_count as career_count
-        WHERE career_count >= 4
-
-        RETURN o.name as officer,
-               o.career_count as career_count,
-               o.influence_score as influence_score,
-               career_history
-        ORDER BY career_count DESC
-        LIMIT 10
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(cypher, company_id=company_id)
-            records = await result.data()
-
-            # 고위험 회사 목록 조회 (db가 제공된 경우)
-            high_risk_company_names = set()
-            if db:
-                try:
-                    from app.models.risk_scores import RiskScore
-                    from app.models.companies import Company
-
-                    # 리스크 점수가 60 이상인 회사 조회
-                    stmt = (
-                        select(Company.name)
-                        .join(RiskScore, Company.id == RiskScore.company_id)
-                        .where(RiskScore.total_score >= 60)
-                    )
-                    result_db = await db.execute(stmt)
-                    high_risk_company_names = {row[0] for row in result_db.fetchall()}
-                    logger.debug(f"Found {len(high_risk_company_names)} high-risk companies")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch high-risk companies: {e}")
-
-            high_risk_officers = []
-            total_high_risk_careers = 0
-
-            for record in records:
-                career_history = record.get("career_history")
-                previous_companies = []
-                high_risk_companies = []
-
-                # career_history JSON 파싱
-                if career_history:
-                    try:
-                        careers = career_history if isinstance(career_history, list) else json.loads(career_history)
-                        for career in careers:
-                            if isinstance(career, dict) and career.get("text"):
-                                company_name = self._extract_company_name_from_career(career["text"])
-                                if company_name:
-                                    previous_companies.append(company_name)
-                                    # 고위험 회사 경력 확인
-                                    if company_name in high_risk_company_names:
-                                        high_risk_companies.append(company_name)
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(f"Failed to parse career_history: {e}")
-
-                if high_risk_companies:
-                    total_high_risk_careers += len(high_risk_companies)
-
-                high_risk_officers.append({
-                    "officer": record["officer"],
-                    "career_count": record["career_count"],
-                    "influence_score": record.get("influence_score", 0),
-                    "previous_companies": previous_companies[:5],  # 최대 5개
-                    "high_risk_companies": high_risk_companies
-                })
-
-            # 위험도 평가 (고위험 회사 경력 기반)
-            if total_high_risk_careers >= 3:
-                risk_level = "high"
-            elif total_high_risk_careers >= 1 or (high_risk_officers and max(o["career_count"] for o in high_risk_officers) >= 6):
-                risk_level = "medium"
-            else:
-                risk_level = "low"
-
-            return {
-                "high_risk_officers": high_risk_officers,
-                "total_high_risk_careers": total_high_risk_careers,
-                "risk_level": risk_level
-            }
+        records, high_risk_company_names = await asyncio.gather(
+            self._fetch_officer_movement([company_id]),
+            self._fetch_high_risk_company_names(db),
+        )
+        return self._assess_officer_movement(records[company_id], high_risk_company_names)
 
     async def detect_cb_investor_concentration(
         self,
@@ -512,57 +808,8 @@ class RiskDetectionEngine:
                 "risk_level": "high"
             }
         """
-        cypher = """
-        MATCH (c:Company {id: $company_id})<-[:ISSUED]-(cb:ConvertibleBond)<-[sub:SUBSCRIBED]-(s:Subscriber)
-        WITH c,
-             COUNT(DISTINCT cb) as total_cb_count,
-             SUM(COALESCE(sub.subscription_amount, 0)) as total_cb_amount
-
-        MATCH (c)<-[:ISSUED]-(cb:ConvertibleBond)<-[sub:SUBSCRIBED]-(s:Subscriber)
-        WITH c, total_cb_count, total_cb_amount, s,
-             COUNT(DISTINCT cb) as investor_cb_count,
-             SUM(COALESCE(sub.subscription_amount, 0)) as investor_amount
-        WITH c, total_cb_count, total_cb_amount, s, investor_cb_count, investor_amount,
-             CASE
-                 WHEN total_cb_count > 0 THEN toFloat(investor_cb_count) / total_cb_count
-                 ELSE 0
-             END as concentration_ratio
-        WHERE concentration_ratio > 0.2
-
-        RETURN s.name as investor,
-               investor_cb_count as investment_count,
-               investor_amount as total_amount,
-               concentration_ratio
-        ORDER BY concentration_ratio DESC
-        LIMIT 10
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(cypher, company_id=company_id)
-            records = await result.data()
-
-            top_investors = []
-            for record in records:
-                top_investors.append({
-                    "investor": record["investor"],
-                    "investment_count": record["investment_count"],
-                    "total_amount": record["total_amount"],
-                    "concentration_ratio": round(record["concentration_ratio"], 3)
-                })
-
-            # 위험도 평가
-            if top_investors and max(inv["concentration_ratio"] for inv in top_investors) > 0.4:
-                risk_level = "high"
-            elif top_investors:
-                risk_level = "medium"
-            else:
-                risk_level = "low"
-
-            return {
-                "top_investors": top_investors,
-                "total_investors": len(top_investors),
-                "risk_level": risk_level
-            }
+        records = await self._fetch_cb_investor_concentration([company_id])
+        return self._assess_cb_investor_concentration(records[company_id])
 
     async def detect_affiliate_chain_risk(
         self,
@@ -587,119 +834,111 @@ class RiskDetectionEngine:
                 "risk_level": "high"
             }
         """
-        cypher = """
-        MATCH (c:Company {id: $company_id})-[:AFFILIATE_OF]-(affiliate:Company)
-        RETURN COLLECT(DISTINCT affiliate.id) as affiliate_ids
-        """
+        affiliate_ids = (await self._fetch_affiliate_ids([company_id]))[company_id]
 
-        async with self.driver.session() as session:
-            result = await session.run(cypher, company_id=company_id)
-            record = await result.single()
-
-            if not record or not record["affiliate_ids"]:
-                return {
-                    "total_affiliates": 0,
-                    "distressed_affiliates": 0,
-                    "distress_ratio": 0.0,
-                    "risk_level": "low"
-                }
+        financials = {}
+        if db and affiliate_ids:
+            try:
+                financials = await self._fetch_affiliate_financials(db, affiliate_ids)
+            except Exception as e:
+                logger.warning(f"Failed to fetch affiliate financials: {e}")
+                return self._affiliate_chain_error(affiliate_ids, e)
 
-            affiliate_ids = record["affiliate_ids"]
-            total_affiliates = len(affiliate_ids)
+        return self._assess_affiliate_chain(affiliate_ids, financials)
 
-            # 계열사 재무 건전성 조회
-            distressed_count = 0
-            distressed_companies = []
+    # ========================================================================
+    # 종합 분석
+    # ========================================================================
 
-            if db:
-                try:
-                    from app.models.financial_statements import FinancialStatement
-                    from app.models.companies import Company
-                    import uuid
-
-                    # UUID 변환
-                    affiliate_uuids = []
-                    for aid in affiliate_ids:
-                        try:
-                            affiliate_uuids.append(uuid.UUID(aid) if isinstance(aid, str) else aid)
-                        except (ValueError, TypeError):
-                            continue
-
-                    if affiliate_uuids:
-                        # 각 계열사의 최신 재무제표 조회
-                        stmt = (
-                            select(
-                                Company.id,
-                                Company.name,
-                                FinancialStatement.total_equity,
-                                FinancialStatement.total_liabilities,
-                                FinancialStatement.operating_income,
-                                FinancialStatement.net_income
-                            )
-                            .join(FinancialStatement, Company.id == FinancialStatement.company_id)
-                            .where(Company.id.in_(affiliate_uuids))
-                            .order_by(Company.id, FinancialStatement.fiscal_year.desc())
-                            .distinct(Company.id)
-                        )
-                        result_db = await db.execute(stmt)
-                        financials = result_db.fetchall()
-
-                        for row in financials:
-                            company_name = row[1]
-                            total_equity = float(row[2]) if row[2] else 0
-                            total_liabilities = float(row[3]) if row[3] else 0
-                            operating_income = float(row[4]) if row[4] else 0
-                            net_income = float(row[5]) if row[5] else 0
-
-                            # 재무 건전성 평가 기준
-                            # 1. 부채비율 200% 초과
-                            # 2. 영업이익 적자
-                            # 3. 당기순이익 적자
-                            is_distressed = False
-
-                            if total_equity > 0:
-                                debt_ratio = total_liabilities / total_equity
-                                if debt_ratio > 2.0:
-                                    is_distressed = True
-
-                            if operating_income < 0 or net_income < 0:
-                                is_distressed = True
-
-                            if is_distressed:
-                                distressed_count += 1
-                                distressed_companies.append(company_name)
-
-                except Exception as e:
-                    logger.warning(f"Failed to fetch affiliate financials: {e}")
-                    return {
-                        "total_affiliates": total_affiliates,
-                        "affiliate_ids": affiliate_ids,
-                        "distressed_affiliates": None,
-                        "distress_ratio": None,
-                        "risk_level": "unknown",
-                        "note": f"Error: {str(e)}"
-                    }
+    async def analyze_companies_risk(
+        self,
+        db: AsyncSession,
+        company_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 회사의 종합 위험도 일괄 분석
 
-            # 부실 비율 계산
-            distress_ratio = distressed_count / total_affiliates if total_affiliates > 0 else 0.0
+        그래프 패턴은 패턴마다 UNWIND Cypher 1회(회사 목록 전체)로 조회하고 동시에 실행한다.
+        재무 건전성/고위험 회사/계열사 재무는 AsyncSession 하나로 순차 조회한다.
 
-            # 위험도 평가
-            if distress_ratio >= 0.5:
-                risk_level = "critical"
-            elif distress_ratio >= 0.3:
-                risk_level = "high"
-            elif distress_ratio >= 0.1:
-                risk_level = "medium"
+        Returns:
+            {company_id: analyze_company_risk 결과}
+        """
+        ids = list(dict.fromkeys(str(cid) for cid in company_ids))
+        if not ids:
+            return {}
+
+        async def fetch_financials():
+            # AsyncSession 동시 사용 불가 → 이 코루틴 안에서만 순차 사용
+            health = {}
+            for cid in ids:
+                health[cid] = await self.metrics_calculator.analyze_company_health(db, cid)
+            high_risk_names = await self._fetch_high_risk_company_names(db)
+            return health, high_risk_names
+
+        (
+            circular,
+            cb_12m,
+            cb_6m,
+            concentration,
+            related,
+            movement,
+            investors,
+            affiliates,
+            (health, high_risk_names),
+        ) = await asyncio.gather(
+            self._fetch_circular_investments(ids),
+            self._fetch_cb_issuances(ids, 12),
+            self._fetch_cb_issuances(ids, 6),
+            self._fetch_officer_concentration(ids),
+            self._fetch_related_party(ids),
+            self._fetch_officer_movement(ids),
+            self._fetch_cb_investor_concentration(ids),
+            self._fetch_affiliate_ids(ids),
+            fetch_financials(),
+        )
+
+        # 계열사 재무 (배치 전체 계열사 1회 조회)
+        affiliate_financials = {}
+        affiliate_error = None
+        all_affiliate_ids = {aid for cid in ids for aid in affiliates[cid]}
+        if db and all_affiliate_ids:
+            try:
+                affiliate_financials = await self._fetch_affiliate_financials(db, all_affiliate_ids)
+            except Exception as e:
+                logger.warning(f"Failed to fetch affiliate financials: {e}")
+                affiliate_error = e
+
+        results = {}
+        for cid in ids:
+            if affiliate_error is not None and affiliates[cid]:
+                affiliate_chain = self._affiliate_chain_error(affiliates[cid], affiliate_error)
             else:
-                risk_level = "low"
-
-            return {
-                "total_affiliates": total_affiliates,
-                "distressed_affiliates": distressed_count,
-                "distressed_companies": distressed_companies[:5],  # 최대 5개
-                "distress_ratio": round(distress_ratio, 3),
-                "risk_level": risk_level
+                affiliate_chain = self._assess_affiliate_chain(affiliates[cid], affiliate_financials)
+
+            patterns = {
+                # 1. 순환 투자
+                "circular_investment": self._assess_circular_investment(circular[cid]),
+                # 2. 과도한 CB 발행
+                "excessive_cb": self._assess_excessive_cb(cb_12m[cid], 12),
+                # 3. 임원 집중도
+                "officer_concentration": self._assess_officer_concentration(concentration[cid]),
+                # 4. 재무 악화 + CB
+                "financial_distress_cb": self._assess_financial_distress(
+                    health[cid], self._assess_excessive_cb(cb_6m[cid], 6)
+                ),
+                # 5. 특수관계자 거래
+                "related_party_transactions": self._assess_related_party(related[cid]),
+                # 6. 임원 이동 패턴
+                "officer_movement": self._assess_officer_movement(movement[cid], high_risk_names),
+                # 7. CB 투자자 집중
+                "cb_investor_concentration": self._assess_cb_investor_concentration(investors[cid]),
+                # 8. 계열사 연쇄 부실
+                "affiliate_chain_risk": affiliate_chain,
             }
+            results[cid] = self._summarize(cid, patterns)
+
+        return results
 
     async def analyze_company_risk(
         self,
@@ -723,33 +962,12 @@ class RiskDetectionEngine:
                 }
             }
         """
-        patterns = {}
-
-        # 1. 순환 투자
-        patterns["circular_investment"] = await self.detect_circular_investment(company_id)
-
-        # 2. 과도한 CB 발행
-        patterns["excessive_cb"] = await self.detect_excessive_cb_issuance(company_id)
-
-        # 3. 임원 집중도
-        patterns["officer_concentration"] = await self.detect_officer_concentration(company_id)
-
-        # 4. 재무 악화 + CB
-        patterns["financial_distress_cb"] = await self.detect_financial_distress_with_cb(db, company_id)
-
-        # 5. 특수관계자 거래
-        patterns["related_party_transactions"] = await self.detect_related_party_transactions(company_id)
-
-        # 6. 임원 이동 패턴
-        patterns["officer_movement"] = await self.detect_officer_movement_pattern(company_id, db=db)
-
-        # 7. CB 투자자 집중
-        patterns["cb_investor_concentration"] = await self.detect_cb_investor_concentration(company_id)
-
-        # 8. 계열사 연쇄 부실
-        patterns["affiliate_chain_risk"] = await self.detect_affiliate_chain_risk(company_id, db=db)
+        results = await self.analyze_companies_risk(db, [company_id])
+        return results[str(company_id)]
 
-        # 종합 위험도 계산
+    @staticmethod
+    def _summarize(company_id: str, patterns: Dict[str, Any]) -> Dict[str, Any]:
+        """패턴별 위험도 → 종합 위험도"""
         risk_scores = {
             "high": 3,
             "medium": 2,
@@ -0,0 +1,87 @@
+"""
+Bulk Upsert (COPY)
+
+행 단위 INSERT ... ON CONFLICT 대신
+COPY로 임시 테이블에 적재 → INSERT ... SELECT ... ON CONFLICT 1회로 병합
+"""
+import logging
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 기본 갱신 제외 컬럼 (행 식별자/최초 생성 시각)
+_NEVER_UPDATED = ('id', 'created_at')
+
+
+async def copy_upsert(
+    conn,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+    conflict_columns: Sequence[str],
+    defaults: Optional[Mapping[str, str]] = None,
+    update_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    레코드 일괄 upsert
+
+    임시 테이블은 대상 테이블 컬럼 타입을 그대로 복사하므로, 레코드 값은
+    행 단위 INSERT 파라미터와 같은 Python 타입을 쓰면 된다.
+    같은 충돌 키가 여러 번 나오면 마지막 레코드를 사용한다 (행 단위 upsert 반복과 동일).
+
+    Args:
+        conn: asyncpg 커넥션 (트랜잭션 안이면 savepoint로 실행)
+        table: 대상 테이블
+        columns: 레코드 컬럼 순서
+        records: 레코드 (columns 순서의 튜플)
+        conflict_columns: ON CONFLICT 대상 (유니크 제약 컬럼)
+        defaults: 레코드에 없는 컬럼의 SQL 식 (예: {"id": "gen_random_uuid()", "created_at": "NOW()"})
+        update_columns: 충돌 시 EXCLUDED 값으로 갱신할 컬럼
+            (기본: 충돌 키/id/created_at 제외 전체, defaults 포함)
+
+    Returns:
+        int: upsert된 행 수
+    """
+    defaults = dict(defaults or {})
+    key_idx = [list(columns).index(col) for col in conflict_columns]
+
+    # 충돌 키 중복 제거 (한 INSERT에서 같은 행을 두 번 갱신할 수 없음)
+    deduped = {}
+    for record in records:
+        record = tuple(record)
+        deduped[tuple(record[i] for i in key_idx)] = record
+    if not deduped:
+        return 0
+
+    insert_columns = list(columns) + list(defaults)
+    if update_columns is None:
+        update_columns = [
+            col for col in insert_columns
+            if col not in conflict_columns and col not in _NEVER_UPDATED
+        ]
+
+    stage = f"_stage_{table}"
+    column_list = ', '.join(columns)
+    select_list = ', '.join(list(columns) + list(defaults.values()))
+    conflict_action = (
+        "DO UPDATE SET " + ', '.join(f"{col} = EXCLUDED.{col}" for col in update_columns)
+        if update_columns else "DO NOTHING"
+    )
+
+    async with conn.transaction():
+        await conn.execute(f"DROP TABLE IF EXISTS {stage}")
+        await conn.execute(f"""
+            CREATE TEMP TABLE {stage} ON COMMIT DROP AS
+            SELECT {column_list} FROM {table} WITH NO DATA
+        """)
+        await conn.copy_records_to_table(stage, records=list(deduped.values()), columns=list(columns))
+        status = await conn.execute(f"""
+            INSERT INTO {table} ({', '.join(insert_columns)})
+            SELECT {select_list} FROM {stage}
+            ON CONFLICT ({', '.join(conflict_columns)}) {conflict_action}
+        """)
+        await conn.execute(f"DROP TABLE {stage}")
+
+    count = int(status.split()[-1])
+    logger.debug(f"copy_upsert {table}: {count} rows")
+    return count
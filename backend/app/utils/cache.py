@@ -6,12 +6,506 @@ Railway 환경 최적화된 캐싱 전략
 import json
 import hashlib
 import logging
-from typing import Any, Optional, Callable
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Optional, Callable, Dict, Iterable, Tuple
 from functools import wraps
 from redis.asyncio import Redis
+from redis.client import NEVER_DECODE
+
+from app.config import settings
+from app.utils.cache_serializer import cache_serializer
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# Raw Value I/O
+# ============================================================================
+
+async def get_raw(redis: Redis, key: str) -> Optional[bytes]:
+    """
+    캐시 값을 bytes로 조회
+
+    공유 클라이언트는 decode_responses=True이지만 캐시 값은 바이너리
+    (cache_serializer 포맷)이므로 이 명령만 디코딩을 끈다.
+    """
+    return await redis.execute_command("GET", key, **{NEVER_DECODE: []})
+
+
+# ============================================================================
+# Single-Flight (동일 키 동시 계산 병합)
+# ============================================================================
+
+class SingleFlight:
+    """
+    동일 키에 대한 동시 캐시 미스를 하나의 계산으로 병합
+
+    - 프로세스 내: 첫 요청(leader)만 계산하고 나머지는 같은 Future를 대기
+    - 워커 간 (선택): Redis 락(SET NX PX)을 잡은 워커만 계산,
+      나머지는 캐시에 값이 채워질 때까지 폴링
+
+    Usage:
+        result = await single_flight.do(key, compute_fn)
+    """
+
+    LOCK_PREFIX = "lock:"
+    LOCK_TTL_MS = 30_000        # 계산이 죽어도 30초 후 락 자동 해제
+    LOCK_WAIT_SECONDS = 10.0    # 다른 워커 계산 대기 최대 시간
+    LOCK_POLL_INTERVAL = 0.05   # 캐시 폴링 간격
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            "leaders": 0,          # 실제 계산 수행
+            "coalesced": 0,        # 프로세스 내 대기 후 결과 재사용
+            "lock_acquired": 0,    # Redis 락 획득 후 계산
+            "lock_coalesced": 0,   # 다른 워커 계산 결과 재사용
+            "lock_timeouts": 0,    # 대기 시간 초과로 직접 계산
+        }
+
+    async def do(self, key: str, fn: Callable) -> Any:
+        """키별로 fn()을 한 번만 실행하고 결과를 동시 요청자에게 공유"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # leader가 취소된 경우 (대기자 자신이 취소된 것이 아니면) 재시도
+                if future.cancelled():
+                    return await self.do(key, fn)
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.stats["leaders"] += 1
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자 없을 때 "exception never retrieved" 경고 방지
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def do_with_lock(
+        self,
+        redis: Redis,
+        key: str,
+        fn: Callable,
+        read_cached: Callable,
+    ) -> Any:
+        """
+        Redis 락으로 워커 간 계산 병합
+
+        Args:
+            redis: Redis 클라이언트
+            key: 캐시 키
+            fn: 계산 + 캐시 저장 함수 (락 획득 시 실행)
+            read_cached: 캐시 조회 함수 (락 대기 중 폴링)
+        """
+        lock_key = f"{self.LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+
+        try:
+            acquired = await redis.set(lock_key, token, nx=True, px=self.LOCK_TTL_MS)
+        except Exception as e:
+            logger.warning(f"Cache lock error for {key}: {e}")
+            return await fn()
+
+        if acquired:
+            self.stats["lock_acquired"] += 1
+            try:
+                return await fn()
+            finally:
+                await self._release_lock(redis, lock_key, token)
+
+        # 다른 워커가 계산 중 → 캐시 채워질 때까지 대기
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.LOCK_WAIT_SECONDS
+        while loop.time() < deadline:
+            await asyncio.sleep(self.LOCK_POLL_INTERVAL)
+            cached = await read_cached()
+            if cached is not None:
+                self.stats["lock_coalesced"] += 1
+                return cached
+
+        self.stats["lock_timeouts"] += 1
+        logger.warning(f"Cache lock wait timeout for {key}, computing directly")
+        return await fn()
+
+    @staticmethod
+    async def _release_lock(redis: Redis, lock_key: str, token: str):
+        """본인이 잡은 락만 해제 (TTL 만료 후 다른 워커가 잡은 락 보호)"""
+        try:
+            if await redis.get(lock_key) == token:
+                await redis.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"Cache lock release error for {lock_key}: {e}")
+
+    def get_stats(self) -> dict:
+        """병합 통계"""
+        return {**self.stats, "inflight": len(self._inflight)}
+
+    def reset(self):
+        for name in self.stats:
+            self.stats[name] = 0
+
+
+# 싱글톤 인스턴스 (CacheManager, CacheService 공용)
+single_flight = SingleFlight()
+
+
+# ============================================================================
+# L1 Cache (프로세스 내 LRU, Redis L2 앞단)
+# ============================================================================
+
+class L1Cache:
+    """
+    프로세스 내 L1 캐시 (LRU + TTL + 바이트 한도)
+
+    Redis(L2)에서 읽은 값을 역직렬화된 상태로 보관하여 핫 키의
+    네트워크 왕복과 JSON 디코딩을 생략한다.
+
+    - TTL은 max_ttl로 상한 → pub/sub 무효화가 유실되어도 워커 간 불일치는 max_ttl 이내
+    - 크기는 Redis에 저장된 직렬화 바이트 수로 추정
+    - 반환 값은 캐시와 같은 객체이므로 호출자는 수정하지 말 것
+
+    Usage:
+        l1_cache.set(key, value, ttl=300, size=len(raw))
+        value = l1_cache.get(key)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        max_ttl: int = 60,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.max_ttl = max_ttl
+        # key -> (만료 시각(monotonic), 값, 바이트 크기)
+        self._data: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,      # 용량 초과로 밀려남
+            "expirations": 0,    # TTL 만료
+            "invalidations": 0,  # 명시적 삭제 / pub/sub 무효화
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료 시 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int, size: int):
+        """
+        값 저장
+
+        Args:
+            ttl: 원본 TTL (초, max_ttl로 상한)
+            size: 직렬화 크기 (바이트)
+        """
+        if key in self._data:
+            self._remove(key)
+
+        if ttl <= 0 or size > self.max_entry_bytes:
+            return
+
+        expires_at = time.monotonic() + min(ttl, self.max_ttl)
+        self._data[key] = (expires_at, value, size)
+        self._bytes += size
+
+        while self._data and (
+            len(self._data) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.stats["evictions"] += 1
+
+    def delete(self, *keys: str) -> int:
+        """키 삭제"""
+        deleted = 0
+        for key in keys:
+            if key in self._data:
+                self._remove(key)
+                deleted += 1
+        self.stats["invalidations"] += deleted
+        return deleted
+
+    def delete_pattern(self, pattern: str) -> int:
+        """glob 패턴 매칭 키 삭제 (Redis MATCH와 같은 문법)"""
+        return self.delete(*[key for key in self._data if fnmatchcase(key, pattern)])
+
+    def clear(self):
+        self._data.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str):
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def get_stats(self) -> dict:
+        """L1 통계"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def reset(self):
+        for name in self.stats:
+            self.stats[name] = 0
+
+
+class L2Stats:
+    """Redis(L2) 조회 통계 (L1 미스 후 조회만 집계)"""
+
+    def __init__(self):
+        self.stats = {"hits": 0, "misses": 0}
+
+    def record(self, hit: bool):
+        self.stats["hits" if hit else "misses"] += 1
+
+    def get_stats(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+    def reset(self):
+        for name in self.stats:
+            self.stats[name] = 0
+
+
+# 싱글톤 인스턴스 (CacheManager, CacheService 공용 - 키는 Redis 키 그대로 사용)
+l1_cache = L1Cache(
+    max_entries=settings.cache_l1_max_entries,
+    max_bytes=settings.cache_l1_max_bytes,
+    max_entry_bytes=settings.cache_l1_max_entry_bytes,
+    max_ttl=settings.cache_l1_max_ttl,
+)
+l2_stats = L2Stats()
+
+
+# ============================================================================
+# L1 Invalidation (Redis pub/sub으로 워커 간 전파)
+# ============================================================================
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# 자신이 보낸 메시지는 이미 로컬에서 삭제했으므로 무시
+_WORKER_ID = uuid.uuid4().hex
+_listener_task: Optional[asyncio.Task] = None
+
+
+def _evict_local(keys: Iterable[str] = (), patterns: Iterable[str] = ()) -> int:
+    evicted = l1_cache.delete(*keys)
+    for pattern in patterns:
+        evicted += l1_cache.delete_pattern(pattern)
+    return evicted
+
+
+async def publish_invalidation(
+    redis: Optional[Redis],
+    keys: Iterable[str] = (),
+    patterns: Iterable[str] = (),
+):
+    """
+    L1 무효화 (로컬 즉시 삭제 + 다른 워커에 전파)
+
+    Args:
+        redis: Redis 클라이언트 (None이면 로컬만 삭제)
+        keys: 삭제할 키
+        patterns: 삭제할 glob 패턴
+    """
+    keys, patterns = list(keys), list(patterns)
+    if not keys and not patterns:
+        return
+
+    _evict_local(keys, patterns)
+
+    if not redis:
+        return
+
+    try:
+        await redis.publish(
+            INVALIDATION_CHANNEL,
+            json.dumps({"origin": _WORKER_ID, "keys": keys, "patterns": patterns}),
+        )
+    except Exception as e:
+        # 전파 실패 시 다른 워커의 L1은 max_ttl 후 만료
+        logger.warning(f"Cache invalidation publish error: {e}")
+
+
+def _apply_invalidation(data: Any):
+    try:
+        message = json.loads(data)
+    except (TypeError, ValueError):
+        logger.warning(f"Malformed cache invalidation message: {data!r}")
+        return
+
+    if message.get("origin") == _WORKER_ID:
+        return
+
+    _evict_local(message.get("keys") or (), message.get("patterns") or ())
+
+
+async def _invalidation_listener(redis: Redis):
+    """무효화 채널 구독 루프 (연결 오류 시 재구독)"""
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            logger.info(f"Subscribed to {INVALIDATION_CHANNEL}")
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message and message.get("type") == "message":
+                    _apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 구독이 끊긴 동안의 메시지는 유실 → L1 전체 비움
+            l1_cache.clear()
+            logger.warning(f"Cache invalidation listener error: {e}. Resubscribing in 5s")
+            await asyncio.sleep(5)
+        finally:
+            try:
+                await pubsub.close()
+            except Exception:
+                pass
+
+
+def start_invalidation_listener(redis: Optional[Redis]):
+    """무효화 구독 시작 (init_db에서 호출)"""
+    global _listener_task
+    if not redis or (_listener_task and not _listener_task.done()):
+        return
+    _listener_task = asyncio.create_task(_invalidation_listener(redis))
+
+
+async def stop_invalidation_listener():
+    """무효화 구독 중지 (close_db에서 호출)"""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except asyncio.CancelledError:
+        pass
+    _listener_task = None
+    l1_cache.clear()
+
+
+# ============================================================================
+# Tag-based Invalidation (태그별 키 집합)
+# ============================================================================
+
+# 태그 → 캐시 키 집합 (Redis SET). 무효화 비용은 태그에 속한 키 수에만 비례
+# (SCAN처럼 전체 키스페이스를 훑지 않음)
+TAG_PREFIX = "cache:tag:"
+# 태그 집합 최소 유지 기간 (만료된 키가 남아도 무효화 시 DEL만 하므로 무해)
+TAG_INDEX_TTL = 7 * 24 * 60 * 60
+
+
+def company_tag(company_id: Any) -> str:
+    """기업 단위 무효화 태그"""
+    return f"company:{company_id}"
+
+
+async def add_tags(redis: Redis, tags: Iterable[str], *keys: str, ttl: int = 0):
+    """
+    키를 태그 집합에 등록
+
+    Args:
+        redis: Redis 클라이언트
+        tags: 태그 목록 (예: company_tag(id))
+        *keys: 등록할 캐시 키 (Redis 키 그대로)
+        ttl: 키 TTL (태그 집합 만료를 이보다 짧게 두지 않음)
+    """
+    tags = list(tags)
+    if not redis or not tags or not keys:
+        return
+
+    pipe = redis.pipeline(transaction=False)
+    for tag in tags:
+        tag_key = f"{TAG_PREFIX}{tag}"
+        pipe.sadd(tag_key, *keys)
+        pipe.expire(tag_key, max(ttl, TAG_INDEX_TTL))
+    await pipe.execute()
+
+
+async def invalidate_tags(redis: Redis, *tags: str) -> int:
+    """
+    태그에 속한 모든 키 삭제 (Redis + 모든 워커의 L1)
+
+    태그 집합은 MULTI로 읽고 지워, 무효화 도중 새로 등록된 키가
+    다음 무효화 대상에서 빠지지 않도록 한다.
+
+    Returns:
+        int: 삭제된 Redis 키 개수
+    """
+    if not redis or not tags:
+        return 0
+
+    tag_keys = [f"{TAG_PREFIX}{tag}" for tag in tags]
+    keys: set = set()
+    deleted = 0
+    try:
+        pipe = redis.pipeline(transaction=True)
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        pipe.delete(*tag_keys)
+        results = await pipe.execute()
+        for members in results[:-1]:
+            keys.update(members)
+
+        if keys:
+            deleted = await redis.delete(*keys)
+    except Exception as e:
+        logger.error(f"Cache tag invalidation error for {tags}: {e}")
+
+    await publish_invalidation(redis, keys=keys)
+    logger.debug(f"Invalidated tags {tags}: {deleted} keys")
+    return deleted
+
+
 # ============================================================================
 # Cache Manager Class (요구사항 패턴)
 # ============================================================================
@@ -39,14 +533,21 @@ class CacheManager:
     TTL_SEARCH_RESULTS = 1800     # 30분
 
     async def get(self, redis: Redis, key: str) -> Optional[Any]:
-        """캐시 조회"""
+        """캐시 조회 (L1 → Redis)"""
         if not redis:
             return None
 
+        value = l1_cache.get(key)
+        if value is not None:
+            return value
+
         try:
-            value = await redis.get(key)
-            if value:
-                return json.loads(value)
+            raw = await get_raw(redis, key)
+            l2_stats.record(bool(raw))
+            if raw:
+                value = cache_serializer.loads(raw)
+                l1_cache.set(key, value, l1_cache.max_ttl, len(raw))
+                return value
             return None
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
@@ -57,18 +558,18 @@ class CacheManager:
         redis: Redis,
         key: str,
         value: Any,
-        ttl: int
+        ttl: int,
+        tags: Iterable[str] = (),
     ):
-        """캐시 저장"""
+        """캐시 저장 (tags: invalidate()로 함께 삭제할 태그)"""
         if not redis:
             return
 
         try:
-            await redis.setex(
-                key,
-                ttl,
-                json.dumps(value, default=str)
-            )
+            serialized = cache_serializer.dumps(value)
+            await redis.setex(key, ttl, serialized)
+            await add_tags(redis, tags, key, ttl=ttl)
+            l1_cache.set(key, value, ttl, len(serialized))
             logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
@@ -78,11 +579,19 @@ class CacheManager:
         redis: Redis,
         key: str,
         compute_fn: Callable,
-        ttl: int
+        ttl: int,
+        single_flight_enabled: bool = True,
+        distributed_lock: bool = False,
+        tags: Iterable[str] = (),
     ) -> Any:
         """
         캐시 미스 시 계산
 
+        Args:
+            single_flight_enabled: 동시 미스를 프로세스 내에서 1회 계산으로 병합
+            distributed_lock: Redis 락으로 워커 간에도 1회 계산으로 병합
+            tags: 무효화 태그 (예: [company_tag(company_id)])
+
         Usage:
             result = await cache.get_or_compute(
                 redis,
@@ -97,31 +606,41 @@ class CacheManager:
             logger.debug(f"Cache hit: {key}")
             return cached
 
-        # 2. 계산
-        logger.debug(f"Cache miss: {key}, computing...")
-        result = await compute_fn() if callable(compute_fn) else compute_fn
+        async def compute_and_set():
+            # 2. 계산
+            logger.debug(f"Cache miss: {key}, computing...")
+            result = await compute_fn() if callable(compute_fn) else compute_fn
 
-        # 3. 캐시 저장
-        if result is not None:
-            await self.set(redis, key, result, ttl)
+            # 3. 캐시 저장
+            if result is not None:
+                await self.set(redis, key, result, ttl, tags=tags)
 
-        return result
+            return result
 
-    async def invalidate(self, redis: Redis, pattern: str):
-        """캐시 무효화"""
-        if not redis:
-            return
+        if not single_flight_enabled:
+            return await compute_and_set()
 
-        try:
-            keys = []
-            async for key in redis.scan_iter(match=pattern, count=100):
-                keys.append(key)
+        if distributed_lock and redis:
+            return await single_flight.do(
+                key,
+                lambda: single_flight.do_with_lock(
+                    redis, key, compute_and_set, lambda: self.get(redis, key)
+                ),
+            )
 
-            if keys:
-                await redis.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache keys matching {pattern}")
-        except Exception as e:
-            logger.error(f"Cache invalidation error for pattern {pattern}: {e}")
+        return await single_flight.do(key, compute_and_set)
+
+    async def invalidate(self, redis: Redis, *tags: str) -> int:
+        """
+        태그 단위 캐시 무효화 (O(태그에 속한 키 수))
+
+        Usage:
+            await cache.invalidate(redis, company_tag(company_id))
+        """
+        deleted = await invalidate_tags(redis, *tags)
+        if deleted:
+            logger.info(f"Invalidated {deleted} cache keys for tags {tags}")
+        return deleted
 
 
 # 싱글톤 인스턴스
@@ -212,7 +731,7 @@ def make_hash_key(prefix: str, data: dict) -> str:
 async def get_cached(
     redis: Redis,
     key: str,
-    deserializer: Callable = json.loads,
+    deserializer: Callable = cache_serializer.loads,
 ) -> Optional[Any]:
     """
     캐시에서 데이터 가져오기
@@ -220,7 +739,7 @@ async def get_cached(
     Args:
         redis: Redis 클라이언트
         key: 캐시 키
-        deserializer: 역직렬화 함수
+        deserializer: 역직렬화 함수 (bytes 입력, None이면 bytes 그대로 반환)
 
     Returns:
         캐시된 데이터 또는 None
@@ -229,7 +748,7 @@ async def get_cached(
         return None
 
     try:
-        data = await redis.get(key)
+        data = await get_raw(redis, key)
         if data:
             logger.debug(f"Cache hit: {key}")
             return deserializer(data) if deserializer else data
@@ -246,7 +765,8 @@ async def set_cached(
     key: str,
     value: Any,
     ttl: int,
-    serializer: Callable = json.dumps,
+    serializer: Callable = cache_serializer.dumps,
+    tags: Iterable[str] = (),
 ) -> bool:
     """
     캐시에 데이터 저장
@@ -257,6 +777,7 @@ async def set_cached(
         value: 저장할 데이터
         ttl: TTL (초)
         serializer: 직렬화 함수
+        tags: 무효화 태그 (invalidate_tags로 함께 삭제)
 
     Returns:
         bool: 성공 여부
@@ -267,6 +788,7 @@ async def set_cached(
     try:
         serialized = serializer(value) if serializer else value
         await redis.setex(key, ttl, serialized)
+        await add_tags(redis, tags, key, ttl=ttl)
         logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
         return True
     except Exception as e:
@@ -291,16 +813,21 @@ async def delete_cached(redis: Redis, *keys: str) -> int:
     try:
         deleted = await redis.delete(*keys)
         logger.debug(f"Cache deleted: {deleted} keys")
-        return deleted
     except Exception as e:
         logger.error(f"Cache delete error: {e}")
-        return 0
+        deleted = 0
+
+    await publish_invalidation(redis, keys=keys)
+    return deleted
 
 
 async def delete_pattern(redis: Redis, pattern: str) -> int:
     """
     패턴에 맞는 캐시 삭제
 
+    SCAN으로 전체 키스페이스를 훑으므로 운영/디버깅용으로만 사용한다.
+    기업 단위 무효화는 태그(invalidate_tags, invalidate_company_cache)를 사용할 것.
+
     Args:
         redis: Redis 클라이언트
         pattern: 패턴 (예: "company:*")
@@ -311,6 +838,7 @@ async def delete_pattern(redis: Redis, pattern: str) -> int:
     if not redis:
         return 0
 
+    deleted = 0
     try:
         keys = []
         async for key in redis.scan_iter(match=pattern, count=100):
@@ -319,11 +847,12 @@ async def delete_pattern(redis: Redis, pattern: str) -> int:
         if keys:
             deleted = await redis.delete(*keys)
             logger.info(f"Cache pattern deleted: {pattern} ({deleted} keys)")
-            return deleted
-        return 0
     except Exception as e:
         logger.error(f"Cache pattern delete error for {pattern}: {e}")
-        return 0
+
+    # Redis 삭제 실패 여부와 무관하게 L1은 비움
+    await publish_invalidation(redis, patterns=[pattern])
+    return deleted
 
 
 # ============================================================================
@@ -402,7 +931,9 @@ async def cache_company_info(
 ) -> bool:
     """기업 기본정보 캐싱"""
     key = make_cache_key("company", company_id)
-    return await set_cached(redis, key, data, CacheTTL.COMPANY_INFO)
+    return await set_cached(
+        redis, key, data, CacheTTL.COMPANY_INFO, tags=[company_tag(company_id)]
+    )
 
 
 async def get_cached_company_info(
@@ -421,7 +952,9 @@ async def cache_risk_score(
 ) -> bool:
     """리스크 점수 캐싱"""
     key = make_cache_key("risk", company_id)
-    return await set_cached(redis, key, risk_data, CacheTTL.RISK_SCORE)
+    return await set_cached(
+        redis, key, risk_data, CacheTTL.RISK_SCORE, tags=[company_tag(company_id)]
+    )
 
 
 async def get_cached_risk_score(
@@ -457,21 +990,15 @@ async def invalidate_company_cache(
     company_id: str,
 ) -> int:
     """
-    기업 관련 모든 캐시 무효화
+    기업 관련 모든 캐시 무효화 (Redis + 모든 워커의 L1)
+
+    company_tag(company_id) 태그로 저장된 키를 삭제한다
+    (기업 정보, 리스크 점수, 회사 상세, 위험도 분석, RaymondsIndex 등).
 
     Returns:
-        int: 삭제된 캐시 개수
+        int: 삭제된 Redis 키 개수
     """
-    patterns = [
-        f"company:{company_id}",
-        f"risk:{company_id}",
-        f"disclosure:{company_id}:*",
-    ]
-
-    total_deleted = 0
-    for pattern in patterns:
-        deleted = await delete_pattern(redis, pattern)
-        total_deleted += deleted
+    total_deleted = await invalidate_tags(redis, company_tag(company_id))
 
     logger.info(f"Invalidated {total_deleted} cache entries for company {company_id}")
     return total_deleted
@@ -492,8 +1019,10 @@ async def get_cache_stats(redis: Redis) -> dict:
             "hit_rate": 0.85,
         }
     """
+    tiers = {"l1": l1_cache.get_stats(), "l2": l2_stats.get_stats()}
+
     if not redis:
-        return {}
+        return {"tiers": tiers, "single_flight": single_flight.get_stats()}
 
     try:
         info = await redis.info("stats")
@@ -508,6 +1037,8 @@ async def get_cache_stats(redis: Redis) -> dict:
                 3
             ),
             "connected_clients": info.get("connected_clients", 0),
+            "tiers": tiers,
+            "single_flight": single_flight.get_stats(),
         }
     except Exception as e:
         logger.error(f"Failed to get cache stats: {e}")
@@ -515,20 +1046,33 @@ async def get_cache_stats(redis: Redis) -> dict:
 
 
 # ============================================================================
-# Cache Warming (선택사항)
+# Cache Warming
 # ============================================================================
 
-async def warm_cache(redis: Redis, popular_company_ids: list[str]):
+async def warm_cache(
+    redis: Redis,
+    popular_company_ids: Optional[list[str]] = None,
+    refresh: bool = False,
+) -> dict:
     """
-    인기 기업 캐시 워밍 (앱 시작시 실행)
+    인기 기업 캐시 워밍 (앱 시작 후, 배치 작업 후 실행)
+
+    실제 구현은 app.services.cache_warmer (엔드포인트 함수로 캐시를 채움)
 
     Args:
-        redis: Redis 클라이언트
-        popular_company_ids: 인기 기업 ID 리스트
+        redis: Redis 클라이언트 (None이면 스킵)
+        popular_company_ids: 워밍할 기업 ID 리스트 (None이면 조회 이력 상위 기업)
+        refresh: 기존 캐시를 지우고 다시 채움
     """
-    logger.info(f"Warming cache for {len(popular_company_ids)} companies...")
+    if not redis:
+        return {"companies": 0, "warmed": 0, "failed": 0}
+
+    from app.services.cache_warmer import warm_company_caches, warm_popular_companies
 
-    # TODO: 실제 데이터 로드 로직 구현
-    # 여기서는 플레이스홀더만 제공
+    if popular_company_ids is None:
+        return await warm_popular_companies(refresh=refresh)
 
-    logger.info("Cache warming completed")
+    logger.info(f"Warming cache for {len(popular_company_ids)} companies...")
+    stats = await warm_company_caches(popular_company_ids, refresh=refresh)
+    logger.info(f"Cache warming completed: {stats['warmed']}/{stats['companies']} companies")
+    return stats
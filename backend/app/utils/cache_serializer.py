@@ -0,0 +1,160 @@
+"""
+캐시 값 직렬화
+
+Redis에 저장되는 캐시 값의 포맷:
+
+    [헤더 1바이트][페이로드]
+
+    헤더 하위 4비트: 코덱 ID (1=json, 2=orjson, 3=msgpack)
+    헤더 0x10 비트: zlib 압축 여부
+
+헤더 값(0x01~0x03, 0x11~0x13)은 JSON 텍스트의 첫 글자가 될 수 없으므로,
+헤더가 없는 값은 이전 포맷(json.dumps 텍스트)으로 읽는다. 포맷/코덱을 바꿔도
+기존 캐시를 비울 필요 없이 워커별로 순차 배포할 수 있다.
+
+Usage:
+    from app.utils.cache_serializer import cache_serializer
+
+    data = cache_serializer.dumps(value)   # bytes
+    value = cache_serializer.loads(data)   # bytes 또는 이전 포맷 str
+"""
+import json
+import logging
+import zlib
+from typing import Any, Callable, Dict, Tuple, Union
+
+from app.config import settings
+
+# orjson: json 대비 인코딩/디코딩 수 배 빠름 (선택사항)
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+    orjson = None
+
+# msgpack: 바이너리 포맷, 숫자 위주 페이로드에서 크기 이점 (선택사항)
+try:
+    import msgpack
+    _msgpack_available = True
+except ImportError:
+    _msgpack_available = False
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+CODEC_JSON = 1
+CODEC_ORJSON = 2
+CODEC_MSGPACK = 3
+
+COMPRESSED_FLAG = 0x10
+_CODEC_MASK = 0x0F
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=str, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    # datetime/UUID는 orjson이 직접 처리, Decimal 등은 str로 변환 (json.dumps default=str와 동일)
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _orjson_loads(data: bytes) -> Any:
+    return orjson.loads(data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, default=str, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+# 코덱 ID → (이름, dumps, loads)
+_CODECS: Dict[int, Tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    CODEC_JSON: ("json", _json_dumps, _json_loads),
+}
+if _orjson_available:
+    _CODECS[CODEC_ORJSON] = ("orjson", _orjson_dumps, _orjson_loads)
+if _msgpack_available:
+    _CODECS[CODEC_MSGPACK] = ("msgpack", _msgpack_dumps, _msgpack_loads)
+
+_CODEC_IDS = {name: codec_id for codec_id, (name, _, _) in _CODECS.items()}
+
+
+class CacheSerializer:
+    """
+    버전 헤더 + 선택적 zlib 압축 직렬화기
+
+    Args:
+        codec: "orjson" | "msgpack" | "json" (미설치 시 json으로 대체)
+        compress_threshold: 이 크기(바이트) 이상이면 zlib 압축 (0이면 압축 안 함)
+        compress_level: zlib 압축 레벨 (1=빠름 ~ 9=작음)
+    """
+
+    def __init__(
+        self,
+        codec: str = "orjson",
+        compress_threshold: int = 4096,
+        compress_level: int = 1,
+    ):
+        if codec not in _CODEC_IDS:
+            logger.warning(f"Cache codec '{codec}' unavailable, falling back to json")
+            codec = "json"
+        self.codec = codec
+        self.codec_id = _CODEC_IDS[codec]
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def dumps(self, value: Any) -> bytes:
+        """값 → [헤더][페이로드]"""
+        _, encode, _ = _CODECS[self.codec_id]
+        payload = encode(value)
+        header = self.codec_id
+
+        if self.compress_threshold and len(payload) >= self.compress_threshold:
+            compressed = zlib.compress(payload, self.compress_level)
+            if len(compressed) < len(payload):
+                payload = compressed
+                header |= COMPRESSED_FLAG
+
+        return bytes((header,)) + payload
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        [헤더][페이로드] → 값
+
+        헤더가 없으면 이전 포맷(json 텍스트)으로 해석. 다른 워커가 다른 코덱으로
+        쓴 값도 헤더의 코덱 ID로 읽는다.
+        """
+        if isinstance(data, str):
+            return json.loads(data)
+
+        header = data[0] if data else 0
+        codec = _CODECS.get(header & _CODEC_MASK)
+        if codec is None or header & ~(_CODEC_MASK | COMPRESSED_FLAG):
+            return json.loads(data)
+
+        payload = data[1:]
+        if header & COMPRESSED_FLAG:
+            payload = zlib.decompress(payload)
+        return codec[2](payload)
+
+
+def available_codecs() -> list:
+    """현재 환경에서 사용 가능한 코덱 이름"""
+    return list(_CODEC_IDS)
+
+
+# 싱글톤 인스턴스 (CacheManager, CacheService 공용)
+cache_serializer = CacheSerializer(
+    codec=settings.cache_codec,
+    compress_threshold=settings.cache_compress_threshold,
+    compress_level=settings.cache_compress_level,
+)
@@ -11,6 +11,25 @@ from sqlalchemy.engine import Connection
 
 logger = logging.getLogger(__name__)
 
+# 현재 임원의 동일인(officers.person_id) 임원 레코드 전체
+# - 같은 사람이 보고서마다 별도 officers 행으로 존재하므로 officer_id 대신 person_key 기준 집계
+# - person_id 미지정 임원은 자기 ID가 person_key
+_COMPANY_OFFICERS_CTE = """
+            WITH company_persons AS (
+                SELECT DISTINCT COALESCE(o.person_id, o.id) AS person_key
+                FROM officer_positions op
+                JOIN officers o ON o.id = op.officer_id
+                WHERE op.company_id = :cid AND op.is_current = TRUE
+            ),
+            company_officers AS (
+                SELECT o.id AS officer_id, cp.person_key
+                FROM company_persons cp
+                JOIN officers o ON o.person_id = cp.person_key
+                UNION
+                SELECT cp.person_key AS officer_id, cp.person_key
+                FROM company_persons cp
+            )"""
+
 
 class OfficerFeatureExtractor:
     """임원 네트워크 피처 추출기 (10개 피처)"""
@@ -118,15 +137,10 @@ class OfficerFeatureExtractor:
     def _exec_other_companies(self, company_id: str) -> tuple:
         """E04, E05: 타사 재직 건수 (PostgreSQL fallback)"""
         # 해당 기업 임원들이 다른 기업에서 재직한 건수
-        result = self.conn.execute(text("""
-            WITH company_officers AS (
-                SELECT DISTINCT officer_id
-                FROM officer_positions
-                WHERE company_id = :cid AND is_current = TRUE
-            )
+        result = self.conn.execute(text(_COMPANY_OFFICERS_CTE + """
             SELECT
                 COUNT(DISTINCT op2.company_id) - 1 as total_other,  -- 자기 기업 제외
-                COUNT(DISTINCT co.officer_id) as officer_count
+                COUNT(DISTINCT co.person_key) as officer_count
             FROM company_officers co
             JOIN officer_positions op2 ON op2.officer_id = co.officer_id
         """), {'cid': company_id}).fetchone()
@@ -139,12 +153,7 @@ class OfficerFeatureExtractor:
 
     def _exec_delisted_connection(self, company_id: str) -> Optional[int]:
         """E06: 임원이 재직했던 상장폐지/거래정지 기업 수"""
-        result = self.conn.execute(text("""
-            WITH company_officers AS (
-                SELECT DISTINCT officer_id
-                FROM officer_positions
-                WHERE company_id = :cid AND is_current = TRUE
-            )
+        result = self.conn.execute(text(_COMPANY_OFFICERS_CTE + """
             SELECT COUNT(DISTINCT c.id)
             FROM company_officers co
             JOIN officer_positions op2 ON op2.officer_id = co.officer_id
@@ -156,12 +165,7 @@ class OfficerFeatureExtractor:
 
     def _exec_managed_connection(self, company_id: str) -> Optional[int]:
         """E07: 임원이 재직했던 관리종목 기업 수"""
-        result = self.conn.execute(text("""
-            WITH company_officers AS (
-                SELECT DISTINCT officer_id
-                FROM officer_positions
-                WHERE company_id = :cid AND is_current = TRUE
-            )
+        result = self.conn.execute(text(_COMPANY_OFFICERS_CTE + """
             SELECT COUNT(DISTINCT c.id)
             FROM company_officers co
             JOIN officer_positions op2 ON op2.officer_id = co.officer_id
@@ -173,13 +177,8 @@ class OfficerFeatureExtractor:
 
     def _exec_concurrent_positions(self, company_id: str) -> Optional[int]:
         """E08: 현재 타사 겸직 중인 임원 수"""
-        result = self.conn.execute(text("""
-            WITH company_officers AS (
-                SELECT DISTINCT officer_id
-                FROM officer_positions
-                WHERE company_id = :cid AND is_current = TRUE
-            )
-            SELECT COUNT(DISTINCT co.officer_id)
+        result = self.conn.execute(text(_COMPANY_OFFICERS_CTE + """
+            SELECT COUNT(DISTINCT co.person_key)
             FROM company_officers co
             WHERE EXISTS (
                 SELECT 1 FROM officer_positions op2
@@ -192,15 +191,10 @@ class OfficerFeatureExtractor:
 
     def _exec_network_density(self, company_id: str) -> Optional[float]:
         """E09: 네트워크 밀도 (근사치) = 연결된 고유 기업 수 / 가능한 최대 연결"""
-        result = self.conn.execute(text("""
-            WITH company_officers AS (
-                SELECT DISTINCT officer_id
-                FROM officer_positions
-                WHERE company_id = :cid AND is_current = TRUE
-            ),
+        result = self.conn.execute(text(_COMPANY_OFFICERS_CTE + """,
             connections AS (
                 SELECT COUNT(DISTINCT op2.company_id) - 1 as connected_companies,
-                       COUNT(DISTINCT co.officer_id) as officer_count
+                       COUNT(DISTINCT co.person_key) as officer_count
                 FROM company_officers co
                 JOIN officer_positions op2 ON op2.officer_id = co.officer_id
             )
@@ -215,18 +209,13 @@ class OfficerFeatureExtractor:
 
     def _exec_high_risk_ratio(self, company_id: str) -> Optional[float]:
         """E10: 고위험 임원 비율 (타사 5개사+ 재직)"""
-        result = self.conn.execute(text("""
-            WITH company_officers AS (
-                SELECT DISTINCT officer_id
-                FROM officer_positions
-                WHERE company_id = :cid AND is_current = TRUE
-            ),
+        result = self.conn.execute(text(_COMPANY_OFFICERS_CTE + """,
             officer_company_counts AS (
-                SELECT co.officer_id,
+                SELECT co.person_key,
                        COUNT(DISTINCT op2.company_id) - 1 as other_companies
                 FROM company_officers co
                 JOIN officer_positions op2 ON op2.officer_id = co.officer_id
-                GROUP BY co.officer_id
+                GROUP BY co.person_key
             )
             SELECT
                 COUNT(CASE WHEN other_companies >= 5 THEN 1 END)::float /
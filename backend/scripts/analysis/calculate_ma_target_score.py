@@ -39,6 +39,7 @@ from app.models.financial_snapshot import FinancialSnapshot
 from app.models.daily_stock_price import DailyStockPrice
 from app.models.financial_details import FinancialDetails
 from app.models.companies import Company
+from app.utils.bulk_upsert import copy_upsert
 
 logging.basicConfig(
     level=logging.INFO,
@@ -46,6 +47,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 일괄 저장 묶음 크기 (묶음마다 커밋, 실패 시 해당 묶음만 오류)
+SAVE_BATCH_SIZE = 500
+
+# financial_snapshots 저장 컬럼 (id, created_at 제외)
+SNAPSHOT_COLUMNS = [
+    "company_id", "snapshot_date", "close_price", "market_cap_krx",
+    "shares_outstanding", "market_cap_calculated",
+    "cash_and_equivalents", "short_term_investments", "total_liquid_assets",
+    "tangible_assets", "revenue", "operating_profit",
+    "tangible_assets_growth", "revenue_growth", "operating_profit_growth",
+    "ma_target_score", "ma_target_grade", "ma_target_factors", "fiscal_year",
+]
+
 
 class MATargetScoreCalculator:
     """M&A 타겟 점수 계산기"""
@@ -448,6 +462,8 @@ class MATargetScoreCalculator:
             stats["total_companies"] = len(companies)
             logger.info(f"대상 기업: {len(companies)}개 (종가 있는 기업)")
 
+            records: List[Dict[str, Any]] = []
+
             for company in companies:
                 company_id = str(company["company_id"])
                 company_name = company["name"]
@@ -525,59 +541,28 @@ class MATargetScoreCalculator:
                     stats["saved"] += 1
                     continue
 
-                # 저장 (UPSERT)
-                try:
-                    stmt = text("""
-                        INSERT INTO financial_snapshots (
-                            company_id, snapshot_date, close_price, market_cap_krx,
-                            shares_outstanding, market_cap_calculated,
-                            cash_and_equivalents, short_term_investments, total_liquid_assets,
-                            tangible_assets, revenue, operating_profit,
-                            tangible_assets_growth, revenue_growth, operating_profit_growth,
-                            ma_target_score, ma_target_grade, ma_target_factors, fiscal_year
-                        ) VALUES (
-                            :company_id, :snapshot_date, :close_price, :market_cap_krx,
-                            :shares_outstanding, :market_cap_calculated,
-                            :cash_and_equivalents, :short_term_investments, :total_liquid_assets,
-                            :tangible_assets, :revenue, :operating_profit,
-                            :tangible_assets_growth, :revenue_growth, :operating_profit_growth,
-                            :ma_target_score, :ma_target_grade, CAST(:ma_target_factors AS jsonb), :fiscal_year
-                        )
-                        ON CONFLICT (company_id, snapshot_date)
-                        DO UPDATE SET
-                            close_price = EXCLUDED.close_price,
-                            market_cap_krx = EXCLUDED.market_cap_krx,
-                            shares_outstanding = EXCLUDED.shares_outstanding,
-                            market_cap_calculated = EXCLUDED.market_cap_calculated,
-                            cash_and_equivalents = EXCLUDED.cash_and_equivalents,
-                            short_term_investments = EXCLUDED.short_term_investments,
-                            total_liquid_assets = EXCLUDED.total_liquid_assets,
-                            tangible_assets = EXCLUDED.tangible_assets,
-                            revenue = EXCLUDED.revenue,
-                            operating_profit = EXCLUDED.operating_profit,
-                            tangible_assets_growth = EXCLUDED.tangible_assets_growth,
-                            revenue_growth = EXCLUDED.revenue_growth,
-                            operating_profit_growth = EXCLUDED.operating_profit_growth,
-                            ma_target_score = EXCLUDED.ma_target_score,
-                            ma_target_grade = EXCLUDED.ma_target_grade,
-                            ma_target_factors = EXCLUDED.ma_target_factors,
-                            fiscal_year = EXCLUDED.fiscal_year
-                    """)
-                    await session.execute(stmt, record)
-                    stats["saved"] += 1
+                records.append(record)
 
-                    # 100건마다 커밋 (메모리/성능 최적화)
-                    if stats["saved"] % 100 == 0:
-                        await session.commit()
-                        logger.info(f"진행: {stats['saved']}/{len(companies)} 저장 완료")
+            # 일괄 저장 (SAVE_BATCH_SIZE건씩 COPY upsert, 세션 트랜잭션 안에서 실행 후 커밋)
+            for i in range(0, len(records), SAVE_BATCH_SIZE):
+                chunk = records[i:i + SAVE_BATCH_SIZE]
+                try:
+                    conn = await session.connection()
+                    raw_conn = await conn.get_raw_connection()
+                    stats["saved"] += await copy_upsert(
+                        raw_conn.driver_connection,
+                        "financial_snapshots",
+                        SNAPSHOT_COLUMNS,
+                        [tuple(r[col] for col in SNAPSHOT_COLUMNS) for r in chunk],
+                        conflict_columns=("company_id", "snapshot_date"),
+                    )
+                    await session.commit()
+                    logger.info(f"저장 진행: {stats['saved']}/{len(companies)}")
                 except Exception as e:
-                    logger.error(f"저장 실패 ({company_name}): {e}")
-                    stats["errors"] += 1
+                    logger.error(f"일괄 저장 실패 ({len(chunk)}건): {e}")
+                    stats["errors"] += len(chunk)
                     await session.rollback()
 
-            if not dry_run:
-                await session.commit()  # 남은 건 최종 커밋
-
         return stats
 
 
@@ -10,9 +10,14 @@ import asyncpg
 import json
 import logging
 import os
+import sys
 from datetime import date, datetime, timedelta
+from pathlib import Path
 import uuid
 
+# 프로젝트 루트 경로 추가 (app 모듈 import를 위해)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -453,6 +458,9 @@ async def calculate_risk_scores():
             saved = await insert_batch(conn, batch_data)
             stats['saved'] += saved
 
+        # 리스크 점수가 바뀐 회사의 종합보고서 스냅샷 무효화 + 재빌드
+        await refresh_report_snapshots(conn, [c['id'] for c in companies])
+
         after_count = await conn.fetchval("SELECT COUNT(*) FROM risk_scores")
 
         logger.info("\n" + "=" * 60)
@@ -479,6 +487,25 @@ async def calculate_risk_scores():
         await conn.close()
 
 
+async def refresh_report_snapshots(conn, company_ids):
+    """보고서 스냅샷 무효화 및 재빌드 (실패해도 점수 저장에는 영향 없음)"""
+    try:
+        from app.database import close_pg_pool
+        from app.services.company_report_snapshot import (
+            invalidate_company_reports,
+            rebuild_stale_company_reports,
+        )
+
+        invalidated = await invalidate_company_reports(conn, company_ids)
+        logger.info(f"보고서 스냅샷 무효화: {invalidated}건")
+        try:
+            await rebuild_stale_company_reports()
+        finally:
+            await close_pg_pool()
+    except Exception as e:
+        logger.warning(f"보고서 스냅샷 갱신 실패: {e}")
+
+
 async def insert_batch(conn, batch_data):
     """배치 삽입"""
     saved = 0
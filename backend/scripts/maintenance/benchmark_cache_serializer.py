@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+캐시 직렬화 포맷 벤치마크
+
+목적:
+- 실제 API 응답(그래프/랭킹)으로 코덱별 인코딩/디코딩 시간과 크기 비교
+- Redis 연결 시 MEMORY USAGE로 실제 저장 메모리 비교
+- app/utils/cache_serializer.py 설정(cache_codec, cache_compress_threshold) 결정용
+
+사용법:
+    # 실행 중인 API에서 그래프 응답 수집 후 비교
+    python -m scripts.maintenance.benchmark_cache_serializer \\
+        --api-url http://localhost:8000 --company-id <UUID> --company-id <UUID>
+
+    # 저장된 응답 파일로 비교 + Redis 메모리 측정
+    python -m scripts.maintenance.benchmark_cache_serializer \\
+        --file graph_samsung.json --file ranking.json --redis-url redis://localhost:6379
+
+    # 반복 횟수/압축 임계값 조정
+    python -m scripts.maintenance.benchmark_cache_serializer --file sample.json \\
+        --iterations 500 --threshold 0 --threshold 4096
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from app.utils.cache_serializer import CacheSerializer, available_codecs
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 기준선: 기존 캐시 경로 (json.dumps(default=str) 텍스트)
+BASELINE = "json-text"
+
+
+async def fetch_graph_samples(
+    api_url: str,
+    company_ids: List[str],
+    depth: int,
+) -> List[Tuple[str, Any]]:
+    """실행 중인 API에서 그래프 응답 수집"""
+    import httpx
+
+    samples = []
+    async with httpx.AsyncClient(base_url=api_url, timeout=60) as client:
+        for company_id in company_ids:
+            response = await client.get(
+                f"/api/graph/company/{company_id}", params={"depth": depth}
+            )
+            response.raise_for_status()
+            samples.append((f"graph:{company_id}", response.json()))
+            logger.info(f"수집: graph:{company_id} ({len(response.content):,} bytes)")
+    return samples
+
+
+def load_file_samples(paths: List[str]) -> List[Tuple[str, Any]]:
+    """JSON 파일 응답 로드"""
+    samples = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            samples.append((Path(path).name, json.load(f)))
+    return samples
+
+
+def build_codecs(thresholds: List[int]) -> Dict[str, Any]:
+    """비교 대상: (dumps, loads) 쌍"""
+    codecs = {
+        BASELINE: (
+            lambda v: json.dumps(v, default=str).encode("utf-8"),
+            json.loads,
+        ),
+    }
+    for codec in available_codecs():
+        for threshold in thresholds:
+            serializer = CacheSerializer(codec=codec, compress_threshold=threshold)
+            name = codec if not threshold else f"{codec}+zlib@{threshold}"
+            codecs[name] = (serializer.dumps, serializer.loads)
+    return codecs
+
+
+def time_per_op(fn, arg, iterations: int) -> float:
+    """1회 평균 소요 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(arg)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def redis_memory_usage(redis_url: str, key: str, data: bytes) -> Optional[int]:
+    """Redis에 저장 후 MEMORY USAGE (바이트), 측정 후 삭제"""
+    from redis.asyncio import Redis
+
+    client = Redis.from_url(redis_url)
+    try:
+        await client.set(key, data, ex=60)
+        return await client.memory_usage(key)
+    finally:
+        await client.delete(key)
+        await client.close()
+
+
+async def run_benchmark(
+    samples: List[Tuple[str, Any]],
+    thresholds: List[int],
+    iterations: int,
+    redis_url: Optional[str],
+) -> List[Dict[str, Any]]:
+    codecs = build_codecs(thresholds)
+    rows = []
+
+    for sample_name, value in samples:
+        for codec_name, (dumps, loads) in codecs.items():
+            data = dumps(value)
+            row = {
+                "sample": sample_name,
+                "codec": codec_name,
+                "bytes": len(data),
+                "encode_us": round(time_per_op(dumps, value, iterations), 1),
+                "decode_us": round(time_per_op(loads, data, iterations), 1),
+                "redis_bytes": None,
+            }
+            if redis_url:
+                row["redis_bytes"] = await redis_memory_usage(
+                    redis_url, f"benchmark:serializer:{codec_name}", data
+                )
+            rows.append(row)
+
+    return rows
+
+
+def print_report(rows: List[Dict[str, Any]]):
+    baselines = {r["sample"]: r for r in rows if r["codec"] == BASELINE}
+
+    print()
+    print(f"{'sample':<40} {'codec':<22} {'bytes':>10} {'size%':>7} "
+          f"{'enc(us)':>9} {'dec(us)':>9} {'redis':>10}")
+    print("-" * 112)
+    for row in rows:
+        base = baselines[row["sample"]]
+        size_pct = row["bytes"] / base["bytes"] * 100 if base["bytes"] else 0
+        redis_bytes = f"{row['redis_bytes']:,}" if row["redis_bytes"] is not None else "-"
+        print(
+            f"{row['sample'][:40]:<40} {row['codec']:<22} {row['bytes']:>10,} "
+            f"{size_pct:>6.1f}% {row['encode_us']:>9.1f} {row['decode_us']:>9.1f} {redis_bytes:>10}"
+        )
+    print()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='캐시 직렬화 포맷 벤치마크')
+    parser.add_argument('--api-url', help='그래프 응답 수집용 API 주소 (예: http://localhost:8000)')
+    parser.add_argument('--company-id', action='append', default=[], help='그래프 조회 회사 ID (반복 가능)')
+    parser.add_argument('--depth', type=int, default=2, help='그래프 탐색 깊이')
+    parser.add_argument('--file', action='append', default=[], help='응답 JSON 파일 (반복 가능)')
+    parser.add_argument('--threshold', type=int, action='append',
+                        help='zlib 압축 임계값 바이트 (반복 가능, 0=압축 안 함, 기본: 0, 4096)')
+    parser.add_argument('--iterations', type=int, default=200, help='측정 반복 횟수')
+    parser.add_argument('--redis-url', default=os.getenv('REDIS_URL'), help='메모리 측정용 Redis')
+    parser.add_argument('--format', choices=['text', 'json'], default='text', help='출력 형식')
+    args = parser.parse_args()
+
+    samples = load_file_samples(args.file)
+    if args.api_url and args.company_id:
+        samples += await fetch_graph_samples(args.api_url, args.company_id, args.depth)
+
+    if not samples:
+        parser.error("--file 또는 --api-url/--company-id로 샘플을 지정하세요")
+
+    rows = await run_benchmark(
+        samples,
+        thresholds=args.threshold or [0, 4096],
+        iterations=args.iterations,
+        redis_url=args.redis_url,
+    )
+
+    if args.format == 'json':
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    else:
+        print_report(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,7 +2,7 @@
 OfficerParser - DART 임원정보 파서
 
 검증된 v2.1 로직 재사용:
-- 동일인 식별 (name + birth_date)
+- 동일인 식별 (name + birth_date, 신규 임원은 officers.person_id 지정)
 - 경력 파싱 (前/現 패턴)
 - 재취임 감지 (appointment_number)
 - 시계열 임기 추적
@@ -43,6 +43,7 @@ class OfficerParser(BaseParser):
         self.company_cache = {}  # corp_code -> company_id
         self.company_market = {}  # corp_code -> market
         self.officer_cache = {}  # name_birthdate -> officer_id
+        self.new_officer_ids = []  # person_id 미지정 신규 임원 (save_to_db 끝에서 일괄 식별)
 
     async def load_companies(self, conn: asyncpg.Connection):
         """회사 정보 로드"""
@@ -379,6 +380,7 @@ class OfficerParser(BaseParser):
             )
             self.officer_cache[cache_key] = officer_id
             self.stats['records_created'] += 1
+            self.new_officer_ids.append(officer_id)
             return officer_id
         except asyncpg.UniqueViolationError:
             # 동시 삽입 충돌
@@ -603,4 +605,20 @@ class OfficerParser(BaseParser):
                 if success:
                     saved_count += 1
 
+        await self.resolve_new_identities(conn)
+
         return saved_count > 0
+
+    async def resolve_new_identities(self, conn: asyncpg.Connection):
+        """신규 임원 동일인 식별 (person_id 지정, 실패해도 파싱 결과에는 영향 없음)
+
+        실패한 임원은 person_id가 비어 있으므로 backfill_officer_identities로 보정된다.
+        """
+        if not self.new_officer_ids:
+            return
+        officer_ids, self.new_officer_ids = self.new_officer_ids, []
+        try:
+            from app.services.officer_identity import resolve_officer_identities
+            await resolve_officer_identities(conn, officer_ids=officer_ids)
+        except Exception as e:
+            logger.warning(f"임원 동일인 식별 실패 ({len(officer_ids)}명): {e}")
@@ -94,6 +94,9 @@ class DARTUnifiedParser:
         conn = await asyncpg.connect(self.database_url)
 
         try:
+            # 보고서 스냅샷 무효화 기준 시각 (DB 시각)
+            watermark = await conn.fetchval("SELECT NOW()")
+
             # 초기화
             await self.initialize(conn)
 
@@ -139,6 +142,10 @@ class DARTUnifiedParser:
                     logger.error(f"처리 오류 {zip_path.name}: {e}")
                     self.stats['errors'] += 1
 
+            # 변경된 회사의 종합보고서 스냅샷 무효화 (다음 조회 또는 파이프라인에서 재빌드)
+            if not dry_run:
+                await self._invalidate_report_snapshots(conn, watermark)
+
         finally:
             await conn.close()
 
@@ -157,6 +164,14 @@ class DARTUnifiedParser:
 
         return self.stats
 
+    async def _invalidate_report_snapshots(self, conn: asyncpg.Connection, since: datetime):
+        """파싱으로 변경된 회사의 보고서 스냅샷 무효화 (실패해도 파싱 결과에는 영향 없음)"""
+        try:
+            from app.services.company_report_snapshot import invalidate_company_reports_since
+            self.stats['snapshots_invalidated'] = await invalidate_company_reports_since(conn, since)
+        except Exception as e:
+            logger.warning(f"보고서 스냅샷 무효화 실패: {e}")
+
     async def parse_financial_only(
         self,
         target_years: Optional[List[int]] = None,
@@ -29,6 +29,7 @@ import asyncpg
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from app.services.financial_ratios_calculator import FinancialRatiosCalculator
+from app.utils.bulk_upsert import copy_upsert
 
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +37,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 일괄 저장 단위
+SAVE_BATCH_SIZE = 500
+
+# financial_ratios 저장 컬럼 (id, calculation_date, created_at 제외)
+FINANCIAL_RATIOS_COLUMNS = [
+    'company_id', 'fiscal_year', 'fiscal_quarter',
+    # 안정성
+    'current_ratio', 'quick_ratio', 'debt_ratio', 'equity_ratio',
+    'debt_dependency', 'non_current_ratio',
+    # 수익성
+    'operating_margin', 'net_profit_margin', 'roa', 'roe',
+    'gross_margin', 'ebitda_margin', 'ebitda',
+    # 성장성
+    'revenue_growth', 'operating_income_growth', 'net_income_growth',
+    'total_assets_growth', 'growth_data_available',
+    # 활동성
+    'asset_turnover', 'receivables_turnover', 'inventory_turnover',
+    'payables_turnover', 'receivables_days', 'inventory_days',
+    'payables_days', 'cash_conversion_cycle',
+    # 현금흐름
+    'ocf_ratio', 'ocf_interest_coverage', 'free_cash_flow', 'fcf_margin',
+    # 레버리지
+    'interest_coverage', 'ebitda_interest_coverage', 'net_debt_to_ebitda',
+    'financial_expense_ratio', 'total_borrowings', 'net_debt',
+    # 연속 적자/흑자
+    'consecutive_loss_quarters', 'consecutive_profit_quarters', 'is_loss_making',
+    # 카테고리 점수
+    'stability_score', 'profitability_score', 'growth_score',
+    'activity_score', 'cashflow_score', 'leverage_score',
+    # 종합
+    'financial_health_score', 'financial_health_grade', 'financial_risk_level',
+    # 메타
+    'data_completeness', 'calculation_notes',
+]
+
 
 class FinancialRatiosBatchCalculator:
     """재무비율 배치 계산기"""
@@ -77,7 +113,8 @@ class FinancialRatiosBatchCalculator:
             grouped = self._group_by_company_year(records)
             logger.info(f"회사-연도 조합: {len(grouped)}건")
 
-            # 3. 배치 계산
+            # 3. 배치 계산 (SAVE_BATCH_SIZE건씩 일괄 저장)
+            pending: List[Dict] = []
             for idx, ((company_id, fiscal_year), current_data) in enumerate(grouped.items(), 1):
                 try:
                     # 전년도 데이터 조회 (성장성 계산용)
@@ -94,10 +131,13 @@ class FinancialRatiosBatchCalculator:
                     )
 
                     # 저장
-                    if not dry_run:
-                        await self._save_result(pool, result)
-
-                    self.stats['success'] += 1
+                    if dry_run:
+                        self.stats['success'] += 1
+                    else:
+                        pending.append(self.calculator.result_to_dict(result))
+                        if len(pending) >= SAVE_BATCH_SIZE:
+                            await self._save_results(pool, pending)
+                            pending = []
 
                     if idx % 100 == 0:
                         logger.info(f"진행: {idx}/{len(grouped)} ({idx/len(grouped)*100:.1f}%)")
@@ -108,6 +148,9 @@ class FinancialRatiosBatchCalculator:
 
                 self.stats['total_processed'] += 1
 
+            if pending:
+                await self._save_results(pool, pending)
+
             # 4. 결과 보고
             self._print_summary()
 
@@ -215,175 +258,31 @@ class FinancialRatiosBatchCalculator:
             row = await conn.fetchrow(query, company_id, fiscal_year - 1)
             return dict(row) if row else None
 
-    async def _save_result(self, pool: asyncpg.Pool, result):
-        """계산 결과 저장 (UPSERT)"""
-        data = self.calculator.result_to_dict(result)
+    async def _save_results(self, pool: asyncpg.Pool, results: List[Dict]):
+        """계산 결과 일괄 저장 (COPY upsert)
 
-        query = """
-            INSERT INTO financial_ratios (
-                id, company_id, fiscal_year, fiscal_quarter, calculation_date,
-                -- 안정성
-                current_ratio, quick_ratio, debt_ratio, equity_ratio,
-                debt_dependency, non_current_ratio,
-                -- 수익성
-                operating_margin, net_profit_margin, roa, roe,
-                gross_margin, ebitda_margin, ebitda,
-                -- 성장성
-                revenue_growth, operating_income_growth, net_income_growth,
-                total_assets_growth, growth_data_available,
-                -- 활동성
-                asset_turnover, receivables_turnover, inventory_turnover,
-                payables_turnover, receivables_days, inventory_days,
-                payables_days, cash_conversion_cycle,
-                -- 현금흐름
-                ocf_ratio, ocf_interest_coverage, free_cash_flow, fcf_margin,
-                -- 레버리지
-                interest_coverage, ebitda_interest_coverage, net_debt_to_ebitda,
-                financial_expense_ratio, total_borrowings, net_debt,
-                -- 연속 적자/흑자
-                consecutive_loss_quarters, consecutive_profit_quarters, is_loss_making,
-                -- 카테고리 점수
-                stability_score, profitability_score, growth_score,
-                activity_score, cashflow_score, leverage_score,
-                -- 종합
-                financial_health_score, financial_health_grade, financial_risk_level,
-                -- 메타
-                data_completeness, calculation_notes, created_at
-            ) VALUES (
-                gen_random_uuid(), $1, $2, $3, NOW(),
-                $4, $5, $6, $7, $8, $9,
-                $10, $11, $12, $13, $14, $15, $16,
-                $17, $18, $19, $20, $21,
-                $22, $23, $24, $25, $26, $27, $28, $29,
-                $30, $31, $32, $33,
-                $34, $35, $36, $37, $38, $39,
-                $40, $41, $42,
-                $43, $44, $45, $46, $47, $48,
-                $49, $50, $51,
-                $52, $53, NOW()
-            )
-            ON CONFLICT (company_id, fiscal_year, fiscal_quarter)
-            DO UPDATE SET
-                calculation_date = NOW(),
-                current_ratio = EXCLUDED.current_ratio,
-                quick_ratio = EXCLUDED.quick_ratio,
-                debt_ratio = EXCLUDED.debt_ratio,
-                equity_ratio = EXCLUDED.equity_ratio,
-                debt_dependency = EXCLUDED.debt_dependency,
-                non_current_ratio = EXCLUDED.non_current_ratio,
-                operating_margin = EXCLUDED.operating_margin,
-                net_profit_margin = EXCLUDED.net_profit_margin,
-                roa = EXCLUDED.roa,
-                roe = EXCLUDED.roe,
-                gross_margin = EXCLUDED.gross_margin,
-                ebitda_margin = EXCLUDED.ebitda_margin,
-                ebitda = EXCLUDED.ebitda,
-                revenue_growth = EXCLUDED.revenue_growth,
-                operating_income_growth = EXCLUDED.operating_income_growth,
-                net_income_growth = EXCLUDED.net_income_growth,
-                total_assets_growth = EXCLUDED.total_assets_growth,
-                growth_data_available = EXCLUDED.growth_data_available,
-                asset_turnover = EXCLUDED.asset_turnover,
-                receivables_turnover = EXCLUDED.receivables_turnover,
-                inventory_turnover = EXCLUDED.inventory_turnover,
-                payables_turnover = EXCLUDED.payables_turnover,
-                receivables_days = EXCLUDED.receivables_days,
-                inventory_days = EXCLUDED.inventory_days,
-                payables_days = EXCLUDED.payables_days,
-                cash_conversion_cycle = EXCLUDED.cash_conversion_cycle,
-                ocf_ratio = EXCLUDED.ocf_ratio,
-                ocf_interest_coverage = EXCLUDED.ocf_interest_coverage,
-                free_cash_flow = EXCLUDED.free_cash_flow,
-                fcf_margin = EXCLUDED.fcf_margin,
-                interest_coverage = EXCLUDED.interest_coverage,
-                ebitda_interest_coverage = EXCLUDED.ebitda_interest_coverage,
-                net_debt_to_ebitda = EXCLUDED.net_debt_to_ebitda,
-                financial_expense_ratio = EXCLUDED.financial_expense_ratio,
-                total_borrowings = EXCLUDED.total_borrowings,
-                net_debt = EXCLUDED.net_debt,
-                consecutive_loss_quarters = EXCLUDED.consecutive_loss_quarters,
-                consecutive_profit_quarters = EXCLUDED.consecutive_profit_quarters,
-                is_loss_making = EXCLUDED.is_loss_making,
-                stability_score = EXCLUDED.stability_score,
-                profitability_score = EXCLUDED.profitability_score,
-                growth_score = EXCLUDED.growth_score,
-                activity_score = EXCLUDED.activity_score,
-                cashflow_score = EXCLUDED.cashflow_score,
-                leverage_score = EXCLUDED.leverage_score,
-                financial_health_score = EXCLUDED.financial_health_score,
-                financial_health_grade = EXCLUDED.financial_health_grade,
-                financial_risk_level = EXCLUDED.financial_risk_level,
-                data_completeness = EXCLUDED.data_completeness,
-                calculation_notes = EXCLUDED.calculation_notes
+        저장 실패 시 해당 묶음 전체를 오류로 집계합니다.
         """
+        records = [
+            tuple(data[col] for col in FINANCIAL_RATIOS_COLUMNS)
+            for data in results
+        ]
 
-        async with pool.acquire() as conn:
-            await conn.execute(
-                query,
-                data['company_id'],
-                data['fiscal_year'],
-                data['fiscal_quarter'],
-                # 안정성
-                data['current_ratio'],
-                data['quick_ratio'],
-                data['debt_ratio'],
-                data['equity_ratio'],
-                data['debt_dependency'],
-                data['non_current_ratio'],
-                # 수익성
-                data['operating_margin'],
-                data['net_profit_margin'],
-                data['roa'],
-                data['roe'],
-                data['gross_margin'],
-                data['ebitda_margin'],
-                data['ebitda'],
-                # 성장성
-                data['revenue_growth'],
-                data['operating_income_growth'],
-                data['net_income_growth'],
-                data['total_assets_growth'],
-                data['growth_data_available'],
-                # 활동성
-                data['asset_turnover'],
-                data['receivables_turnover'],
-                data['inventory_turnover'],
-                data['payables_turnover'],
-                data['receivables_days'],
-                data['inventory_days'],
-                data['payables_days'],
-                data['cash_conversion_cycle'],
-                # 현금흐름
-                data['ocf_ratio'],
-                data['ocf_interest_coverage'],
-                data['free_cash_flow'],
-                data['fcf_margin'],
-                # 레버리지
-                data['interest_coverage'],
-                data['ebitda_interest_coverage'],
-                data['net_debt_to_ebitda'],
-                data['financial_expense_ratio'],
-                data['total_borrowings'],
-                data['net_debt'],
-                # 연속
-                data['consecutive_loss_quarters'],
-                data['consecutive_profit_quarters'],
-                data['is_loss_making'],
-                # 카테고리 점수
-                data['stability_score'],
-                data['profitability_score'],
-                data['growth_score'],
-                data['activity_score'],
-                data['cashflow_score'],
-                data['leverage_score'],
-                # 종합
-                data['financial_health_score'],
-                data['financial_health_grade'],
-                data['financial_risk_level'],
-                # 메타
-                data['data_completeness'],
-                data['calculation_notes'],
-            )
+        try:
+            async with pool.acquire() as conn:
+                await copy_upsert(
+                    conn, 'financial_ratios', FINANCIAL_RATIOS_COLUMNS, records,
+                    conflict_columns=('company_id', 'fiscal_year', 'fiscal_quarter'),
+                    defaults={
+                        'id': 'gen_random_uuid()',
+                        'calculation_date': 'NOW()',
+                        'created_at': 'NOW()',
+                    },
+                )
+            self.stats['success'] += len(results)
+        except Exception as e:
+            logger.error(f"일괄 저장 오류 ({len(results)}건): {e}")
+            self.stats['errors'] += len(results)
 
     def _print_summary(self):
         """결과 요약 출력"""
@@ -14,25 +14,42 @@ RaymondsIndex 계산 (v2.1 통합)
     python -m scripts.pipeline.calculate_index --year 2025
     python -m scripts.pipeline.calculate_index --year 2025 --sample 100
     python -m scripts.pipeline.calculate_index --year 2025 --version 3.0
+    python -m scripts.pipeline.calculate_index --year 2025 --batch
+    python -m scripts.pipeline.calculate_index --year 2025 --workers 8 --batch
+    python -m scripts.pipeline.calculate_index --year 2025 --incremental --dry-run
+    python -m scripts.pipeline.calculate_index --year 2025 --since 2026-10-01T00:00:00+09:00
     python -m scripts.pipeline.calculate_index --stats
 
 옵션:
     --year: 대상 연도 (해당 연도 재무 데이터 기준)
     --sample: 샘플 개수 (테스트용)
     --version: 알고리즘 버전 (2.1 또는 3.0, 기본값: 2.1)
+    --batch: 배치 모드 (v2.1) - 재무 데이터 1회 조회 + NumPy 일괄 계산 + COPY 일괄 저장
+             (v3.0은 --workers와 함께 사용 시 청크별 calculate_batch)
+    --workers: 프로세스 풀 병렬 모드 - 회사를 N개 워커로 분할, 워커별 DB 연결로
+               조회 → 계산 → 저장을 청크 단위 파이프라인으로 실행 (--batch와 함께 사용 가능)
+    --incremental: 마지막 재계산 이후 입력 구간(대상 연도 포함 3개년, v3.0은 대상 연도 이하)의
+                   financial_details가 변경된 회사만 재계산 (워터마크 없으면 전체 재계산)
+                   워터마크는 버전 × --year별로 저장되며, 같은 범위의 전체/증분 실행만 전진시킴
+    --since: 지정 시각 이후 변경된 회사만 재계산 (ISO 8601, --incremental 워터마크 대신 사용,
+             워터마크는 갱신하지 않음)
+    --dry-run: 계산 없이 재계산 대상 회사 목록만 출력
     --stats: 계산 없이 현재 통계만 출력
 """
 
 import argparse
 import asyncio
 import logging
+import multiprocessing
 import os
 import sys
+import time
 import json
 from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 
 import asyncpg
 
@@ -40,6 +57,8 @@ import asyncpg
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.services.raymonds_index_calculator import RaymondsIndexCalculator as ProperCalculator
+from app.services.raymonds_index_batch import FinancialPanel, RaymondsIndexBatchCalculator
+from app.utils.bulk_upsert import copy_upsert
 
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +66,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# v2.1 계산용 재무 항목 (회사별 조회 / 배치 조회 공용)
+FINANCIAL_COLUMNS = """
+    fiscal_year, fiscal_quarter, fs_type,
+    -- 재무상태표
+    cash_and_equivalents, short_term_investments, trade_and_other_receivables,
+    inventories, tangible_assets, intangible_assets,
+    total_assets, current_liabilities, non_current_liabilities,
+    total_liabilities, total_equity,
+    -- 재무상태표 (투자괴리율 v2용)
+    right_of_use_assets, investments_in_associates,
+    fvpl_financial_assets, other_financial_assets_non_current,
+    -- 손익계산서
+    revenue, cost_of_sales, selling_admin_expenses,
+    operating_income, net_income,
+    -- 현금흐름표
+    operating_cash_flow, investing_cash_flow, financing_cash_flow,
+    capex, intangible_acquisition, dividend_paid,
+    treasury_stock_acquisition, stock_issuance, bond_issuance
+"""
+
+# v3.0 계산용 재무 항목 (최근 5개 행)
+V3_FINANCIAL_COLUMNS = """
+    fiscal_year, revenue, operating_income, net_income,
+    total_assets, total_liabilities, total_equity,
+    operating_cash_flow, investing_cash_flow, financing_cash_flow,
+    capex, r_and_d_expense, dividend_paid,
+    cash_and_equivalents, short_term_investments, tangible_assets
+"""
+
+V3_UPSERT_SQL = """
+    INSERT INTO raymonds_index_v3 (
+        id, company_id, fiscal_year, total_score, grade,
+        cei_score, rii_score, cgi_score, mai_score,
+        investment_gap, cash_cagr, capex_growth,
+        asset_turnover, reinvestment_rate,
+        algorithm_version, data_quality_score, calculation_date
+    )
+    VALUES (
+        gen_random_uuid(), $1, $2, $3, $4,
+        $5, $6, $7, $8,
+        $9, $10, $11,
+        $12, $13,
+        $14, $15, CURRENT_DATE
+    )
+    ON CONFLICT (company_id, fiscal_year)
+    DO UPDATE SET
+        total_score = $3, grade = $4,
+        cei_score = $5, rii_score = $6, cgi_score = $7, mai_score = $8,
+        investment_gap = $9, cash_cagr = $10, capex_growth = $11,
+        asset_turnover = $12, reinvestment_rate = $13,
+        algorithm_version = $14, data_quality_score = $15,
+        calculation_date = CURRENT_DATE
+"""
+
+# raymonds_index_v3 저장 컬럼 (id, calculation_date 제외, _v3_record 순서)
+V3_COLUMNS = [
+    'company_id', 'fiscal_year', 'total_score', 'grade',
+    'cei_score', 'rii_score', 'cgi_score', 'mai_score',
+    'investment_gap', 'cash_cagr', 'capex_growth',
+    'asset_turnover', 'reinvestment_rate',
+    'algorithm_version', 'data_quality_score',
+]
+
+# 병렬 모드 청크 크기 (워커 내부 파이프라인 단위) / 단계 간 대기 청크 수
+WORKER_CHUNK_SIZE = 200
+PIPELINE_DEPTH = 2
+
+# raymonds_index 저장 컬럼 (id, created_at 제외, _result_record 순서)
+RAYMONDS_INDEX_COLUMNS = [
+    'company_id', 'calculation_date', 'fiscal_year',
+    'total_score', 'grade',
+    'cei_score', 'rii_score', 'cgi_score', 'mai_score',
+    'investment_gap', 'cash_cagr', 'capex_growth', 'idle_cash_ratio',
+    'asset_turnover', 'reinvestment_rate', 'shareholder_return',
+    'cash_tangible_ratio', 'fundraising_utilization', 'short_term_ratio',
+    'capex_trend', 'roic', 'capex_cv', 'violation_count',
+    'investment_gap_v2', 'investment_gap_v21', 'investment_gap_v21_flag',
+    'cash_utilization', 'industry_sector', 'weight_adjustment',
+    'tangible_efficiency', 'cash_yield', 'debt_to_ebitda', 'growth_investment_ratio',
+    'red_flags', 'yellow_flags',
+    'verdict', 'key_risk', 'recommendation', 'watch_trigger',
+    'data_quality_score',
+]
+
 
 class RaymondsIndexPipelineCalculator:
     """RaymondsIndex 파이프라인 계산기
@@ -86,7 +189,12 @@ class RaymondsIndexPipelineCalculator:
     async def calculate(
         self,
         year: Optional[int] = None,
-        sample: Optional[int] = None
+        sample: Optional[int] = None,
+        batch: bool = False,
+        workers: Optional[int] = None,
+        since: Optional[datetime] = None,
+        incremental: bool = False,
+        dry_run: bool = False
     ) -> Dict[str, Any]:
         """RaymondsIndex 계산
 
@@ -95,6 +203,11 @@ class RaymondsIndexPipelineCalculator:
         Args:
             year: 대상 연도
             sample: 샘플 개수
+            batch: 배치 모드 (결과는 회사별 계산과 동일, v3.0은 workers 지정 시에만)
+            workers: 프로세스 풀 워커 수 (지정 시 병렬 모드)
+            since: 이 시각 이후 financial_details가 변경된 회사만 계산
+            incremental: since 미지정 시 저장된 워터마크(raymonds_index_calc_state, 버전 × 연도별) 사용
+            dry_run: 계산 없이 대상 회사 목록만 반환
 
         Returns:
             계산 결과 통계
@@ -104,6 +217,16 @@ class RaymondsIndexPipelineCalculator:
         conn = await asyncpg.connect(self.database_url)
 
         try:
+            # 이번 실행 기준 시각 (대상 조회 전 DB 시각 → 다음 증분 재계산 워터마크)
+            run_watermark = await conn.fetchval("SELECT NOW()")
+            # --since 지정 실행은 일부 회사만 계산하므로 워터마크를 전진시키지 않음
+            explicit_since = since is not None
+
+            if incremental and since is None:
+                since = await self._get_watermark(conn, year)
+                if since is None:
+                    logger.info("저장된 워터마크 없음 - 전체 재계산")
+
             # 계산 대상 회사 조회 (SPAC/REIT/ETF 제외)
             query = """
                 SELECT DISTINCT c.id, c.name, c.ticker
@@ -118,6 +241,11 @@ class RaymondsIndexPipelineCalculator:
                 query += " AND fd.fiscal_year = $1"
                 params.append(year)
 
+            if since is not None:
+                params.append(since)
+                query += f" AND c.id IN ({self._changed_companies_sql(len(params), year)})"
+                logger.info(f"증분 재계산: {since} 이후 재무 데이터 변경 회사")
+
             query += " ORDER BY c.name"
 
             if sample:
@@ -126,6 +254,20 @@ class RaymondsIndexPipelineCalculator:
             companies = await conn.fetch(query, *params)
             logger.info(f"계산 대상: {len(companies)}개 회사")
 
+            if dry_run:
+                logger.info("[DRY-RUN] 재계산 대상 회사:")
+                for company in companies:
+                    logger.info(f"  - {company['name']} ({company['ticker'] or '-'})")
+                return {
+                    'dry_run': True,
+                    'since': since,
+                    'total': len(companies),
+                    'companies': [
+                        {'id': str(c['id']), 'name': c['name'], 'ticker': c['ticker']}
+                        for c in companies
+                    ],
+                }
+
             stats = {
                 'started_at': datetime.now(),
                 'total': len(companies),
@@ -135,36 +277,51 @@ class RaymondsIndexPipelineCalculator:
                 'grade_distribution': {},
             }
 
-            for i, company in enumerate(companies):
-                if (i + 1) % 100 == 0:
-                    logger.info(f"진행: {i+1}/{len(companies)}")
-
-                try:
-                    # company_id를 문자열로 변환 (asyncpg UUID 호환)
-                    company_id_str = str(company['id'])
-
-                    # 버전에 따라 다른 계산기 사용
-                    if self.version == '3.0' and self._v3_calculator:
-                        result = await self._calculate_v3(
-                            conn, company_id_str, company['name'], year
-                        )
-                    else:
-                        result = await self._calculate_for_company(
-                            conn, company_id_str, company['name'], year
-                        )
-
-                    if result:
-                        stats['calculated'] += 1
-                        grade = result.get('grade', 'N/A')
-                        stats['grade_distribution'][grade] = \
-                            stats['grade_distribution'].get(grade, 0) + 1
-                    else:
-                        stats['skipped'] += 1
-
-                except Exception as e:
-                    logger.error(f"계산 오류 {company['name']}: {e}")
-                    stats['errors'] += 1
-
+            if batch and self.version != '2.1' and not workers:
+                logger.warning(f"v{self.version} 배치 계산은 --workers 모드에서만 지원합니다 - 회사별 계산으로 진행")
+                batch = False
+
+            if workers:
+                await self._calculate_parallel([c['id'] for c in companies], year, batch, workers, stats)
+            elif batch:
+                await self._calculate_batch(conn, [c['id'] for c in companies], year, stats)
+            else:
+                for i, company in enumerate(companies):
+                    if (i + 1) % 100 == 0:
+                        logger.info(f"진행: {i+1}/{len(companies)}")
+
+                    try:
+                        # company_id를 문자열로 변환 (asyncpg UUID 호환)
+                        company_id_str = str(company['id'])
+
+                        # 버전에 따라 다른 계산기 사용
+                        if self.version == '3.0' and self._v3_calculator:
+                            result = await self._calculate_v3(
+                                conn, company_id_str, company['name'], year
+                            )
+                        else:
+                            result = await self._calculate_for_company(
+                                conn, company_id_str, company['name'], year
+                            )
+
+                        if result:
+                            stats['calculated'] += 1
+                            grade = result.get('grade', 'N/A')
+                            stats['grade_distribution'][grade] = \
+                                stats['grade_distribution'].get(grade, 0) + 1
+                        else:
+                            stats['skipped'] += 1
+
+                    except Exception as e:
+                        logger.error(f"계산 오류 {company['name']}: {e}")
+                        stats['errors'] += 1
+
+            # 같은 연도 범위의 전체/증분 대상을 오류 없이 처리한 경우에만 워터마크 전진
+            # (실패 회사는 다음 증분에 재시도)
+            if not sample and not explicit_since and stats['errors'] == 0:
+                await self._save_watermark(conn, year, run_watermark, stats['calculated'])
+
+            stats['since'] = since
             stats['finished_at'] = datetime.now()
             stats['duration'] = (stats['finished_at'] - stats['started_at']).total_seconds()
 
@@ -174,6 +331,14 @@ class RaymondsIndexPipelineCalculator:
             logger.info(f"  - 계산: {stats['calculated']}개")
             logger.info(f"  - 스킵: {stats['skipped']}개")
             logger.info(f"  - 오류: {stats['errors']}개")
+            if stats['duration'] > 0:
+                logger.info(f"  - 처리량: {stats['calculated'] / stats['duration']:.1f}개/초")
+            if stats.get('stage_seconds'):
+                stages = stats['stage_seconds']
+                logger.info(
+                    f"  - 단계별 시간 (워커 합계): 조회 {stages['fetch']:.1f}초 / "
+                    f"계산 {stages['compute']:.1f}초 / 저장 {stages['save']:.1f}초"
+                )
             logger.info(f"\n등급 분포:")
             for grade, count in sorted(stats['grade_distribution'].items()):
                 logger.info(f"  {grade}: {count}")
@@ -183,6 +348,38 @@ class RaymondsIndexPipelineCalculator:
         finally:
             await conn.close()
 
+    def _changed_companies_sql(self, param_idx: int, year: Optional[int]) -> str:
+        """워터마크 이후 입력 구간의 financial_details가 변경된 회사 (idx_fd_updated_at)"""
+        query = f"SELECT company_id FROM financial_details WHERE updated_at >= ${param_idx}"
+        if year and self.version == '3.0':
+            query += f" AND fiscal_year <= {year}"
+        elif year:
+            query += f" AND fiscal_year BETWEEN {year - 2} AND {year}"
+        return query
+
+    async def _get_watermark(self, conn: asyncpg.Connection, year: Optional[int]) -> Optional[datetime]:
+        """마지막 재계산 워터마크 (알고리즘 버전 × 대상 연도별, 연도 미지정은 0)"""
+        return await conn.fetchval("""
+            SELECT financial_watermark FROM raymonds_index_calc_state
+            WHERE algorithm_version = $1 AND target_year = $2
+        """, self.version, year or 0)
+
+    async def _save_watermark(
+        self, conn: asyncpg.Connection, year: Optional[int], watermark: datetime, calculated: int
+    ):
+        """재계산 워터마크 저장 (같은 버전 × 대상 연도 행만 갱신)"""
+        await conn.execute("""
+            INSERT INTO raymonds_index_calc_state (
+                algorithm_version, target_year, financial_watermark, companies_calculated, calculated_at
+            )
+            VALUES ($1, $2, $3, $4, NOW())
+            ON CONFLICT (algorithm_version, target_year) DO UPDATE SET
+                financial_watermark = EXCLUDED.financial_watermark,
+                companies_calculated = EXCLUDED.companies_calculated,
+                calculated_at = NOW()
+        """, self.version, year or 0, watermark, calculated)
+        logger.info(f"✓ 워터마크 갱신 (연도: {year or '최신'}): {watermark}")
+
     async def _get_financial_data(
         self,
         conn: asyncpg.Connection,
@@ -195,24 +392,9 @@ class RaymondsIndexPipelineCalculator:
         else:
             years = None
 
-        query = """
+        query = f"""
             SELECT DISTINCT ON (fiscal_year)
-                fiscal_year, fiscal_quarter, fs_type,
-                -- 재무상태표
-                cash_and_equivalents, short_term_investments, trade_and_other_receivables,
-                inventories, tangible_assets, intangible_assets,
-                total_assets, current_liabilities, non_current_liabilities,
-                total_liabilities, total_equity,
-                -- 재무상태표 (투자괴리율 v2용)
-                right_of_use_assets, investments_in_associates,
-                fvpl_financial_assets, other_financial_assets_non_current,
-                -- 손익계산서
-                revenue, cost_of_sales, selling_admin_expenses,
-                operating_income, net_income,
-                -- 현금흐름표
-                operating_cash_flow, investing_cash_flow, financing_cash_flow,
-                capex, intangible_acquisition, dividend_paid,
-                treasury_stock_acquisition, stock_issuance, bond_issuance
+                {FINANCIAL_COLUMNS}
             FROM financial_details
             WHERE company_id = $1
         """
@@ -232,6 +414,51 @@ class RaymondsIndexPipelineCalculator:
             return None
         return max(min_val, min(max_val, value))
 
+    def _result_record(self, result_dict: Dict) -> tuple:
+        """저장 레코드 (RAYMONDS_INDEX_COLUMNS 순서, DB overflow 방지 clamp 포함)"""
+        return (
+            uuid.UUID(result_dict['company_id']),
+            date.today(),
+            result_dict['fiscal_year'],
+            result_dict['total_score'],
+            result_dict['grade'],
+            self._clamp(result_dict.get('cei_score'), 0, 100),
+            self._clamp(result_dict.get('rii_score'), 0, 100),
+            self._clamp(result_dict.get('cgi_score'), 0, 100),
+            self._clamp(result_dict.get('mai_score'), 0, 100),
+            self._clamp(result_dict.get('investment_gap'), -999, 999),
+            self._clamp(result_dict.get('cash_cagr'), -999, 999),
+            self._clamp(result_dict.get('capex_growth'), -999, 999),
+            self._clamp(result_dict.get('idle_cash_ratio'), 0, 100),
+            self._clamp(result_dict.get('asset_turnover'), 0, 99.999),
+            self._clamp(result_dict.get('reinvestment_rate'), 0, 100),
+            self._clamp(result_dict.get('shareholder_return'), 0, 100),
+            self._clamp(result_dict.get('cash_tangible_ratio', 0), 0, 9999999.99),
+            self._clamp(result_dict.get('fundraising_utilization', -1), -1, 999),
+            self._clamp(result_dict.get('short_term_ratio', 0), 0, 100),
+            result_dict.get('capex_trend', 'stable'),
+            self._clamp(result_dict.get('roic', 0), -999, 999),
+            self._clamp(result_dict.get('capex_cv', 0), 0, 9.999),
+            result_dict.get('violation_count', 0),
+            self._clamp(result_dict.get('investment_gap_v2', 0), -100, 100),
+            self._clamp(result_dict.get('investment_gap_v21', 0), -50, 50),
+            result_dict.get('investment_gap_v21_flag', 'ok'),
+            self._clamp(result_dict.get('cash_utilization', 0), 0, 999),
+            result_dict.get('industry_sector', ''),
+            json.dumps(result_dict.get('weight_adjustment', {}), ensure_ascii=False),
+            self._clamp(result_dict.get('tangible_efficiency', 0), 0, 999.999),
+            self._clamp(result_dict.get('cash_yield', 0), -999, 999),
+            self._clamp(result_dict.get('debt_to_ebitda', 0), 0, 999),
+            self._clamp(result_dict.get('growth_investment_ratio', 0), 0, 100),
+            json.dumps(result_dict.get('red_flags', []), ensure_ascii=False),
+            json.dumps(result_dict.get('yellow_flags', []), ensure_ascii=False),
+            result_dict.get('verdict', ''),
+            result_dict.get('key_risk', ''),
+            result_dict.get('recommendation', ''),
+            result_dict.get('watch_trigger', ''),
+            result_dict.get('data_quality_score', 0),
+        )
+
     async def _save_result(self, conn: asyncpg.Connection, result_dict: Dict) -> bool:
         """계산 결과 저장 (v2.1 - Sub-Index 포함)"""
         try:
@@ -306,53 +533,92 @@ class RaymondsIndexPipelineCalculator:
                     recommendation = EXCLUDED.recommendation,
                     watch_trigger = EXCLUDED.watch_trigger,
                     data_quality_score = EXCLUDED.data_quality_score
-            """,
-                uuid.UUID(result_dict['company_id']),
-                date.today(),
-                result_dict['fiscal_year'],
-                result_dict['total_score'],
-                result_dict['grade'],
-                self._clamp(result_dict.get('cei_score'), 0, 100),
-                self._clamp(result_dict.get('rii_score'), 0, 100),
-                self._clamp(result_dict.get('cgi_score'), 0, 100),
-                self._clamp(result_dict.get('mai_score'), 0, 100),
-                self._clamp(result_dict.get('investment_gap'), -999, 999),
-                self._clamp(result_dict.get('cash_cagr'), -999, 999),
-                self._clamp(result_dict.get('capex_growth'), -999, 999),
-                self._clamp(result_dict.get('idle_cash_ratio'), 0, 100),
-                self._clamp(result_dict.get('asset_turnover'), 0, 99.999),
-                self._clamp(result_dict.get('reinvestment_rate'), 0, 100),
-                self._clamp(result_dict.get('shareholder_return'), 0, 100),
-                self._clamp(result_dict.get('cash_tangible_ratio', 0), 0, 9999999.99),
-                self._clamp(result_dict.get('fundraising_utilization', -1), -1, 999),
-                self._clamp(result_dict.get('short_term_ratio', 0), 0, 100),
-                result_dict.get('capex_trend', 'stable'),
-                self._clamp(result_dict.get('roic', 0), -999, 999),
-                self._clamp(result_dict.get('capex_cv', 0), 0, 9.999),
-                result_dict.get('violation_count', 0),
-                self._clamp(result_dict.get('investment_gap_v2', 0), -100, 100),
-                self._clamp(result_dict.get('investment_gap_v21', 0), -50, 50),
-                result_dict.get('investment_gap_v21_flag', 'ok'),
-                self._clamp(result_dict.get('cash_utilization', 0), 0, 999),
-                result_dict.get('industry_sector', ''),
-                json.dumps(result_dict.get('weight_adjustment', {}), ensure_ascii=False),
-                self._clamp(result_dict.get('tangible_efficiency', 0), 0, 999.999),
-                self._clamp(result_dict.get('cash_yield', 0), -999, 999),
-                self._clamp(result_dict.get('debt_to_ebitda', 0), 0, 999),
-                self._clamp(result_dict.get('growth_investment_ratio', 0), 0, 100),
-                json.dumps(result_dict.get('red_flags', []), ensure_ascii=False),
-                json.dumps(result_dict.get('yellow_flags', []), ensure_ascii=False),
-                result_dict.get('verdict', ''),
-                result_dict.get('key_risk', ''),
-                result_dict.get('recommendation', ''),
-                result_dict.get('watch_trigger', ''),
-                result_dict.get('data_quality_score', 0)
-            )
+            """, *self._result_record(result_dict))
             return True
         except Exception as e:
             logger.error(f"Save error: {e}")
             return False
 
+    async def _save_results_bulk(self, conn: asyncpg.Connection, result_dicts: List[Dict]) -> int:
+        """계산 결과 일괄 저장 (COPY upsert, _save_result와 같은 값/같은 갱신 컬럼)"""
+        return await self._copy_upsert(conn, [self._result_record(r) for r in result_dicts])
+
+    async def _copy_upsert(self, conn: asyncpg.Connection, records: List[tuple]) -> int:
+        """_result_record 레코드 일괄 upsert (저장 행 수 반환)"""
+        return await copy_upsert(
+            conn, 'raymonds_index', RAYMONDS_INDEX_COLUMNS, records,
+            conflict_columns=('company_id', 'fiscal_year'),
+            defaults={'id': 'gen_random_uuid()', 'created_at': 'NOW()'},
+        )
+
+    async def _copy_upsert_v3(self, conn: asyncpg.Connection, records: List[tuple]) -> int:
+        """_v3_record 레코드 일괄 upsert (V3_UPSERT_SQL과 같은 갱신 컬럼)"""
+        return await copy_upsert(
+            conn, 'raymonds_index_v3', V3_COLUMNS, records,
+            conflict_columns=('company_id', 'fiscal_year'),
+            defaults={'id': 'gen_random_uuid()', 'calculation_date': 'CURRENT_DATE'},
+        )
+
+    async def _fetch_financial_rows(
+        self,
+        conn: asyncpg.Connection,
+        company_ids: List[Any],
+        year: Optional[int] = None
+    ) -> List[Dict]:
+        """여러 회사의 재무 데이터 1회 조회 (회사별 _get_financial_data와 같은 행 선택)
+
+        company_id는 문자열로 변환하며, (company_id, fiscal_year) 순으로 정렬된다.
+        """
+        query = f"""
+            SELECT DISTINCT ON (company_id, fiscal_year)
+                company_id, {FINANCIAL_COLUMNS}
+            FROM financial_details
+            WHERE company_id = ANY($1::uuid[])
+        """
+        if year:
+            query += f" AND fiscal_year IN ({year - 2}, {year - 1}, {year})"
+        query += " ORDER BY company_id, fiscal_year, fiscal_quarter NULLS FIRST"
+
+        rows = await conn.fetch(query, [uuid.UUID(str(cid)) for cid in company_ids])
+        return [{**dict(row), 'company_id': str(row['company_id'])} for row in rows]
+
+    async def _calculate_batch(
+        self,
+        conn: asyncpg.Connection,
+        company_ids: List[uuid.UUID],
+        year: Optional[int],
+        stats: Dict[str, Any]
+    ):
+        """전체 회사 배치 계산 (v2.1)
+
+        재무 데이터 1회 조회 → FinancialPanel → RaymondsIndexBatchCalculator → COPY 일괄 저장.
+        결과는 회사별 계산(_calculate_for_company)과 동일하다.
+        """
+        t0 = time.perf_counter()
+        rows = await self._fetch_financial_rows(conn, company_ids, year)
+        panel = FinancialPanel.from_rows(rows)
+        t1 = time.perf_counter()
+        logger.info(f"✓ 재무 데이터 조회: {len(rows):,}행, 계산 대상 {panel.size:,}개 ({t1 - t0:.1f}초)")
+
+        results = RaymondsIndexBatchCalculator().calculate(panel, target_year=year)
+        t2 = time.perf_counter()
+        logger.info(f"✓ 배치 계산: {len(results):,}개 ({t2 - t1:.1f}초)")
+
+        try:
+            saved = await self._save_results_bulk(conn, results) if results else 0
+        except Exception as e:
+            logger.error(f"일괄 저장 오류: {e}")
+            stats['errors'] += len(results)
+            stats['skipped'] += len(company_ids) - len(results)
+            return
+        logger.info(f"✓ 일괄 저장: {saved:,}개 ({time.perf_counter() - t2:.1f}초)")
+
+        stats['calculated'] += len(results)
+        stats['skipped'] += len(company_ids) - len(results)
+        for result in results:
+            grade = result['grade']
+            stats['grade_distribution'][grade] = stats['grade_distribution'].get(grade, 0) + 1
+
     async def _calculate_for_company(
         self,
         conn: asyncpg.Connection,
@@ -404,12 +670,8 @@ class RaymondsIndexPipelineCalculator:
            → 기존 raymonds_index 테이블 영향 없음
         """
         # 재무 데이터 조회 (5년치)
-        query = """
-            SELECT fiscal_year, revenue, operating_income, net_income,
-                   total_assets, total_liabilities, total_equity,
-                   operating_cash_flow, investing_cash_flow, financing_cash_flow,
-                   capex, r_and_d_expense, dividend_paid,
-                   cash_and_equivalents, short_term_investments, tangible_assets
+        query = f"""
+            SELECT {V3_FINANCIAL_COLUMNS}
             FROM financial_details
             WHERE company_id = $1
         """
@@ -435,46 +697,7 @@ class RaymondsIndexPipelineCalculator:
 
             # ⭐ 별도 테이블 (raymonds_index_v3)에 저장
             # 기존 raymonds_index 테이블은 변경하지 않음
-            await conn.execute("""
-                INSERT INTO raymonds_index_v3 (
-                    id, company_id, fiscal_year, total_score, grade,
-                    cei_score, rii_score, cgi_score, mai_score,
-                    investment_gap, cash_cagr, capex_growth,
-                    asset_turnover, reinvestment_rate,
-                    algorithm_version, data_quality_score, calculation_date
-                )
-                VALUES (
-                    gen_random_uuid(), $1, $2, $3, $4,
-                    $5, $6, $7, $8,
-                    $9, $10, $11,
-                    $12, $13,
-                    $14, $15, CURRENT_DATE
-                )
-                ON CONFLICT (company_id, fiscal_year)
-                DO UPDATE SET
-                    total_score = $3, grade = $4,
-                    cei_score = $5, rii_score = $6, cgi_score = $7, mai_score = $8,
-                    investment_gap = $9, cash_cagr = $10, capex_growth = $11,
-                    asset_turnover = $12, reinvestment_rate = $13,
-                    algorithm_version = $14, data_quality_score = $15,
-                    calculation_date = CURRENT_DATE
-            """,
-                company_id,
-                result.fiscal_year,
-                result.total_score,
-                result.grade,
-                result.cei_score,
-                result.rii_score,
-                result.cgi_score,
-                result.mai_score,
-                result.investment_gap,
-                result.raw_metrics.get('cash_cagr') if result.raw_metrics else None,
-                result.raw_metrics.get('capex_growth') if result.raw_metrics else None,
-                result.raw_metrics.get('asset_turnover') if result.raw_metrics else None,
-                result.raw_metrics.get('reinvestment_rate') if result.raw_metrics else None,
-                '3.0',
-                result.data_quality_score,
-            )
+            await conn.execute(V3_UPSERT_SQL, *self._v3_record(company_id, result))
 
             return {'score': result.total_score, 'grade': result.grade}
 
@@ -482,6 +705,262 @@ class RaymondsIndexPipelineCalculator:
             logger.error(f"v3.0 계산 오류 {company_name}: {e}")
             return None
 
+    def _v3_record(self, company_id: str, result) -> tuple:
+        """raymonds_index_v3 저장 레코드 (V3_UPSERT_SQL 파라미터 순서)"""
+        raw = result.raw_metrics
+        return (
+            company_id,
+            result.fiscal_year,
+            result.total_score,
+            result.grade,
+            result.cei_score,
+            result.rii_score,
+            result.cgi_score,
+            result.mai_score,
+            result.investment_gap,
+            raw.get('cash_cagr') if raw else None,
+            raw.get('capex_growth') if raw else None,
+            raw.get('asset_turnover') if raw else None,
+            raw.get('reinvestment_rate') if raw else None,
+            '3.0',
+            result.data_quality_score,
+        )
+
+    # =========================================================================
+    # 병렬 모드 (--workers)
+    # =========================================================================
+
+    async def _calculate_parallel(
+        self,
+        company_ids: List[uuid.UUID],
+        year: Optional[int],
+        batch: bool,
+        workers: int,
+        stats: Dict[str, Any]
+    ):
+        """프로세스 풀 병렬 계산
+
+        회사를 워커 수만큼 교차 분할(이름순 정렬 편중 방지)해 워커 프로세스별로
+        _process_shard를 실행하고 통계를 합산한다. 워커는 spawn으로 생성해
+        부모 이벤트 루프/연결을 물려받지 않는다.
+        """
+        ids = [str(cid) for cid in company_ids]
+        shards = [ids[i::workers] for i in range(workers) if ids[i::workers]]
+        stats['workers'] = len(shards)
+        stats['stage_seconds'] = {'fetch': 0.0, 'compute': 0.0, 'save': 0.0}
+        logger.info(f"병렬 모드: 워커 {len(shards)}개, 청크 {WORKER_CHUNK_SIZE}개 단위")
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context('spawn')
+        ) as pool:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, _run_shard, self.database_url, self.version, shard, year, batch
+                )
+                for shard in shards
+            ], return_exceptions=True)
+
+        for shard, result in zip(shards, results):
+            if isinstance(result, Exception):
+                logger.error(f"워커 실패 ({len(shard)}개 회사): {result}")
+                stats['errors'] += len(shard)
+                continue
+            for key in ('calculated', 'skipped', 'errors'):
+                stats[key] += result[key]
+            for grade, count in result['grade_distribution'].items():
+                stats['grade_distribution'][grade] = stats['grade_distribution'].get(grade, 0) + count
+            for stage, seconds in result['stage_seconds'].items():
+                stats['stage_seconds'][stage] += seconds
+
+    async def _process_shard(
+        self,
+        company_ids: List[str],
+        year: Optional[int],
+        batch: bool
+    ) -> Dict[str, Any]:
+        """워커 1개 분량 계산 (조회 → 계산 → 저장 파이프라인)
+
+        조회/저장은 각자 연결을 가진 태스크로, 계산은 이벤트 루프에서 실행한다.
+        청크 k를 계산하는 동안 청크 k+1 조회와 청크 k-1 저장이 진행된다.
+        """
+        stats = {
+            'calculated': 0,
+            'skipped': 0,
+            'errors': 0,
+            'grade_distribution': {},
+            'stage_seconds': {'fetch': 0.0, 'compute': 0.0, 'save': 0.0},
+        }
+        chunks = [
+            company_ids[i:i + WORKER_CHUNK_SIZE]
+            for i in range(0, len(company_ids), WORKER_CHUNK_SIZE)
+        ]
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+        computed: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+
+        read_conn = await asyncpg.connect(self.database_url)
+        write_conn = await asyncpg.connect(self.database_url)
+
+        async def fetch_stage():
+            for chunk in chunks:
+                started = time.perf_counter()
+                try:
+                    rows = await self._fetch_chunk(read_conn, chunk, year)
+                except Exception as e:
+                    logger.error(f"조회 오류 ({len(chunk)}개 회사): {e}")
+                    stats['errors'] += len(chunk)
+                    continue
+                finally:
+                    stats['stage_seconds']['fetch'] += time.perf_counter() - started
+                await fetched.put((chunk, rows))
+            await fetched.put(None)
+
+        async def save_stage():
+            while (results := await computed.get()) is not None:
+                started = time.perf_counter()
+                try:
+                    await self._save_chunk(write_conn, results)
+                except Exception as e:
+                    logger.error(f"저장 오류 ({len(results)}개 회사): {e}")
+                    stats['errors'] += len(results)
+                    continue
+                finally:
+                    stats['stage_seconds']['save'] += time.perf_counter() - started
+                stats['calculated'] += len(results)
+                for grade, _ in results:
+                    stats['grade_distribution'][grade] = stats['grade_distribution'].get(grade, 0) + 1
+
+        try:
+            fetch_task = asyncio.create_task(fetch_stage())
+            save_task = asyncio.create_task(save_stage())
+
+            while (item := await fetched.get()) is not None:
+                chunk, rows = item
+                started = time.perf_counter()
+                try:
+                    results = self._compute_chunk(chunk, rows, year, batch, stats)
+                except Exception as e:
+                    logger.error(f"계산 오류 ({len(chunk)}개 회사): {e}")
+                    stats['errors'] += len(chunk)
+                    results = []
+                stats['stage_seconds']['compute'] += time.perf_counter() - started
+                if results:
+                    await computed.put(results)
+                # 계산 중 쌓인 조회/저장 I/O 처리 기회
+                await asyncio.sleep(0)
+
+            await computed.put(None)
+            await asyncio.gather(fetch_task, save_task)
+            return stats
+        finally:
+            await read_conn.close()
+            await write_conn.close()
+
+    async def _fetch_chunk(
+        self,
+        conn: asyncpg.Connection,
+        company_ids: List[str],
+        year: Optional[int]
+    ) -> Dict[str, List[Dict]]:
+        """청크 재무 데이터 조회 → 회사별 행 목록 (회사별 조회와 같은 행/순서)"""
+        by_company: Dict[str, List[Dict]] = {}
+
+        if self.version == '3.0' and self._v3_calculator:
+            query = f"""
+                SELECT company_id, {V3_FINANCIAL_COLUMNS}
+                FROM financial_details
+                WHERE company_id = ANY($1::uuid[])
+            """
+            params: List[Any] = [[uuid.UUID(cid) for cid in company_ids]]
+            if year:
+                query += " AND fiscal_year <= $2"
+                params.append(year)
+            query += " ORDER BY company_id, fiscal_year DESC"
+
+            for row in await conn.fetch(query, *params):
+                rows = by_company.setdefault(str(row['company_id']), [])
+                if len(rows) < 5:
+                    rows.append({k: v for k, v in row.items() if k != 'company_id'})
+            # 오래된 순서로 정렬
+            return {cid: rows[::-1] for cid, rows in by_company.items()}
+
+        for row in await self._fetch_financial_rows(conn, company_ids, year):
+            by_company.setdefault(row.pop('company_id'), []).append(row)
+        return by_company
+
+    def _compute_chunk(
+        self,
+        company_ids: List[str],
+        rows_by_company: Dict[str, List[Dict]],
+        year: Optional[int],
+        batch: bool,
+        stats: Dict[str, Any]
+    ) -> List[tuple]:
+        """청크 계산 → [(grade, 저장 레코드)]
+
+        데이터 부족(2개 연도 미만) 회사는 skipped, 계산 예외는 errors로 집계한다.
+        """
+        results = []
+
+        if self.version == '2.1' and batch:
+            panel = FinancialPanel.from_rows(
+                {**row, 'company_id': cid}
+                for cid, rows in rows_by_company.items()
+                for row in rows
+            )
+            for result_dict in RaymondsIndexBatchCalculator().calculate(panel, target_year=year):
+                results.append((result_dict['grade'], self._result_record(result_dict)))
+            stats['skipped'] += len(company_ids) - len(results)
+            return results
+
+        if self.version == '3.0' and self._v3_calculator and batch:
+            eligible = {
+                cid: rows_by_company[cid]
+                for cid in company_ids
+                if len(rows_by_company.get(cid, [])) >= 2  # 최소 2년 데이터 필요
+            }
+            for result in self._v3_calculator.calculate_batch(eligible):
+                results.append((result.grade, self._v3_record(result.company_id, result)))
+            stats['skipped'] += len(company_ids) - len(results)
+            return results
+
+        for company_id in company_ids:
+            financial_data = rows_by_company.get(company_id, [])
+            if len(financial_data) < 2:  # 최소 2년 데이터 필요
+                stats['skipped'] += 1
+                continue
+
+            try:
+                if self.version == '3.0' and self._v3_calculator:
+                    result = self._v3_calculator.calculate(company_id, financial_data)
+                    results.append((result.grade, self._v3_record(company_id, result)))
+                    continue
+
+                result = self._proper_calculator.calculate(
+                    company_id=company_id,
+                    financial_data=financial_data,
+                    target_year=year
+                )
+                if result is None:
+                    stats['skipped'] += 1
+                    continue
+                result_dict = self._proper_calculator.to_dict(result)
+                results.append((result.grade, self._result_record(result_dict)))
+            except Exception as e:
+                logger.error(f"계산 오류 {company_id}: {e}")
+                stats['errors'] += 1
+
+        return results
+
+    async def _save_chunk(self, conn: asyncpg.Connection, results: List[tuple]):
+        """청크 저장 (COPY 일괄 upsert)"""
+        records = [record for _, record in results]
+        if self.version == '3.0' and self._v3_calculator:
+            await self._copy_upsert_v3(conn, records)
+        else:
+            await self._copy_upsert(conn, records)
+
     def _get_grade(self, score: float) -> str:
         """점수 → 등급 변환"""
         if score >= 95:
@@ -537,12 +1016,32 @@ class RaymondsIndexPipelineCalculator:
             await conn.close()
 
 
+def _run_shard(
+    database_url: str,
+    version: str,
+    company_ids: List[str],
+    year: Optional[int],
+    batch: bool
+) -> Dict[str, Any]:
+    """워커 프로세스 진입점 (워커별 계산기/이벤트 루프/DB 연결)"""
+    calculator = RaymondsIndexPipelineCalculator(database_url=database_url, version=version)
+    return asyncio.run(calculator._process_shard(company_ids, year, batch))
+
+
 async def main():
     parser = argparse.ArgumentParser(description='RaymondsIndex 계산')
     parser.add_argument('--year', type=int, help='대상 연도')
     parser.add_argument('--sample', type=int, help='샘플 개수 (테스트용)')
     parser.add_argument('--version', type=str, default='2.1', choices=['2.1', '3.0'],
                         help='알고리즘 버전 (2.1 또는 3.0, 기본값: 2.1)')
+    parser.add_argument('--batch', action='store_true',
+                        help='배치 모드 (v2.1): 재무 데이터 1회 조회 + 일괄 계산 + COPY 일괄 저장')
+    parser.add_argument('--workers', type=int, help='프로세스 풀 워커 수 (병렬 모드)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='마지막 재계산 이후 재무 데이터가 변경된 회사만 재계산')
+    parser.add_argument('--since', type=datetime.fromisoformat,
+                        help='지정 시각 이후 재무 데이터가 변경된 회사만 재계산 (ISO 8601)')
+    parser.add_argument('--dry-run', action='store_true', help='계산 없이 재계산 대상 회사 목록만 출력')
     parser.add_argument('--stats', action='store_true', help='현재 통계만 출력')
 
     args = parser.parse_args()
@@ -560,7 +1059,10 @@ async def main():
         for year, count in stats['yearly_distribution'].items():
             print(f"  {year}: {count}")
     else:
-        await calculator.calculate(year=args.year, sample=args.sample)
+        await calculator.calculate(
+            year=args.year, sample=args.sample, batch=args.batch, workers=args.workers,
+            since=args.since, incremental=args.incremental, dry_run=args.dry_run
+        )
 
 
 if __name__ == '__main__':
@@ -9,8 +9,9 @@ DART 분기보고서 다운로드부터 RaymondsIndex 계산까지 전체 프로
     2. 파싱 - 통합 파서로 데이터 추출
     3. 검증 - 데이터 품질 검증
     4. 적재 - DB UPSERT
-    5. 계산 - RaymondsIndex 재계산
-    6. 보고서 - 품질 보고서 생성
+    5. 계산 - RaymondsIndex 재계산 (재무 데이터 변경 회사만 증분)
+    6. 스냅샷 - 변경된 회사의 종합보고서 스냅샷 무효화/재빌드
+    7. 보고서 - 품질 보고서 생성
 
 사용법:
     # 전체 파이프라인 실행
@@ -22,6 +23,10 @@ DART 분기보고서 다운로드부터 RaymondsIndex 계산까지 전체 프로
     # 테스트 모드 (샘플만)
     python -m scripts.pipeline.run_quarterly_pipeline --quarter Q1 --year 2025 --sample 10
 
+    # 스냅샷 단계만 재실행 (지정 시각 이후 변경된 회사 무효화)
+    python -m scripts.pipeline.run_quarterly_pipeline --quarter Q1 --year 2025 \
+        --start-from snapshot --since 2026-10-01T00:00:00+09:00
+
 분기별 일정:
     Q1 (1분기): 5월 15일 마감 → 5월 20일 실행
     Q2 (반기):  8월 14일 마감 → 8월 20일 실행
@@ -38,7 +43,7 @@ import asyncio
 import logging
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -57,6 +62,7 @@ class PipelineStep(Enum):
     VALIDATE = 'validate'
     LOAD = 'load'  # 파싱에 포함됨
     CALCULATE = 'calculate'
+    SNAPSHOT = 'snapshot'
     REPORT = 'report'
 
 
@@ -68,6 +74,7 @@ class QuarterlyPipeline:
         PipelineStep.PARSE,
         PipelineStep.VALIDATE,
         PipelineStep.CALCULATE,
+        PipelineStep.SNAPSHOT,
         PipelineStep.REPORT,
     ]
 
@@ -93,13 +100,18 @@ class QuarterlyPipeline:
             'steps': {},
         }
 
+        # 보고서 스냅샷 무효화 기준 시각
+        # (--since 또는 이번 실행에서 다운로드/파싱 단계를 실행한 경우 시작 시 DB 시각)
+        self.snapshot_watermark: Optional[datetime] = None
+
     async def run(
         self,
         start_from: Optional[PipelineStep] = None,
         stop_after: Optional[PipelineStep] = None,
         skip_steps: Optional[List[PipelineStep]] = None,
         sample: Optional[int] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        since: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """파이프라인 실행
 
@@ -109,6 +121,7 @@ class QuarterlyPipeline:
             skip_steps: 스킵할 단계 목록
             sample: 샘플 개수 (테스트용)
             dry_run: True면 실제 저장 없이 테스트
+            since: 스냅샷 무효화 기준 시각 (다운로드/파싱 단계를 실행하지 않을 때 필요)
 
         Returns:
             실행 결과
@@ -144,6 +157,16 @@ class QuarterlyPipeline:
 
         steps_to_run = self.STEPS[start_idx:end_idx]
 
+        # 스냅샷 무효화 기준: --since, 없으면 이번 실행에서 데이터를 적재하는 경우에만 시작 시각
+        # (적재 단계 없이 시작 시각을 쓰면 이전 실행에서 바뀐 회사를 무효화하지 못함)
+        self.snapshot_watermark = since
+        loads_data = any(
+            step in steps_to_run and step not in skip_steps
+            for step in (PipelineStep.DOWNLOAD, PipelineStep.PARSE)
+        )
+        if self.snapshot_watermark is None and loads_data:
+            self.snapshot_watermark = await self._get_db_now()
+
         # 각 단계 실행
         for step in steps_to_run:
             if step in skip_steps:
@@ -199,7 +222,10 @@ class QuarterlyPipeline:
             return await self._step_validate()
 
         elif step == PipelineStep.CALCULATE:
-            return await self._step_calculate(sample=sample)
+            return await self._step_calculate(sample=sample, dry_run=dry_run)
+
+        elif step == PipelineStep.SNAPSHOT:
+            return await self._step_snapshot(dry_run=dry_run)
 
         elif step == PipelineStep.REPORT:
             return await self._step_report()
@@ -248,16 +274,76 @@ class QuarterlyPipeline:
         result = await checker.validate_quarter(self.quarter, self.year)
         return result
 
-    async def _step_calculate(self, sample: Optional[int] = None) -> Dict[str, Any]:
-        """4단계: RaymondsIndex 계산"""
-        from .calculate_index import RaymondsIndexCalculator
+    async def _step_calculate(
+        self,
+        sample: Optional[int] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """4단계: RaymondsIndex 계산
 
-        calculator = RaymondsIndexCalculator(self.database_url)
-        stats = await calculator.calculate(year=self.year, sample=sample)
+        마지막 재계산 이후 재무 데이터가 변경된 회사만 재계산합니다 (증분).
+        dry_run이면 재계산 대상 회사 목록만 반환합니다.
+        """
+        from .calculate_index import RaymondsIndexPipelineCalculator
+
+        calculator = RaymondsIndexPipelineCalculator(self.database_url)
+        stats = await calculator.calculate(
+            year=self.year, sample=sample, incremental=True, dry_run=dry_run
+        )
         return stats
 
+    async def _get_db_now(self) -> datetime:
+        """DB 기준 현재 시각 (스냅샷 무효화 워터마크용)"""
+        import asyncpg
+        from app.database import get_asyncpg_dsn
+
+        try:
+            conn = await asyncpg.connect(get_asyncpg_dsn(self.database_url))
+            try:
+                return await conn.fetchval("SELECT NOW()")
+            finally:
+                await conn.close()
+        except Exception as e:
+            logger.warning(f"DB 시각 조회 실패, 로컬 시각 사용: {e}")
+            return datetime.now(timezone.utc)
+
+    async def _step_snapshot(self, dry_run: bool = False) -> Dict[str, Any]:
+        """5단계: 종합보고서 스냅샷 무효화 및 재빌드
+
+        snapshot_watermark(--since 또는 파이프라인 시작 시각) 이후 원천 데이터가 바뀐 회사만
+        무효화하고, 조회 이력이 있는 스냅샷은 즉시 재빌드합니다.
+        """
+        if dry_run:
+            return {'status': 'skipped', 'reason': 'dry_run'}
+
+        if self.snapshot_watermark is None:
+            raise ValueError(
+                "스냅샷 무효화 기준 시각이 없습니다: 다운로드/파싱 단계 없이 실행할 때는 "
+                "--since로 마지막 스냅샷 갱신 시각을 지정하세요"
+            )
+
+        import asyncpg
+        from app.database import get_asyncpg_dsn, close_pg_pool
+        from app.services.company_report_snapshot import (
+            invalidate_company_reports_since,
+            rebuild_stale_company_reports,
+        )
+
+        conn = await asyncpg.connect(get_asyncpg_dsn(self.database_url))
+        try:
+            invalidated = await invalidate_company_reports_since(conn, self.snapshot_watermark)
+        finally:
+            await conn.close()
+
+        try:
+            rebuild_stats = await rebuild_stale_company_reports()
+        finally:
+            await close_pg_pool()
+
+        return {'invalidated': invalidated, **rebuild_stats}
+
     async def _step_report(self) -> Dict[str, Any]:
-        """5단계: 보고서 생성"""
+        """6단계: 보고서 생성"""
         from .generate_report import PipelineReporter
 
         reporter = PipelineReporter(self.database_url)
@@ -332,7 +418,7 @@ async def main():
 
     parser.add_argument('--start-from', type=parse_step,
                         choices=[s.value for s in PipelineStep],
-                        help='시작 단계 (download, parse, validate, calculate, report)')
+                        help='시작 단계 (download, parse, validate, calculate, snapshot, report)')
     parser.add_argument('--stop-after', type=parse_step,
                         choices=[s.value for s in PipelineStep],
                         help='종료 단계')
@@ -342,6 +428,8 @@ async def main():
 
     parser.add_argument('--sample', type=int, help='샘플 개수 (테스트용)')
     parser.add_argument('--dry-run', action='store_true', help='실제 저장 없이 테스트')
+    parser.add_argument('--since', type=datetime.fromisoformat,
+                        help='스냅샷 무효화 기준 시각 (ISO 8601, 다운로드/파싱 없이 snapshot 단계 실행 시 필수)')
 
     args = parser.parse_args()
 
@@ -355,7 +443,8 @@ async def main():
         stop_after=args.stop_after,
         skip_steps=args.skip,
         sample=args.sample,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        since=args.since
     )
 
 
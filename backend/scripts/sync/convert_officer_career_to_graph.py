@@ -34,6 +34,7 @@ from app.database import AsyncSessionLocal
 from app.models.officers import Officer
 from app.models.companies import Company
 from app.config import settings
+from app.services.graph_cache import invalidate_graph_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -342,7 +343,11 @@ class OfficerCareerGraphConverter:
 async def main():
     """메인 함수"""
     async with OfficerCareerGraphConverter() as converter:
-        await converter.run()
+        try:
+            await converter.run()
+        finally:
+            # 그래프 API 응답 캐시 무효화
+            await invalidate_graph_cache()
 
 
 if __name__ == "__main__":
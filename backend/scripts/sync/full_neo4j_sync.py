@@ -12,15 +12,42 @@ PostgreSQL → Neo4j 전체 동기화 스크립트
 
 엔티티: Company, Officer, ConvertibleBond, Subscriber
 관계: WORKS_AT, BOARD_MEMBER_AT, ISSUED, SUBSCRIBED
+
+동기화 모드:
+- 기본: 전체 삭제 후 재생성 (동기화 중 그래프가 비어 있음)
+- --blue-green: _Shadow* 라벨로 새 그래프를 만든 뒤 한 트랜잭션에서 라벨 교체
+  (기존 노드는 _Retired* 라벨로 바꾼 뒤 배치 삭제, 동기화 중에도 기존 그래프 조회 가능)
+- --incremental: 워터마크(SyncState 노드) 이후 updated_at이 바뀐 행만 MERGE,
+  PostgreSQL에서 삭제된 행은 id 비교로 DETACH DELETE
+  (WORKS_AT에 position id가 필요하므로 이 버전의 전체/blue-green 동기화 후 사용 가능)
+
+벌크 로드 (--bulk, 전체/blue-green):
+- 엔티티별로 서버 측 커서에서 --batch-size행씩 읽어 --workers개 쓰기 트랜잭션을 동시 실행
+- 노드 단계(Company, Officer, ConvertibleBond, Subscriber)가 끝난 뒤 관계 단계 실행
+- 단계별 행/초 출력
+- --export-csv DIR: neo4j-admin database import용 CSV만 생성 (오프라인 재구축)
+
+사용법:
+    python scripts/sync/full_neo4j_sync.py                  # 전체 (삭제 후 재생성)
+    python scripts/sync/full_neo4j_sync.py --blue-green     # 전체 (무중단 교체)
+    python scripts/sync/full_neo4j_sync.py --incremental    # 변경분만
+    python scripts/sync/full_neo4j_sync.py --blue-green --bulk --batch-size 10000 --workers 8
+    python scripts/sync/full_neo4j_sync.py --export-csv /tmp/neo4j_import
 """
 import asyncio
 import asyncpg
+import csv
 import logging
 import os
+import re
 import sys
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 # Neo4j 동기 드라이버 사용 (asyncpg와 함께)
 from neo4j import GraphDatabase
 
@@ -41,6 +68,84 @@ NEO4J_USER = os.getenv('NEO4J_USER', 'neo4j')
 NEO4J_PASSWORD = os.getenv('NEO4J_PASSWORD', 'password')
 
 BATCH_SIZE = 50  # 메모리 최적화를 위해 50건씩 처리
+DELETE_BATCH_SIZE = 5000
+
+# 이 스크립트가 관리하는 라벨 (blue-green 교체 대상)
+SYNCED_LABELS = ('Company', 'Officer', 'ConvertibleBond', 'Subscriber')
+SHADOW_PREFIX = '_Shadow'
+RETIRED_PREFIX = '_Retired'
+_LABEL_PATTERN = re.compile(r':(%s)\b' % '|'.join(SYNCED_LABELS))
+
+# 증분 동기화 워터마크 (Neo4j에 저장 → 그래프 상태와 항상 일치)
+SYNC_STATE_ID = 'full_neo4j_sync'
+
+# 벌크 로드 (--bulk): 서버 측 커서로 BULK_BATCH_SIZE행씩 읽어 BULK_WORKERS개 트랜잭션 동시 쓰기
+BULK_BATCH_SIZE = 5000
+BULK_WORKERS = 4
+
+# PostgreSQL 조회 ({where}: 증분 조건)
+COMPANIES_SQL = """
+    SELECT id, name, ticker, corp_code, name_en,
+           business_number, sector, industry, market
+    FROM companies
+    {where}
+"""
+OFFICERS_SQL = """
+    SELECT id, name, birth_date, gender, person_id
+    FROM officers
+    {where}
+"""
+POSITIONS_SQL = """
+    SELECT id, officer_id, company_id, position, is_current
+    FROM officer_positions
+    {where}
+"""
+CBS_SQL = """
+    SELECT id, company_id, issue_amount, conversion_price,
+           issue_date, maturity_date, interest_rate, bond_name
+    FROM convertible_bonds
+    {where}
+"""
+SUBSCRIBERS_SQL = """
+    SELECT id, cb_id, subscriber_name, subscription_amount, is_related_party
+    FROM cb_subscribers
+    {where}
+"""
+
+WORKS_AT_CYPHER = """
+    UNWIND $rows AS p
+    MATCH (o:Officer {id: p.officer_id})
+    MATCH (c:Company {id: p.company_id})
+    CREATE (o)-[r:WORKS_AT {
+        id: p.id,
+        position: p.position,
+        is_current: p.is_current
+    }]->(c)
+    RETURN count(r) as cnt
+"""
+ISSUED_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (c:Company {id: row.company_id})
+    MATCH (cb:ConvertibleBond {id: row.id})
+    CREATE (c)-[r:ISSUED]->(cb)
+    RETURN count(r) as cnt
+"""
+SUBSCRIBED_CYPHER = """
+    UNWIND $rows AS row
+    MATCH (s:Subscriber {id: row.id})
+    MATCH (cb:ConvertibleBond {id: row.cb_id})
+    CREATE (s)-[r:SUBSCRIBED]->(cb)
+    RETURN count(r) as cnt
+"""
+
+# neo4j-admin import CSV 헤더 타입 (나머지는 string)
+CSV_TYPES = {
+    'issue_amount': 'float',
+    'conversion_price': 'float',
+    'interest_rate': 'float',
+    'subscription_amount': 'float',
+    'is_current': 'boolean',
+}
 
 
 class Neo4jFullSyncer:
@@ -49,12 +154,16 @@ class Neo4jFullSyncer:
     def __init__(self):
         self.pg_conn: Optional[asyncpg.Connection] = None
         self.neo4j_driver = None
+        # True면 모든 Cypher의 관리 라벨을 _Shadow* 라벨로 치환 (blue-green 빌드)
+        self.shadow = False
+        # 벌크 로드/CSV 단계별 처리량 {단계: {rows, seconds, rows_per_sec}}
+        self.phase_metrics: Dict[str, Dict[str, Any]] = {}
         self.stats = {
-            'companies': {'pg': 0, 'synced': 0, 'errors': 0},
-            'officers': {'pg': 0, 'synced': 0, 'errors': 0},
-            'positions': {'pg': 0, 'synced': 0, 'errors': 0},
-            'cbs': {'pg': 0, 'synced': 0, 'errors': 0},
-            'subscribers': {'pg': 0, 'synced': 0, 'errors': 0},
+            'companies': {'pg': 0, 'synced': 0, 'errors': 0, 'deleted': 0},
+            'officers': {'pg': 0, 'synced': 0, 'errors': 0, 'deleted': 0},
+            'positions': {'pg': 0, 'synced': 0, 'errors': 0, 'deleted': 0},
+            'cbs': {'pg': 0, 'synced': 0, 'errors': 0, 'deleted': 0},
+            'subscribers': {'pg': 0, 'synced': 0, 'errors': 0, 'deleted': 0},
             'relationships': {'works_at': 0, 'issued': 0, 'subscribed': 0}
         }
 
@@ -93,6 +202,107 @@ class Neo4jFullSyncer:
             return value.decode('utf-8', errors='replace')
         return value
 
+    def _cypher(self, query: str) -> str:
+        """blue-green 빌드 중이면 관리 라벨을 shadow 라벨로 치환"""
+        if not self.shadow:
+            return query
+        return _LABEL_PATTERN.sub(lambda m: f":{SHADOW_PREFIX}{m.group(1)}", query)
+
+    def _run(self, session, query: str, **params):
+        return session.run(self._cypher(query), **params)
+
+    @staticmethod
+    def _since_clause(since: Optional[datetime], column: str = 'updated_at', naive: bool = False) -> str:
+        """
+        증분 조건 (워터마크는 SELECT NOW()의 timestamptz)
+
+        naive=True: timestamp without time zone 컬럼 (NOW()가 세션 TimeZone 기준으로 기록됨)
+        → 워터마크를 같은 TimeZone의 timestamp로 변환해 비교 (인덱스 사용 가능)
+        """
+        if not since:
+            return ""
+        if naive:
+            return f"WHERE {column} > ($1::timestamptz AT TIME ZONE current_setting('TimeZone'))"
+        return f"WHERE {column} > $1::timestamptz"
+
+    async def _fetch(self, query: str, since: Optional[datetime]):
+        return await self.pg_conn.fetch(query, since) if since else await self.pg_conn.fetch(query)
+
+    @staticmethod
+    def _node_cypher(label: str, merge: bool) -> str:
+        """노드 생성(전체) 또는 id 기준 MERGE(증분), 속성은 props로 일괄 SET (None이면 속성 제거)"""
+        op = "MERGE" if merge else "CREATE"
+        return f"""
+            UNWIND $rows AS row
+            {op} (n:{label} {{id: row.id}})
+            SET n += row.props, n.synced_at = datetime()
+        """
+
+    def _upsert_nodes(self, session, label: str, nodes: List[Dict[str, Any]], merge: bool):
+        self._run(session, self._node_cypher(label, merge), rows=nodes)
+
+    # ---- PostgreSQL 행 → Neo4j 파라미터 ----
+
+    def _company_row(self, r) -> Dict[str, Any]:
+        return {
+            'id': str(r['id']),
+            'props': {
+                'name': self._ensure_utf8(r['name']),
+                'ticker': r['ticker'],
+                'corp_code': r['corp_code'],
+                'name_en': self._ensure_utf8(r['name_en']),
+                'business_number': r['business_number'],
+                'sector': self._ensure_utf8(r['sector']),
+                'industry': self._ensure_utf8(r['industry']),
+                'market': r['market']
+            }
+        }
+
+    def _officer_row(self, r) -> Dict[str, Any]:
+        return {
+            'id': str(r['id']),
+            'props': {
+                'name': self._ensure_utf8(r['name']),
+                'birth_date': self._ensure_utf8(r['birth_date']),
+                'gender': self._ensure_utf8(r['gender']),
+                'person_id': str(r['person_id']) if r['person_id'] else None
+            }
+        }
+
+    def _position_row(self, r) -> Dict[str, Any]:
+        return {
+            'id': str(r['id']),
+            'officer_id': str(r['officer_id']),
+            'company_id': str(r['company_id']),
+            'position': self._ensure_utf8(r['position']),
+            'is_current': r['is_current']
+        }
+
+    def _cb_row(self, r) -> Dict[str, Any]:
+        return {
+            'id': str(r['id']),
+            'props': {
+                'company_id': str(r['company_id']) if r['company_id'] else None,
+                'bond_name': self._ensure_utf8(r['bond_name']),
+                'issue_amount': float(r['issue_amount']) if r['issue_amount'] else None,
+                'conversion_price': float(r['conversion_price']) if r['conversion_price'] else None,
+                'issue_date': r['issue_date'].isoformat() if r['issue_date'] else None,
+                'maturity_date': r['maturity_date'].isoformat() if r['maturity_date'] else None,
+                'interest_rate': float(r['interest_rate']) if r['interest_rate'] else None
+            }
+        }
+
+    def _subscriber_row(self, r) -> Dict[str, Any]:
+        return {
+            'id': str(r['id']),
+            'props': {
+                'cb_id': str(r['cb_id']) if r['cb_id'] else None,
+                'name': self._ensure_utf8(r['subscriber_name']),
+                'subscription_amount': float(r['subscription_amount']) if r['subscription_amount'] else None,
+                'is_related_party': self._ensure_utf8(r['is_related_party'])
+            }
+        }
+
     # ==================== Phase 1: 제약조건 및 인덱스 ====================
 
     def create_constraints(self):
@@ -110,7 +320,16 @@ class Neo4jFullSyncer:
             "CREATE INDEX company_name IF NOT EXISTS FOR (c:Company) ON (c.name)",
             "CREATE INDEX company_ticker IF NOT EXISTS FOR (c:Company) ON (c.ticker)",
             "CREATE INDEX officer_name IF NOT EXISTS FOR (o:Officer) ON (o.name)",
+            "CREATE INDEX officer_person_id IF NOT EXISTS FOR (o:Officer) ON (o.person_id)",
             "CREATE INDEX cb_company IF NOT EXISTS FOR (cb:ConvertibleBond) ON (cb.company_id)",
+            # 증분 동기화에서 position id로 WORKS_AT 교체/삭제
+            "CREATE INDEX works_at_id IF NOT EXISTS FOR ()-[r:WORKS_AT]-() ON (r.id)",
+        ]
+        # blue-green 빌드 중 관계 생성 시 shadow 노드 id 조회용
+        indexes += [
+            f"CREATE INDEX {SHADOW_PREFIX.strip('_').lower()}_{label.lower()}_id IF NOT EXISTS "
+            f"FOR (n:{SHADOW_PREFIX}{label}) ON (n.id)"
+            for label in SYNCED_LABELS
         ]
 
         with self.neo4j_driver.session() as session:
@@ -148,16 +367,12 @@ class Neo4jFullSyncer:
 
     # ==================== Phase 3: Company 동기화 ====================
 
-    async def sync_companies(self):
-        """Company 동기화"""
+    async def sync_companies(self, since: Optional[datetime] = None):
+        """Company 동기화 (since 지정 시 이후 변경분만 MERGE)"""
         logger.info("[Phase 3] Company 동기화...")
 
         # PostgreSQL에서 조회
-        rows = await self.pg_conn.fetch("""
-            SELECT id, name, ticker, corp_code, name_en,
-                   business_number, sector, industry, market
-            FROM companies
-        """)
+        rows = await self._fetch(COMPANIES_SQL.format(where=self._since_clause(since)), since)
         self.stats['companies']['pg'] = len(rows)
         logger.info(f"  PostgreSQL Company: {len(rows)}개")
 
@@ -165,37 +380,10 @@ class Neo4jFullSyncer:
         with self.neo4j_driver.session() as session:
             for i in range(0, len(rows), BATCH_SIZE):
                 batch = rows[i:i+BATCH_SIZE]
-                companies = []
-
-                for r in batch:
-                    companies.append({
-                        'id': str(r['id']),
-                        'name': self._ensure_utf8(r['name']),
-                        'ticker': r['ticker'],
-                        'corp_code': r['corp_code'],
-                        'name_en': self._ensure_utf8(r['name_en']),
-                        'business_number': r['business_number'],
-                        'sector': self._ensure_utf8(r['sector']),
-                        'industry': self._ensure_utf8(r['industry']),
-                        'market': r['market']
-                    })
+                companies = [self._company_row(r) for r in batch]
 
                 try:
-                    session.run("""
-                        UNWIND $companies AS c
-                        CREATE (n:Company {
-                            id: c.id,
-                            name: c.name,
-                            ticker: c.ticker,
-                            corp_code: c.corp_code,
-                            name_en: c.name_en,
-                            business_number: c.business_number,
-                            sector: c.sector,
-                            industry: c.industry,
-                            market: c.market,
-                            synced_at: datetime()
-                        })
-                    """, companies=companies)
+                    self._upsert_nodes(session, 'Company', companies, merge=since is not None)
                     self.stats['companies']['synced'] += len(batch)
                 except Exception as e:
                     logger.error(f"  Company 배치 오류: {e}")
@@ -208,15 +396,17 @@ class Neo4jFullSyncer:
 
     # ==================== Phase 4: Officer 동기화 ====================
 
-    async def sync_officers(self):
-        """Officer 동기화"""
+    async def sync_officers(self, since: Optional[datetime] = None):
+        """Officer 동기화 (since 지정 시 이후 변경분만 MERGE)"""
         logger.info("[Phase 4] Officer 동기화...")
 
+        # 동일인 식별 (person_id 미지정 임원) → Neo4j 경력 조회가 person_id 동등 비교
+        # (person_id 지정 시 updated_at 갱신 → 증분 대상에 포함)
+        from app.services.officer_identity import resolve_officer_identities
+        await resolve_officer_identities(self.pg_conn)
+
         # PostgreSQL에서 조회
-        rows = await self.pg_conn.fetch("""
-            SELECT id, name, birth_date, gender
-            FROM officers
-        """)
+        rows = await self._fetch(OFFICERS_SQL.format(where=self._since_clause(since)), since)
         self.stats['officers']['pg'] = len(rows)
         logger.info(f"  PostgreSQL Officer: {len(rows)}개")
 
@@ -224,27 +414,10 @@ class Neo4jFullSyncer:
         with self.neo4j_driver.session() as session:
             for i in range(0, len(rows), BATCH_SIZE):
                 batch = rows[i:i+BATCH_SIZE]
-                officers = []
-
-                for r in batch:
-                    officers.append({
-                        'id': str(r['id']),
-                        'name': self._ensure_utf8(r['name']),
-                        'birth_date': self._ensure_utf8(r['birth_date']),
-                        'gender': self._ensure_utf8(r['gender'])
-                    })
+                officers = [self._officer_row(r) for r in batch]
 
                 try:
-                    session.run("""
-                        UNWIND $officers AS o
-                        CREATE (n:Officer {
-                            id: o.id,
-                            name: o.name,
-                            birth_date: o.birth_date,
-                            gender: o.gender,
-                            synced_at: datetime()
-                        })
-                    """, officers=officers)
+                    self._upsert_nodes(session, 'Officer', officers, merge=since is not None)
                     self.stats['officers']['synced'] += len(batch)
                 except Exception as e:
                     logger.error(f"  Officer 배치 오류: {e}")
@@ -257,43 +430,32 @@ class Neo4jFullSyncer:
 
     # ==================== Phase 5: Officer-Company 관계 ====================
 
-    async def sync_officer_positions(self):
-        """Officer-Company 관계 (WORKS_AT) 동기화"""
+    async def sync_officer_positions(self, since: Optional[datetime] = None):
+        """Officer-Company 관계 (WORKS_AT) 동기화 (since 지정 시 변경된 포지션의 관계만 교체)"""
         logger.info("[Phase 5] Officer-Company 관계 동기화...")
 
         # PostgreSQL에서 조회
-        rows = await self.pg_conn.fetch("""
-            SELECT officer_id, company_id, position, is_current
-            FROM officer_positions
-        """)
+        # officer_positions.updated_at은 timestamp without time zone
+        rows = await self._fetch(POSITIONS_SQL.format(where=self._since_clause(since, naive=True)), since)
         self.stats['positions']['pg'] = len(rows)
         logger.info(f"  PostgreSQL OfficerPosition: {len(rows)}개")
 
+        # 증분: 임원/회사가 바뀌었을 수 있으므로 기존 관계 삭제 후 재생성
+        replace = """
+            UNWIND $rows AS p
+            OPTIONAL MATCH ()-[old:WORKS_AT {id: p.id}]->()
+            DELETE old
+            WITH count(*) AS replaced
+        """ if since else ""
+
         # 배치 처리
         with self.neo4j_driver.session() as session:
             for i in range(0, len(rows), BATCH_SIZE):
                 batch = rows[i:i+BATCH_SIZE]
-                positions = []
-
-                for r in batch:
-                    positions.append({
-                        'officer_id': str(r['officer_id']),
-                        'company_id': str(r['company_id']),
-                        'position': self._ensure_utf8(r['position']),
-                        'is_current': r['is_current']
-                    })
+                positions = [self._position_row(r) for r in batch]
 
                 try:
-                    result = session.run("""
-                        UNWIND $positions AS p
-                        MATCH (o:Officer {id: p.officer_id})
-                        MATCH (c:Company {id: p.company_id})
-                        CREATE (o)-[r:WORKS_AT {
-                            position: p.position,
-                            is_current: p.is_current
-                        }]->(c)
-                        RETURN count(r) as cnt
-                    """, positions=positions)
+                    result = self._run(session, replace + WORKS_AT_CYPHER, rows=positions)
                     cnt = result.single()['cnt']
                     self.stats['relationships']['works_at'] += cnt
                     self.stats['positions']['synced'] += len(batch)
@@ -308,16 +470,12 @@ class Neo4jFullSyncer:
 
     # ==================== Phase 6: ConvertibleBond 동기화 ====================
 
-    async def sync_convertible_bonds(self):
-        """ConvertibleBond 동기화"""
+    async def sync_convertible_bonds(self, since: Optional[datetime] = None):
+        """ConvertibleBond 동기화 (since 지정 시 이후 변경분만 MERGE + ISSUED 교체)"""
         logger.info("[Phase 6] ConvertibleBond 동기화...")
 
         # PostgreSQL에서 조회
-        rows = await self.pg_conn.fetch("""
-            SELECT id, company_id, issue_amount, conversion_price,
-                   issue_date, maturity_date, interest_rate, bond_name
-            FROM convertible_bonds
-        """)
+        rows = await self._fetch(CBS_SQL.format(where=self._since_clause(since)), since)
         self.stats['cbs']['pg'] = len(rows)
         logger.info(f"  PostgreSQL ConvertibleBond: {len(rows)}개")
 
@@ -325,35 +483,10 @@ class Neo4jFullSyncer:
         with self.neo4j_driver.session() as session:
             for i in range(0, len(rows), BATCH_SIZE):
                 batch = rows[i:i+BATCH_SIZE]
-                cbs = []
-
-                for r in batch:
-                    cbs.append({
-                        'id': str(r['id']),
-                        'company_id': str(r['company_id']) if r['company_id'] else None,
-                        'bond_name': self._ensure_utf8(r['bond_name']),
-                        'issue_amount': float(r['issue_amount']) if r['issue_amount'] else None,
-                        'conversion_price': float(r['conversion_price']) if r['conversion_price'] else None,
-                        'issue_date': r['issue_date'].isoformat() if r['issue_date'] else None,
-                        'maturity_date': r['maturity_date'].isoformat() if r['maturity_date'] else None,
-                        'interest_rate': float(r['interest_rate']) if r['interest_rate'] else None
-                    })
+                cbs = [self._cb_row(r) for r in batch]
 
                 try:
-                    session.run("""
-                        UNWIND $cbs AS cb
-                        CREATE (n:ConvertibleBond {
-                            id: cb.id,
-                            company_id: cb.company_id,
-                            bond_name: cb.bond_name,
-                            issue_amount: cb.issue_amount,
-                            conversion_price: cb.conversion_price,
-                            issue_date: cb.issue_date,
-                            maturity_date: cb.maturity_date,
-                            interest_rate: cb.interest_rate,
-                            synced_at: datetime()
-                        })
-                    """, cbs=cbs)
+                    self._upsert_nodes(session, 'ConvertibleBond', cbs, merge=since is not None)
                     self.stats['cbs']['synced'] += len(batch)
                 except Exception as e:
                     logger.error(f"  CB 배치 오류: {e}")
@@ -361,29 +494,41 @@ class Neo4jFullSyncer:
 
         # Company-CB 관계 생성
         with self.neo4j_driver.session() as session:
-            result = session.run("""
-                MATCH (cb:ConvertibleBond)
-                WHERE cb.company_id IS NOT NULL
-                MATCH (c:Company {id: cb.company_id})
-                CREATE (c)-[r:ISSUED]->(cb)
-                RETURN count(r) as cnt
-            """)
-            self.stats['relationships']['issued'] = result.single()['cnt']
+            if since is None:
+                result = self._run(session, """
+                    MATCH (cb:ConvertibleBond)
+                    WHERE cb.company_id IS NOT NULL
+                    MATCH (c:Company {id: cb.company_id})
+                    CREATE (c)-[r:ISSUED]->(cb)
+                    RETURN count(r) as cnt
+                """)
+                self.stats['relationships']['issued'] = result.single()['cnt']
+            else:
+                # 변경된 CB만 발행사 관계 교체
+                result = self._run(session, """
+                    UNWIND $ids AS cb_id
+                    MATCH (cb:ConvertibleBond {id: cb_id})
+                    OPTIONAL MATCH (cb)<-[old:ISSUED]-()
+                    DELETE old
+                    WITH DISTINCT cb
+                    WHERE cb.company_id IS NOT NULL
+                    MATCH (c:Company {id: cb.company_id})
+                    CREATE (c)-[r:ISSUED]->(cb)
+                    RETURN count(r) as cnt
+                """, ids=[str(r['id']) for r in rows])
+                self.stats['relationships']['issued'] = result.single()['cnt']
 
         logger.info(f"  ✓ ConvertibleBond 동기화 완료: {self.stats['cbs']['synced']}개")
         logger.info(f"  ✓ ISSUED 관계: {self.stats['relationships']['issued']}개")
 
     # ==================== Phase 7: Subscriber 동기화 ====================
 
-    async def sync_subscribers(self):
-        """Subscriber 동기화"""
+    async def sync_subscribers(self, since: Optional[datetime] = None):
+        """Subscriber 동기화 (since 지정 시 이후 변경분만 MERGE + SUBSCRIBED 교체)"""
         logger.info("[Phase 7] Subscriber 동기화...")
 
         # PostgreSQL에서 조회
-        rows = await self.pg_conn.fetch("""
-            SELECT id, cb_id, subscriber_name, subscription_amount, is_related_party
-            FROM cb_subscribers
-        """)
+        rows = await self._fetch(SUBSCRIBERS_SQL.format(where=self._since_clause(since)), since)
         self.stats['subscribers']['pg'] = len(rows)
         logger.info(f"  PostgreSQL Subscriber: {len(rows)}개")
 
@@ -391,29 +536,10 @@ class Neo4jFullSyncer:
         with self.neo4j_driver.session() as session:
             for i in range(0, len(rows), BATCH_SIZE):
                 batch = rows[i:i+BATCH_SIZE]
-                subscribers = []
-
-                for r in batch:
-                    subscribers.append({
-                        'id': str(r['id']),
-                        'cb_id': str(r['cb_id']) if r['cb_id'] else None,
-                        'subscriber_name': self._ensure_utf8(r['subscriber_name']),
-                        'subscription_amount': float(r['subscription_amount']) if r['subscription_amount'] else None,
-                        'is_related_party': self._ensure_utf8(r['is_related_party'])
-                    })
+                subscribers = [self._subscriber_row(r) for r in batch]
 
                 try:
-                    session.run("""
-                        UNWIND $subscribers AS s
-                        CREATE (n:Subscriber {
-                            id: s.id,
-                            cb_id: s.cb_id,
-                            name: s.subscriber_name,
-                            subscription_amount: s.subscription_amount,
-                            is_related_party: s.is_related_party,
-                            synced_at: datetime()
-                        })
-                    """, subscribers=subscribers)
+                    self._upsert_nodes(session, 'Subscriber', subscribers, merge=since is not None)
                     self.stats['subscribers']['synced'] += len(batch)
                 except Exception as e:
                     logger.error(f"  Subscriber 배치 오류: {e}")
@@ -424,18 +550,318 @@ class Neo4jFullSyncer:
 
         # Subscriber-CB 관계 생성
         with self.neo4j_driver.session() as session:
-            result = session.run("""
-                MATCH (s:Subscriber)
-                WHERE s.cb_id IS NOT NULL
-                MATCH (cb:ConvertibleBond {id: s.cb_id})
-                CREATE (s)-[r:SUBSCRIBED]->(cb)
-                RETURN count(r) as cnt
-            """)
-            self.stats['relationships']['subscribed'] = result.single()['cnt']
+            if since is None:
+                result = self._run(session, """
+                    MATCH (s:Subscriber)
+                    WHERE s.cb_id IS NOT NULL
+                    MATCH (cb:ConvertibleBond {id: s.cb_id})
+                    CREATE (s)-[r:SUBSCRIBED]->(cb)
+                    RETURN count(r) as cnt
+                """)
+                self.stats['relationships']['subscribed'] = result.single()['cnt']
+            else:
+                # 변경된 인수자만 CB 관계 교체
+                result = self._run(session, """
+                    UNWIND $ids AS subscriber_id
+                    MATCH (s:Subscriber {id: subscriber_id})
+                    OPTIONAL MATCH (s)-[old:SUBSCRIBED]->()
+                    DELETE old
+                    WITH DISTINCT s
+                    WHERE s.cb_id IS NOT NULL
+                    MATCH (cb:ConvertibleBond {id: s.cb_id})
+                    CREATE (s)-[r:SUBSCRIBED]->(cb)
+                    RETURN count(r) as cnt
+                """, ids=[str(r['id']) for r in rows])
+                self.stats['relationships']['subscribed'] = result.single()['cnt']
 
         logger.info(f"  ✓ Subscriber 동기화 완료: {self.stats['subscribers']['synced']}개")
         logger.info(f"  ✓ SUBSCRIBED 관계: {self.stats['relationships']['subscribed']}개")
 
+    # ==================== 벌크 로드 (--bulk) ====================
+
+    def _bulk_phases(self) -> List[Dict[str, Any]]:
+        """벌크 로드/CSV 단계 (노드 단계가 모두 끝난 뒤 관계 단계)"""
+        return [
+            {'name': 'Company', 'sql': COMPANIES_SQL.format(where=''), 'row': self._company_row,
+             'cypher': self._node_cypher('Company', merge=False), 'stat': 'companies'},
+            {'name': 'Officer', 'sql': OFFICERS_SQL.format(where=''), 'row': self._officer_row,
+             'cypher': self._node_cypher('Officer', merge=False), 'stat': 'officers'},
+            {'name': 'ConvertibleBond', 'sql': CBS_SQL.format(where=''), 'row': self._cb_row,
+             'cypher': self._node_cypher('ConvertibleBond', merge=False), 'stat': 'cbs'},
+            {'name': 'Subscriber', 'sql': SUBSCRIBERS_SQL.format(where=''), 'row': self._subscriber_row,
+             'cypher': self._node_cypher('Subscriber', merge=False), 'stat': 'subscribers'},
+            {'name': 'WORKS_AT', 'sql': POSITIONS_SQL.format(where=''), 'row': self._position_row,
+             'cypher': WORKS_AT_CYPHER, 'stat': 'positions', 'rel': 'works_at',
+             'start': ('Officer', 'officer_id'), 'end': ('Company', 'company_id'),
+             'props': ('id', 'position', 'is_current')},
+            {'name': 'ISSUED',
+             'sql': "SELECT id, company_id FROM convertible_bonds WHERE company_id IS NOT NULL",
+             'row': lambda r: {'id': str(r['id']), 'company_id': str(r['company_id'])},
+             'cypher': ISSUED_CYPHER, 'rel': 'issued',
+             'start': ('Company', 'company_id'), 'end': ('ConvertibleBond', 'id'), 'props': ()},
+            {'name': 'SUBSCRIBED',
+             'sql': "SELECT id, cb_id FROM cb_subscribers WHERE cb_id IS NOT NULL",
+             'row': lambda r: {'id': str(r['id']), 'cb_id': str(r['cb_id'])},
+             'cypher': SUBSCRIBED_CYPHER, 'rel': 'subscribed',
+             'start': ('Subscriber', 'id'), 'end': ('ConvertibleBond', 'cb_id'), 'props': ()},
+        ]
+
+    async def _stream(self, query: str, batch_size: int):
+        """서버 측 커서로 batch_size행씩 조회 (전체 결과를 메모리에 올리지 않음)"""
+        async with self.pg_conn.transaction():
+            cursor = await self.pg_conn.cursor(query)
+            while True:
+                rows = await cursor.fetch(batch_size)
+                if not rows:
+                    break
+                yield rows
+
+    def _write_batch(self, cypher: str, rows: List[Dict[str, Any]]) -> int:
+        """관리 트랜잭션으로 배치 쓰기 (동시 쓰기 중 교착 등 일시 오류는 드라이버가 재시도)"""
+        def work(tx):
+            record = tx.run(cypher, rows=rows).single()
+            return record['cnt'] if record else len(rows)
+
+        with self.neo4j_driver.session() as session:
+            return session.execute_write(work)
+
+    def _record_phase(self, name: str, rows: int, seconds: float):
+        rate = rows / seconds if seconds > 0 else 0.0
+        self.phase_metrics[name] = {'rows': rows, 'seconds': round(seconds, 2), 'rows_per_sec': round(rate)}
+        logger.info(f"  ✓ {name}: {rows:,}행 / {seconds:.1f}초 ({rate:,.0f}행/초)")
+
+    async def _bulk_phase(self, phase: Dict[str, Any], batch_size: int, workers: int):
+        cypher = self._cypher(phase['cypher'])
+        stat = self.stats.get(phase.get('stat'))
+        # 쓰기 대기 배치를 workers개로 제한 → 조회가 쓰기보다 빨라도 메모리 상한 유지
+        semaphore = asyncio.Semaphore(workers)
+        tasks = []
+        total = 0
+
+        async def write(rows: List[Dict[str, Any]]):
+            try:
+                written = await asyncio.to_thread(self._write_batch, cypher, rows)
+                if 'rel' in phase:
+                    self.stats['relationships'][phase['rel']] += written
+                if stat:
+                    stat['synced'] += len(rows)
+            except Exception as e:
+                logger.error(f"  {phase['name']} 배치 오류: {e}")
+                if stat:
+                    stat['errors'] += len(rows)
+            finally:
+                semaphore.release()
+
+        start = time.perf_counter()
+        async for records in self._stream(phase['sql'], batch_size):
+            await semaphore.acquire()
+            rows = [phase['row'](r) for r in records]
+            total += len(rows)
+            tasks.append(asyncio.create_task(write(rows)))
+        await asyncio.gather(*tasks)
+
+        if stat:
+            stat['pg'] = total
+        self._record_phase(phase['name'], total, time.perf_counter() - start)
+
+    async def bulk_load(self, batch_size: int = BULK_BATCH_SIZE, workers: int = BULK_WORKERS):
+        """전체 재구축용 벌크 로드 (Phase 3-7 대체)"""
+        logger.info(f"[Phase 3-7] 벌크 로드 (batch={batch_size}, workers={workers})...")
+
+        # 동일인 식별 (person_id 미지정 임원) → Neo4j 경력 조회가 person_id 동등 비교
+        from app.services.officer_identity import resolve_officer_identities
+        await resolve_officer_identities(self.pg_conn)
+
+        for phase in self._bulk_phases():
+            await self._bulk_phase(phase, batch_size, workers)
+
+    async def export_csv(self, out_dir: Path, batch_size: int = BULK_BATCH_SIZE) -> List[str]:
+        """
+        neo4j-admin database import용 CSV 생성 (오프라인 재구축)
+
+        Returns:
+            neo4j-admin 인자 목록 (--nodes=..., --relationships=...)
+        """
+        out_dir.mkdir(parents=True, exist_ok=True)
+        from app.services.officer_identity import resolve_officer_identities
+        await resolve_officer_identities(self.pg_conn)
+
+        def header_for(name: str) -> str:
+            return f"{name}:{CSV_TYPES[name]}" if name in CSV_TYPES else name
+
+        def csv_value(value):
+            if value is None:
+                return ''
+            if isinstance(value, bool):
+                return 'true' if value else 'false'
+            return value
+
+        import_args = []
+        for phase in self._bulk_phases():
+            path = out_dir / f"{phase['name']}.csv"
+            start = time.perf_counter()
+            total = 0
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if 'start' in phase:
+                    (start_label, start_key), (end_label, end_key) = phase['start'], phase['end']
+                    writer.writerow(
+                        [f":START_ID({start_label})", f":END_ID({end_label})"]
+                        + [header_for(n) for n in phase['props']]
+                    )
+
+                prop_names = None
+                async for records in self._stream(phase['sql'], batch_size):
+                    rows = [phase['row'](r) for r in records]
+                    total += len(rows)
+                    if 'start' in phase:
+                        writer.writerows(
+                            [row[start_key], row[end_key]] + [csv_value(row[n]) for n in phase['props']]
+                            for row in rows
+                        )
+                        continue
+
+                    # 노드 속성 컬럼은 행 변환 결과 기준
+                    if prop_names is None:
+                        prop_names = list(rows[0]['props'].keys())
+                        writer.writerow([f"id:ID({phase['name']})"] + [header_for(n) for n in prop_names])
+                    writer.writerows(
+                        [row['id']] + [csv_value(row['props'][n]) for n in prop_names] for row in rows
+                    )
+
+                if 'start' not in phase and prop_names is None:
+                    writer.writerow([f"id:ID({phase['name']})"])
+
+            self._record_phase(f"CSV {phase['name']}", total, time.perf_counter() - start)
+            kind = 'relationships' if 'start' in phase else 'nodes'
+            import_args.append(f"--{kind}={phase['name']}={path}")
+
+        return import_args
+
+    # ==================== 증분: 삭제 반영 ====================
+
+    async def delete_removed(self):
+        """PostgreSQL에서 삭제된 행을 id 비교로 Neo4j에서 삭제"""
+        logger.info("[증분] 삭제된 행 반영...")
+
+        targets = [
+            ('companies', 'Company', 'companies'),
+            ('officers', 'Officer', 'officers'),
+            ('convertible_bonds', 'ConvertibleBond', 'cbs'),
+            ('cb_subscribers', 'Subscriber', 'subscribers'),
+        ]
+
+        with self.neo4j_driver.session() as session:
+            for table, label, stat_key in targets:
+                pg_ids = {str(r['id']) for r in await self.pg_conn.fetch(f"SELECT id FROM {table}")}
+                neo4j_ids = {
+                    r['id'] for r in session.run(f"MATCH (n:{label}) WHERE n.id IS NOT NULL RETURN n.id AS id")
+                }
+                removed = list(neo4j_ids - pg_ids)
+                for i in range(0, len(removed), DELETE_BATCH_SIZE):
+                    session.run(f"""
+                        UNWIND $ids AS id
+                        MATCH (n:{label} {{id: id}})
+                        DETACH DELETE n
+                    """, ids=removed[i:i + DELETE_BATCH_SIZE])
+                self.stats[stat_key]['deleted'] = len(removed)
+                logger.info(f"  ✓ {label} {len(removed)}개 삭제")
+
+            # position id가 있는 WORKS_AT만 대상 (다른 스크립트가 만든 관계는 유지)
+            pg_ids = {str(r['id']) for r in await self.pg_conn.fetch("SELECT id FROM officer_positions")}
+            neo4j_ids = {
+                r['id'] for r in session.run(
+                    "MATCH ()-[r:WORKS_AT]->() WHERE r.id IS NOT NULL RETURN r.id AS id"
+                )
+            }
+            removed = list(neo4j_ids - pg_ids)
+            for i in range(0, len(removed), DELETE_BATCH_SIZE):
+                session.run("""
+                    UNWIND $ids AS id
+                    MATCH ()-[r:WORKS_AT {id: id}]->()
+                    DELETE r
+                """, ids=removed[i:i + DELETE_BATCH_SIZE])
+            self.stats['positions']['deleted'] = len(removed)
+            logger.info(f"  ✓ WORKS_AT {len(removed)}개 삭제")
+
+    # ==================== 워터마크 ====================
+
+    def get_watermark(self) -> Optional[datetime]:
+        """마지막 동기화 워터마크 (없으면 None → 전체 동기화 필요)"""
+        with self.neo4j_driver.session() as session:
+            record = session.run(
+                "MATCH (s:SyncState {id: $id}) RETURN s.watermark AS watermark", id=SYNC_STATE_ID
+            ).single()
+        if not record or not record['watermark']:
+            return None
+        return datetime.fromisoformat(record['watermark'])
+
+    def set_watermark(self, watermark: datetime, mode: str):
+        with self.neo4j_driver.session() as session:
+            session.run("""
+                MERGE (s:SyncState {id: $id})
+                SET s.watermark = $watermark, s.mode = $mode, s.synced_at = datetime()
+            """, id=SYNC_STATE_ID, watermark=watermark.isoformat(), mode=mode)
+
+    def error_count(self) -> int:
+        """배치 오류로 반영되지 않은 행 수"""
+        return sum(stat.get('errors', 0) for stat in self.stats.values())
+
+    def advance_watermark(self, watermark: datetime, mode: str) -> bool:
+        """
+        배치 오류 없이 끝난 경우에만 워터마크 전진
+
+        배치 오류는 예외 없이 stats에만 집계되므로, 오류가 있는데 워터마크를 옮기면
+        실패한 행은 다음 증분 동기화에서도 조회되지 않는다.
+        """
+        errors = self.error_count()
+        if errors:
+            logger.warning(f"  배치 오류 {errors}건: 워터마크 유지 (다음 증분에서 재시도)")
+            return False
+        self.set_watermark(watermark, mode)
+        return True
+
+    # ==================== blue-green 교체 ====================
+
+    def _delete_label_in_batches(self, session, label: str) -> int:
+        deleted = 0
+        while True:
+            result = session.run(f"""
+                MATCH (n:{label})
+                WITH n LIMIT {DELETE_BATCH_SIZE}
+                DETACH DELETE n
+                RETURN count(n) as deleted
+            """)
+            count = result.single()['deleted']
+            deleted += count
+            if count == 0:
+                return deleted
+
+    def prepare_shadow(self):
+        """이전 실패 실행이 남긴 shadow/retired 노드 정리"""
+        logger.info("[blue-green] shadow 라벨 정리...")
+        with self.neo4j_driver.session() as session:
+            for label in SYNCED_LABELS:
+                for prefix in (SHADOW_PREFIX, RETIRED_PREFIX):
+                    deleted = self._delete_label_in_batches(session, f"{prefix}{label}")
+                    if deleted:
+                        logger.info(f"  ✓ {prefix}{label} {deleted}개 삭제")
+
+    def swap_shadow(self):
+        """shadow 그래프를 한 트랜잭션에서 서비스 라벨로 교체, 기존 노드는 retired 후 배치 삭제"""
+        logger.info("[blue-green] 라벨 교체...")
+        with self.neo4j_driver.session() as session:
+            with session.begin_transaction() as tx:
+                for label in SYNCED_LABELS:
+                    tx.run(f"MATCH (n:{label}) REMOVE n:{label} SET n:{RETIRED_PREFIX}{label}")
+                    tx.run(f"MATCH (n:{SHADOW_PREFIX}{label}) REMOVE n:{SHADOW_PREFIX}{label} SET n:{label}")
+                tx.commit()
+            logger.info("  ✓ 교체 완료")
+
+            for label in SYNCED_LABELS:
+                deleted = self._delete_label_in_batches(session, f"{RETIRED_PREFIX}{label}")
+                logger.info(f"  ✓ 이전 {label} {deleted}개 삭제")
+
     # ==================== Phase 8: 검증 ====================
 
     def verify_sync(self):
@@ -505,12 +931,30 @@ class Neo4jFullSyncer:
 
     # ==================== Main ====================
 
-    async def run(self, skip_cleanup: bool = False):
-        """전체 동기화 실행"""
+    async def run(
+        self,
+        skip_cleanup: bool = False,
+        mode: str = 'full',
+        bulk: bool = False,
+        batch_size: int = BULK_BATCH_SIZE,
+        workers: int = BULK_WORKERS,
+        since: Optional[datetime] = None,
+    ):
+        """
+        동기화 실행
+
+        Args:
+            skip_cleanup: (full) 기존 데이터 삭제 스킵
+            mode: full | blue-green | incremental
+            bulk: (full, blue-green) 서버 측 커서 + 병렬 쓰기 벌크 로드 사용
+            batch_size: 벌크 로드 배치 크기
+            workers: 벌크 로드 동시 쓰기 트랜잭션 수
+            since: (incremental) 저장된 워터마크 대신 사용할 기준 시각
+        """
         start_time = datetime.now()
 
         logger.info("=" * 60)
-        logger.info("PostgreSQL → Neo4j 전체 동기화 시작")
+        logger.info(f"PostgreSQL → Neo4j 동기화 시작 ({mode})")
         logger.info(f"시작 시간: {start_time}")
         logger.info("=" * 60)
 
@@ -520,16 +964,48 @@ class Neo4jFullSyncer:
             # Phase 1: 제약조건
             self.create_constraints()
 
-            # Phase 2: Stale 데이터 정리
-            if not skip_cleanup:
+            # 읽기 전에 워터마크 확보 (동기화 중 변경된 행은 다음 증분에서 다시 반영)
+            watermark = await self.pg_conn.fetchval("SELECT NOW()")
+
+            if mode == 'incremental':
+                since = since or self.get_watermark()
+                if since is None:
+                    raise RuntimeError("워터마크 없음: --blue-green 또는 전체 동기화를 먼저 실행하세요")
+                logger.info(f"  워터마크: {since.isoformat()}")
+            else:
+                since = None
+
+            if mode == 'blue-green':
+                self.prepare_shadow()
+                self.shadow = True
+            elif mode == 'full' and not skip_cleanup:
+                # Phase 2: Stale 데이터 정리
                 self.cleanup_stale_data()
 
             # Phase 3-7: 데이터 동기화
-            await self.sync_companies()
-            await self.sync_officers()
-            await self.sync_officer_positions()
-            await self.sync_convertible_bonds()
-            await self.sync_subscribers()
+            if bulk and mode != 'incremental':
+                await self.bulk_load(batch_size, workers)
+            else:
+                await self.sync_companies(since)
+                await self.sync_officers(since)
+                await self.sync_officer_positions(since)
+                await self.sync_convertible_bonds(since)
+                await self.sync_subscribers(since)
+
+            if mode == 'incremental':
+                await self.delete_removed()
+            elif mode == 'blue-green':
+                self.shadow = False
+                self.swap_shadow()
+
+            self.advance_watermark(watermark, mode)
+
+            # 순환 투자 인덱스 갱신 (전체 동기화는 삭제된 인수자 행까지 반영하도록 재계산)
+            from app.services.investment_cycles import rebuild_investment_cycles, refresh_investment_cycles
+            if mode == 'incremental':
+                await refresh_investment_cycles(self.pg_conn)
+            else:
+                await rebuild_investment_cycles(self.pg_conn)
 
             # Phase 8: 검증
             success = self.verify_sync()
@@ -540,6 +1016,10 @@ class Neo4jFullSyncer:
             logger.info("")
             logger.info(f"완료 시간: {end_time}")
             logger.info(f"소요 시간: {duration}")
+            if self.phase_metrics:
+                logger.info("단계별 처리량:")
+                for name, metric in self.phase_metrics.items():
+                    logger.info(f"  {name}: {metric['rows']:,}행 ({metric['rows_per_sec']:,}행/초)")
             logger.info("")
 
             if success:
@@ -554,16 +1034,59 @@ class Neo4jFullSyncer:
             raise
         finally:
             await self.close()
+            # 그래프 API 응답 캐시 무효화 (부분 실패여도 Neo4j 데이터는 바뀌었음)
+            from app.services.graph_cache import invalidate_graph_cache
+            await invalidate_graph_cache()
+
+
+async def export_for_admin_import(out_dir: Path, batch_size: int):
+    """neo4j-admin import용 CSV 생성 (Neo4j 연결 불필요)"""
+    syncer = Neo4jFullSyncer()
+    syncer.pg_conn = await asyncpg.connect(DB_URL)
+    try:
+        watermark = await syncer.pg_conn.fetchval("SELECT NOW()")
+        import_args = await syncer.export_csv(out_dir, batch_size)
+    finally:
+        await syncer.close()
+
+    logger.info("")
+    logger.info("오프라인 재구축 (Neo4j 중지 후):")
+    logger.info(
+        "  neo4j-admin database import full neo4j --overwrite-destination "
+        "--multiline-fields=true --skip-bad-relationships \\"
+    )
+    for arg in import_args:
+        logger.info(f"    {arg} \\")
+    logger.info("  이후 제약조건 생성 + 워터마크 기록 (CSV 생성 중 변경분 반영):")
+    logger.info(f"  python scripts/sync/full_neo4j_sync.py --incremental --since {watermark.isoformat()}")
 
 
 async def main():
     import argparse
     parser = argparse.ArgumentParser(description='PostgreSQL → Neo4j 전체 동기화')
     parser.add_argument('--skip-cleanup', action='store_true', help='기존 데이터 삭제 스킵')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--incremental', action='store_true', help='워터마크 이후 변경분만 동기화')
+    mode.add_argument('--blue-green', action='store_true', help='shadow 라벨로 빌드 후 교체 (무중단 전체 동기화)')
+    mode.add_argument('--export-csv', type=Path, metavar='DIR', help='neo4j-admin import용 CSV만 생성')
+    parser.add_argument('--since', type=datetime.fromisoformat, help='증분 기준 시각 (기본: 저장된 워터마크)')
+    parser.add_argument('--bulk', action='store_true', help='전체/blue-green 동기화를 벌크 로드로 실행')
+    parser.add_argument('--batch-size', type=int, default=BULK_BATCH_SIZE, help=f'벌크 배치 크기 (기본 {BULK_BATCH_SIZE})')
+    parser.add_argument('--workers', type=int, default=BULK_WORKERS, help=f'벌크 동시 쓰기 수 (기본 {BULK_WORKERS})')
     args = parser.parse_args()
 
+    if args.export_csv:
+        await export_for_admin_import(args.export_csv, args.batch_size)
+        return
+
     syncer = Neo4jFullSyncer()
-    await syncer.run(skip_cleanup=args.skip_cleanup)
+    bulk_options = {'bulk': args.bulk, 'batch_size': args.batch_size, 'workers': args.workers}
+    if args.incremental:
+        await syncer.run(mode='incremental', since=args.since)
+    elif args.blue_green:
+        await syncer.run(mode='blue-green', **bulk_options)
+    else:
+        await syncer.run(skip_cleanup=args.skip_cleanup, **bulk_options)
 
 
 if __name__ == "__main__":
@@ -15,8 +15,11 @@ Neo4j 임원 데이터 재동기화 스크립트
 import logging
 import sys
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 import psycopg2
 from neo4j import GraphDatabase
 
@@ -210,7 +213,7 @@ class OfficerResyncer:
         while offset < total:
             cursor.execute(f"""
                 SELECT id::text, name, position, current_company_id::text,
-                       birth_date, gender
+                       birth_date, gender, person_id::text
                 FROM officers
                 ORDER BY id
                 LIMIT {BATCH_SIZE} OFFSET {offset}
@@ -233,6 +236,7 @@ class OfficerResyncer:
                     "company_id": row[3],
                     "birth_date": birth_date,
                     "gender": row[5],
+                    "person_id": row[6],
                 })
 
             if officers:
@@ -246,6 +250,7 @@ class OfficerResyncer:
                             company_id: o.company_id,
                             birth_date: o.birth_date,
                             gender: o.gender,
+                            person_id: o.person_id,
                             synced_at: datetime()
                         })
                     """, officers=officers)
@@ -411,6 +416,9 @@ class OfficerResyncer:
             raise
         finally:
             self.close()
+            # 그래프 API 응답 캐시 무효화
+            from app.services.graph_cache import invalidate_graph_cache_sync
+            invalidate_graph_cache_sync()
 
 
 def main():
@@ -6,8 +6,12 @@ CB 데이터를 Neo4j에 동기화하는 독립 스크립트
 import asyncio
 import asyncpg
 import logging
+import sys
+from pathlib import Path
 from neo4j import AsyncGraphDatabase
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -222,6 +226,10 @@ async def main():
             count = record["count"] if record else 0
         logger.info(f"  INVESTED_IN 관계 {count}개 생성 완료")
 
+        # 순환 투자 인덱스 증분 갱신 (변경된 CB/인수자 행 기준)
+        from app.services.investment_cycles import refresh_investment_cycles
+        await refresh_investment_cycles(conn)
+
         # 6. 통계 확인
         logger.info("=" * 60)
         logger.info("Neo4j CB 네트워크 통계")
@@ -269,6 +277,9 @@ async def main():
     finally:
         await conn.close()
         await driver.close()
+        # 그래프 API 응답 캐시 무효화
+        from app.services.graph_cache import invalidate_graph_cache
+        await invalidate_graph_cache()
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ from neo4j import AsyncGraphDatabase
 from app.database import AsyncSessionLocal
 from app.models.companies import Company
 from app.config import settings
+from app.services.graph_cache import invalidate_graph_cache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -210,7 +211,11 @@ class CompanySyncer:
 async def main():
     """메인"""
     syncer = CompanySyncer()
-    await syncer.run()
+    try:
+        await syncer.run()
+    finally:
+        # 그래프 API 응답 캐시 무효화
+        await invalidate_graph_cache()
 
 
 if __name__ == "__main__":
@@ -13,9 +13,13 @@ Docker PostgreSQL에 직접 연결하여 동기화
 import logging
 import subprocess
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Any, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 from neo4j import GraphDatabase
 
 logging.basicConfig(
@@ -520,7 +524,12 @@ def main():
     import sys
     clear_first = "--no-clear" not in sys.argv
     syncer = DockerNeo4jSyncer()
-    syncer.run(clear_first=clear_first)
+    try:
+        syncer.run(clear_first=clear_first)
+    finally:
+        # 그래프 API 응답 캐시 무효화
+        from app.services.graph_cache import invalidate_graph_cache_sync
+        invalidate_graph_cache_sync()
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
 import psycopg2
 from neo4j import GraphDatabase
 
@@ -480,6 +482,9 @@ class Neo4jSyncer:
             raise
         finally:
             self.close()
+            # 그래프 API 응답 캐시 무효화
+            from app.services.graph_cache import invalidate_graph_cache_sync
+            invalidate_graph_cache_sync()
 
 
 def main():
@@ -20,6 +20,7 @@ import uuid
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 # Configuration
 NEO4J_URI = os.getenv('NEO4J_URI', 'neo4j://localhost:7687')
@@ -235,8 +236,11 @@ class TemporalDataSync:
 
         inserted = 0
         updated = 0
+        officer_ids = []
 
         for officer in officers:
+            officer_id = officer.get('id') or str(uuid.uuid4())
+            officer_ids.append(officer_id)
             await self.pg_conn.execute("""
                 INSERT INTO officers (
                     id, name, name_en, resident_number_hash, position,
@@ -254,7 +258,7 @@ class TemporalDataSync:
                     board_count = EXCLUDED.board_count,
                     updated_at = NOW()
             """,
-                officer.get('id') or str(uuid.uuid4()),
+                officer_id,
                 officer.get('name'),
                 officer.get('name_en'),
                 officer.get('resident_number_hash'),
@@ -268,6 +272,14 @@ class TemporalDataSync:
 
         print(f"  ✓ Officers: {inserted} 동기화 완료")
 
+        # 동일인 식별 (이름이 바뀐 임원도 person_id 재계산)
+        try:
+            from app.services.officer_identity import resolve_officer_identities
+            linked = await resolve_officer_identities(self.pg_conn, officer_ids=officer_ids, only_missing=False)
+            print(f"  ✓ Officer person_id: {linked} 지정")
+        except Exception as e:
+            print(f"  ⚠ Officer person_id 지정 실패 (backfill_officer_identities로 보정): {e}")
+
     async def sync_officer_positions(self, positions: List[Dict[str, Any]]):
         """Officer Positions 동기화 (UPSERT - Temporal 데이터)"""
         print("\n[동기화 2.5/4] Officer Positions → PostgreSQL (Temporal)")
@@ -0,0 +1,198 @@
+"""
+RaymondsIndex v3.0 배열/일괄 계산 패리티 테스트
+
+테스트 대상:
+- *_array 정규화 함수: 스칼라 함수를 원소마다 호출한 결과와 동일한지
+- SubIndexCalculator.calculate_batch: calculate와 동일한지
+- RaymondsIndexCalculatorV3.calculate_batch: calculate와 동일한지
+"""
+
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.services.raymonds_index_v3.engine import RaymondsIndexCalculatorV3
+from app.services.raymonds_index_v3.constants import SUBINDEX_WEIGHTS
+from app.services.raymonds_index_v3.normalizers import (
+    min_max_normalize,
+    v_score_normalize,
+    inverse_normalize,
+    clamp,
+    winsorize,
+    geometric_mean_weighted,
+    arithmetic_mean_weighted,
+    min_max_normalize_array,
+    v_score_normalize_array,
+    inverse_normalize_array,
+    clamp_array,
+    winsorize_array,
+    geometric_mean_weighted_array,
+    arithmetic_mean_weighted_array,
+)
+
+FIELDS = [
+    'revenue', 'operating_income', 'net_income', 'total_assets',
+    'total_liabilities', 'total_equity', 'operating_cash_flow',
+    'investing_cash_flow', 'financing_cash_flow', 'capex', 'r_and_d_expense',
+    'dividend_paid', 'cash_and_equivalents', 'short_term_investments', 'tangible_assets',
+]
+
+
+def _random_values(seed: int, count: int) -> list:
+    """경계값/None/극단값 포함 무작위 값"""
+    rng = random.Random(seed)
+    specials = [None, 0, -50, 50, 0.1, 3.0, 15.0, 35.0, 100, -1e6, 1e6]
+    return [
+        rng.choice(specials) if rng.random() < 0.2 else rng.uniform(-200, 200)
+        for _ in range(count)
+    ]
+
+
+def _random_companies(seed: int, count: int) -> dict:
+    """무작위 회사 재무 데이터 (결측, 0, 음수, 1~5개 연도)"""
+    rng = random.Random(seed)
+    companies = {}
+    for i in range(count):
+        years = sorted(rng.sample(range(2018, 2026), rng.choice([1, 2, 3, 5, 5])))
+        rows = []
+        for year in years:
+            row = {'fiscal_year': year}
+            for field in FIELDS:
+                roll = rng.random()
+                if roll < 0.08:
+                    row[field] = None
+                elif roll < 0.15:
+                    row[field] = 0
+                else:
+                    value = rng.uniform(1e8, 5e11)
+                    if field in ('operating_income', 'net_income', 'operating_cash_flow',
+                                 'investing_cash_flow', 'financing_cash_flow') and rng.random() < 0.3:
+                        value = -value
+                    row[field] = value
+            rows.append(row)
+        companies[f"company-{i}"] = rows
+    return companies
+
+
+def _assert_same(batch: list, scalar: list):
+    assert len(batch) == len(scalar)
+    for b, s in zip(batch, scalar):
+        assert (b is None and s is None) or b == s
+
+
+class TestArrayNormalizers:
+    """배열 정규화 함수 ↔ 스칼라 함수"""
+
+    values = _random_values(seed=20261016, count=5000)
+
+    def test_min_max_normalize(self):
+        result = min_max_normalize_array(self.values, 0.1, 3.0).tolist()
+        _assert_same(result, [min_max_normalize(v, 0.1, 3.0) for v in self.values])
+
+    def test_min_max_invalid_goalpost(self):
+        assert min_max_normalize_array(self.values, 1.0, 1.0).tolist() == [50.0] * len(self.values)
+
+    @pytest.mark.parametrize("optimal,min_val,max_val", [
+        (0.0, -50.0, 50.0),   # 투자괴리율
+        (35.0, 0.0, 100.0),   # 주주환원율
+        (15.0, 5.0, 50.0),    # 현금/자산
+        (0.0, 0.0, 10.0),     # 최적값 = 최소값
+        (10.0, 0.0, 10.0),    # 최적값 = 최대값
+    ])
+    def test_v_score_normalize(self, optimal, min_val, max_val):
+        result = v_score_normalize_array(self.values, optimal, min_val, max_val).tolist()
+        _assert_same(result, [v_score_normalize(v, optimal, min_val, max_val) for v in self.values])
+
+    def test_inverse_normalize(self):
+        result = inverse_normalize_array(self.values, 0.0, 10.0).tolist()
+        _assert_same(result, [inverse_normalize(v, 0.0, 10.0) for v in self.values])
+
+    @pytest.mark.parametrize("metric", ['capex_growth', 'investment_gap', 'unknown_metric'])
+    def test_clamp(self, metric):
+        result = clamp_array(self.values, metric).tolist()
+        _assert_same(result, [clamp(v, metric) for v in self.values])
+
+    def test_winsorize_keeps_none_positions(self):
+        result = winsorize_array(self.values)
+        expected = winsorize(self.values)
+        for b, s in zip(result.tolist(), expected):
+            assert (s is None and b != b) or b == s
+
+    def test_winsorize_small_sample_skipped(self):
+        assert winsorize_array([1.0, 1000.0, -1000.0]).tolist() == [1.0, 1000.0, -1000.0]
+
+    @pytest.mark.parametrize("weights", [
+        SUBINDEX_WEIGHTS,
+        {'CEI': 0.2, 'RII': 0.35, 'CGI': 0.25, 'MAI': 0.1},  # 가중치 합 ≠ 1 보정
+        {'CEI': 0.5, 'RII': 0.5, 'XXX': 1.0},                # 없는 키는 제외
+    ])
+    def test_weighted_means(self, weights):
+        rng = random.Random(7)
+        keys = ['CEI', 'RII', 'CGI', 'MAI']
+        scores = {
+            key: [
+                None if rng.random() < 0.03 else rng.choice([rng.uniform(-5, 100), 0, 1.0, 100])
+                for _ in range(5000)
+            ]
+            for key in keys
+        }
+        rows = [{key: scores[key][i] for key in keys} for i in range(5000)]
+
+        _assert_same(
+            geometric_mean_weighted_array(scores, weights).tolist(),
+            [geometric_mean_weighted(row, weights) for row in rows],
+        )
+        _assert_same(
+            arithmetic_mean_weighted_array(scores, weights).tolist(),
+            [arithmetic_mean_weighted(row, weights) for row in rows],
+        )
+
+
+class TestCalculateBatch:
+    """RaymondsIndexCalculatorV3.calculate_batch ↔ calculate"""
+
+    @pytest.mark.parametrize("target_year", [None, 2025])
+    @pytest.mark.parametrize("use_geometric_mean", [True, False])
+    def test_random_companies_match_scalar(self, target_year, use_geometric_mean):
+        """무작위 회사 400개: 점수/등급/지표/신호/해석 모두 일치"""
+        companies = _random_companies(seed=20261016, count=400)
+        calculator = RaymondsIndexCalculatorV3(use_geometric_mean=use_geometric_mean)
+
+        results = calculator.calculate_batch(companies, target_year=target_year)
+
+        assert [r.company_id for r in results] == list(companies)
+        for result in results:
+            expected = calculator.calculate(result.company_id, companies[result.company_id], target_year)
+            assert result.to_dict() == expected.to_dict()
+
+        assert any(r.status == 'SUCCESS' for r in results)
+        assert any(r.status == 'DATA_INSUFFICIENT' for r in results)
+
+    def test_industry_weights(self):
+        """업종별 가중치 조정 반영"""
+        companies = _random_companies(seed=11, count=100)
+        calculator = RaymondsIndexCalculatorV3(industry_sector='반도체')
+
+        for result in calculator.calculate_batch(companies):
+            expected = calculator.calculate(result.company_id, companies[result.company_id])
+            assert result.total_score == expected.total_score
+            assert result.grade == expected.grade
+
+    def test_sub_index_batch_matches_calculate(self):
+        """Sub-Index 계산기 단위 일치"""
+        calculator = RaymondsIndexCalculatorV3()
+        data = [
+            calculator._convert_to_dict_format(sorted(rows, key=lambda x: x['fiscal_year']))
+            for rows in _random_companies(seed=3, count=200).values()
+        ]
+        for calc in (calculator.cei_calc, calculator.rii_calc, calculator.cgi_calc, calculator.mai_calc):
+            batch = calc.calculate_batch([calc._calculate_raw_metrics(d) for d in data])
+            for result, d in zip(batch, data):
+                assert result.to_dict() == calc.calculate(d).to_dict()
+
+    def test_empty(self):
+        assert RaymondsIndexCalculatorV3().calculate_batch({}) == []
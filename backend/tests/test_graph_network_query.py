@@ -0,0 +1,53 @@
+"""
+회사 네트워크 Cypher 구성 테스트
+
+테스트 대상:
+- _company_network_query: depth별 Cypher 문자열 생성 (f-string 중괄호 이스케이프)
+"""
+
+import asyncio
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.endpoints.graph import (
+    _COMPANY_NETWORK_NODE_GROUPS,
+    _COMPANY_NETWORK_REL_GROUPS,
+    _company_network_query,
+)
+
+
+def _build(company_id: str, depth: int) -> str:
+    # report_years 없으면 DB 조회 없음
+    cypher, officer_ids = asyncio.run(_company_network_query(company_id, depth, None, None))
+    assert officer_ids is None
+    return cypher
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3])
+def test_binds_all_groups(depth):
+    """모든 노드/관계 그룹이 마지막 WITH 절에 바인딩됨"""
+    cypher = _build("00126380", depth)
+    for name, _, _ in _COMPANY_NETWORK_NODE_GROUPS[1:]:
+        assert f"as {name}" in cypher
+    for name in _COMPANY_NETWORK_REL_GROUPS:
+        assert f"as {name}" in cypher
+
+
+def test_depth3_same_person_match():
+    """3단계 동일인 매칭: person_id 또는 자기 자신 (person_id 미지정 임원도 경력 유지)"""
+    cypher = _build("00126380", 3)
+    assert "(same_officer.person_id = o.person_id OR same_officer.id = o.id)" in cypher
+    # f-string 중괄호가 그대로 남지 않음
+    assert "{{" not in cypher and "}}" not in cypher
+
+
+@pytest.mark.parametrize("company_id,match", [
+    ("00126380", "MATCH (c:Company {corp_code: $company_id})"),
+    ("6f1c2a4e-0000-0000-0000-000000000000", "MATCH (c:Company {id: $company_id})"),
+])
+def test_company_match(company_id, match):
+    assert _build(company_id, 3).lstrip().startswith(match)
@@ -0,0 +1,143 @@
+"""
+순환 투자 열거 테스트
+
+테스트 대상:
+- _strongly_connected: Tarjan SCC (반복 구현)
+- find_cycles: 길이 제한 순환 열거 (전체 / through= 증분)
+"""
+
+import itertools
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.investment_cycles import _strongly_connected, find_cycles
+
+
+def _edges(*pairs, amount=100.0, count=1) -> dict:
+    """(투자 회사, 발행 회사) 목록 → InvestmentEdges"""
+    edges = {}
+    for investor, issuer in pairs:
+        edges.setdefault(investor, {})[issuer] = (count, amount)
+    return edges
+
+
+def _keys(cycles: list) -> set:
+    return {c["cycle_key"] for c in cycles}
+
+
+def _brute_force(edges: dict, max_length: int) -> set:
+    """모든 노드 순열을 확인하는 기준 구현 (최소 ID 회전 키)"""
+    nodes = sorted(set(edges) | {n for succs in edges.values() for n in succs})
+    keys = set()
+    for length in range(1, max_length + 1):
+        for perm in itertools.permutations(nodes, length):
+            if perm[0] != min(perm):
+                continue
+            if all(perm[(i + 1) % length] in edges.get(perm[i], {}) for i in range(length)):
+                keys.add("->".join(perm))
+    return keys
+
+
+def _random_edges(seed: int, n_nodes: int, n_edges: int) -> dict:
+    rng = random.Random(seed)
+    nodes = [f"c{i:02d}" for i in range(n_nodes)]
+    edges = {}
+    for _ in range(n_edges):
+        investor, issuer = rng.choice(nodes), rng.choice(nodes)
+        edges.setdefault(investor, {})[issuer] = (rng.randint(1, 5), float(rng.randint(1, 1000)))
+    return edges
+
+
+class TestStronglyConnected:
+
+    def test_components(self):
+        edges = _edges(("a", "b"), ("b", "a"), ("b", "c"), ("c", "d"), ("d", "c"), ("d", "e"))
+        component = _strongly_connected(edges)
+        assert component["a"] == component["b"]
+        assert component["c"] == component["d"]
+        assert component["a"] != component["c"]
+        # 진출 간선 없는 발행 회사도 단독 SCC
+        assert component["e"] not in (component["a"], component["c"])
+
+    def test_long_chain_no_recursion_limit(self):
+        n = 5000
+        edges = _edges(*[(f"n{i:05d}", f"n{i + 1:05d}") for i in range(n)], (f"n{n:05d}", "n00000"))
+        component = _strongly_connected(edges)
+        assert len(set(component.values())) == 1
+
+
+class TestFindCycles:
+
+    def test_self_loop(self):
+        cycles = find_cycles(_edges(("a", "a")))
+        assert _keys(cycles) == {"a"}
+        assert cycles[0]["cycle_length"] == 1
+
+    def test_two_and_three_cycles(self):
+        edges = _edges(("a", "b"), ("b", "a"), ("b", "c"), ("c", "a"))
+        assert _keys(find_cycles(edges)) == {"a->b", "a->b->c"}
+
+    def test_record_fields(self):
+        edges = {
+            "a": {"b": (2, 100.0)},
+            "b": {"c": (1, 50.0)},
+            "c": {"a": (3, 25.0)},
+        }
+        cycle, = find_cycles(edges)
+        assert cycle == {
+            "cycle_key": "a->b->c",
+            "company_ids": ["a", "b", "c"],
+            "cycle_length": 3,
+            "total_amount": 175.0,
+            "min_investment_count": 1,
+        }
+
+    def test_starts_at_min_id(self):
+        edges = _edges(("c", "a"), ("a", "b"), ("b", "c"))
+        assert _keys(find_cycles(edges)) == {"a->b->c"}
+
+    @pytest.mark.parametrize("max_length,expected", [
+        (1, set()),
+        (2, {"a->b"}),
+        (3, {"a->b", "a->b->c"}),
+        (4, {"a->b", "a->b->c", "a->b->c->d"}),
+    ])
+    def test_max_length_cutoff(self, max_length, expected):
+        edges = _edges(("a", "b"), ("b", "a"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "a"))
+        assert _keys(find_cycles(edges, max_length=max_length)) == expected
+
+    def test_no_cycle_outside_scc(self):
+        edges = _edges(("a", "b"), ("b", "c"), ("c", "d"))
+        assert find_cycles(edges) == []
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("max_length", [2, 3, 4])
+    def test_matches_brute_force_without_duplicates(self, seed, max_length):
+        edges = _random_edges(seed, n_nodes=9, n_edges=30)
+        cycles = find_cycles(edges, max_length=max_length)
+        keys = [c["cycle_key"] for c in cycles]
+        assert len(keys) == len(set(keys))
+        assert set(keys) == _brute_force(edges, max_length)
+
+    @pytest.mark.parametrize("seed", [4, 5, 6])
+    def test_through_matches_full_enumeration(self, seed):
+        """증분(through=) 결과 = 전체 열거 중 지정 회사를 포함하는 순환"""
+        edges = _random_edges(seed, n_nodes=12, n_edges=45)
+        full = find_cycles(edges)
+        touched = set(random.Random(seed).sample(sorted(edges), 3))
+
+        expected = {c["cycle_key"]: c for c in full if touched & set(c["company_ids"])}
+        incremental = find_cycles(edges, through=touched)
+
+        keys = [c["cycle_key"] for c in incremental]
+        assert len(keys) == len(set(keys))
+        assert {c["cycle_key"]: c for c in incremental} == expected
+
+    def test_through_unknown_company(self):
+        edges = _edges(("a", "b"), ("b", "a"))
+        assert find_cycles(edges, through=["zzz"]) == []
@@ -0,0 +1,263 @@
+"""
+Neo4j 증분 동기화 테스트
+
+가짜 asyncpg 커넥션(테이블별 행 + 세션 TimeZone)과 가짜 Neo4j 세션으로 동작을 확인한다.
+
+테스트 대상:
+- 워터마크 이후 변경된 행만 조회 (timestamptz / timestamp without time zone 컬럼)
+- 증분 포지션 동기화 시 기존 WORKS_AT 관계 교체
+- SyncState 워터마크는 배치 오류 없이 끝난 경우에만 전진
+"""
+
+import asyncio
+import re
+import sys
+import os
+from datetime import datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'scripts', 'sync'))
+
+from full_neo4j_sync import (  # noqa: E402
+    COMPANIES_SQL,
+    POSITIONS_SQL,
+    Neo4jFullSyncer,
+)
+
+SESSION_TZ = ZoneInfo('Asia/Seoul')
+
+# SELECT NOW() 결과와 같은 tz-aware 워터마크 (2026-10-16 12:00 KST)
+WATERMARK = datetime(2026, 10, 16, 3, 0, tzinfo=timezone.utc)
+
+# timestamp without time zone updated_at 컬럼 (세션 TimeZone 기준 NOW()로 기록)
+NAIVE_TABLES = {'officer_positions'}
+
+
+class FakePgConnection:
+    """
+    테이블별 행을 가진 asyncpg 커넥션
+
+    증분 조건(updated_at > $1 ...)을 PostgreSQL 규칙대로 평가한다:
+    - timestamp 컬럼과 캐스트 없는 $1 비교 → 파라미터가 timestamp로 추론되어 aware 값 거부
+    - $1::timestamptz → timestamp 컬럼은 세션 TimeZone 기준으로 해석
+    - $1::timestamptz AT TIME ZONE current_setting('TimeZone') → 세션 TimeZone의 timestamp
+    """
+
+    def __init__(self, tables: dict):
+        self.tables = tables
+        self.queries = []
+
+    async def fetch(self, query, *args):
+        self.queries.append(query)
+        table = re.search(r"FROM (\w+)", query).group(1)
+        rows = self.tables.get(table, [])
+        where = re.search(r"WHERE updated_at > (.+)", query)
+        if not where:
+            return list(rows)
+        return [row for row in rows if self._newer(row['updated_at'], where.group(1).strip(), args[0], table)]
+
+    @staticmethod
+    def _newer(value: datetime, condition: str, param: datetime, table: str) -> bool:
+        naive_column = table in NAIVE_TABLES
+        if condition == "($1::timestamptz AT TIME ZONE current_setting('TimeZone'))":
+            return value > param.astimezone(SESSION_TZ).replace(tzinfo=None)
+        if condition == "$1::timestamptz":
+            if naive_column:
+                value = value.replace(tzinfo=SESSION_TZ)
+            return value > param
+        if condition == "$1" and naive_column and param.tzinfo is not None:
+            raise TypeError("can't subtract offset-naive and offset-aware datetimes")
+        return value > param
+
+
+class FakeResult:
+    def __init__(self, records=()):
+        self.records = list(records)
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+    def __iter__(self):
+        return iter(self.records)
+
+
+class FakeGraph:
+    """WORKS_AT 관계와 SyncState만 보관하는 Neo4j 그래프"""
+
+    def __init__(self, works_at=()):
+        # (position id, officer_id, company_id) - 중복 생성 확인을 위해 리스트
+        self.works_at = list(works_at)
+        self.sync_state = None
+        self.fail_works_at = False
+
+    def session(self):
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, **params):
+        graph = self.graph
+        if "SyncState" in query and "MERGE" in query:
+            graph.sync_state = params['watermark']
+            return FakeResult()
+        if "SyncState" in query:
+            return FakeResult([{'watermark': graph.sync_state}] if graph.sync_state else [])
+        if "CREATE (o)-[r:WORKS_AT" in query:
+            if graph.fail_works_at:
+                raise RuntimeError("Neo.TransientError.Transaction.DeadlockDetected")
+            rows = params['rows']
+            if "DELETE old" in query:
+                replaced = {p['id'] for p in rows}
+                graph.works_at = [rel for rel in graph.works_at if rel[0] not in replaced]
+            graph.works_at += [(p['id'], p['officer_id'], p['company_id']) for p in rows]
+            return FakeResult([{'cnt': len(rows)}])
+        return FakeResult()
+
+
+def _kst(hour: int, minute: int = 0) -> datetime:
+    """세션 TimeZone(KST) 기준 naive 시각"""
+    return datetime(2026, 10, 16, hour, minute)
+
+
+def _position(position_id: str, company_id: str, updated_at: datetime) -> dict:
+    return {
+        'id': position_id, 'officer_id': 'officer-1', 'company_id': company_id,
+        'position': '사내이사', 'is_current': True, 'updated_at': updated_at,
+    }
+
+
+def _syncer(tables: dict, graph: FakeGraph = None) -> Neo4jFullSyncer:
+    syncer = Neo4jFullSyncer()
+    syncer.pg_conn = FakePgConnection(tables)
+    syncer.neo4j_driver = graph or FakeGraph()
+    return syncer
+
+
+class TestFetchSince:
+    """워터마크 이후 변경된 행만 조회"""
+
+    def test_naive_positions_compared_in_session_timezone(self):
+        # 11:30 KST = 워터마크(12:00 KST) 이전, 12:30 KST = 이후
+        # (UTC 벽시계로 비교하면 둘 다 03:00 이후로 잘못 조회됨)
+        syncer = _syncer({'officer_positions': [
+            _position('p-old', 'company-1', _kst(11, 30)),
+            _position('p-new', 'company-1', _kst(12, 30)),
+        ]})
+        query = POSITIONS_SQL.format(where=syncer._since_clause(WATERMARK, naive=True))
+
+        rows = asyncio.run(syncer._fetch(query, WATERMARK))
+
+        assert [r['id'] for r in rows] == ['p-new']
+
+    def test_timestamptz_rows(self):
+        syncer = _syncer({'companies': [
+            {'id': 'c-old', 'updated_at': WATERMARK - timedelta(minutes=1)},
+            {'id': 'c-new', 'updated_at': WATERMARK + timedelta(minutes=1)},
+        ]})
+        query = COMPANIES_SQL.format(where=syncer._since_clause(WATERMARK))
+
+        rows = asyncio.run(syncer._fetch(query, WATERMARK))
+
+        assert [r['id'] for r in rows] == ['c-new']
+
+    def test_full_sync_fetches_everything(self):
+        positions = [_position('p-1', 'company-1', _kst(1)), _position('p-2', 'company-1', _kst(23))]
+        syncer = _syncer({'officer_positions': positions})
+        query = POSITIONS_SQL.format(where=syncer._since_clause(None, naive=True))
+
+        rows = asyncio.run(syncer._fetch(query, None))
+
+        assert [r['id'] for r in rows] == ['p-1', 'p-2']
+
+
+class TestIncrementalPositions:
+    """증분 포지션 동기화 (Phase 5)"""
+
+    def test_resynced_position_replaces_stale_works_at(self):
+        graph = FakeGraph(works_at=[
+            ('p-moved', 'officer-1', 'company-1'),
+            ('p-same', 'officer-1', 'company-3'),
+        ])
+        syncer = _syncer({'officer_positions': [
+            _position('p-moved', 'company-2', _kst(13)),   # 회사 변경 (워터마크 이후)
+            _position('p-same', 'company-3', _kst(9)),     # 변경 없음
+        ]}, graph)
+
+        asyncio.run(syncer.sync_officer_positions(since=WATERMARK))
+
+        assert sorted(graph.works_at) == [
+            ('p-moved', 'officer-1', 'company-2'),
+            ('p-same', 'officer-1', 'company-3'),
+        ]
+        assert syncer.stats['positions']['pg'] == 1
+
+    def test_full_sync_creates_without_replacing(self):
+        graph = FakeGraph()
+        syncer = _syncer({'officer_positions': [_position('p-1', 'company-1', _kst(9))]}, graph)
+
+        asyncio.run(syncer.sync_officer_positions())
+
+        assert graph.works_at == [('p-1', 'officer-1', 'company-1')]
+
+
+class TestWatermark:
+    """SyncState 워터마크"""
+
+    PREVIOUS = datetime(2026, 10, 15, 3, 0, tzinfo=timezone.utc)
+
+    def _run_positions(self, fail: bool):
+        graph = FakeGraph()
+        graph.sync_state = self.PREVIOUS.isoformat()
+        graph.fail_works_at = fail
+        syncer = _syncer({'officer_positions': [_position('p-1', 'company-1', _kst(13))]}, graph)
+
+        since = syncer.get_watermark()
+        asyncio.run(syncer.sync_officer_positions(since=since))
+        advanced = syncer.advance_watermark(WATERMARK, 'incremental')
+        return syncer, advanced
+
+    def test_advances_after_successful_run(self):
+        syncer, advanced = self._run_positions(fail=False)
+
+        assert advanced
+        assert syncer.get_watermark() == WATERMARK
+
+    def test_kept_when_batch_failed(self):
+        syncer, advanced = self._run_positions(fail=True)
+
+        assert not advanced
+        assert syncer.stats['positions']['errors'] == 1
+        assert syncer.get_watermark() == self.PREVIOUS
+
+    def test_missing_watermark(self):
+        assert _syncer({}).get_watermark() is None
+
+
+@pytest.mark.parametrize("watermark", [
+    WATERMARK,
+    WATERMARK.astimezone(timezone(timedelta(hours=9))),
+])
+def test_watermark_offset_does_not_change_rows(watermark):
+    """같은 시각이면 워터마크의 UTC 오프셋과 무관하게 같은 행 조회"""
+    syncer = _syncer({'officer_positions': [
+        _position('p-old', 'company-1', _kst(11, 59)),
+        _position('p-new', 'company-1', _kst(12, 1)),
+    ]})
+    query = POSITIONS_SQL.format(where=syncer._since_clause(watermark, naive=True))
+
+    rows = asyncio.run(syncer._fetch(query, watermark))
+
+    assert [r['id'] for r in rows] == ['p-new']
@@ -0,0 +1,142 @@
+"""
+RaymondsIndex v2.1 배치 계산 엔진 패리티 테스트
+
+테스트 대상:
+- RaymondsIndexBatchCalculator: 배치 계산 결과가 회사별 계산기(RaymondsIndexCalculator)와 동일한지
+- FinancialPanel: 행 → 패널 변환 (중복 연도, 데이터 부족 회사)
+"""
+
+import random
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.raymonds_index_calculator import RaymondsIndexCalculator
+from app.services.raymonds_index_batch import (
+    FINANCIAL_FIELDS,
+    FinancialPanel,
+    RaymondsIndexBatchCalculator,
+)
+
+
+def _random_year(rng: random.Random, year: int) -> dict:
+    """무작위 재무 데이터 (결측, 0, 음수 포함)"""
+    row = {'fiscal_year': year}
+    for field in FINANCIAL_FIELDS:
+        roll = rng.random()
+        if roll < 0.08:
+            row[field] = None
+        elif roll < 0.15:
+            row[field] = 0
+        else:
+            value = rng.uniform(1e8, 5e11)
+            if field in ('operating_income', 'net_income', 'operating_cash_flow') and rng.random() < 0.25:
+                value = -value
+            if field in ('capex', 'dividend_paid', 'treasury_stock_acquisition') and rng.random() < 0.7:
+                value = -value  # 현금흐름표 유출 부호
+            row[field] = value
+    return row
+
+
+def _random_companies(seed: int, count: int) -> dict:
+    rng = random.Random(seed)
+    companies = {}
+    for i in range(count):
+        n_years = rng.choice([1, 2, 3, 3, 3, 4])
+        years = sorted(rng.sample(range(2019, 2026), n_years))
+        companies[f"company-{i}"] = [_random_year(rng, y) for y in years]
+    return companies
+
+
+def _to_rows(companies: dict) -> list:
+    return [
+        {'company_id': company_id, **row}
+        for company_id, rows in companies.items()
+        for row in rows
+    ]
+
+
+def _assert_same(batch: dict, scalar: dict):
+    assert batch.keys() == scalar.keys()
+    for key, expected in scalar.items():
+        assert batch[key] == expected, key
+
+
+class TestRaymondsIndexBatchParity:
+    """배치 계산 ↔ 회사별 계산 패리티"""
+
+    @pytest.mark.parametrize("target_year", [None, 2025])
+    def test_random_companies_match_scalar(self, target_year):
+        """무작위 회사 300개: 모든 지표/점수/등급/문구 일치"""
+        companies = _random_companies(seed=20261016, count=300)
+        scalar = RaymondsIndexCalculator()
+        batch = RaymondsIndexBatchCalculator()
+
+        panel = FinancialPanel.from_rows(_to_rows(companies))
+        results = {r['company_id']: r for r in batch.calculate(panel, target_year=target_year)}
+
+        compared = 0
+        for company_id, rows in companies.items():
+            expected = scalar.calculate(company_id, rows, target_year=target_year)
+            if expected is None:
+                assert company_id not in results
+                continue
+            _assert_same(results[company_id], scalar.to_dict(expected))
+            compared += 1
+
+        assert compared == len(results) > 0
+
+    def test_grade_distribution_matches(self):
+        """등급/위반 개수 일치 (회사 500개)"""
+        companies = _random_companies(seed=7, count=500)
+        scalar = RaymondsIndexCalculator()
+        panel = FinancialPanel.from_rows(_to_rows(companies))
+
+        for result in RaymondsIndexBatchCalculator().calculate(panel):
+            expected = scalar.calculate(result['company_id'], companies[result['company_id']])
+            assert result['grade'] == expected.grade
+            assert result['violation_count'] == expected.violation_count
+
+    def test_industry_weights(self):
+        """업종별 가중치 조정 반영"""
+        companies = _random_companies(seed=11, count=50)
+        scalar = RaymondsIndexCalculator(industry_sector='반도체')
+        panel = FinancialPanel.from_rows(_to_rows(companies))
+
+        for result in RaymondsIndexBatchCalculator(industry_sector='반도체').calculate(panel):
+            expected = scalar.to_dict(scalar.calculate(result['company_id'], companies[result['company_id']]))
+            assert result['total_score'] == expected['total_score']
+            assert result['industry_sector'] == '반도체'
+
+
+class TestFinancialPanel:
+    """FinancialPanel 변환 테스트"""
+
+    def test_skips_companies_with_one_year(self):
+        rows = [
+            {'company_id': 'a', 'fiscal_year': 2024, 'revenue': 100},
+            {'company_id': 'b', 'fiscal_year': 2023, 'revenue': 100},
+            {'company_id': 'b', 'fiscal_year': 2024, 'revenue': 120},
+        ]
+        panel = FinancialPanel.from_rows(rows)
+        assert panel.company_ids == ['b']
+        assert panel.lengths.tolist() == [2]
+
+    def test_first_row_per_year_wins(self):
+        """같은 연도 행이 여러 개면 먼저 나온 행 사용 (DISTINCT ON 순서)"""
+        rows = [
+            {'company_id': 'a', 'fiscal_year': 2024, 'revenue': 100},
+            {'company_id': 'a', 'fiscal_year': 2024, 'revenue': 999},
+            {'company_id': 'a', 'fiscal_year': 2023, 'revenue': 80},
+        ]
+        panel = FinancialPanel.from_rows(rows)
+        assert panel.values['revenue'][0].tolist() == [80.0, 100.0]
+        assert panel.fiscal_years[0].tolist() == [2023, 2024]
+
+    def test_empty(self):
+        panel = FinancialPanel.from_rows([])
+        assert panel.size == 0
+        assert RaymondsIndexBatchCalculator().calculate(panel) == []
@@ -177,6 +177,7 @@ function transformApiResponse(response: ApiGraphResponse): GraphData {
     if (!linkSet.has(linkKey)) {
       linkSet.add(linkKey)
       links.push({
+        id: rel.id,
         source,
         target,
         type: linkType,
@@ -348,6 +349,60 @@ export async function getOfficerCareerNetwork(officerId: string): Promise<GraphD
   }
 }
 
+// 증분 확장 API 응답 타입
+interface ApiExpandResponse extends ApiGraphResponse {
+  next_cursor: string | null
+  has_more: boolean
+  total_relationships: number | null
+}
+
+export interface ExpandResult extends GraphData {
+  nextCursor: string | null
+  hasMore: boolean
+  totalRelationships: number | null
+}
+
+// 프론트 노드 타입 → API 노드 타입 (mapNodeType 역방향)
+const API_NODE_TYPES: Record<GraphNode['type'], string> = {
+  company: 'Company',
+  affiliate: 'Company',
+  officer: 'Officer',
+  subscriber: 'Subscriber',
+  cb: 'ConvertibleBond',
+  shareholder: 'Shareholder',
+}
+
+/**
+ * 노드 증분 확장 API
+ * 이미 그래프에 있는 노드/관계를 제외한 신규 노드/관계만 받는다.
+ * 연결이 많은 노드는 nextCursor로 다음 페이지 요청
+ * @param node 확장할 노드
+ * @param graph 현재 그래프 (노드 ID/관계 ID를 제외 목록으로 전송)
+ * @param cursor 이전 응답의 nextCursor
+ * @param limit 페이지당 관계 수
+ */
+export async function expandNode(
+  node: Pick<GraphNode, 'id' | 'type'>,
+  graph: GraphData,
+  cursor: string | null = null,
+  limit: number = 100
+): Promise<ExpandResult> {
+  const response = await apiClient.post<ApiExpandResponse>('/api/graph/expand', {
+    node_type: API_NODE_TYPES[node.type],
+    node_id: node.id,
+    known_node_ids: graph.nodes.map(n => n.id),
+    known_relationship_ids: graph.links.flatMap(link => (link.id ? [link.id] : [])),
+    cursor,
+    limit,
+  })
+  return {
+    ...transformApiResponse(response.data),
+    nextCursor: response.data.next_cursor,
+    hasMore: response.data.has_more,
+    totalRelationships: response.data.total_relationships,
+  }
+}
+
 /**
  * CB 인수자 투자 네트워크 조회 API
  * @param subscriberId 인수자 ID
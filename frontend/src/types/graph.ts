@@ -46,6 +46,7 @@ export interface GraphNode {
 
 // 그래프 엣지 데이터
 export interface GraphLink {
+  id?: string  // API 관계 ID (증분 확장 시 이미 가진 관계 제외용)
   source: string | GraphNode
   target: string | GraphNode
   type: 'officer' | 'subscriber' | 'cb_issue' | 'affiliate'